@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark CairoGraphicsManager.draw_callback.
+
+Draws 0, 1, 5 and 20 visible elements (lower thirds, scoreboards, tickers and
+timers in turn) onto a 1920x1080 ARGB surface, as cairooverlay does for each
+frame, and reports the cost per frame in microseconds. Timestamps advance at
+30 fps, so tickers scroll and timers tick as they would live.
+
+Needs pycairo only (no GStreamer).
+
+Usage:
+    python3 scripts/benchmark_cairo_draw.py [--frames 600] [--counts 0 1 5 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.cairo_graphics import CairoGraphicsManager, LowerThird, Scoreboard, Ticker, Timer  # noqa: E402
+from src.cairo_graphics.manager import CAIRO_AVAILABLE  # noqa: E402
+
+FRAME_NS = 1_000_000_000 // 30
+WARMUP_FRAMES = 30
+
+
+def make_element(index: int):
+    element_id = f"bench{index}"
+    kind = index % 4
+    if kind == 0:
+        return LowerThird(element_id, name=f"Speaker {index}", title="Chief Executive Officer", y=40 + 40 * index)
+    if kind == 1:
+        return Scoreboard(element_id, team1_score=index, team2_score=3, x=40 * index)
+    if kind == 2:
+        return Ticker(element_id, text="Breaking news: the quick brown fox jumps over the lazy dog " * 2, y=40 * index)
+    return Timer(element_id, duration=300.0, x=40 * index, y=900)
+
+
+def run(count: int, frames: int, width: int, height: int) -> dict:
+    import cairo
+
+    manager = CairoGraphicsManager()
+    for index in range(count):
+        element = make_element(index)
+        manager.add_element(element.element_id, element)
+        if isinstance(element, Timer):
+            element.start(FRAME_NS)
+        else:
+            element.show(FRAME_NS)
+        element.animation_state = "visible"
+
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    context = cairo.Context(surface)
+
+    timings = []
+    for frame in range(WARMUP_FRAMES + frames):
+        timestamp = (frame + 1) * FRAME_NS
+        start = time.perf_counter()
+        manager.draw_callback(None, context, timestamp, FRAME_NS)
+        elapsed = time.perf_counter() - start
+        if frame >= WARMUP_FRAMES:
+            timings.append(elapsed * 1e6)
+
+    timings.sort()
+    return {
+        "count": count,
+        "mean_us": statistics.mean(timings),
+        "p50_us": statistics.median(timings),
+        "p99_us": timings[int(0.99 * (len(timings) - 1))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 1, 5, 20])
+    parser.add_argument("--resolution", default="1920x1080")
+    args = parser.parse_args()
+
+    if not CAIRO_AVAILABLE:
+        print("pycairo not available")
+        return 1
+    width, height = (int(v) for v in args.resolution.split("x"))
+
+    print(f"{'elements':<10}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}")
+    for count in args.counts:
+        result = run(count, args.frames, width, height)
+        print(
+            f"{result['count']:<10}{result['mean_us']:>10.1f}"
+            f"{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark the mixer's compositor backends.
+
+Runs every available backend (see src/mixer/backends.py) on the given scenes
+with videotestsrc inputs, so it works without cameras (and in CI), and
+reports ms per output frame. The backend MixerCore would pick with
+mixer.compositor_backend = auto is marked.
+
+Usage:
+    python3 scripts/benchmark_compositor_backends.py [--frames 90] [--resolution 1920x1080]
+        [--scenes quad two_up pip_cam1_over_cam0]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.gst_utils import ensure_gst_initialized, get_gst  # noqa: E402
+from src.mixer.backends import BACKENDS, benchmark_backends, select_backend  # noqa: E402
+from src.mixer.scenes import SceneManager  # noqa: E402
+
+DEFAULT_SCENES = ["quad", "two_up", "pip_cam1_over_cam0"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=90)
+    parser.add_argument("--resolution", default="1920x1080")
+    parser.add_argument("--scenes", nargs="+", default=DEFAULT_SCENES)
+    args = parser.parse_args()
+
+    if not ensure_gst_initialized():
+        print("GStreamer not available")
+        return 1
+    Gst = get_gst()
+
+    width, height = args.resolution.split("x")
+    with tempfile.TemporaryDirectory() as scenes_dir:
+        scene_manager = SceneManager(scenes_dir=scenes_dir)
+        scenes = [scene_manager.get_scene(scene_id) for scene_id in args.scenes]
+        scenes = [scene for scene in scenes if scene]
+        if not scenes:
+            print("No scenes found")
+            return 1
+        results = benchmark_backends(Gst, scenes, (int(width), int(height)), args.frames)
+
+    selected = select_backend(results)
+    print(f"{'backend':<10}{'ms/frame':>10}  description")
+    for name, backend in BACKENDS.items():
+        if name not in results:
+            timing = "n/a"
+        elif results[name] is None:
+            timing = "failed"
+        else:
+            timing = f"{results[name]:.2f}"
+        marker = " *" if name == selected else ""
+        print(f"{name:<10}{timing:>10}  {backend.description}{marker}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ingest -> mixer frame path.
+
+Compares the two ways a camera reaches the compositor:
+  rtsp   - encode (mpph264enc/x264enc) -> H.264 -> decode, as the mixer does
+           when it reads the MediaMTX stream (the network hop itself is not
+           included, so this is a lower bound for the RTSP path)
+  local  - raw NV12 frames handed over with intervideosink/intervideosrc,
+           as the mixer does when mixer.local_frames is enabled
+
+Uses videotestsrc so it runs without cameras. Reports process CPU usage,
+delivered frame rate and per-frame latency from source to compositor input.
+
+Usage:
+    python3 scripts/benchmark_frame_path.py [--seconds 10] [--resolution 1920x1080]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.gst_utils import ensure_gst_initialized, get_gst, get_glib  # noqa: E402
+from src.pipelines import (  # noqa: E402
+    build_local_frame_source,
+    get_local_frame_branch,
+    local_frames_supported,
+)
+
+CAM_ID = "bench"
+
+
+def get_encoder(Gst) -> str:
+    if Gst.ElementFactory.find("mpph264enc"):
+        return "mpph264enc qp-init=26 gop=30 profile=baseline rc-mode=cbr bps=18000000"
+    return "x264enc bitrate=18000 speed-preset=ultrafast tune=zerolatency key-int-max=30"
+
+
+def build_pipelines(path: str, width: str, height: str, Gst):
+    """Return (producer, consumer) pipeline descriptions for a path."""
+    source = (
+        f"videotestsrc pattern=ball is-live=true ! "
+        f"video/x-raw,format=NV12,width={width},height={height},framerate=30/1 ! "
+        f"identity name=bench_src signal-handoffs=true"
+    )
+    compositor_input = (
+        f"videoconvert ! videoscale ! video/x-raw,width={width},height={height} ! "
+        f"identity name=bench_sink signal-handoffs=true ! fakesink sync=false"
+    )
+    if path == "rtsp":
+        return (
+            f"{source} ! queue ! {get_encoder(Gst)} ! video/x-h264,profile=baseline ! "
+            f"h264parse ! decodebin ! {compositor_input}"
+        ), None
+    return (
+        f"{source} ! {get_local_frame_branch(CAM_ID, f'{width}x{height}')}",
+        f"{build_local_frame_source(CAM_ID, f'{width}x{height}')} ! {compositor_input}",
+    )
+
+
+def run(path: str, seconds: float, resolution: str) -> dict:
+    Gst = get_gst()
+    GLib = get_glib()
+    width, height = resolution.split("x")
+    producer_str, consumer_str = build_pipelines(path, width, height, Gst)
+
+    produced = {}  # pts -> monotonic time (rtsp path keeps source PTS)
+    latest = [0.0]  # last source push (local path restamps PTS)
+    latencies = []
+
+    def on_source(identity, buffer):
+        now = time.monotonic()
+        latest[0] = now
+        produced[buffer.pts] = now
+
+    def on_sink(identity, buffer):
+        now = time.monotonic()
+        if path == "rtsp":
+            started = produced.pop(buffer.pts, None)
+        else:
+            # intervideosrc always hands over the newest frame: its age is the
+            # time since the producer last pushed one
+            started = latest[0] or None
+        if started is not None:
+            latencies.append(now - started)
+
+    pipelines = [Gst.parse_launch(producer_str)]
+    if consumer_str:
+        pipelines.append(Gst.parse_launch(consumer_str))
+    pipelines[0].get_by_name("bench_src").connect("handoff", on_source)
+    pipelines[-1].get_by_name("bench_sink").connect("handoff", on_sink)
+
+    loop = GLib.MainLoop()
+    GLib.timeout_add(int(seconds * 1000), loop.quit)
+
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    for pipeline in reversed(pipelines):
+        pipeline.set_state(Gst.State.PLAYING)
+    loop.run()
+    cpu = time.process_time() - cpu_start
+    wall = time.monotonic() - wall_start
+    for pipeline in pipelines:
+        pipeline.set_state(Gst.State.NULL)
+
+    latencies.sort()
+    return {
+        "path": path,
+        "cpu_percent": 100.0 * cpu / wall,
+        "fps": len(latencies) / wall,
+        "latency_p50_ms": 1000 * statistics.median(latencies) if latencies else 0.0,
+        "latency_p99_ms": 1000 * latencies[int(0.99 * (len(latencies) - 1))] if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--resolution", default="1920x1080")
+    args = parser.parse_args()
+
+    if not ensure_gst_initialized():
+        print("GStreamer not available")
+        return 1
+
+    paths = ["rtsp"]
+    if local_frames_supported():
+        paths.append("local")
+    else:
+        print("intervideosink/intervideosrc not installed, benchmarking RTSP path only")
+
+    print(f"{'path':<8}{'cpu %':>8}{'fps':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for path in paths:
+        result = run(path, args.seconds, args.resolution)
+        print(
+            f"{result['path']:<8}{result['cpu_percent']:>8.1f}{result['fps']:>8.1f}"
+            f"{result['latency_p50_ms']:>10.1f}{result['latency_p99_ms']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark mixer CPU with Cairo graphics idle, static and animated.
+
+Runs a live videotestsrc -> compositor -> NV12 program pipeline and compares
+the two ways graphics reach the program frame:
+  layer    - GraphicsLayer: a BGRA compositor input, re-rendered only when
+             the graphics change (what MixerCore uses)
+  overlay  - cairooverlay on the full output frame, drawn every frame
+             (the previous pipeline)
+
+Graphics states:
+  idle     - no elements
+  static   - a lower third and a scoreboard on screen, not changing
+  animated - a scrolling ticker, and a lower third sliding in and out
+             every two seconds
+
+Reports process CPU usage and delivered frame rate.
+
+Usage:
+    python3 scripts/benchmark_graphics_layer.py [--seconds 10] [--resolution 1920x1080]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.cairo_graphics import CairoGraphicsManager, GraphicsLayer, LowerThird, Scoreboard, Ticker  # noqa: E402
+from src.cairo_graphics.layer import build_graphics_source  # noqa: E402
+from src.cairo_graphics.manager import CAIRO_AVAILABLE  # noqa: E402
+from src.gst_utils import ensure_gst_initialized, get_glib, get_gst  # noqa: E402
+
+STATES = ["idle", "static", "animated"]
+MODES = ["layer", "overlay"]
+
+
+def build_pipeline_str(mode: str, width: int, height: int) -> str:
+    graphics = "" if mode == "layer" else "cairooverlay name=graphics_overlay ! "
+    pipeline = (
+        f"compositor name=compositor background=black ! video/x-raw,width={width},height={height} ! "
+        f"{graphics}timeoverlay ! videoconvert ! video/x-raw,format=NV12 ! "
+        f"identity name=bench_sink signal-handoffs=true ! fakesink sync=true "
+        f"videotestsrc pattern=ball is-live=true ! "
+        f"video/x-raw,width={width},height={height},framerate=30/1 ! compositor.sink_0"
+    )
+    if mode == "layer":
+        pipeline += f" {build_graphics_source(width, height)}"
+    return pipeline
+
+
+def add_graphics(manager: CairoGraphicsManager, state: str, GLib) -> None:
+    if state == "static":
+        manager.add_element("lt", LowerThird("lt", name="Jane Smith", title="Chief Executive Officer"))
+        manager.add_element("sb", Scoreboard("sb", team1_score=2, team2_score=1))
+        manager.show_element("lt")
+        manager.show_element("sb")
+    elif state == "animated":
+        manager.add_element("tk", Ticker("tk", text="Breaking news: the quick brown fox jumps over the lazy dog", y=1000))
+        manager.add_element("lt", LowerThird("lt", name="Jane Smith", title="Chief Executive Officer"))
+        manager.show_element("tk")
+        shown = [False]
+
+        def toggle():
+            if shown[0]:
+                manager.hide_element("lt")
+            else:
+                manager.show_element("lt")
+            shown[0] = not shown[0]
+            return True
+
+        GLib.timeout_add(2000, toggle)
+
+
+def run(mode: str, state: str, seconds: float, width: int, height: int) -> dict:
+    Gst = get_gst()
+    GLib = get_glib()
+    pipeline = Gst.parse_launch(build_pipeline_str(mode, width, height))
+    manager = CairoGraphicsManager()
+    if mode == "layer":
+        GraphicsLayer(manager, width, height).attach(pipeline)
+    else:
+        pipeline.get_by_name("graphics_overlay").connect("draw", manager.draw_callback)
+    frames = [0]
+
+    def on_frame(identity, buffer):
+        frames[0] += 1
+
+    pipeline.get_by_name("bench_sink").connect("handoff", on_frame)
+    add_graphics(manager, state, GLib)
+
+    loop = GLib.MainLoop()
+    GLib.timeout_add(int(seconds * 1000), loop.quit)
+    pipeline.set_state(Gst.State.PLAYING)
+    time.sleep(1.0)  # Let the pipeline settle before measuring
+    frames[0] = 0
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    loop.run()
+    cpu = time.process_time() - cpu_start
+    wall = time.monotonic() - wall_start
+    pipeline.set_state(Gst.State.NULL)
+    return {"mode": mode, "state": state, "cpu_percent": 100.0 * cpu / wall, "fps": frames[0] / wall}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--resolution", default="1920x1080")
+    args = parser.parse_args()
+
+    if not CAIRO_AVAILABLE:
+        print("pycairo not available")
+        return 1
+    if not ensure_gst_initialized():
+        print("GStreamer not available")
+        return 1
+    width, height = (int(v) for v in args.resolution.split("x"))
+
+    print(f"{'mode':<9}{'graphics':<10}{'cpu %':>8}{'fps':>8}")
+    for state in STATES:
+        for mode in MODES:
+            result = run(mode, state, args.seconds, width, height)
+            print(f"{result['mode']:<9}{result['state']:<10}{result['cpu_percent']:>8.1f}{result['fps']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark mixer CPU usage with and without scale-at-source.
+
+For the default quad, two_up and PiP scenes, runs a compositor pipeline fed
+by 1080p videotestsrc inputs in two modes:
+  output  - every branch scales to the full output size and the compositor
+            scales again to the slot (previous behaviour)
+  slot    - every branch crops and scales once, straight to its slot size
+            (MixerCore._build_slot_tail)
+
+Reports process CPU usage for each scene and mode. The encoder is left out
+so the numbers isolate source scaling and compositing.
+
+Usage:
+    python3 scripts/benchmark_mixer_scaling.py [--seconds 10] [--scenes quad two_up pip_cam1_over_cam0]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.gst_utils import ensure_gst_initialized, get_gst, get_glib  # noqa: E402
+from src.mixer.core import SLOT_QUEUE, _build_slot_tail  # noqa: E402
+from src.mixer.scenes import SceneManager  # noqa: E402
+
+DEFAULT_SCENES = ["quad", "two_up", "pip_cam1_over_cam0"]
+SOURCE = (
+    "videotestsrc pattern=smpte is-live=true ! "
+    "video/x-raw,format=NV12,width=1920,height=1080,framerate=30/1"
+)
+
+
+def build_pipeline_str(scene, mode: str) -> str:
+    width, height = scene.resolution["width"], scene.resolution["height"]
+    branches = []
+    pad_props = []
+    for i, slot in enumerate(scene.slots):
+        coords = scene.get_absolute_coords(slot)
+        if mode == "slot":
+            tail = _build_slot_tail(i, slot, coords, (1920, 1080), (width, height))
+        else:
+            tail = f"videoconvert ! videoscale ! video/x-raw,width={width},height={height} ! {SLOT_QUEUE}"
+        branches.append(f"{SOURCE} ! {tail} ! compositor.sink_{i}")
+        pad_props.append(
+            f"sink_{i}::xpos={coords['x']} sink_{i}::ypos={coords['y']} "
+            f"sink_{i}::width={coords['w']} sink_{i}::height={coords['h']} sink_{i}::zorder={slot.z}"
+        )
+    return (
+        " ".join(branches) + " "
+        f"compositor name=compositor {' '.join(pad_props)} ! "
+        f"video/x-raw,width={width},height={height} ! fakesink sync=false"
+    )
+
+
+def run(scene, mode: str, seconds: float) -> float:
+    Gst = get_gst()
+    GLib = get_glib()
+    pipeline = Gst.parse_launch(build_pipeline_str(scene, mode))
+    loop = GLib.MainLoop()
+    GLib.timeout_add(int(seconds * 1000), loop.quit)
+
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    pipeline.set_state(Gst.State.PLAYING)
+    loop.run()
+    cpu = time.process_time() - cpu_start
+    wall = time.monotonic() - wall_start
+    pipeline.set_state(Gst.State.NULL)
+    return 100.0 * cpu / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--scenes", nargs="+", default=DEFAULT_SCENES)
+    args = parser.parse_args()
+
+    if not ensure_gst_initialized():
+        print("GStreamer not available")
+        return 1
+
+    with tempfile.TemporaryDirectory() as scenes_dir:
+        scene_manager = SceneManager(scenes_dir=scenes_dir)
+        print(f"{'scene':<22}{'output cpu %':>14}{'slot cpu %':>12}{'saved':>8}")
+        for scene_id in args.scenes:
+            scene = scene_manager.get_scene(scene_id)
+            if not scene:
+                print(f"{scene_id:<22} not found")
+                continue
+            baseline = run(scene, "output", args.seconds)
+            scaled = run(scene, "slot", args.seconds)
+            saved = 100.0 * (baseline - scaled) / baseline if baseline else 0.0
+            print(f"{scene_id:<22}{baseline:>14.1f}{scaled:>12.1f}{saved:>7.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
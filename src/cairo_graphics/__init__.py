@@ -1,11 +1,14 @@
 """Cairo-based broadcast graphics for real-time overlays.
 
 This package provides high-performance graphics rendering using Cairo,
-integrated with GStreamer's cairooverlay element.
+composited by the mixer as a separate RGBA layer (GraphicsLayer) or drawn
+by GStreamer's cairooverlay element (CairoGraphicsManager.draw_callback).
 
 Components:
 - CairoGraphicsManager: Main manager coordinating all graphics elements
 - GraphicsElement: Base class for all graphics (lower thirds, scoreboards, etc.)
+- GraphicsLayer: Renders the elements into a compositor input, only when they change
+- Timeline: Keyframe tracks (position, scale, alpha, color) with precomputed easing tables
 - Animation helpers: Easing functions and timing utilities
 
 Features:
@@ -25,6 +28,7 @@ Usage:
 """
 
 from .manager import CairoGraphicsManager
+from .layer import GraphicsLayer
 from .elements import (
     GraphicsElement,
     LowerThird,
@@ -33,6 +37,11 @@ from .elements import (
     Timer,
     LogoOverlay
 )
+from .timeline import (
+    Keyframe,
+    Track,
+    Timeline
+)
 from .animations import (
     ease_in_out_cubic,
     ease_out_bounce,
@@ -43,12 +52,16 @@ from .animations import (
 
 __all__ = [
     "CairoGraphicsManager",
+    "GraphicsLayer",
     "GraphicsElement",
     "LowerThird",
     "Scoreboard",
     "Ticker",
     "Timer",
     "LogoOverlay",
+    "Keyframe",
+    "Track",
+    "Timeline",
     "ease_in_out_cubic",
     "ease_out_bounce",
     "ease_in_cubic",
@@ -2,24 +2,36 @@
 
 Each element is a self-contained graphics object that can be shown, hidden,
 updated, and animated independently.
+
+Elements with static content (lower thirds, scoreboards, tickers, timers)
+render it once into a cached ARGB surface; the per-frame draw is a blit of
+that surface with the animated position, scale and alpha.
+
+Animations are keyframe timelines (see timeline.py): enter_timeline runs on
+show(), exit_timeline on hide() and loop_timeline while the element is
+visible. An element without running timelines is not evaluated per frame. The cache is re-rendered
+when the element is updated (invalidate()) or when its _cache_key() changes,
+e.g. once per displayed second for a timer.
 """
 import logging
 import math
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+from .text import get_text_layouts
+from .timeline import Timeline, pulse as pulse_timeline, slide_in, slide_out
 from .animations import (
-    ease_in_out_cubic,
-    ease_out_bounce,
-    lerp,
     hex_to_rgb,
     timestamp_to_seconds
 )
 
 logger = logging.getLogger(__name__)
 
+# Timeline properties applied as a transform when drawing (others set attributes)
+TRANSFORM_PROPERTIES = ("x", "y", "scale", "alpha")
+
 # Try to import Cairo - will be available on R58
 try:
     import cairo
@@ -45,6 +57,24 @@ class GraphicsElement:
     animation_state: str = "hidden"  # hidden, entering, visible, exiting
     animation_duration: float = 0.5  # seconds
     
+    # Keyframe timelines (templates, see timeline.py); None = appear/disappear instantly
+    enter_timeline: Optional[Timeline] = field(default=None, repr=False, compare=False)
+    exit_timeline: Optional[Timeline] = field(default=None, repr=False, compare=False)
+    loop_timeline: Optional[Timeline] = field(default=None, repr=False, compare=False)
+    
+    # Pre-rendered static content (see _get_surface)
+    _surface: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _surface_key: Any = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    
+    # Set by the draw budget (see profiling.py): animations frozen until shown again
+    degraded: bool = field(default=False, init=False, compare=False)
+    
+    # Running timelines and their last evaluated transform values
+    _timeline: Optional[Timeline] = field(default=None, init=False, repr=False, compare=False)
+    _loop: Optional[Timeline] = field(default=None, init=False, repr=False, compare=False)
+    _animated: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def show(self, timestamp: int) -> None:
         """Show element with animation.
         
@@ -53,7 +83,11 @@ class GraphicsElement:
         """
         self.visible = True
         self.show_time = timestamp
-        self.animation_state = "entering"
+        self.degraded = False
+        self._animated = {}
+        self._loop = self._run(self.loop_timeline, timestamp)
+        self._timeline = self._run(self.enter_timeline, timestamp)
+        self.animation_state = "entering" if self._timeline else "visible"
         logger.debug(f"Element {self.element_id} showing")
     
     def hide(self, timestamp: int) -> None:
@@ -63,34 +97,119 @@ class GraphicsElement:
             timestamp: GStreamer timestamp in nanoseconds
         """
         self.hide_time = timestamp
-        self.animation_state = "exiting"
+        self._timeline = self._run(self.exit_timeline, timestamp)
+        if self._timeline:
+            self.animation_state = "exiting"
+        else:
+            self._set_hidden()
         logger.debug(f"Element {self.element_id} hiding")
     
-    def get_animation_progress(self, timestamp: int) -> float:
-        """Get current animation progress (0.0 to 1.0).
+    def check_timelines(self, **timelines: Optional[Timeline]) -> None:
+        """Validate enter/exit/loop timelines for this element.
         
-        Args:
-            timestamp: Current GStreamer timestamp
+        Raises:
+            ValueError: If a track animates a property the element does not have
+        """
+        for phase, timeline in timelines.items():
+            if phase not in ("enter", "exit", "loop"):
+                raise ValueError(f"Unknown timeline '{phase}'")
+            for name in (timeline.tracks if timeline else ()):
+                if name in TRANSFORM_PROPERTIES:
+                    if any(isinstance(k.value, tuple) for k in timeline.tracks[name].keyframes):
+                        raise ValueError(f"Track '{name}' needs numeric values")
+                elif name.startswith("_") or not hasattr(self, name):
+                    raise ValueError(f"{type(self).__name__} has no property '{name}' to animate")
+    
+    def set_timelines(self, **timelines: Optional[Timeline]) -> None:
+        """Replace enter/exit/loop timelines (None removes one).
         
-        Returns:
-            Progress from 0.0 (start) to 1.0 (complete)
+        Enter/exit timelines apply from the next show/hide; a loop timeline
+        starts right away if the element is visible.
         """
-        if self.animation_state == "entering" and self.show_time is not None:
-            elapsed = timestamp_to_seconds(timestamp - self.show_time)
-            progress = min(elapsed / self.animation_duration, 1.0)
-            if progress >= 1.0:
-                self.animation_state = "visible"
-            return progress
+        self.check_timelines(**timelines)
+        for phase, timeline in timelines.items():
+            setattr(self, f"{phase}_timeline", timeline)
+        if "loop" in timelines and self.visible:
+            self._loop = self._run(self.loop_timeline, self.show_time or 0)
+            self._animated = {}
+    
+    @staticmethod
+    def _run(template: Optional[Timeline], timestamp: int) -> Optional[Timeline]:
+        if template is None:
+            return None
+        timeline = template.copy()
+        timeline.start(timestamp)
+        return timeline
+    
+    def _set_hidden(self) -> None:
+        self.animation_state = "hidden"
+        self.visible = False
+        self._loop = None
+    
+    @property
+    def animating(self) -> bool:
+        """Whether a timeline is running (the element changes every frame)."""
+        return self._timeline is not None or self._loop is not None
+    
+    def advance(self, timestamp: int) -> Dict[str, Any]:
+        """Evaluate running timelines for this frame.
+        
+        Idle elements return their last values without evaluating anything.
+        Finishing the enter/exit timeline completes the show/hide.
         
-        elif self.animation_state == "exiting" and self.hide_time is not None:
-            elapsed = timestamp_to_seconds(timestamp - self.hide_time)
-            progress = min(elapsed / self.animation_duration, 1.0)
-            if progress >= 1.0:
-                self.animation_state = "hidden"
-                self.visible = False
-            return progress
+        Returns:
+            Animated transform values (x, y, scale, alpha; missing = neutral)
+        """
+        if self._timeline is None and self._loop is None:
+            return self._animated
+        values = self._loop.evaluate(timestamp) if self._loop else {}
+        timeline = self._timeline
+        if timeline is not None:
+            if timeline.finished(timestamp):
+                values.update(timeline.final_values())
+                self._finish_timeline()
+            else:
+                values.update(timeline.evaluate(timestamp))
+        self._apply_values(values)
+        return self._animated
+    
+    def _finish_timeline(self) -> None:
+        self._timeline = None
+        if self.animation_state == "entering":
+            self.animation_state = "visible"
+        elif self.animation_state == "exiting":
+            self._set_hidden()
+    
+    def _apply_values(self, values: Dict[str, Any]) -> None:
+        for name, value in values.items():
+            if name in TRANSFORM_PROPERTIES:
+                self._animated[name] = value
+            elif getattr(self, name, None) != value:
+                setattr(self, name, value)
+                self.invalidate()
+    
+    def degrade(self) -> None:
+        """Freeze animations and draw only the cached surface (until shown again).
         
-        return 1.0  # Fully visible or hidden
+        A running enter/exit timeline jumps to its end; loop timelines stop
+        at their neutral values.
+        """
+        self.degraded = True
+        self._loop = None
+        self._animated = {}
+        if self._timeline is not None:
+            self._apply_values(self._timeline.final_values())
+            self._finish_timeline()
+    
+    def get_transform(self, timestamp: int) -> Tuple[float, float, float, float]:
+        """Position, scale and alpha to draw this frame: (x, y, scale, alpha)."""
+        animated = self.advance(timestamp)
+        return (
+            self.x + animated.get("x", 0.0),
+            self.y + animated.get("y", 0.0),
+            animated.get("scale", 1.0),
+            self.alpha * animated.get("alpha", 1.0),
+        )
     
     def draw(self, context, timestamp: int) -> None:
         """Draw the element. Override in subclasses.
@@ -100,6 +219,93 @@ class GraphicsElement:
             timestamp: GStreamer timestamp in nanoseconds
         """
         pass
+    
+    def invalidate(self) -> None:
+        """Mark the cached surface stale so it is re-rendered on the next frame."""
+        self._dirty = True
+    
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Frame area (x, y, width, height) the element can touch, animations included.
+        
+        None if unknown (the graphics layer then assumes the whole frame).
+        """
+        width = getattr(self, "width", None)
+        height = getattr(self, "height", None)
+        if width is None or height is None:
+            return None
+        return self._animated_bounds(self.x, self.y, width, height)
+    
+    def _animated_bounds(self, x: float, y: float, width: float, height: float) -> Tuple[float, float, float, float]:
+        """Grow a rectangle by the offsets and scales its timelines can reach."""
+        timelines = [t for t in (self.enter_timeline, self.exit_timeline, self.loop_timeline) if t]
+        dx_min = min([t.extent("x", 0.0)[0] for t in timelines] + [0.0])
+        dx_max = max([t.extent("x", 0.0)[1] for t in timelines] + [0.0])
+        dy_min = min([t.extent("y", 0.0)[0] for t in timelines] + [0.0])
+        dy_max = max([t.extent("y", 0.0)[1] for t in timelines] + [0.0])
+        grow = max([t.extent("scale", 1.0)[1] for t in timelines] + [1.0]) - 1.0
+        return (
+            x + dx_min - width * grow / 2,
+            y + dy_min - height * grow / 2,
+            width * (1.0 + grow) + dx_max - dx_min,
+            height * (1.0 + grow) + dy_max - dy_min,
+        )
+    
+    def needs_redraw(self, timestamp: int) -> bool:
+        """Whether the element would look different than at its last draw."""
+        if self.animating:
+            return True
+        return self._dirty or self._cache_key(timestamp) != self._surface_key
+    
+    def _cache_key(self, timestamp: int) -> Any:
+        """Frame-dependent state baked into the cached surface (None if there is none)."""
+        return None
+    
+    def _surface_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+    
+    def _render_static(self, context) -> None:
+        """Render the cached content at (0, 0). Override in subclasses."""
+        pass
+    
+    def _get_surface(self, timestamp: int):
+        """Cached surface with the static content, re-rendered only when stale."""
+        key = self._cache_key(timestamp)
+        if self._dirty or self._surface is None or key != self._surface_key:
+            # Clear first so an update racing with the render marks it stale again
+            self._dirty = False
+            self._surface_key = key
+            width, height = self._surface_size()
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, max(1, int(math.ceil(width))), max(1, int(height)))
+            self._render_static(cairo.Context(surface))
+            surface.flush()
+            self._surface = surface
+        return self._surface
+    
+    @staticmethod
+    def _blit(context, surface, x: float, y: float, alpha: float, scale: float = 1.0) -> None:
+        """Paint a cached surface at (x, y), clipped to its own extent.
+        
+        Integer offsets keep the paint a straight copy (no resampling);
+        scale != 1 scales around the surface center.
+        """
+        if scale != 1.0:
+            width, height = surface.get_width(), surface.get_height()
+            context.save()
+            context.translate(x + width / 2, y + height / 2)
+            context.scale(scale, scale)
+            context.rectangle(-width / 2, -height / 2, width, height)
+            context.clip()
+            context.set_source_surface(surface, -width / 2, -height / 2)
+            context.paint_with_alpha(alpha)
+            context.restore()
+            return
+        x, y = round(x), round(y)
+        context.save()
+        context.rectangle(x, y, surface.get_width(), surface.get_height())
+        context.clip()
+        context.set_source_surface(surface, x, y)
+        context.paint_with_alpha(alpha)
+        context.restore()
 
 
 class LowerThird(GraphicsElement):
@@ -139,6 +345,10 @@ class LowerThird(GraphicsElement):
         self.title_font_size = title_font_size
         self.logo_surface: Optional[Any] = None
         
+        # Slide in from (and out to) the left edge of the frame while fading
+        self.enter_timeline = slide_in(x + width, animation_duration)
+        self.exit_timeline = slide_out(x + width, animation_duration)
+        
         # Load logo if provided
         if logo_path and Path(logo_path).exists() and CAIRO_AVAILABLE:
             try:
@@ -157,68 +367,38 @@ class LowerThird(GraphicsElement):
             self.name = name
         if title is not None:
             self.title = title
+        self.invalidate()
     
-    def draw(self, context, timestamp: int) -> None:
-        """Draw lower third with animation."""
-        if not CAIRO_AVAILABLE:
-            return
-        
-        if self.animation_state == "hidden":
-            return
-        
-        # Get animation progress
-        progress = self.get_animation_progress(timestamp)
-        
-        # Calculate position based on animation
-        if self.animation_state == "entering":
-            eased = ease_in_out_cubic(progress)
-            current_x = -self.width + (self.x + self.width) * eased
-            current_alpha = self.alpha * eased
-        elif self.animation_state == "exiting":
-            eased = ease_in_out_cubic(progress)
-            current_x = self.x - (self.x + self.width) * eased
-            current_alpha = self.alpha * (1.0 - eased)
-        else:  # visible
-            current_x = self.x
-            current_alpha = self.alpha
-        
-        # Draw background
-        context.set_source_rgba(
-            self.bg_color[0],
-            self.bg_color[1],
-            self.bg_color[2],
-            self.bg_alpha * current_alpha
-        )
-        context.rectangle(current_x, self.y, self.width, self.height)
+    def _render_static(self, context) -> None:
+        """Background, logo and text at full opacity."""
+        context.set_source_rgba(self.bg_color[0], self.bg_color[1], self.bg_color[2], self.bg_alpha)
+        context.rectangle(0, 0, self.width, self.height)
         context.fill()
         
-        # Draw logo if available
         if self.logo_surface:
-            logo_x = current_x + 10
-            logo_y = self.y + (self.height - self.logo_surface.get_height()) / 2
-            context.set_source_surface(self.logo_surface, logo_x, logo_y)
-            context.paint_with_alpha(current_alpha)
-            text_x = current_x + self.logo_surface.get_width() + 20
+            logo_y = (self.height - self.logo_surface.get_height()) / 2
+            context.set_source_surface(self.logo_surface, 10, logo_y)
+            context.paint()
+            text_x = self.logo_surface.get_width() + 20
         else:
-            text_x = current_x + 20
+            text_x = 20
         
-        # Draw name
-        context.set_source_rgba(
-            self.text_color[0],
-            self.text_color[1],
-            self.text_color[2],
-            current_alpha
-        )
-        context.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        context.set_font_size(self.name_font_size)
-        context.move_to(text_x, self.y + 50)
-        context.show_text(self.name)
+        text = get_text_layouts()
+        context.set_source_rgb(*self.text_color)
+        text.show(context, self.name, self.name_font_size, text_x, 50)
         
-        # Draw title
         if self.title:
-            context.set_font_size(self.title_font_size)
-            context.move_to(text_x, self.y + 85)
-            context.show_text(self.title)
+            text.show(context, self.title, self.title_font_size, text_x, 85)
+    
+    def draw(self, context, timestamp: int) -> None:
+        """Draw lower third with animation."""
+        if not CAIRO_AVAILABLE or not self.visible:
+            return
+        
+        x, y, scale, alpha = self.get_transform(timestamp)
+        if not self.visible:
+            return
+        self._blit(context, self._get_surface(timestamp), x, y, alpha, scale)
 
 
 class Scoreboard(GraphicsElement):
@@ -276,90 +456,53 @@ class Scoreboard(GraphicsElement):
             self.team2_score = team2_score
             self.highlight_team = 2
             self.highlight_start_time = current_time
+        
+        self.invalidate()
+    
+    def _cache_key(self, timestamp: int) -> Any:
+        """The highlighted team, until the highlight expires."""
+        if self.highlight_team and (time.time() - self.highlight_start_time) > self.highlight_duration:
+            return None
+        return self.highlight_team
+    
+    def _render_static(self, context) -> None:
+        """Background, scores (with highlight) and team names at full opacity."""
+        context.set_source_rgba(self.bg_color[0], self.bg_color[1], self.bg_color[2], self.bg_alpha)
+        context.rectangle(0, 0, self.width, self.height)
+        context.fill()
+        
+        text = get_text_layouts()
+        
+        # Team 1 score
+        context.set_source_rgb(*(self.highlight_color if self._surface_key == 1 else self.text_color))
+        text.show(context, str(self.team1_score), 72, 50, 90)
+        
+        # Separator
+        context.set_source_rgb(0.5, 0.5, 0.5)
+        text.show(context, "-", 48, 115, 90)
+        
+        # Team 2 score
+        context.set_source_rgb(*(self.highlight_color if self._surface_key == 2 else self.text_color))
+        text.show(context, str(self.team2_score), 72, 150, 90)
+        
+        # Team names (smaller)
+        context.set_source_rgba(self.text_color[0], self.text_color[1], self.text_color[2], 0.7)
+        text.show(context, self.team1_name, 16, 30, 130)
+        text.show(context, self.team2_name, 16, 130, 130)
     
     def draw(self, context, timestamp: int) -> None:
         """Draw scoreboard."""
         if not CAIRO_AVAILABLE or not self.visible:
             return
         
-        # Check if highlight expired
-        current_time = time.time()
-        if self.highlight_team and (current_time - self.highlight_start_time) > self.highlight_duration:
-            self.highlight_team = None
-        
-        # Draw background
-        context.set_source_rgba(
-            self.bg_color[0],
-            self.bg_color[1],
-            self.bg_color[2],
-            self.bg_alpha * self.alpha
-        )
-        context.rectangle(self.x, self.y, self.width, self.height)
-        context.fill()
-        
-        # Draw team 1 score
-        if self.highlight_team == 1:
-            context.set_source_rgba(
-                self.highlight_color[0],
-                self.highlight_color[1],
-                self.highlight_color[2],
-                self.alpha
-            )
-        else:
-            context.set_source_rgba(
-                self.text_color[0],
-                self.text_color[1],
-                self.text_color[2],
-                self.alpha
-            )
-        
-        context.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        context.set_font_size(72)
-        context.move_to(self.x + 50, self.y + 90)
-        context.show_text(str(self.team1_score))
-        
-        # Draw separator
-        context.set_source_rgba(0.5, 0.5, 0.5, self.alpha)
-        context.set_font_size(48)
-        context.move_to(self.x + 115, self.y + 90)
-        context.show_text("-")
-        
-        # Draw team 2 score
-        if self.highlight_team == 2:
-            context.set_source_rgba(
-                self.highlight_color[0],
-                self.highlight_color[1],
-                self.highlight_color[2],
-                self.alpha
-            )
-        else:
-            context.set_source_rgba(
-                self.text_color[0],
-                self.text_color[1],
-                self.text_color[2],
-                self.alpha
-            )
-        
-        context.set_font_size(72)
-        context.move_to(self.x + 150, self.y + 90)
-        context.show_text(str(self.team2_score))
-        
-        # Draw team names (smaller)
-        context.set_source_rgba(
-            self.text_color[0],
-            self.text_color[1],
-            self.text_color[2],
-            self.alpha * 0.7
-        )
-        context.set_font_size(16)
-        context.move_to(self.x + 30, self.y + 130)
-        context.show_text(self.team1_name)
-        context.move_to(self.x + 130, self.y + 130)
-        context.show_text(self.team2_name)
+        x, y, scale, alpha = self.get_transform(timestamp)
+        if not self.visible:
+            return
+        self._blit(context, self._get_surface(timestamp), x, y, alpha, scale)
 
 
 class Ticker(GraphicsElement):
-    """Scrolling ticker text."""
+    """Scrolling ticker text, looping seamlessly (text, separator, text, ...)."""
     
     def __init__(
         self,
@@ -373,7 +516,8 @@ class Ticker(GraphicsElement):
         bg_alpha: float = 0.9,
         text_color: str = "#FFFFFF",
         font_size: int = 36,
-        scroll_speed: float = 100.0  # pixels per second
+        scroll_speed: float = 100.0,  # pixels per second
+        separator: str = "   •   "  # Between repeats of the text
     ):
         super().__init__(element_id=element_id, x=x, y=y)
         self.text = text
@@ -384,7 +528,9 @@ class Ticker(GraphicsElement):
         self.text_color = hex_to_rgb(text_color)
         self.font_size = font_size
         self.scroll_speed = scroll_speed
+        self.separator = separator
         self.scroll_offset: float = 0.0
+        self.loop_width: float = 0.0  # Exact text + separator width, measured with the strip
     
     def update_text(self, text: str) -> None:
         """Update ticker text.
@@ -394,43 +540,79 @@ class Ticker(GraphicsElement):
         """
         self.text = text
         self.scroll_offset = 0.0  # Reset scroll
+        self.invalidate()
+    
+    def needs_redraw(self, timestamp: int) -> bool:
+        """A scrolling ticker changes every frame (unless degraded: scrolling frozen)."""
+        return (self.scroll_speed > 0 and not self.degraded) or super().needs_redraw(timestamp)
+    
+    def _strip_text(self) -> str:
+        return self.text + self.separator if self.text else ""
+    
+    def _surface_size(self) -> Tuple[int, int]:
+        """The cached surface is one loop period: the text and its separator."""
+        self.loop_width = get_text_layouts().measure(self._strip_text(), self.font_size)[0]
+        return self.loop_width, self.height
+    
+    def _render_static(self, context) -> None:
+        context.set_source_rgb(*self.text_color)
+        get_text_layouts().show(context, self._strip_text(), self.font_size, 0, self.height - 15)
+    
+    def strip_positions(self) -> List[float]:
+        """X positions of the text strip copies visible in the ticker this frame.
+        
+        The first copy enters at the right edge when shown; copies follow
+        each other every loop_width pixels, so the loop has no gap or jump.
+        """
+        period = self.loop_width
+        if period <= 0:
+            return []
+        x = self.x + self.width - self.scroll_offset
+        if x < self.x - period:
+            # Skip the copies that have already scrolled off the left edge
+            x += ((self.x - x) // period) * period
+        positions = []
+        while x < self.x + self.width:
+            positions.append(x)
+            x += period
+        return positions
     
     def draw(self, context, timestamp: int) -> None:
         """Draw scrolling ticker."""
         if not CAIRO_AVAILABLE or not self.visible:
             return
         
-        # Draw background
-        context.set_source_rgba(
-            self.bg_color[0],
-            self.bg_color[1],
-            self.bg_color[2],
-            self.bg_alpha * self.alpha
-        )
-        context.rectangle(self.x, self.y, self.width, self.height)
-        context.fill()
+        # Tickers animate position and alpha (not scale)
+        x, y, _, alpha = self.get_transform(timestamp)
+        if not self.visible:
+            return
+        
+        strip = self._get_surface(timestamp)
         
         # Calculate scroll position
-        time_sec = timestamp_to_seconds(timestamp)
-        if self.show_time:
+        if self.show_time and not self.degraded:
             elapsed = timestamp_to_seconds(timestamp - self.show_time)
             self.scroll_offset = elapsed * self.scroll_speed
         
-        # Loop scroll (assuming text width ~10px per character)
-        text_width = len(self.text) * 10
-        scroll_x = self.x + self.width - (self.scroll_offset % (self.width + text_width))
+        context.save()
+        context.translate(round(x - self.x), round(y - self.y))  # Timeline offset
+        context.rectangle(self.x, self.y, self.width, self.height)
+        context.clip()
         
-        # Draw text
+        # Background
         context.set_source_rgba(
-            self.text_color[0],
-            self.text_color[1],
-            self.text_color[2],
-            self.alpha
+            self.bg_color[0],
+            self.bg_color[1],
+            self.bg_color[2],
+            self.bg_alpha * alpha
         )
-        context.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        context.set_font_size(self.font_size)
-        context.move_to(scroll_x, self.y + self.height - 15)
-        context.show_text(self.text)
+        context.paint()
+        
+        # Text strips (integer offsets: straight copies, no resampling)
+        for strip_x in self.strip_positions():
+            context.set_source_surface(strip, round(strip_x), self.y)
+            context.paint_with_alpha(alpha)
+        context.restore()
 
 
 class Timer(GraphicsElement):
@@ -520,43 +702,36 @@ class Timer(GraphicsElement):
         secs = int(seconds % 60)
         return f"{minutes:02d}:{secs:02d}"
     
-    def draw(self, context, timestamp: int) -> None:
-        """Draw timer."""
-        if not CAIRO_AVAILABLE or not self.visible:
-            return
-        
-        # Get current time
+    def _cache_key(self, timestamp: int) -> Any:
+        """The displayed MM:SS and whether it is in the warning color."""
         current_time = self.get_current_time(timestamp)
-        time_str = self.format_time(current_time)
-        
-        # Determine color (warning if below threshold)
-        if self.mode == "countdown" and current_time <= self.warning_threshold:
-            color = self.warning_color
-        else:
-            color = self.text_color
+        warning = self.mode == "countdown" and current_time <= self.warning_threshold
+        return self.format_time(current_time), warning
+    
+    def _render_static(self, context) -> None:
+        time_str, warning = self._surface_key
+        color = self.warning_color if warning else self.text_color
         
-        # Draw background
-        context.set_source_rgba(
-            self.bg_color[0],
-            self.bg_color[1],
-            self.bg_color[2],
-            self.bg_alpha * self.alpha
-        )
-        context.rectangle(self.x, self.y, self.width, self.height)
+        # Background
+        context.set_source_rgba(self.bg_color[0], self.bg_color[1], self.bg_color[2], self.bg_alpha)
+        context.rectangle(0, 0, self.width, self.height)
         context.fill()
         
-        # Draw time
-        context.set_source_rgba(color[0], color[1], color[2], self.alpha)
-        context.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        context.set_font_size(self.font_size)
-        
-        # Center text
-        extents = context.text_extents(time_str)
-        text_x = self.x + (self.width - extents.width) / 2
-        text_y = self.y + (self.height + extents.height) / 2
+        # Time, centered
+        context.set_source_rgb(*color)
+        layout = get_text_layouts().get(time_str, self.font_size)
+        baseline = (self.height - layout.height) / 2 + layout.baseline
+        get_text_layouts().show(context, time_str, self.font_size, (self.width - layout.width) / 2, baseline)
+    
+    def draw(self, context, timestamp: int) -> None:
+        """Draw timer (re-rendered once per displayed second)."""
+        if not CAIRO_AVAILABLE or not self.visible:
+            return
         
-        context.move_to(text_x, text_y)
-        context.show_text(time_str)
+        x, y, scale, alpha = self.get_transform(timestamp)
+        if not self.visible:
+            return
+        self._blit(context, self._get_surface(timestamp), x, y, alpha, scale)
 
 
 class LogoOverlay(GraphicsElement):
@@ -581,6 +756,8 @@ class LogoOverlay(GraphicsElement):
         self.pulse_max = pulse_max
         self.pulse_duration = pulse_duration
         self.logo_surface: Optional[Any] = None
+        if pulse:
+            self.loop_timeline = pulse_timeline(pulse_min, pulse_max, pulse_duration)
         
         # Load logo
         if Path(logo_path).exists() and CAIRO_AVAILABLE:
@@ -589,38 +766,27 @@ class LogoOverlay(GraphicsElement):
             except Exception as e:
                 logger.error(f"Failed to load logo {logo_path}: {e}")
     
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Logo rectangle at its largest (pulse) scale, around the logo center."""
+        if not self.logo_surface:
+            return None
+        logo_width = self.logo_surface.get_width()
+        logo_height = self.logo_surface.get_height()
+        return self._animated_bounds(
+            self.x + logo_width * (1 - self.scale) / 2, self.y + logo_height * (1 - self.scale) / 2,
+            logo_width * self.scale, logo_height * self.scale,
+        )
+    
+    def needs_redraw(self, timestamp: int) -> bool:
+        """Static unless a timeline runs (the logo itself never changes)."""
+        return self.animating
+    
     def draw(self, context, timestamp: int) -> None:
         """Draw logo with optional pulse animation."""
         if not CAIRO_AVAILABLE or not self.visible or not self.logo_surface:
             return
         
-        # Calculate scale (with pulse if enabled)
-        current_scale = self.scale
-        if self.pulse and self.show_time:
-            elapsed = timestamp_to_seconds(timestamp - self.show_time)
-            pulse_progress = (elapsed % self.pulse_duration) / self.pulse_duration
-            pulse_value = self.pulse_min + (self.pulse_max - self.pulse_min) * (0.5 + 0.5 * math.sin(pulse_progress * 2 * math.pi))
-            current_scale *= pulse_value
-        
-        # Get logo dimensions
-        logo_width = self.logo_surface.get_width()
-        logo_height = self.logo_surface.get_height()
-        
-        # Apply transform
-        context.save()
-        context.translate(self.x + logo_width / 2, self.y + logo_height / 2)
-        context.scale(current_scale, current_scale)
-        context.translate(-logo_width / 2, -logo_height / 2)
-        
-        # Draw logo
-        context.set_source_surface(self.logo_surface, 0, 0)
-        context.paint_with_alpha(self.alpha)
-        
-        context.restore()
-
-
-
-
-
-
-
+        x, y, scale, alpha = self.get_transform(timestamp)
+        if not self.visible:
+            return
+        self._blit(context, self.logo_surface, x, y, alpha, scale * self.scale)
@@ -0,0 +1,240 @@
+"""Cairo graphics as a separate RGBA compositor layer.
+
+Instead of a cairooverlay drawing on every full program frame, graphics are
+rendered into a BGRA layer that feeds a compositor input through an appsrc:
+
+- The layer covers only the union of the visible elements' bounds, and the
+  compositor pad is placed and sized to match, so blending touches only
+  that region.
+- A new layer buffer is rendered and pushed only when something changed
+  (an element needs_redraw, or elements were shown/hidden). In between the
+  compositor keeps blending the last buffer, which has no duration.
+- Within the layer, only the dirty rectangles are cleared and redrawn.
+- With nothing visible the pad alpha is 0 and the compositor skips it.
+
+GraphicsLayer.on_frame is called once per program frame (a buffer probe on
+the compositor output) with the frame timestamp, like cairooverlay's draw
+signal, so element animations keep the same time base.
+
+Cairo surfaces are premultiplied while the compositor treats BGRA as
+straight alpha, so semi-transparent colors come out slightly darker than
+with cairooverlay.
+"""
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..gst_utils import get_gst
+
+logger = logging.getLogger(__name__)
+
+try:
+    import cairo
+    CAIRO_AVAILABLE = True
+except ImportError:
+    CAIRO_AVAILABLE = False
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height (frame pixels)
+
+GRAPHICS_PAD_INDEX = 999  # compositor sink_999, well clear of source pads
+GRAPHICS_ZORDER = 1000  # Above every scene slot
+
+
+def layer_caps(width: int, height: int) -> str:
+    return f"video/x-raw,format=BGRA,width={width},height={height},framerate=0/1,pixel-aspect-ratio=1/1"
+
+
+def build_graphics_source(width: int, height: int) -> str:
+    """appsrc feeding the graphics layer into compositor.sink_<GRAPHICS_PAD_INDEX>."""
+    return (
+        f'appsrc name=graphics_src is-live=true do-timestamp=true format=time '
+        f'caps="{layer_caps(width, height)}" ! '
+        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
+        f"compositor.sink_{GRAPHICS_PAD_INDEX}"
+    )
+
+
+def snap_rect(bounds: Optional[Tuple[float, float, float, float]], width: int, height: int) -> Optional[Rect]:
+    """Round bounds out to whole pixels and clip to the frame (None if off-frame).
+
+    Unknown bounds (None) mean the whole frame.
+    """
+    if bounds is None:
+        return 0, 0, width, height
+    x, y, w, h = bounds
+    left = max(0, math.floor(x))
+    top = max(0, math.floor(y))
+    right = min(width, math.ceil(x + w))
+    bottom = min(height, math.ceil(y + h))
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right - left, bottom - top
+
+
+def union_rect(rects: Iterable[Optional[Rect]]) -> Optional[Rect]:
+    """Bounding box of rects (None entries are ignored)."""
+    rects = [r for r in rects if r]
+    if not rects:
+        return None
+    left = min(r[0] for r in rects)
+    top = min(r[1] for r in rects)
+    right = max(r[0] + r[2] for r in rects)
+    bottom = max(r[1] + r[3] for r in rects)
+    return left, top, right - left, bottom - top
+
+
+@dataclass
+class LayerUpdate:
+    """What a frame has to do to the layer."""
+    region: Optional[Rect]  # Layer position/size in the frame (None: hide the layer)
+    dirty: List[Rect] = field(default_factory=list)  # Frame rects to clear and redraw
+    moved: bool = False  # Region changed: reposition the pad (and resize the surface)
+
+
+class GraphicsLayer:
+    """Renders a CairoGraphicsManager's elements into a compositor layer."""
+
+    def __init__(self, manager, width: int, height: int):
+        self.manager = manager
+        self.width = width
+        self.height = height
+        self._region: Optional[Rect] = None
+        self._drawn: Dict[int, Tuple[Any, Optional[Rect]]] = {}  # id(element) -> (element, rect) at last render
+        self._surface = None
+        self._appsrc = None
+        self._pad = None
+        self._pending_pad_props: Optional[Dict[str, Any]] = None
+        self._pad_lock = threading.Lock()
+        self.frames = 0
+        self.renders = 0
+        self.rendered_pixels = 0
+
+    def attach(self, pipeline) -> bool:
+        """Hook up to graphics_src and the compositor of a freshly built pipeline."""
+        Gst = get_gst()
+        compositor = pipeline.get_by_name("compositor")
+        appsrc = pipeline.get_by_name("graphics_src")
+        pad = compositor.get_static_pad(f"sink_{GRAPHICS_PAD_INDEX}") if compositor else None
+        if not appsrc or not pad:
+            logger.warning("Graphics layer elements not found in pipeline")
+            return False
+        self._appsrc = appsrc
+        self._pad = pad
+        pad.set_property("zorder", GRAPHICS_ZORDER)
+        pad.set_property("alpha", 0.0)
+        # Geometry changes are applied when the matching layer buffer reaches
+        # the compositor, so a resized layer is never shown at the old size
+        pad.add_probe(Gst.PadProbeType.BUFFER, self._on_layer_buffer)
+        compositor.get_static_pad("src").add_probe(Gst.PadProbeType.BUFFER, self._on_program_frame)
+        return True
+
+    def _on_program_frame(self, pad, info):
+        buffer = info.get_buffer()
+        try:
+            self.on_frame(buffer.pts if buffer else 0)
+        except Exception as e:
+            logger.error(f"Graphics layer update failed: {e}")
+        return get_gst().PadProbeReturn.OK
+
+    def _on_layer_buffer(self, pad, info):
+        with self._pad_lock:
+            props, self._pending_pad_props = self._pending_pad_props, None
+        if props:
+            for name, value in props.items():
+                pad.set_property(name, value)
+        return get_gst().PadProbeReturn.OK
+
+    def on_frame(self, timestamp: int) -> None:
+        """Per-program-frame update: re-render and push the layer only if it changed."""
+        self.frames += 1
+        self.manager.begin_frame(timestamp)
+        update = self.plan(timestamp)
+        if update is None:
+            return
+        if update.region is None:
+            with self._pad_lock:
+                self._pending_pad_props = None
+            if self._pad:
+                self._pad.set_property("alpha", 0.0)
+            return
+        self.render(update, timestamp)
+        self._push(update)
+
+    def plan(self, timestamp: int) -> Optional[LayerUpdate]:
+        """Work out the layer region and dirty rectangles for this frame (None: nothing changed)."""
+        visible = {}
+        for element in self.manager.draw_list:
+            if element.visible:
+                visible[id(element)] = (element, snap_rect(element.bounds(), self.width, self.height))
+        region = union_rect(rect for _, rect in visible.values())
+
+        if region is None:
+            hide = self._region is not None
+            self._region = None
+            self._drawn = {}
+            return LayerUpdate(region=None) if hide else None
+
+        if region != self._region:
+            dirty = [region]
+        else:
+            dirty = []
+            for key, (element, rect) in visible.items():
+                previous = self._drawn.get(key)
+                if previous is None or previous[1] != rect or element.needs_redraw(timestamp):
+                    dirty.append(rect)
+                    if previous is not None and previous[1] != rect:
+                        dirty.append(previous[1])
+            for key, (_, rect) in self._drawn.items():
+                if key not in visible:
+                    dirty.append(rect)  # Shown last frame, gone now: clear it
+            dirty = [rect for rect in dirty if rect]
+            if not dirty:
+                return None
+
+        moved = region != self._region
+        self._region = region
+        self._drawn = visible
+        return LayerUpdate(region=region, dirty=dirty, moved=moved)
+
+    def render(self, update: LayerUpdate, timestamp: int) -> None:
+        """Clear and redraw the dirty rectangles of the layer surface."""
+        x, y, width, height = update.region
+        surface = self._surface
+        if surface is None or (surface.get_width(), surface.get_height()) != (width, height):
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+            self._surface = surface
+        context = cairo.Context(surface)
+        context.translate(-x, -y)  # Elements draw in frame coordinates
+        for rect in update.dirty:
+            context.rectangle(*rect)
+        context.clip()
+        context.set_operator(cairo.OPERATOR_CLEAR)
+        context.paint()
+        context.set_operator(cairo.OPERATOR_OVER)
+        self.manager.draw_frame(context, timestamp)
+        surface.flush()
+        self.renders += 1
+        self.rendered_pixels += sum(rect[2] * rect[3] for rect in update.dirty)
+
+    def _push(self, update: LayerUpdate) -> None:
+        if not self._appsrc:
+            return
+        Gst = get_gst()
+        x, y, width, height = update.region
+        if update.moved:
+            self._appsrc.set_property("caps", Gst.Caps.from_string(layer_caps(width, height)))
+            with self._pad_lock:
+                self._pending_pad_props = {"xpos": x, "ypos": y, "width": width, "height": height, "alpha": 1.0}
+        # Cairo ARGB32 is BGRA in memory with a width * 4 stride, as GStreamer expects
+        buffer = Gst.Buffer.new_wrapped(bytes(self._surface.get_data()))
+        self._appsrc.emit("push-buffer", buffer)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "region": list(self._region) if self._region else None,
+            "frames": self.frames,
+            "renders": self.renders,
+            "rendered_megapixels": round(self.rendered_pixels / 1e6, 1),
+        }
@@ -1,10 +1,13 @@
 """Cairo Graphics Manager - coordinates all Cairo-based graphics elements."""
 import logging
 import threading
-from typing import Dict, Optional, Any
-from pathlib import Path
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 from .elements import GraphicsElement
+from .profiling import DEFAULT_BUDGET_MS, DrawProfiler
+from .text import get_text_layouts
 
 logger = logging.getLogger(__name__)
 
@@ -16,14 +19,20 @@ except ImportError:
     logger.warning("Cairo not available")
     CAIRO_AVAILABLE = False
 
+# Apply queued mutations on the caller's thread if no frame was drawn for this long
+IDLE_APPLY_AFTER = 0.1  # seconds
+
 
 class CairoGraphicsManager:
     """Manages all Cairo graphics elements and provides draw callback for GStreamer.
     
     This manager:
     - Maintains a registry of graphics elements (lower thirds, scoreboards, etc.)
-    - Provides thread-safe access for API updates
-    - Calls each element's draw() method every frame
+    - Publishes the registry as immutable snapshots, so the draw callback
+      never waits on API calls
+    - Queues element mutations and applies them at frame boundaries
+    - Calls each element's draw() method every frame, timing each draw
+      against the per-frame draw budget (see profiling.py)
     - Handles element lifecycle (show, hide, update)
     
     Usage:
@@ -37,15 +46,30 @@ class CairoGraphicsManager:
         overlay = pipeline.get_by_name("graphics_overlay")
         overlay.connect("draw", manager.draw_callback)
         
-        # Control via API
-        lower_third.show(timestamp)
-        lower_third.update(name="Jane Smith", title="CTO")
+        # Control via API (applied before the next frame, at its timestamp)
+        manager.show_element("lt1")
+        manager.apply("lt1", lambda e: e.update(name="Jane Smith", title="CTO"))
     """
     
-    def __init__(self):
-        """Initialize Cairo graphics manager."""
+    def __init__(self, draw_budget_ms: float = DEFAULT_BUDGET_MS, degrade_over_budget: bool = False):
+        """Initialize Cairo graphics manager.
+        
+        Args:
+            draw_budget_ms: Time all elements may take to draw one frame
+            degrade_over_budget: Freeze the animations of the slowest element
+                when frames keep exceeding the budget
+        """
+        # Serializes writers only; draw_callback and readers never take it
         self._lock = threading.Lock()
+        # Published registry: replaced (never mutated) under _lock, so readers
+        # can use whatever snapshot they load without locking
         self._elements: Dict[str, GraphicsElement] = {}
+        self._draw_list: Tuple[GraphicsElement, ...] = ()
+        # Element mutations waiting for the next frame boundary (called with its timestamp)
+        self._pending: Deque[Callable[[int], None]] = deque()
+        self._last_draw: Optional[float] = None
+        self._frame_time: Optional[int] = None  # Timestamp of the last frame drawn
+        self.profiler = DrawProfiler(draw_budget_ms, degrade_over_budget)
         self._enabled = True
         
         if not CAIRO_AVAILABLE:
@@ -63,7 +87,9 @@ class CairoGraphicsManager:
         """GStreamer draw callback - called every frame.
         
         This method is called by GStreamer's cairooverlay element for each frame.
-        It iterates through all elements and calls their draw() method.
+        It applies queued element mutations, then draws the current registry
+        snapshot. It never takes the manager lock, so API calls cannot stall
+        the streaming thread.
         
         Args:
             overlay: GStreamer cairooverlay element
@@ -74,12 +100,100 @@ class CairoGraphicsManager:
         if not self._enabled:
             return
         
-        with self._lock:
-            for element in self._elements.values():
-                try:
-                    element.draw(context, timestamp)
-                except Exception as e:
-                    logger.error(f"Error drawing element {element.element_id}: {e}")
+        self.begin_frame(timestamp)
+        self.draw_frame(context, timestamp)
+    
+    def draw_frame(self, context, timestamp: int) -> None:
+        """Draw the visible elements of the current snapshot (timed per element)."""
+        self.profiler.draw(self._draw_list, context, timestamp)
+    
+    def add_budget_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback(event) when frames keep exceeding the draw budget."""
+        self.profiler.add_listener(callback)
+    
+    @property
+    def draw_list(self) -> Tuple[GraphicsElement, ...]:
+        """Current registry snapshot in draw order (safe to use without locking)."""
+        return self._draw_list
+    
+    def begin_frame(self, timestamp: int) -> None:
+        """Apply queued element mutations; call once per frame before drawing.
+        
+        Args:
+            timestamp: Frame timestamp in nanoseconds, passed to timed
+                mutations (show/hide, timer start) so timelines run on the
+                same clock they are evaluated against
+        """
+        self._last_draw = time.monotonic()
+        self._frame_time = timestamp
+        if self._pending:
+            self._apply_pending(timestamp)
+    
+    def _frame_clock(self) -> int:
+        """Estimated timestamp of the next frame (for mutations applied between frames)."""
+        last_draw, frame_time = self._last_draw, self._frame_time
+        if last_draw is None or frame_time is None:
+            return 0  # No frame drawn yet: the pipeline starts at 0
+        return frame_time + int((time.monotonic() - last_draw) * 1_000_000_000)
+    
+    def _publish(self, elements: Dict[str, GraphicsElement]) -> None:
+        """Swap in a new registry snapshot (caller holds _lock)."""
+        self._elements = elements
+        self._draw_list = tuple(elements.values())
+    
+    def _apply_pending(self, timestamp: int) -> None:
+        # popleft is atomic, so each mutation runs exactly once even if an
+        # idle-path apply races with the next frame
+        while True:
+            try:
+                mutation = self._pending.popleft()
+            except IndexError:
+                return
+            try:
+                mutation(timestamp)
+            except Exception as e:
+                logger.error(f"Error applying graphics update: {e}")
+    
+    def apply(self, element_id: str, mutation: Callable[[GraphicsElement], None]) -> bool:
+        """Queue a change to an element, applied at the next frame boundary.
+        
+        Mutations are applied by the draw callback before it draws, so a frame
+        never shows a half-applied update. When no frames are being drawn
+        (overlay not running) the mutation is applied immediately.
+        
+        Args:
+            element_id: Element identifier
+            mutation: Called with the element, e.g. lambda e: e.update(name="Jane")
+        
+        Returns:
+            True if the element exists
+        """
+        return self.apply_timed(element_id, lambda element, timestamp: mutation(element))
+    
+    def apply_timed(self, element_id: str, mutation: Callable[[GraphicsElement, int], None]) -> bool:
+        """Queue a change that needs the frame timestamp, e.g. starting a timeline.
+        
+        Like apply(), but the mutation is also called with the timestamp of
+        the frame it is applied at (estimated from the last frame when no
+        frames are being drawn).
+        
+        Args:
+            element_id: Element identifier
+            mutation: Called with the element and timestamp, e.g. lambda e, t: e.start(t)
+        
+        Returns:
+            True if the element exists
+        """
+        element = self._elements.get(element_id)
+        if not element:
+            logger.warning(f"Element {element_id} not found")
+            return False
+        
+        self._pending.append(lambda timestamp: mutation(element, timestamp))
+        last_draw = self._last_draw
+        if last_draw is None or time.monotonic() - last_draw > IDLE_APPLY_AFTER:
+            self._apply_pending(self._frame_clock())
+        return True
     
     def add_element(self, element_id: str, element: GraphicsElement) -> bool:
         """Add a graphics element to the manager.
@@ -95,9 +209,9 @@ class CairoGraphicsManager:
             if element_id in self._elements:
                 logger.warning(f"Element {element_id} already exists, replacing")
             
-            self._elements[element_id] = element
-            logger.info(f"Added graphics element: {element_id} ({type(element).__name__})")
-            return True
+            self._publish({**self._elements, element_id: element})
+        logger.info(f"Added graphics element: {element_id} ({type(element).__name__})")
+        return True
     
     def remove_element(self, element_id: str) -> bool:
         """Remove a graphics element.
@@ -113,9 +227,10 @@ class CairoGraphicsManager:
                 logger.warning(f"Element {element_id} not found")
                 return False
             
-            del self._elements[element_id]
-            logger.info(f"Removed graphics element: {element_id}")
-            return True
+            self._publish({k: v for k, v in self._elements.items() if k != element_id})
+        self.profiler.forget(element_id)
+        logger.info(f"Removed graphics element: {element_id}")
+        return True
     
     def get_element(self, element_id: str) -> Optional[GraphicsElement]:
         """Get a graphics element by ID.
@@ -126,8 +241,7 @@ class CairoGraphicsManager:
         Returns:
             GraphicsElement instance or None
         """
-        with self._lock:
-            return self._elements.get(element_id)
+        return self._elements.get(element_id)
     
     def list_elements(self) -> Dict[str, Dict[str, Any]]:
         """List all graphics elements with their status.
@@ -135,61 +249,49 @@ class CairoGraphicsManager:
         Returns:
             Dictionary of element info
         """
-        with self._lock:
-            result = {}
-            for element_id, element in self._elements.items():
-                result[element_id] = {
-                    "type": type(element).__name__,
-                    "visible": element.visible,
-                    "animation_state": element.animation_state,
-                    "x": element.x,
-                    "y": element.y,
-                    "alpha": element.alpha
-                }
-            return result
+        result = {}
+        for element_id, element in self._elements.items():
+            result[element_id] = {
+                "type": type(element).__name__,
+                "visible": element.visible,
+                "animation_state": element.animation_state,
+                "x": element.x,
+                "y": element.y,
+                "alpha": element.alpha,
+                "degraded": element.degraded,
+                "draw": self.profiler.element_status(element_id)
+            }
+        return result
     
     def clear_all(self) -> None:
         """Remove all graphics elements."""
         with self._lock:
             count = len(self._elements)
-            self._elements.clear()
-            logger.info(f"Cleared all graphics elements ({count} removed)")
+            self._publish({})
+        self.profiler.forget()
+        logger.info(f"Cleared all graphics elements ({count} removed)")
     
-    def show_element(self, element_id: str, timestamp: int) -> bool:
-        """Show an element with animation.
+    def show_element(self, element_id: str) -> bool:
+        """Show an element with animation (from the next frame).
         
         Args:
             element_id: Element identifier
-            timestamp: GStreamer timestamp
         
         Returns:
             True if shown successfully
         """
-        element = self.get_element(element_id)
-        if not element:
-            logger.warning(f"Element {element_id} not found")
-            return False
-        
-        element.show(timestamp)
-        return True
+        return self.apply_timed(element_id, lambda element, timestamp: element.show(timestamp))
     
-    def hide_element(self, element_id: str, timestamp: int) -> bool:
-        """Hide an element with animation.
+    def hide_element(self, element_id: str) -> bool:
+        """Hide an element with animation (from the next frame).
         
         Args:
             element_id: Element identifier
-            timestamp: GStreamer timestamp
         
         Returns:
             True if hidden successfully
         """
-        element = self.get_element(element_id)
-        if not element:
-            logger.warning(f"Element {element_id} not found")
-            return False
-        
-        element.hide(timestamp)
-        return True
+        return self.apply_timed(element_id, lambda element, timestamp: element.hide(timestamp))
     
     def get_status(self) -> Dict[str, Any]:
         """Get manager status.
@@ -197,17 +299,13 @@ class CairoGraphicsManager:
         Returns:
             Status dictionary
         """
-        with self._lock:
-            return {
-                "enabled": self._enabled,
-                "cairo_available": CAIRO_AVAILABLE,
-                "element_count": len(self._elements),
-                "elements": self.list_elements()
-            }
-
-
-
-
-
-
-
+        elements = self.list_elements()
+        return {
+            "enabled": self._enabled,
+            "cairo_available": CAIRO_AVAILABLE,
+            "element_count": len(elements),
+            "pending_updates": len(self._pending),
+            "text_layouts": get_text_layouts().get_status(),
+            "draw_budget": self.profiler.get_status(),
+            "elements": elements
+        }
@@ -0,0 +1,176 @@
+"""Per-element draw-time profiling and the per-frame draw budget.
+
+Every element draw is timed with perf_counter_ns into a fixed-size ring of
+recent samples (no allocation per frame); percentiles are only computed
+when status is requested. Timing costs two clock reads and a list store per
+element, well under a microsecond.
+
+When the elements of a frame together take longer than the budget for
+OVER_BUDGET_FRAMES frames in a row, a "graphics_over_budget" event naming
+the slowest elements is logged and passed to listeners (at most once per
+WARNING_INTERVAL). With degradation enabled, the slowest element is also
+degraded (GraphicsElement.degrade: animations frozen, cached surface only)
+until it is shown again.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ..metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_registry = get_metrics_registry()
+_OVER_BUDGET = _registry.counter("r58_cairo_over_budget_frames", "Graphics frames drawn over the draw budget")
+_DEGRADED = _registry.counter("r58_cairo_degraded_elements", "Graphics elements degraded for exceeding the draw budget")
+
+DEFAULT_BUDGET_MS = 4.0
+SAMPLES = 256  # Recent draws kept per element (about 8 s at 30 fps)
+OVER_BUDGET_FRAMES = 15  # Consecutive frames over budget before acting
+WARNING_INTERVAL = 10.0  # seconds between warning events
+
+
+class DrawStats:
+    """Ring buffer of recent draw durations (nanoseconds)."""
+
+    __slots__ = ("_samples", "_index", "count", "last")
+
+    def __init__(self, size: int = SAMPLES):
+        self._samples = [0] * size
+        self._index = 0
+        self.count = 0
+        self.last = 0
+
+    def record(self, duration_ns: int) -> None:
+        self._samples[self._index] = duration_ns
+        self._index = (self._index + 1) % len(self._samples)
+        self.count += 1
+        self.last = duration_ns
+
+    def percentile(self, fraction: float) -> float:
+        """Percentile of the recent samples in milliseconds (0 if none)."""
+        samples = sorted(self._samples[:self.count] if self.count < len(self._samples) else self._samples)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))] / 1e6
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "last_ms": round(self.last / 1e6, 3),
+            "draws": self.count,
+        }
+
+
+class DrawProfiler:
+    """Times element draws and enforces the per-frame draw budget."""
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, degrade: bool = False):
+        self.budget_ms = budget_ms
+        self.degrade = degrade
+        self.frame = DrawStats()
+        self._elements: Dict[str, DrawStats] = {}
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._consecutive = 0
+        self._last_warning: Optional[float] = None
+        self.over_budget_frames = 0
+        self.last_event: Optional[Dict[str, Any]] = None
+
+    def draw(self, elements, context, timestamp: int) -> None:
+        """Draw the visible elements in order, timing each one."""
+        stats = self._elements
+        clock = time.perf_counter_ns
+        total = 0
+        for element in elements:
+            if not element.visible:
+                continue
+            start = clock()
+            try:
+                element.draw(context, timestamp)
+            except Exception as e:
+                logger.error(f"Error drawing element {element.element_id}: {e}")
+            duration = clock() - start
+            total += duration
+            element_stats = stats.get(element.element_id)
+            if element_stats is None:
+                element_stats = stats[element.element_id] = DrawStats()
+            element_stats.record(duration)
+        self.end_frame(total, elements)
+
+    def end_frame(self, total_ns: int, elements) -> None:
+        """Record a frame's total draw time and act on sustained overruns."""
+        self.frame.record(total_ns)
+        if total_ns <= self.budget_ms * 1e6:
+            self._consecutive = 0
+            return
+        self.over_budget_frames += 1
+        _OVER_BUDGET.inc()
+        self._consecutive += 1
+        if self._consecutive >= OVER_BUDGET_FRAMES:
+            self._consecutive = 0
+            self._over_budget(total_ns, elements)
+
+    def _over_budget(self, total_ns: int, elements) -> None:
+        offenders = sorted(
+            (e for e in elements if e.visible and e.element_id in self._elements),
+            key=lambda e: self._elements[e.element_id].percentile(0.5),
+            reverse=True,
+        )
+        degraded = None
+        if self.degrade:
+            for element in offenders:
+                if not element.degraded:
+                    element.degrade()
+                    degraded = element.element_id
+                    _DEGRADED.inc()
+                    break
+
+        now = time.monotonic()
+        if degraded is None and self._last_warning is not None and now - self._last_warning < WARNING_INTERVAL:
+            return
+        self._last_warning = now
+        event = {
+            "event": "graphics_over_budget",
+            "frame_ms": round(total_ns / 1e6, 3),
+            "budget_ms": self.budget_ms,
+            "elements": [
+                {"element_id": e.element_id, **self._elements[e.element_id].get_status()} for e in offenders[:3]
+            ],
+            "degraded": degraded,
+        }
+        self.last_event = event
+        slowest = ", ".join(f"{e['element_id']} ({e['p50_ms']} ms)" for e in event["elements"])
+        logger.warning(
+            f"Graphics draw over budget: {event['frame_ms']} ms > {self.budget_ms} ms, slowest: {slowest}"
+            + (f"; degraded {degraded}" if degraded else "")
+        )
+        for callback in list(self._listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"Draw budget listener failed: {e}")
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback(event) on over-budget events (from the streaming thread: keep it quick)."""
+        self._listeners.append(callback)
+
+    def element_status(self, element_id: str) -> Optional[Dict[str, Any]]:
+        stats = self._elements.get(element_id)
+        return stats.get_status() if stats else None
+
+    def forget(self, element_id: Optional[str] = None) -> None:
+        """Drop the stats of a removed element (all elements if None)."""
+        if element_id is None:
+            self._elements = {}
+        else:
+            self._elements.pop(element_id, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "budget_ms": self.budget_ms,
+            "degrade": self.degrade,
+            "frame": self.frame.get_status(),
+            "over_budget_frames": self.over_budget_frames,
+            "last_event": self.last_event,
+        }
@@ -0,0 +1,181 @@
+"""Text layout for Cairo graphics elements.
+
+Text is shaped with PangoCairo (proper kerning, font fallback for non-Latin
+scripts, exact extents) once per content change: layouts are cached by
+(text, family, bold, size), so measuring a ticker or re-rendering a timer
+digit reuses the shaped layout instead of resolving fonts again. Elements
+draw text only when they re-render their cached surface (see
+GraphicsElement._get_surface), so per frame there is no text work at all.
+
+Without the Pango GObject bindings, Cairo's toy text API is used instead
+(same interface, Latin-only shaping).
+"""
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAMILY = "Sans"
+MAX_LAYOUTS = 256
+
+_pango = None  # (Pango, PangoCairo) once loaded, False if unavailable
+_pango_lock = threading.Lock()
+
+
+def _load_pango():
+    """Import Pango/PangoCairo on first use (None if not installed)."""
+    global _pango
+    with _pango_lock:
+        if _pango is None:
+            try:
+                import gi
+                gi.require_version("Pango", "1.0")
+                gi.require_version("PangoCairo", "1.0")
+                from gi.repository import Pango, PangoCairo
+                _pango = (Pango, PangoCairo)
+            except (ImportError, ValueError) as e:
+                logger.warning(f"PangoCairo not available, using Cairo toy text: {e}")
+                _pango = False
+        return _pango or None
+
+
+@dataclass(frozen=True)
+class TextKey:
+    text: str
+    family: str
+    bold: bool
+    size: float  # Pixels (matches Cairo's set_font_size)
+
+
+@dataclass
+class TextLayout:
+    """A shaped piece of text and its logical extents in pixels."""
+    key: TextKey
+    width: float  # Logical width (advance), use for positioning and looping
+    height: float  # Logical line height
+    baseline: float  # Distance from the top of the layout to the baseline
+    layout: Any = None  # Pango.Layout (None with the toy text fallback)
+
+
+class TextLayoutCache:
+    """LRU of shaped text layouts."""
+
+    def __init__(self, max_layouts: int = MAX_LAYOUTS):
+        self.max_layouts = max_layouts
+        self._layouts: "OrderedDict[TextKey, TextLayout]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pango_context = None
+        self._scratch = None  # Cairo context for toy text measurement
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, size: float, bold: bool = True, family: str = DEFAULT_FAMILY) -> TextLayout:
+        """Shaped layout for text (cached)."""
+        key = TextKey(text, family, bold, float(size))
+        with self._lock:
+            layout = self._layouts.get(key)
+            if layout:
+                self._layouts.move_to_end(key)
+                self.hits += 1
+                return layout
+            self.misses += 1
+            layout = self._create(key)
+            self._layouts[key] = layout
+            if len(self._layouts) > self.max_layouts:
+                self._layouts.popitem(last=False)
+            return layout
+
+    def measure(self, text: str, size: float, bold: bool = True, family: str = DEFAULT_FAMILY) -> Tuple[float, float]:
+        """Logical (width, height) of text in pixels."""
+        layout = self.get(text, size, bold, family)
+        return layout.width, layout.height
+
+    def show(
+        self,
+        context,
+        text: str,
+        size: float,
+        x: float,
+        baseline_y: float,
+        bold: bool = True,
+        family: str = DEFAULT_FAMILY,
+    ) -> float:
+        """Draw text with its baseline at (x, baseline_y) in the current source.
+
+        Returns:
+            The text's logical width
+        """
+        layout = self.get(text, size, bold, family)
+        pango = _load_pango()
+        if layout.layout is not None and pango:
+            _, PangoCairo = pango
+            context.move_to(x, baseline_y - layout.baseline)
+            PangoCairo.update_layout(context, layout.layout)
+            PangoCairo.show_layout(context, layout.layout)
+        else:
+            self._set_toy_font(context, layout.key)
+            context.move_to(x, baseline_y)
+            context.show_text(text)
+        return layout.width
+
+    def _create(self, key: TextKey) -> TextLayout:
+        pango = _load_pango()
+        if pango:
+            Pango, PangoCairo = pango
+            if self._pango_context is None:
+                self._pango_context = PangoCairo.FontMap.get_default().create_context()
+            layout = Pango.Layout.new(self._pango_context)
+            font = Pango.FontDescription.from_string(f"{key.family} {'Bold' if key.bold else ''}".strip())
+            font.set_absolute_size(key.size * Pango.SCALE)
+            layout.set_font_description(font)
+            layout.set_text(key.text, -1)
+            _, logical = layout.get_pixel_extents()
+            return TextLayout(
+                key=key,
+                width=float(logical.width),
+                height=float(logical.height),
+                baseline=layout.get_baseline() / Pango.SCALE,
+                layout=layout,
+            )
+
+        import cairo
+        if self._scratch is None:
+            self._scratch = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        self._set_toy_font(self._scratch, key)
+        ascent, descent, line_height, _, _ = self._scratch.font_extents()
+        return TextLayout(
+            key=key,
+            width=self._scratch.text_extents(key.text).x_advance,
+            height=line_height,
+            baseline=ascent,
+        )
+
+    @staticmethod
+    def _set_toy_font(context, key: TextKey) -> None:
+        import cairo
+        weight = cairo.FONT_WEIGHT_BOLD if key.bold else cairo.FONT_WEIGHT_NORMAL
+        context.select_font_face(key.family, cairo.FONT_SLANT_NORMAL, weight)
+        context.set_font_size(key.size)
+
+    def get_status(self):
+        with self._lock:
+            return {
+                "engine": "pango" if _pango else ("cairo" if _pango is False else None),
+                "layouts": len(self._layouts),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_text_layouts: Optional[TextLayoutCache] = None
+
+
+def get_text_layouts() -> TextLayoutCache:
+    """Get the shared text layout cache."""
+    global _text_layouts
+    if _text_layouts is None:
+        _text_layouts = TextLayoutCache()
+    return _text_layouts
@@ -0,0 +1,237 @@
+"""Keyframe timelines for Cairo graphics elements.
+
+A Timeline is a set of tracks, one per animated property, each a list of
+keyframes (time in seconds, value, easing of the segment to the next
+keyframe). Values are numbers or tuples (e.g. RGB colors, interpolated per
+component). Timelines are started and evaluated with the pipeline timestamp
+of the frame (see CairoGraphicsManager.begin_frame), never wall-clock time.
+
+Element properties understood by GraphicsElement:
+- x, y: offset in pixels from the element's position
+- scale: scale factor around the element's center
+- alpha: opacity multiplier
+- any other attribute of the element (e.g. bg_color), set on the element
+  while the track runs (re-rendering its cached surface when it changes)
+
+Easing curves are sampled into lookup tables when this module is loaded,
+so evaluating a keyframe segment is a table lookup, not a curve function.
+Elements with no running timeline are not evaluated at all (see
+GraphicsElement.advance).
+
+Timelines can be declared as data, e.g. from the API:
+
+    Timeline.from_dict({
+        "duration": 0.6,
+        "tracks": {
+            "x": [[0, -400, "ease_out_cubic"], [0.6, 0]],
+            "alpha": [[0, 0], [0.3, 1]],
+        },
+    })
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from .animations import (
+    ease_in_cubic,
+    ease_in_out_cubic,
+    ease_in_out_sine,
+    ease_out_bounce,
+    ease_out_cubic,
+    timestamp_to_seconds,
+)
+
+Value = Union[float, Tuple[float, ...]]
+
+EASING_SAMPLES = 1024
+
+EASING_FUNCTIONS = {
+    "linear": lambda t: t,
+    "ease_in_cubic": ease_in_cubic,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_cubic": ease_in_out_cubic,
+    "ease_in_out_sine": ease_in_out_sine,
+    "ease_out_bounce": ease_out_bounce,
+}
+
+
+class EasingTable:
+    """An easing curve sampled at EASING_SAMPLES points (linear in between)."""
+
+    __slots__ = ("name", "_samples", "_scale")
+
+    def __init__(self, name: str, samples: int = EASING_SAMPLES):
+        function = EASING_FUNCTIONS[name]
+        self.name = name
+        self._samples = [function(i / (samples - 1)) for i in range(samples)]
+        self._scale = samples - 1
+
+    def __call__(self, t: float) -> float:
+        if t <= 0.0:
+            return self._samples[0]
+        if t >= 1.0:
+            return self._samples[self._scale]
+        position = t * self._scale
+        index = int(position)
+        low = self._samples[index]
+        return low + (self._samples[index + 1] - low) * (position - index)
+
+
+EASINGS: Dict[str, EasingTable] = {name: EasingTable(name) for name in EASING_FUNCTIONS}
+
+
+def get_easing(name: str) -> EasingTable:
+    """Get a precomputed easing table (ValueError for unknown names)."""
+    try:
+        return EASINGS[name]
+    except KeyError:
+        raise ValueError(f"Unknown easing '{name}', expected one of {sorted(EASINGS)}")
+
+
+def _interpolate(start: Value, end: Value, t: float) -> Value:
+    if isinstance(start, tuple):
+        return tuple(a + (b - a) * t for a, b in zip(start, end))
+    return start + (end - start) * t
+
+
+@dataclass
+class Keyframe:
+    time: float  # Seconds from the start of the timeline
+    value: Value
+    easing: str = "linear"  # Curve of the segment from this keyframe to the next
+
+
+class Track:
+    """Keyframes of one property."""
+
+    def __init__(self, keyframes: Sequence[Keyframe]):
+        if not keyframes:
+            raise ValueError("A track needs at least one keyframe")
+        self.keyframes = sorted(keyframes, key=lambda k: k.time)
+        self._times = [k.time for k in self.keyframes]
+        self._easings = [get_easing(k.easing) for k in self.keyframes]
+
+    @property
+    def duration(self) -> float:
+        return self._times[-1]
+
+    def value_at(self, t: float) -> Value:
+        index = bisect_right(self._times, t) - 1
+        if index < 0:
+            return self.keyframes[0].value
+        if index >= len(self.keyframes) - 1:
+            return self.keyframes[-1].value
+        start, end = self.keyframes[index], self.keyframes[index + 1]
+        progress = (t - start.time) / (end.time - start.time)
+        return _interpolate(start.value, end.value, self._easings[index](progress))
+
+    def extent(self) -> Tuple[float, float]:
+        """Smallest and largest keyframe value (numeric tracks)."""
+        values = [k.value for k in self.keyframes]
+        return min(values), max(values)
+
+
+@dataclass
+class Timeline:
+    """Tracks of keyframes, run from start(timestamp)."""
+    tracks: Dict[str, Track]
+    loop: bool = False
+    duration: Optional[float] = None  # Defaults to the longest track
+    start_time: Optional[int] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        if self.duration is None:
+            self.duration = max((track.duration for track in self.tracks.values()), default=0.0)
+
+    def start(self, timestamp: int) -> None:
+        self.start_time = timestamp
+
+    def _since_start(self, timestamp: int) -> float:
+        if timestamp < self.start_time:
+            # Timestamps went back (pipeline restarted): run from this frame
+            self.start_time = timestamp
+        return timestamp_to_seconds(timestamp - self.start_time)
+
+    def elapsed(self, timestamp: int) -> float:
+        if self.start_time is None:
+            return 0.0
+        elapsed = self._since_start(timestamp)
+        if self.loop and self.duration > 0:
+            return elapsed % self.duration
+        return elapsed
+
+    def finished(self, timestamp: int) -> bool:
+        """Whether a non-looping timeline has reached its end."""
+        if self.loop or self.start_time is None:
+            return False
+        return self._since_start(timestamp) >= self.duration
+
+    def evaluate(self, timestamp: int) -> Dict[str, Value]:
+        t = self.elapsed(timestamp)
+        return {name: track.value_at(t) for name, track in self.tracks.items()}
+
+    def final_values(self) -> Dict[str, Value]:
+        return {name: track.keyframes[-1].value for name, track in self.tracks.items()}
+
+    def extent(self, name: str, default: float) -> Tuple[float, float]:
+        """Value range of a numeric track (default if the timeline has none)."""
+        track = self.tracks.get(name)
+        return track.extent() if track else (default, default)
+
+    def copy(self) -> "Timeline":
+        """Same tracks with its own start time (tracks are immutable)."""
+        return Timeline(self.tracks, loop=self.loop, duration=self.duration)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Timeline":
+        """Build from {"duration"?, "loop"?, "tracks": {prop: [[time, value, easing?], ...]}}."""
+        tracks = {}
+        for name, keyframes in data.get("tracks", {}).items():
+            frames = []
+            for keyframe in keyframes:
+                time, value = keyframe[0], keyframe[1]
+                easing = keyframe[2] if len(keyframe) > 2 else "linear"
+                frames.append(Keyframe(float(time), tuple(value) if isinstance(value, list) else float(value), easing))
+            tracks[name] = Track(frames)
+        return cls(tracks, loop=bool(data.get("loop", False)), duration=data.get("duration"))
+
+
+def slide_in(distance: float, duration: float, easing: str = "ease_in_out_cubic") -> Timeline:
+    """Slide in from `distance` pixels left of the position while fading in."""
+    return Timeline({
+        "x": Track([Keyframe(0.0, -distance, easing), Keyframe(duration, 0.0)]),
+        "alpha": Track([Keyframe(0.0, 0.0, easing), Keyframe(duration, 1.0)]),
+    })
+
+
+def slide_out(distance: float, duration: float, easing: str = "ease_in_out_cubic") -> Timeline:
+    """Slide out to `distance` pixels left of the position while fading out."""
+    return Timeline({
+        "x": Track([Keyframe(0.0, 0.0, easing), Keyframe(duration, -distance)]),
+        "alpha": Track([Keyframe(0.0, 1.0, easing), Keyframe(duration, 0.0)]),
+    })
+
+
+def pulse(scale_min: float, scale_max: float, period: float) -> Timeline:
+    """Endless sinusoidal scale pulse between scale_min and scale_max."""
+    half = period / 2
+    return Timeline({
+        "scale": Track([
+            Keyframe(0.0, scale_min, "ease_in_out_sine"),
+            Keyframe(half, scale_max, "ease_in_out_sine"),
+            Keyframe(period, scale_min),
+        ]),
+    }, loop=True)
+
+
+def timelines_from_request(data: Dict[str, Any]) -> Dict[str, Optional[Timeline]]:
+    """Parse {"enter"|"exit"|"loop": timeline dict or None} (ValueError if invalid)."""
+    result: Dict[str, Optional[Timeline]] = {}
+    for phase in ("enter", "exit", "loop"):
+        if phase in data:
+            try:
+                result[phase] = Timeline.from_dict(data[phase]) if data[phase] else None
+            except (AttributeError, KeyError, IndexError, TypeError) as e:
+                raise ValueError(f"Invalid {phase} timeline: {e}")
+    return result
+
@@ -42,6 +42,9 @@ class GraphicsConfig:
     enabled: bool = True
     templates_dir: str = "graphics_templates"
     output_dir: str = "/tmp/graphics_output"
+    cairo_draw_budget_ms: float = 4.0  # Per-frame draw time for all Cairo overlays
+    cairo_degrade_over_budget: bool = False  # Freeze animations of the slowest overlay when over budget
+    prerender_workers: int = 1  # Parallel offline renders of HTML templates (one browser each)
 
 
 @dataclass
@@ -56,6 +59,20 @@ class MixerConfig:
     mediamtx_enabled: bool = True
     mediamtx_path: str = "mixer_program"
     scenes_dir: str = "scenes"
+    local_frames: bool = False  # Raw in-process frames from ingest (intervideo), opt-in; RTSP otherwise
+    clip_cache_mb: int = 512  # RAM budget for pre-decoded stingers, loops and stills
+    clip_cache_max_seconds: float = 15.0  # Longer videos stream from disk
+    compositor_backend: str = "auto"  # "auto" (benchmark at startup), "software" or "gl"
+    compositor_benchmark_file: str = "compositor_benchmark.json"  # Saved "auto" benchmark result
+    preview_enabled: bool = False  # Second compositor bus for the staged scene
+    preview_resolution: str = "640x360"
+    preview_bitrate: int = 800  # kbps
+    preview_path: str = "mixer_preview"
+    multiview_enabled: bool = False  # Program/preview/camera grid published as one stream
+    multiview_resolution: str = "960x540"
+    multiview_fps: int = 15
+    multiview_bitrate: int = 1500  # kbps
+    multiview_path: str = "multiview"
 
 
 @dataclass
@@ -99,6 +116,9 @@ class RevealConfig:
     mediamtx_path: str = "slides"  # Default path (backward compat)
     renderer: str = "auto"  # auto, wpe, chromium
     outputs: list = field(default_factory=lambda: ["slides", "slides_overlay"])
+    prerender_slides: bool = False  # Serve static slides from pre-rendered stills
+    variable_framerate: bool = True  # Encode rendered frames only when the page changes
+    output_resolutions: dict = field(default_factory=dict)  # output_id -> "WxH" (default: resolution)
 
 
 @dataclass
@@ -125,6 +145,13 @@ class WordPressConfig:
     app_password: str = ""
 
 
+@dataclass
+class LatencyTracingConfig:
+    """Request latency tracing and event-loop stall sampling."""
+    enabled: bool = True
+    slow_threshold_ms: float = 250.0  # Loop stall that triggers a stack sample
+
+
 @dataclass
 class AppConfig:
     """Main application configuration."""
@@ -140,6 +167,7 @@ class AppConfig:
     reveal: RevealConfig = field(default_factory=RevealConfig)
     davinci_automation: DavinciAutomationConfig = field(default_factory=DavinciAutomationConfig)
     wordpress: WordPressConfig = field(default_factory=WordPressConfig)
+    latency_tracing: LatencyTracingConfig = field(default_factory=LatencyTracingConfig)
     external_cameras: list = field(default_factory=list)
     log_level: str = "INFO"
 
@@ -184,6 +212,9 @@ class AppConfig:
             enabled=graphics_data.get("enabled", True),
             templates_dir=graphics_data.get("templates_dir", "graphics_templates"),
             output_dir=graphics_data.get("output_dir", "/tmp/graphics_output"),
+            cairo_draw_budget_ms=graphics_data.get("cairo_draw_budget_ms", 4.0),
+            cairo_degrade_over_budget=graphics_data.get("cairo_degrade_over_budget", False),
+            prerender_workers=graphics_data.get("prerender_workers", 1),
         )
 
         # Load Mixer config
@@ -198,6 +229,20 @@ class AppConfig:
             mediamtx_enabled=mixer_data.get("mediamtx_enabled", True),
             mediamtx_path=mixer_data.get("mediamtx_path", "mixer_program"),
             scenes_dir=mixer_data.get("scenes_dir", "scenes"),
+            local_frames=mixer_data.get("local_frames", False),
+            clip_cache_mb=mixer_data.get("clip_cache_mb", 512),
+            clip_cache_max_seconds=mixer_data.get("clip_cache_max_seconds", 15.0),
+            compositor_backend=mixer_data.get("compositor_backend", "auto"),
+            compositor_benchmark_file=mixer_data.get("compositor_benchmark_file", "compositor_benchmark.json"),
+            preview_enabled=mixer_data.get("preview_enabled", False),
+            preview_resolution=mixer_data.get("preview_resolution", "640x360"),
+            preview_bitrate=mixer_data.get("preview_bitrate", 800),
+            preview_path=mixer_data.get("preview_path", "mixer_preview"),
+            multiview_enabled=mixer_data.get("multiview_enabled", False),
+            multiview_resolution=mixer_data.get("multiview_resolution", "960x540"),
+            multiview_fps=mixer_data.get("multiview_fps", 15),
+            multiview_bitrate=mixer_data.get("multiview_bitrate", 1500),
+            multiview_path=mixer_data.get("multiview_path", "multiview"),
         )
 
         # Load cameras
@@ -249,6 +294,9 @@ class AppConfig:
             mediamtx_path=reveal_data.get("mediamtx_path", "slides"),
             renderer=reveal_data.get("renderer", "auto"),
             outputs=reveal_data.get("outputs", default_outputs),
+            prerender_slides=reveal_data.get("prerender_slides", False),
+            variable_framerate=reveal_data.get("variable_framerate", True),
+            output_resolutions=reveal_data.get("output_resolutions") or {},
         )
         
         # Load external cameras
@@ -278,6 +326,13 @@ class AppConfig:
             app_password=wordpress_data.get("app_password", "") or os.environ.get("WORDPRESS_APP_PASSWORD", ""),
         )
 
+        # Load latency tracing config
+        tracing_data = data.get("latency_tracing", {})
+        latency_tracing = LatencyTracingConfig(
+            enabled=tracing_data.get("enabled", True),
+            slow_threshold_ms=tracing_data.get("slow_threshold_ms", 250.0),
+        )
+
         return cls(
             platform=platform_name,
             cameras=cameras,
@@ -291,6 +346,7 @@ class AppConfig:
             wordpress=wordpress,
             reveal=reveal,
             davinci_automation=davinci_automation,
+            latency_tracing=latency_tracing,
             external_cameras=external_cameras,
             log_level=data.get("log_level", "INFO"),
         )
@@ -0,0 +1,130 @@
+"""Damage-driven frame gating for rendered (browser) sources.
+
+A rendered source such as wpesrc produces frames at the full framerate
+whether or not anything on the page changed, and every frame is converted
+and encoded. DamageGate sits on the raw frames right after the renderer
+and passes a frame downstream only when:
+
+- its content differs from the last frame passed (checksum of the frame
+  data; adler32 over a 1080p BGRA frame takes a few milliseconds), or
+- KEEPALIVE_INTERVAL passed since the last frame, so receivers keep a
+  live stream.
+
+Every KEYFRAME_INTERVAL (at the next frame passed), a GstForceKeyUnit
+event is sent ahead of the frame, so a subscriber joining a static
+stream gets a keyframe within that interval even though the encoder sees
+only a keep-alive frame or two per second. Encoders fed by the gate
+should use a long GOP and leave keyframe placement to it.
+
+Usage:
+    gate = DamageGate()
+    gate.attach(pipeline.get_by_name("damage"))  # identity after the renderer
+"""
+import logging
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .gst_utils import get_gst
+    from .metrics import get_metrics_registry
+except ImportError:
+    # Fallback for direct execution
+    from gst_utils import get_gst
+    from metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_registry = get_metrics_registry()
+_DROPPED = _registry.counter("r58_damage_frames_dropped", "Unchanged rendered frames not passed to the encoder")
+_FORCED_KEYFRAMES = _registry.counter("r58_damage_forced_keyframes", "Keyframes requested by damage gates")
+
+KEEPALIVE_INTERVAL = 1.0  # seconds between frames while the content is static
+KEYFRAME_INTERVAL = 2.0  # seconds between forced keyframes
+
+
+def force_key_unit_event():
+    """Downstream GstForceKeyUnit event (handled by GstVideoEncoder-based encoders)."""
+    Gst = get_gst()
+    structure = Gst.Structure.new_from_string("GstForceKeyUnit, all-headers=(boolean)true, count=(uint)0")
+    return Gst.Event.new_custom(Gst.EventType.CUSTOM_DOWNSTREAM, structure)
+
+
+class DamageGate:
+    """Drops unchanged frames and schedules keyframes for a rendered source."""
+
+    def __init__(self, keepalive: float = KEEPALIVE_INTERVAL, keyframe_interval: float = KEYFRAME_INTERVAL):
+        self.keepalive = keepalive
+        self.keyframe_interval = keyframe_interval
+        self._checksum: Optional[int] = None
+        self._last_push: Optional[float] = None
+        self._last_keyframe: Optional[float] = None
+        self.passed = 0
+        self.dropped = 0
+        self.keyframes = 0
+
+    def check(self, checksum: Optional[int], now: float) -> Tuple[bool, bool]:
+        """Decide on a frame.
+
+        Args:
+            checksum: Frame content checksum (None: unknown, treated as changed)
+            now: Monotonic time in seconds
+
+        Returns:
+            (pass the frame, force a keyframe before it)
+        """
+        changed = checksum is None or checksum != self._checksum
+        if not changed and self._last_push is not None and now - self._last_push < self.keepalive:
+            self.dropped += 1
+            return False, False
+        self._checksum = checksum
+        self._last_push = now
+        self.passed += 1
+        keyframe = self._last_keyframe is None or now - self._last_keyframe >= self.keyframe_interval
+        if keyframe:
+            self._last_keyframe = now
+            self.keyframes += 1
+        return True, keyframe
+
+    def request_keyframe(self) -> None:
+        """Force a keyframe at the next frame passed (e.g. for a new subscriber)."""
+        self._last_keyframe = None
+        self._last_push = None  # Pass the next frame even if unchanged
+
+    def attach(self, element) -> bool:
+        """Gate the frames leaving an element's src pad (e.g. an identity after the renderer)."""
+        pad = element.get_static_pad("src") if element else None
+        if not pad:
+            logger.warning("Damage gate element not found, passing every frame")
+            return False
+        pad.add_probe(get_gst().PadProbeType.BUFFER, self._on_buffer)
+        return True
+
+    def _on_buffer(self, pad, info):
+        Gst = get_gst()
+        buffer = info.get_buffer()
+        checksum = None
+        if buffer:
+            ok, mapinfo = buffer.map(Gst.MapFlags.READ)
+            if ok:
+                try:
+                    checksum = zlib.adler32(mapinfo.data)
+                finally:
+                    buffer.unmap(mapinfo)
+        push, keyframe = self.check(checksum, time.monotonic())
+        if not push:
+            _DROPPED.inc()
+            return Gst.PadProbeReturn.DROP
+        if keyframe:
+            _FORCED_KEYFRAMES.inc()
+            pad.push_event(force_key_unit_event())
+        return Gst.PadProbeReturn.OK
+
+    def get_status(self) -> Dict[str, Any]:
+        total = self.passed + self.dropped
+        return {
+            "passed": self.passed,
+            "dropped": self.dropped,
+            "keyframes": self.keyframes,
+            "pass_ratio": round(self.passed / total, 3) if total else None,
+        }
@@ -8,6 +8,24 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Columns added to file_metadata after the initial schema
+FILE_METADATA_MIGRATIONS = [
+    ("content_hash", "TEXT"),
+    ("container", "TEXT"),
+    ("video_codec", "TEXT"),
+    ("audio_codec", "TEXT"),
+    ("framerate", "REAL"),
+    ("keyframe_interval", "REAL"),
+    ("thumbnail_path", "TEXT"),
+    ("probe_status", "TEXT"),
+]
+
+# Columns written by the media probe
+FILE_PROBE_COLUMNS = [
+    "duration", "width", "height", "framerate", "container",
+    "video_codec", "audio_codec", "keyframe_interval", "thumbnail_path", "probe_status",
+]
+
 
 class Database:
     """SQLite database manager for scenes, queue, and file metadata."""
@@ -81,6 +99,17 @@ class Database:
                 )
             """)
             
+            # Content hash and probed media info (migration)
+            for column, column_type in FILE_METADATA_MIGRATIONS:
+                try:
+                    cursor.execute(f"ALTER TABLE file_metadata ADD COLUMN {column} {column_type}")
+                except sqlite3.OperationalError:
+                    pass  # Column likely already exists
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_file_metadata_content_hash
+                ON file_metadata (content_hash)
+            """)
+            
             conn.commit()
             logger.info("Database initialized")
         except Exception as e:
@@ -291,6 +320,29 @@ class Database:
             conn.close()
     
     # File metadata methods
+    @staticmethod
+    def _file_row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a file_metadata row to a metadata dictionary."""
+        return {
+            "id": row["id"],
+            "file_path": row["file_path"],
+            "file_type": row["file_type"],
+            "duration": row["duration"],
+            "width": row["width"],
+            "height": row["height"],
+            "framerate": row["framerate"],
+            "container": row["container"],
+            "video_codec": row["video_codec"],
+            "audio_codec": row["audio_codec"],
+            "keyframe_interval": row["keyframe_interval"],
+            "thumbnail_path": row["thumbnail_path"],
+            "probe_status": row["probe_status"],
+            "loop": bool(row["loop"]),
+            "size_bytes": row["size_bytes"],
+            "content_hash": row["content_hash"],
+            "created_at": row["created_at"]
+        }
+    
     def save_file_metadata(self, file_id: str, metadata: Dict[str, Any]) -> bool:
         """Save file metadata."""
         conn = self._get_connection()
@@ -298,8 +350,9 @@ class Database:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO file_metadata 
-                (id, file_path, file_type, duration, width, height, loop, size_bytes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (id, file_path, file_type, duration, width, height, loop, size_bytes,
+                 content_hash, probe_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 file_id,
                 metadata["file_path"],
@@ -308,7 +361,9 @@ class Database:
                 metadata.get("width"),
                 metadata.get("height"),
                 1 if metadata.get("loop", False) else 0,
-                metadata.get("size_bytes")
+                metadata.get("size_bytes"),
+                metadata.get("content_hash"),
+                metadata.get("probe_status")
             ))
             conn.commit()
             return True
@@ -329,19 +384,34 @@ class Database:
             if not row:
                 return None
             
-            return {
-                "id": row["id"],
-                "file_path": row["file_path"],
-                "file_type": row["file_type"],
-                "duration": row["duration"],
-                "width": row["width"],
-                "height": row["height"],
-                "loop": bool(row["loop"]),
-                "size_bytes": row["size_bytes"],
-                "created_at": row["created_at"]
-            }
+            return self._file_row_to_dict(row)
+        finally:
+            conn.close()
+    
+    def find_file_by_path(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Find file metadata by stored file path."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM file_metadata WHERE file_path = ?", (file_path,))
+            row = cursor.fetchone()
+            return self._file_row_to_dict(row) if row else None
+        finally:
+            conn.close()
+    
+    def find_file_by_hash(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Find file metadata by content hash (for upload deduplication)."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id FROM file_metadata WHERE content_hash = ? ORDER BY created_at LIMIT 1",
+                (content_hash,)
+            )
+            row = cursor.fetchone()
         finally:
             conn.close()
+        return self.get_file_metadata(row["id"]) if row else None
     
     def list_files(self) -> List[Dict[str, Any]]:
         """List all file metadata."""
@@ -349,20 +419,7 @@ class Database:
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM file_metadata ORDER BY created_at DESC")
-            return [
-                {
-                    "id": row["id"],
-                    "file_path": row["file_path"],
-                    "file_type": row["file_type"],
-                    "duration": row["duration"],
-                    "width": row["width"],
-                    "height": row["height"],
-                    "loop": bool(row["loop"]),
-                    "size_bytes": row["size_bytes"],
-                    "created_at": row["created_at"]
-                }
-                for row in cursor.fetchall()
-            ]
+            return [self._file_row_to_dict(row) for row in cursor.fetchall()]
         finally:
             conn.close()
     
@@ -409,4 +466,26 @@ class Database:
             return False
         finally:
             conn.close()
+    
+    def update_file_probe(self, file_id: str, probe: Dict[str, Any]) -> bool:
+        """Store media probe results (duration, resolution, codecs, thumbnail)."""
+        columns = [c for c in FILE_PROBE_COLUMNS if c in probe]
+        if not columns:
+            return True
+        
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"UPDATE file_metadata SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                [probe[c] for c in columns] + [file_id]
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Failed to update file probe data: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
 
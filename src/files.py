@@ -1,36 +1,363 @@
-"""File management for uploaded videos and images."""
+"""File management for uploaded videos and images.
+
+Uploads are streamed to a temp file next to their destination in fixed-size
+chunks, hashed while streaming, deduplicated by content hash and then moved
+into place with an atomic rename, so a multi-GB loop video never has to fit
+in RAM and a half-written file is never visible under its final name.
+
+MultipartFileReader parses a multipart/form-data request body as it
+arrives, so the file part goes straight from the socket into
+stream_to_temp instead of being spooled to a temp file by the framework
+first.
+"""
+import asyncio
+import hashlib
+import io
 import logging
+import os
+import tempfile
+import threading
+import time
 import uuid
 import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import BinaryIO, Dict, List, Optional, Any, Tuple
 import mimetypes
 
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:
+    # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
 logger = logging.getLogger(__name__)
 
 # Supported file types
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".mov", ".avi", ".webm"}
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp"}
 
+# Streaming upload settings
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+DEFAULT_MAX_UPLOAD_BYTES = 4 * 1024 ** 3  # 4 GiB
+UPLOAD_PROGRESS_TTL = 600  # Keep finished upload progress for 10 minutes
+UPLOAD_QUEUE_CHUNKS = 16  # Body chunks buffered between the request and the writer thread
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+@dataclass
+class UploadProgress:
+    """Progress of a single upload being written to the file store."""
+    upload_id: str
+    filename: str
+    total_bytes: Optional[int] = None
+    bytes_written: int = 0
+    status: str = "receiving"  # receiving, complete, deduplicated, failed
+    content_hash: Optional[str] = None
+    error: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        percent = None
+        if self.total_bytes:
+            percent = round(min(100.0, self.bytes_written * 100.0 / self.total_bytes), 1)
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "status": self.status,
+            "bytes_written": self.bytes_written,
+            "total_bytes": self.total_bytes,
+            "percent": percent,
+            "content_hash": self.content_hash,
+            "error": self.error,
+        }
+
+
+def stream_to_temp(
+    stream: BinaryIO,
+    dest_dir: Path,
+    max_bytes: int,
+    progress: Optional[UploadProgress] = None
+) -> Tuple[Path, str, int]:
+    """Copy a stream into a temp file in dest_dir, hashing as it goes.
+    
+    The temp file lives in the destination directory so the final move is
+    an atomic rename on the same filesystem. Blocking; call from a worker
+    thread when serving requests.
+    
+    Args:
+        stream: Readable binary stream
+        dest_dir: Directory the file will end up in
+        max_bytes: Abort once more than this many bytes were read
+        progress: Optional progress record updated per chunk
+    
+    Returns:
+        (temp_path, content_hash, size_bytes)
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=str(dest_dir), prefix=".upload-", suffix=".part")
+    tmp_path = Path(tmp_name)
+    hasher = hashlib.blake2b(digest_size=32)
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"Upload exceeds maximum size of {max_bytes // (1024 * 1024)} MB"
+                    )
+                hasher.update(chunk)
+                out.write(chunk)
+                if progress:
+                    progress.bytes_written = size
+            out.flush()
+            os.fsync(out.fileno())
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, hasher.hexdigest(), size
+
+
+class MultipartFileReader:
+    """Blocking reader over the file part of a multipart/form-data body.
+    
+    The request body is fed in from the event loop (feed/feed_all) and
+    parsed incrementally; the file part's data is handed to a worker thread
+    through a bounded queue, so a slow disk slows the upload down instead
+    of buffering it. read() blocks and must be called off the event loop,
+    e.g. by save_stream in asyncio.to_thread.
+    
+    Usage:
+        reader = MultipartFileReader(request.headers["content-type"])
+        body = request.stream()
+        await reader.read_headers(body)  # reader.filename is set now
+        feeding = asyncio.create_task(reader.feed_all(body))
+        metadata = await asyncio.to_thread(file_manager.save_stream, reader, reader.filename)
+    """
+    
+    def __init__(self, content_type: str, field_name: str = "file"):
+        """Raises ValueError if content_type is not multipart/form-data with a boundary."""
+        mime, options = parse_options_header(content_type)
+        boundary = options.get(b"boundary")
+        if mime != b"multipart/form-data" or not boundary:
+            raise ValueError("Expected a multipart/form-data upload")
+        self.field_name = field_name
+        self.filename: Optional[str] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._parsed: List[bytes] = []  # File data parsed from the current body chunk
+        self._in_file = False
+        self._file_done = False
+        self._buffer = b""
+        self._eof = False
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+    
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+    
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+    
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+    
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+    
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        if self.filename is None and name == self.field_name and filename is not None:
+            self.filename = Path(filename.decode("utf-8", "replace")).name
+            self._in_file = True
+    
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._parsed.append(data[start:end])
+    
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._file_done = True
+    
+    async def feed(self, chunk: bytes) -> None:
+        """Parse a body chunk and queue its file data (waits while the queue is full)."""
+        if self._queue is None:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_CHUNKS)
+        self._parser.write(chunk)
+        parsed, self._parsed = b"".join(self._parsed), []
+        if parsed:
+            await self._queue.put(parsed)
+    
+    async def read_headers(self, body) -> None:
+        """Feed body chunks until the file part starts.
+        
+        Raises:
+            ValueError: If the body ends without a file part
+        """
+        async for chunk in body:
+            await self.feed(chunk)
+            if self.filename is not None:
+                return
+        raise ValueError(f"No '{self.field_name}' file in upload")
+    
+    async def feed_all(self, body) -> None:
+        """Feed the rest of the body, then end the file (errors are raised by read())."""
+        try:
+            async for chunk in body:
+                await self.feed(chunk)
+            self._parser.finalize()
+            if not self._file_done:
+                raise ValueError("Upload ended before the end of the file")
+            await self._queue.put(b"")
+        except asyncio.CancelledError:
+            self.abort(ConnectionError("Upload cancelled"))
+            raise
+        except Exception as e:
+            await self._queue.put(e)
+    
+    def abort(self, error: Exception) -> None:
+        """End the file with an error without waiting (queued data is dropped).
+        
+        Wakes up a read() blocked on the queue, so the worker thread raises
+        and removes its temporary file instead of waiting forever.
+        """
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(error)
+    
+    def read(self, size: int = -1) -> bytes:
+        """Next chunk of file data, b"" at the end (blocking; call from a worker thread)."""
+        if not self._buffer and not self._eof:
+            item = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop).result()
+            if isinstance(item, Exception):
+                raise item
+            self._buffer = item
+            self._eof = not item
+        if size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
 
 class FileManager:
     """Manages uploaded video and image files."""
     
-    def __init__(self, uploads_dir: str = "uploads", database=None):
+    def __init__(
+        self,
+        uploads_dir: str = "uploads",
+        database=None,
+        max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+        media_probe=None
+    ):
         """Initialize file manager.
         
         Args:
             uploads_dir: Base directory for uploads
             database: Database instance for metadata storage
+            max_upload_bytes: Maximum accepted upload size
+            media_probe: Optional MediaProbe that fills in duration/resolution/codecs
         """
         self.uploads_dir = Path(uploads_dir)
         self.videos_dir = self.uploads_dir / "videos"
         self.images_dir = self.uploads_dir / "images"
         self.database = database
+        self.max_upload_bytes = max_upload_bytes
+        self.media_probe = media_probe
+        
+        # Upload progress by upload ID
+        self._uploads: Dict[str, UploadProgress] = {}
+        self._uploads_lock = threading.Lock()
+        # Serializes the hash lookup and insert of finished uploads (deduplication)
+        self._store_lock = threading.Lock()
         
         # Create directories
         self.videos_dir.mkdir(parents=True, exist_ok=True)
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._cleanup_partial_uploads()
+    
+    def _cleanup_partial_uploads(self) -> None:
+        """Remove temp files left behind by interrupted uploads."""
+        for directory in (self.videos_dir, self.images_dir):
+            for tmp_path in directory.glob(".upload-*.part"):
+                try:
+                    tmp_path.unlink()
+                    logger.info(f"Removed partial upload: {tmp_path.name}")
+                except OSError as e:
+                    logger.warning(f"Failed to remove partial upload {tmp_path}: {e}")
+    
+    def _start_progress(
+        self,
+        filename: str,
+        upload_id: Optional[str],
+        total_bytes: Optional[int]
+    ) -> UploadProgress:
+        """Register progress tracking for a new upload."""
+        progress = UploadProgress(
+            upload_id=upload_id or str(uuid.uuid4()),
+            filename=filename,
+            total_bytes=total_bytes
+        )
+        now = time.time()
+        with self._uploads_lock:
+            # Drop finished uploads nobody polled for
+            expired = [
+                uid for uid, p in self._uploads.items()
+                if p.finished_at and now - p.finished_at > UPLOAD_PROGRESS_TTL
+            ]
+            for uid in expired:
+                del self._uploads[uid]
+            self._uploads[progress.upload_id] = progress
+        return progress
+    
+    def get_upload_progress(self, upload_id: str) -> Optional[Dict[str, Any]]:
+        """Get progress of an upload by ID."""
+        with self._uploads_lock:
+            progress = self._uploads.get(upload_id)
+        return progress.to_dict() if progress else None
+    
+    def list_uploads(self) -> List[Dict[str, Any]]:
+        """List progress of recent and in-flight uploads."""
+        with self._uploads_lock:
+            uploads = list(self._uploads.values())
+        return [p.to_dict() for p in uploads]
+    
+    def _check_size(self, total_bytes: Optional[int]) -> None:
+        """Reject uploads whose announced size is already too large."""
+        if total_bytes is not None and total_bytes > self.max_upload_bytes:
+            raise UploadTooLargeError(
+                f"Upload exceeds maximum size of {self.max_upload_bytes // (1024 * 1024)} MB"
+            )
     
     def _get_file_type(self, filename: str) -> Optional[str]:
         """Determine file type from extension."""
@@ -53,7 +380,9 @@ class FileManager:
         return True, None
     
     def save_file(self, file_content: bytes, filename: str, loop: bool = False) -> Dict[str, Any]:
-        """Save uploaded file.
+        """Save uploaded file from an in-memory byte string.
+        
+        Prefer save_stream() for uploads; this wraps it for small payloads.
         
         Args:
             file_content: File content as bytes
@@ -63,47 +392,153 @@ class FileManager:
         Returns:
             File metadata dictionary
         """
+        return self.save_stream(io.BytesIO(file_content), filename, loop=loop,
+                                total_bytes=len(file_content))
+    
+    def save_stream(
+        self,
+        stream: BinaryIO,
+        filename: str,
+        loop: bool = False,
+        upload_id: Optional[str] = None,
+        total_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Save an uploaded file by streaming it to disk.
+        
+        Blocking; run in a worker thread from async handlers. If a file with
+        the same content already exists, the new copy is discarded and the
+        existing metadata is returned with "deduplicated" set.
+        
+        Args:
+            stream: Readable binary stream with the file content
+            filename: Original filename
+            loop: Whether video should loop (for videos only)
+            upload_id: Optional client-chosen ID for progress polling
+            total_bytes: Expected size, if known (for progress and early size check)
+        
+        Returns:
+            File metadata dictionary (includes "upload_id")
+        """
         # Validate file type
         is_valid, error = self._validate_file(filename)
         if not is_valid:
             raise ValueError(error)
+        self._check_size(total_bytes)
         
         file_type = self._get_file_type(filename)
+        save_dir = self.videos_dir if file_type == "video" else self.images_dir
+        progress = self._start_progress(filename, upload_id, total_bytes)
         
-        # Generate unique file ID
-        file_id = str(uuid.uuid4())
-        ext = Path(filename).suffix
+        try:
+            tmp_path, content_hash, size_bytes = stream_to_temp(
+                stream, save_dir, self.max_upload_bytes, progress
+            )
+        except Exception as e:
+            progress.finish("failed", str(e))
+            raise
+        progress.content_hash = content_hash
         
-        # Determine save directory
-        save_dir = self.videos_dir if file_type == "video" else self.images_dir
-        file_path = save_dir / f"{file_id}{ext}"
-        
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-        
-        # Get file metadata
-        size_bytes = len(file_content)
-        
-        # For videos, we'd need to probe with GStreamer to get duration/resolution
-        # For now, we'll set defaults and update later if needed
-        metadata = {
-            "id": file_id,
-            "file_path": str(file_path),
-            "file_type": file_type,
-            "duration": None,  # Will be set when probed
-            "width": None,
-            "height": None,
-            "loop": loop if file_type == "video" else False,
-            "size_bytes": size_bytes
-        }
+        # Lookup and insert under one lock, so two concurrent identical
+        # uploads cannot both miss the hash and both be stored
+        with self._store_lock:
+            try:
+                # Deduplicate against existing files with the same content
+                existing = self.database.find_file_by_hash(content_hash) if self.database else None
+                if existing and Path(existing["file_path"]).exists():
+                    tmp_path.unlink(missing_ok=True)
+                    progress.finish("deduplicated")
+                    logger.info(f"Upload {filename} matches existing file {existing['id']}, reusing it")
+                    return {**existing, "deduplicated": True, "upload_id": progress.upload_id}
+                
+                # Generate unique file ID and move into place atomically
+                file_id = str(uuid.uuid4())
+                ext = Path(filename).suffix
+                file_path = save_dir / f"{file_id}{ext}"
+                os.replace(tmp_path, file_path)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                progress.finish("failed", str(e))
+                raise
+            
+            # Duration/resolution/codecs are filled in by the background media probe
+            metadata = {
+                "id": file_id,
+                "file_path": str(file_path),
+                "file_type": file_type,
+                "duration": None,  # Will be set when probed
+                "width": None,
+                "height": None,
+                "loop": loop if file_type == "video" else False,
+                "size_bytes": size_bytes,
+                "content_hash": content_hash,
+                "probe_status": "pending" if self.media_probe else None
+            }
+            
+            # Save to database if available
+            if self.database:
+                self.database.save_file_metadata(file_id, metadata)
         
-        # Save to database if available
-        if self.database:
-            self.database.save_file_metadata(file_id, metadata)
+        if self.media_probe:
+            self.media_probe.submit(file_id, str(file_path), file_type)
+        
+        progress.finish("complete")
+        logger.info(f"Saved {file_type} file: {file_id} ({filename}, {size_bytes} bytes)")
+        return {**metadata, "deduplicated": False, "upload_id": progress.upload_id}
+    
+    def store_asset(
+        self,
+        stream: BinaryIO,
+        dest_dir: Path,
+        ext: str,
+        filename: str = "",
+        total_bytes: Optional[int] = None
+    ) -> Tuple[str, bool]:
+        """Stream a graphics asset into a content-addressed file.
+        
+        The stored name is derived from the content hash, so uploading the
+        same image or video twice reuses the existing file.
         
-        logger.info(f"Saved {file_type} file: {file_id} ({filename})")
-        return metadata
+        Blocking; run in a worker thread from async handlers.
+        
+        Args:
+            stream: Readable binary stream with the file content
+            dest_dir: Directory to store the asset in
+            ext: File extension (including the dot)
+            filename: Original filename (for progress reporting)
+            total_bytes: Expected size, if known
+        
+        Returns:
+            (stored_filename, deduplicated)
+        """
+        self._check_size(total_bytes)
+        dest_dir = Path(dest_dir)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        progress = self._start_progress(filename or ext, None, total_bytes)
+        
+        try:
+            tmp_path, content_hash, _ = stream_to_temp(
+                stream, dest_dir, self.max_upload_bytes, progress
+            )
+        except Exception as e:
+            progress.finish("failed", str(e))
+            raise
+        progress.content_hash = content_hash
+        
+        stored_name = f"{content_hash[:32]}{ext.lower()}"
+        target = dest_dir / stored_name
+        try:
+            if target.exists():
+                tmp_path.unlink(missing_ok=True)
+                progress.finish("deduplicated")
+                return stored_name, True
+            os.replace(tmp_path, target)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            progress.finish("failed", str(e))
+            raise
+        
+        progress.finish("complete")
+        return stored_name, False
     
     def get_file_path(self, file_id: str) -> Optional[Path]:
         """Get file path by ID."""
@@ -141,6 +576,10 @@ class FileManager:
                 logger.error(f"Failed to delete file {file_path}: {e}")
                 return False
         
+        # Delete thumbnail generated by the media probe
+        if metadata.get("thumbnail_path"):
+            Path(metadata["thumbnail_path"]).unlink(missing_ok=True)
+        
         # Delete metadata from database
         if self.database:
             self.database.delete_file_metadata(file_id)
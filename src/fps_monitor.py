@@ -10,8 +10,21 @@ import threading
 from typing import Dict, Optional, Callable
 from dataclasses import dataclass, field
 
+from .metrics import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
+# GST_CLOCK_TIME_NONE (avoids importing Gst here)
+_CLOCK_TIME_NONE = 2**64 - 1
+
+# Metrics (updated from GStreamer streaming threads)
+_registry = get_metrics_registry()
+_FRAMES = _registry.counter("r58_camera_frames", "Frames received per camera", ["camera"])
+_DROPS = _registry.counter(
+    "r58_camera_dropped_frames", "Frames missing from the timestamp sequence", ["camera"]
+)
+_FPS = _registry.gauge("r58_camera_fps", "Measured framerate per camera", ["camera"])
+
 
 @dataclass
 class FpsStats:
@@ -32,6 +45,12 @@ class FpsStats:
     total_frames: int = 0
     start_time: float = field(default_factory=time.time)
     dropped_frames: int = 0
+    last_pts: Optional[int] = None
+    
+    def __post_init__(self):
+        self._frames_metric = _FRAMES.labels(self.cam_id)
+        self._drops_metric = _DROPS.labels(self.cam_id)
+        self._fps_metric = _FPS.labels(self.cam_id)
     
     def update(self):
         """Calculate FPS from recent frames."""
@@ -56,14 +75,32 @@ class FpsStats:
             
             self.last_log_time = now
             self.last_log_frame_count = self.frame_count
+            self._fps_metric.set(self.current_fps)
             return True
         return False
     
-    def on_frame(self):
-        """Called for each frame received."""
+    def on_frame(self, pts: Optional[int] = None, duration: Optional[int] = None):
+        """Called for each frame received.
+        
+        Args:
+            pts: Buffer timestamp (ns), used to detect dropped frames
+            duration: Buffer duration (ns)
+        """
         self.frame_count += 1
         self.total_frames += 1
         self.last_frame_time = time.time()
+        self._frames_metric.inc()
+        
+        if pts is None:
+            return
+        # A gap of more than 1.5 frame durations means frames went missing upstream
+        if duration and self.last_pts is not None and pts > self.last_pts:
+            gap = pts - self.last_pts
+            if gap > duration * 1.5:
+                missed = int(round(gap / duration)) - 1
+                self.dropped_frames += missed
+                self._drops_metric.inc(missed)
+        self.last_pts = pts
 
 
 class FpsMonitor:
@@ -125,16 +162,22 @@ class FpsMonitor:
                 )
                 del self.stats[cam_id]
     
-    def on_frame(self, cam_id: str):
+    def on_frame(self, cam_id: str, pts: Optional[int] = None, duration: Optional[int] = None):
         """Called when a frame is received for a camera."""
         with self._lock:
             if cam_id in self.stats:
-                self.stats[cam_id].on_frame()
+                self.stats[cam_id].on_frame(pts, duration)
+    
+    def _on_buffer(self, cam_id: str, buffer) -> None:
+        """Count a buffer, passing valid timestamps on for drop detection."""
+        pts = buffer.pts if buffer.pts != _CLOCK_TIME_NONE else None
+        duration = buffer.duration if buffer.duration != _CLOCK_TIME_NONE else None
+        self.on_frame(cam_id, pts, duration)
     
     def create_handoff_callback(self, cam_id: str) -> Callable:
         """Create a handoff callback for identity element."""
         def on_handoff(identity, buffer):
-            self.on_frame(cam_id)
+            self._on_buffer(cam_id, buffer)
         return on_handoff
     
     def get_fps_element_string(self, cam_id: str) -> str:
@@ -174,7 +217,7 @@ class FpsMonitor:
             
             # Connect handoff signal
             def on_handoff(element, buffer):
-                self.on_frame(cam_id)
+                self._on_buffer(cam_id, buffer)
             
             identity.connect("handoff", on_handoff)
             logger.info(f"[FPS Monitor] Connected to pipeline for {cam_id}")
@@ -262,6 +305,7 @@ class FpsMonitor:
                     "min_fps": round(stats.min_fps, 1) if stats.min_fps != float('inf') else 0,
                     "max_fps": round(stats.max_fps, 1),
                     "total_frames": stats.total_frames,
+                    "dropped_frames": stats.dropped_frames,
                     "uptime_seconds": round(time.time() - stats.start_time, 1)
                 }
             return result
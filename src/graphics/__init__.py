@@ -4,6 +4,7 @@ Components:
 - GraphicsRenderer: Renders presentations and graphics to video
 - GraphicsTemplates: Predefined broadcast graphics templates
 - HTMLGraphicsRenderer: HTML/CSS based graphics rendering
+- PrerenderFarm: Renders HTML templates offline to cached alpha clips
 
 Usage:
     from .graphics import create_graphics_plugin
@@ -12,6 +13,7 @@ Usage:
 """
 
 from typing import TYPE_CHECKING, Optional, Any
+from pathlib import Path
 import logging
 
 if TYPE_CHECKING:
@@ -26,6 +28,7 @@ class GraphicsPlugin:
     def __init__(self):
         self.renderer: Optional[Any] = None
         self.html_renderer: Optional[Any] = None
+        self.prerender: Optional[Any] = None
         self.reveal_source_manager: Optional[Any] = None
         self._initialized = False
     
@@ -42,6 +45,7 @@ class GraphicsPlugin:
         # Import lazily
         from .renderer import GraphicsRenderer
         from .html_renderer import HTMLGraphicsRenderer
+        from .prerender import PrerenderFarm
         
         self.reveal_source_manager = reveal_source_manager
         
@@ -49,9 +53,15 @@ class GraphicsPlugin:
             output_dir=config.graphics.output_dir,
             reveal_source_manager=reveal_source_manager
         )
+        self.prerender = PrerenderFarm(
+            templates_dir=config.graphics.templates_dir,
+            cache_dir=str(Path(config.graphics.output_dir) / "prerender"),
+            workers=config.graphics.prerender_workers
+        )
         self.html_renderer = HTMLGraphicsRenderer(
             templates_dir=config.graphics.templates_dir,
-            output_dir=config.graphics.output_dir
+            output_dir=config.graphics.output_dir,
+            prerender=self.prerender
         )
         
         self._initialized = True
@@ -1,4 +1,8 @@
-"""HTML/CSS graphics renderer for complex graphics that GStreamer can't handle natively."""
+"""HTML/CSS graphics renderer for complex graphics that GStreamer can't handle natively.
+
+Template-based stingers and tickers play clips pre-rendered by the
+PrerenderFarm (see prerender.py), so no browser runs while they are on air.
+"""
 import logging
 import subprocess
 import threading
@@ -8,6 +12,9 @@ from typing import Dict, Optional, Any
 from dataclasses import dataclass
 import json
 
+from .prerender import DEFAULT_DURATION, bind_template
+from ..mixer.clip_cache import build_sequence_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,12 +31,18 @@ class HTMLGraphicsSource:
 class HTMLGraphicsRenderer:
     """Renders HTML/CSS graphics to video streams for mixer input."""
     
-    def __init__(self, templates_dir: str = "graphics_templates", output_dir: str = "/tmp/mixer_graphics"):
+    def __init__(
+        self,
+        templates_dir: str = "graphics_templates",
+        output_dir: str = "/tmp/mixer_graphics",
+        prerender: Optional[Any] = None
+    ):
         """Initialize HTML graphics renderer.
         
         Args:
             templates_dir: Directory containing HTML graphics templates
             output_dir: Directory for temporary graphics outputs
+            prerender: Optional PrerenderFarm for template-based graphics
         """
         self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
@@ -37,6 +50,7 @@ class HTMLGraphicsRenderer:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.active_sources: Dict[str, HTMLGraphicsSource] = {}
         self._lock = threading.Lock()
+        self.prerender = prerender
         
         # Web server port for serving HTML templates
         self.web_port = 8001
@@ -52,16 +66,9 @@ class HTMLGraphicsRenderer:
             Generated HTML content
         """
         try:
-            template_content = template_path.read_text()
-            
             # Simple template engine: replace {{variable}} with data values
             # For more complex templates, consider using Jinja2
-            html_content = template_content
-            for key, value in data.items():
-                placeholder = f"{{{{{key}}}}}"
-                html_content = html_content.replace(placeholder, str(value))
-            
-            return html_content
+            return bind_template(template_path.read_text(), data)
         except Exception as e:
             logger.error(f"Failed to generate HTML from template {template_path}: {e}")
             return ""
@@ -84,14 +91,10 @@ class HTMLGraphicsRenderer:
         """
         logger.info(f"Creating stinger source: {source_id}")
         
-        # For now, return None as this requires HTML rendering
-        # Future implementation would:
-        # 1. Load HTML template for stinger type
-        # 2. Generate HTML with data binding
-        # 3. Serve via web server or render with headless browser
-        # 4. Capture as video stream
+        if stinger_data.get("template_id"):
+            return self._create_prerendered_source(source_id, stinger_data, loop=False)
         
-        logger.warning(f"Stinger rendering not yet implemented for {source_id}")
+        logger.warning(f"Stinger {source_id} needs a template_id to be rendered")
         return None
     
     def create_ticker_source(self, source_id: str, ticker_data: Dict[str, Any]) -> Optional[str]:
@@ -113,15 +116,40 @@ class HTMLGraphicsRenderer:
         """
         logger.info(f"Creating ticker source: {source_id}")
         
-        # For now, return None as this requires HTML/CSS rendering
-        # Future implementation would:
-        # 1. Generate HTML with CSS animation for scrolling
-        # 2. Serve via web server
-        # 3. Capture with souphttpsrc or headless browser
+        if ticker_data.get("template_id"):
+            # The template's CSS animation should loop within the clip duration
+            return self._create_prerendered_source(source_id, ticker_data, loop=True)
         
-        logger.warning(f"Ticker rendering not yet implemented for {source_id}")
+        logger.warning(f"Ticker {source_id} needs a template_id to be rendered")
         return None
     
+    def _create_prerendered_source(self, source_id: str, source_data: Dict[str, Any], loop: bool) -> Optional[str]:
+        """Play a template's pre-rendered clip (None while it renders in the background).
+        
+        Args:
+            source_id: Unique identifier
+            source_data: template_id, data (bound into the template), duration,
+                width and height
+            loop: Loop the clip
+        """
+        if not self.prerender:
+            logger.warning(f"Template graphics need the pre-render farm, {source_id} unavailable")
+            return None
+        try:
+            key, clip = self.prerender.request(
+                source_data["template_id"],
+                source_data.get("data") or {},
+                source_data.get("duration") or DEFAULT_DURATION,
+                (source_data.get("width", 1920), source_data.get("height", 1080)),
+            )
+        except ValueError as e:
+            logger.error(f"Cannot render {source_id}: {e}")
+            return None
+        if not clip:
+            logger.info(f"{source_id} is being pre-rendered ({key}), not available yet")
+            return None
+        return f"{build_sequence_source(str(clip.path), loop)} ! videoconvert"
+    
     def create_timer_source(self, source_id: str, timer_data: Dict[str, Any]) -> Optional[str]:
         """Create a timer (countdown/clock) graphics source.
         
@@ -0,0 +1,345 @@
+"""Offline pre-rendering of HTML graphics templates to cached alpha clips.
+
+Rendering a template live (wpesrc in the mixer pipeline) runs a full browser
+engine for as long as the graphic is on air. Instead, a template bound to a
+data set is rendered once, headless and off the live path, to a PNG
+sequence with alpha:
+
+- Renders run in a low-priority gst-launch-1.0 subprocess (wpesrc with a
+  transparent background) on a small worker pool, never in the server or
+  mixer process.
+- Clips are cached on disk under a key hashing the template content, its
+  local assets (size and mtime), the data and the render size/duration, so
+  a re-used lower third or stinger is rendered once and editing a template's
+  image or stylesheet renders it again. Renders write to a temporary directory that is renamed
+  into place with its manifest, so a clip directory is always complete.
+  The bound HTML gets a <base href> pointing at the template's directory,
+  so relative assets resolve as they do when the template is served.
+- The mixer plays a clip like a file slot: decoded into the RAM clip cache
+  when it fits, otherwise streamed as PNGs (see mixer/clip_cache.py). Either
+  way, air time costs no browser CPU.
+
+Usage:
+    farm = PrerenderFarm("graphics_templates", "/tmp/graphics_output/prerender")
+    key, clip = farm.request("lower_third", {"name": "Jane Doe"}, 5.0, (1920, 1080))
+    # clip is None until the background render finishes (see farm.state(key))
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..mixer.clip_cache import CLIP_FRAMERATE, SEQUENCE_PATTERN
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "clip.json"
+DEFAULT_DURATION = 5.0  # seconds
+MAX_DURATION = 60.0  # seconds
+RENDER_TIMEOUT_FACTOR = 4  # Renders run in real time; allow slow starts
+RENDER_TIMEOUT_MIN = 30.0  # seconds
+
+_TEMPLATE_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+_CLIP_KEY = re.compile(r"^[0-9a-f]+$")
+_HEAD = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+_BASE = re.compile(r"<base\b", re.IGNORECASE)
+# Relative asset references: src/href attributes and CSS url()
+_ASSET_REF = re.compile(
+    r"""(?:\b(?:src|href)\s*=\s*["']|url\(\s*["']?)(?![a-z][a-z0-9+.-]*:|/|#)([^"')?#\s]+)""",
+    re.IGNORECASE,
+)
+
+
+def bind_template(template: str, data: Dict[str, Any]) -> str:
+    """Replace {{variable}} placeholders with data values."""
+    html = template
+    for key, value in data.items():
+        html = html.replace(f"{{{{{key}}}}}", str(value))
+    return html
+
+
+def with_base_href(html: str, base_dir: Path) -> str:
+    """Resolve the page's relative URLs against base_dir (unless it sets its own <base>)."""
+    if _BASE.search(html):
+        return html
+    base = f'<base href="file://{base_dir.resolve()}/">'
+    head = _HEAD.search(html)
+    if head:
+        return html[:head.end()] + base + html[head.end():]
+    return base + html
+
+
+def asset_fingerprint(template_path: Path, template: str) -> str:
+    """Hash of the size and mtime of the local files a template uses.
+    
+    A directory template (<id>/index.html) may load anything in its
+    directory, so all of it counts; a single-file template only counts the
+    relative files it references.
+    """
+    base_dir = template_path.parent
+    if template_path.name == "index.html":
+        paths = [path for path in base_dir.rglob("*") if path.is_file() and path != template_path]
+    else:
+        paths = [base_dir / ref for ref in set(_ASSET_REF.findall(template))]
+    entries = []
+    for path in sorted(paths):
+        try:
+            stat = path.stat()
+            entries.append(f"{path.relative_to(base_dir)}:{stat.st_size}:{stat.st_mtime_ns}")
+        except (OSError, ValueError):
+            continue  # Missing, or outside the template directory
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()[:16]
+
+
+def clip_key(
+    template: str, data: Dict[str, Any], duration: float, size: Tuple[int, int], fps: int, assets: str = ""
+) -> str:
+    """Cache key of a template rendered with data (stable across dict ordering)."""
+    payload = json.dumps(
+        {"data": data, "duration": round(duration, 3), "size": list(size), "fps": fps, "assets": assets},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(template.encode() + b"\0" + payload.encode()).hexdigest()[:20]
+
+
+def build_render_command(html_path: Path, output_dir: Path, size: Tuple[int, int], frames: int, fps: int) -> List[str]:
+    """gst-launch-1.0 command rendering frames of a page to a PNG sequence with alpha."""
+    width, height = size
+    pipeline = (
+        f'wpesrc location="file://{html_path}" draw-background=false ! '
+        f"video/x-raw,width={width},height={height},framerate={fps}/1 ! "
+        f"videoconvert ! video/x-raw,format=RGBA ! "
+        f"identity eos-after={frames} ! "
+        f'pngenc ! multifilesink location="{output_dir / SEQUENCE_PATTERN}"'
+    )
+    command = ["gst-launch-1.0", "-q", pipeline]
+    if shutil.which("nice"):
+        command = ["nice", "-n", "10", *command]
+    return command
+
+
+@dataclass
+class PrerenderedClip:
+    """A rendered PNG sequence on disk."""
+    key: str
+    path: Path
+    width: int
+    height: int
+    fps: int
+    frames: int
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.fps
+
+
+def load_clip(path: Path) -> Optional[PrerenderedClip]:
+    """Read a clip directory's manifest (None if the clip is missing or incomplete)."""
+    try:
+        manifest = json.loads((path / MANIFEST).read_text())
+        return PrerenderedClip(
+            key=path.name,
+            path=path,
+            width=int(manifest["width"]),
+            height=int(manifest["height"]),
+            fps=int(manifest["fps"]),
+            frames=int(manifest["frames"]),
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class PrerenderFarm:
+    """Renders templates to cached clips on a background worker pool."""
+
+    def __init__(
+        self,
+        templates_dir: str = "graphics_templates",
+        cache_dir: str = "/tmp/graphics_output/prerender",
+        workers: int = 1,
+        fps: int = CLIP_FRAMERATE,
+    ):
+        self.templates_dir = Path(templates_dir)
+        self.cache_dir = Path(cache_dir)
+        self.fps = fps
+        self.workers = max(1, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._clips: Dict[str, PrerenderedClip] = {}
+        self._rendering: Set[str] = set()
+        self._failed: Dict[str, str] = {}
+        self._templates: Dict[Path, Tuple[float, str]] = {}  # path -> (mtime, content)
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def template_path(self, template_id: str) -> Path:
+        """HTML file of a template (ValueError for invalid or unknown IDs)."""
+        if not _TEMPLATE_ID.match(template_id or ""):
+            raise ValueError(f"Invalid template ID '{template_id}'")
+        for path in (self.templates_dir / f"{template_id}.html", self.templates_dir / template_id / "index.html"):
+            if path.is_file():
+                return path
+        raise ValueError(f"Template {template_id} not found in {self.templates_dir}")
+
+    def _read_template(self, path: Path) -> str:
+        mtime = path.stat().st_mtime
+        with self._lock:
+            cached = self._templates.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        content = path.read_text()
+        with self._lock:
+            self._templates[path] = (mtime, content)
+        return content
+
+    def key_for(self, template_id: str, data: Dict[str, Any], duration: float, size: Tuple[int, int]) -> str:
+        """Cache key of a render (ValueError for unknown templates or durations)."""
+        if not 0 < duration <= MAX_DURATION:
+            raise ValueError(f"Duration must be between 0 and {MAX_DURATION} seconds")
+        path = self.template_path(template_id)
+        template = self._read_template(path)
+        return clip_key(template, data, duration, size, self.fps, asset_fingerprint(path, template))
+
+    def get(self, key: str) -> Optional[PrerenderedClip]:
+        """A finished clip (from memory, or from a previous run's cache directory)."""
+        if not _CLIP_KEY.match(key or ""):
+            return None
+        with self._lock:
+            clip = self._clips.get(key)
+        if clip:
+            return clip
+        clip = load_clip(self.cache_dir / key)
+        if clip:
+            with self._lock:
+                self._clips[key] = clip
+        return clip
+
+    def request(
+        self,
+        template_id: str,
+        data: Dict[str, Any],
+        duration: float = DEFAULT_DURATION,
+        size: Tuple[int, int] = (1920, 1080),
+    ) -> Tuple[str, Optional[PrerenderedClip]]:
+        """Get a rendered clip, starting a background render if there is none.
+
+        Returns:
+            (key, clip), clip None while rendering
+
+        Raises:
+            ValueError: Unknown template or invalid duration
+        """
+        key = self.key_for(template_id, data, duration, size)
+        clip = self.get(key)
+        if clip:
+            return key, clip
+        with self._lock:
+            if key in self._rendering:
+                return key, None
+            self._rendering.add(key)
+            self._failed.pop(key, None)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prerender")
+            executor = self._executor
+        logger.info(f"Pre-rendering template {template_id} ({duration}s at {size[0]}x{size[1]}) as {key}")
+        executor.submit(self._render, key, template_id, data, duration, size)
+        return key, None
+
+    def state(self, key: str) -> str:
+        """ready, rendering, failed or missing."""
+        if self.get(key):
+            return "ready"
+        with self._lock:
+            if key in self._rendering:
+                return "rendering"
+            if key in self._failed:
+                return "failed"
+        return "missing"
+
+    def error(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._failed.get(key)
+
+    def add_ready_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Call callback({key}) (from a worker thread) when a clip finishes rendering."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _render(self, key: str, template_id: str, data: Dict[str, Any], duration: float, size: Tuple[int, int]) -> None:
+        work_dir = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        started = time.monotonic()
+        frames = max(1, round(duration * self.fps))
+        try:
+            template_path = self.template_path(template_id)
+            html = with_base_href(bind_template(self._read_template(template_path), data), template_path.parent)
+            shutil.rmtree(work_dir, ignore_errors=True)
+            work_dir.mkdir(parents=True)
+            html_path = work_dir / "index.html"
+            html_path.write_text(html)
+            timeout = max(RENDER_TIMEOUT_MIN, duration * RENDER_TIMEOUT_FACTOR)
+            result = subprocess.run(
+                build_render_command(html_path, work_dir, size, frames, self.fps),
+                capture_output=True, text=True, timeout=timeout,
+            )
+            rendered = len(list(work_dir.glob("*.png")))
+            if result.returncode != 0 or rendered == 0:
+                raise RuntimeError(result.stderr.strip() or f"gst-launch-1.0 exited with {result.returncode}")
+            html_path.unlink()
+            (work_dir / MANIFEST).write_text(json.dumps({
+                "template_id": template_id,
+                "width": size[0],
+                "height": size[1],
+                "fps": self.fps,
+                "frames": rendered,
+            }))
+            target = self.cache_dir / key
+            if load_clip(target):
+                shutil.rmtree(work_dir)  # Rendered meanwhile (e.g. by another process)
+            else:
+                shutil.rmtree(target, ignore_errors=True)
+                work_dir.rename(target)
+        except Exception as e:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            logger.error(f"Pre-render of template {template_id} ({key}) failed: {e}")
+            with self._lock:
+                self._rendering.discard(key)
+                self._failed[key] = str(e)
+            return
+
+        elapsed = time.monotonic() - started
+        clip = load_clip(self.cache_dir / key)
+        with self._lock:
+            self._rendering.discard(key)
+            if clip:
+                self._clips[key] = clip
+            self.renders += 1
+            self.render_seconds += elapsed
+            listeners = list(self._listeners)
+        logger.info(f"Pre-rendered template {template_id} as {key}: {rendered} frames in {elapsed:.1f}s")
+        for callback in listeners:
+            try:
+                callback({key})
+            except Exception as e:
+                logger.warning(f"Pre-render listener failed: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "workers": self.workers,
+                "clips": len(self._clips),
+                "rendering": sorted(self._rendering),
+                "failed": dict(self._failed),
+                "renders": self.renders,
+                "render_seconds": round(self.render_seconds, 1),
+            }
@@ -189,3 +189,45 @@ def get_glib():
         logger.error(f"Failed to import GLib: {e}")
         return None
 
+
+
+def get_gst_pbutils():
+    """
+    Get the GstPbutils module (Discoverer), initializing GStreamer if needed.
+    
+    Returns:
+        The GstPbutils module, or None if not available
+    """
+    if not ensure_gst_initialized():
+        return None
+    
+    try:
+        import gi
+        gi.require_version("Gst", "1.0")
+        gi.require_version("GstPbutils", "1.0")
+        from gi.repository import GstPbutils
+        return GstPbutils
+    except Exception as e:
+        logger.error(f"Failed to import GstPbutils: {e}")
+        return None
+
+
+def get_gst_controller():
+    """
+    Get the GstController module (control sources/bindings), initializing GStreamer if needed.
+    
+    Returns:
+        The GstController module, or None if not available
+    """
+    if not ensure_gst_initialized():
+        return None
+    
+    try:
+        import gi
+        gi.require_version("Gst", "1.0")
+        gi.require_version("GstController", "1.0")
+        from gi.repository import GstController
+        return GstController
+    except Exception as e:
+        logger.error(f"Failed to import GstController: {e}")
+        return None
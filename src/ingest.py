@@ -6,8 +6,9 @@ from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
 from .config import AppConfig, CameraConfig
-from .pipelines import build_ingest_pipeline
+from .pipelines import build_ingest_pipeline, local_frames_supported
 from .gst_utils import ensure_gst_initialized, get_gst
+from .metrics import instrument_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class IngestManager:
         self.signal_states: Dict[str, bool] = {}
         self.signal_loss_times: Dict[str, Optional[float]] = {}
         self.error_retry_count: Dict[str, int] = {}
+        self.local_frames: Dict[str, bool] = {}  # cam_id -> raw frame branch for mixer active
         self._gst_ready = False
         self._health_check_running = False
         self._health_check_thread: Optional[threading.Thread] = None
@@ -94,6 +96,7 @@ class IngestManager:
 
         # Build MediaMTX path
         mediamtx_path = f"rtsp://localhost:{self.config.mediamtx.rtsp_port}/{cam_id}"
+        local_frames_resolution = self._get_local_frames_resolution()
 
         # Build ingest pipeline
         try:
@@ -105,6 +108,7 @@ class IngestManager:
                 bitrate=18000,  # 18Mbps for high-quality recording via subscriber
                 codec=cam_config.codec,
                 mediamtx_path=mediamtx_path,
+                local_frames_resolution=local_frames_resolution,
             )
 
             # Set up bus message handler
@@ -112,6 +116,8 @@ class IngestManager:
             bus.add_signal_watch()
             bus.connect("message", self._on_bus_message, cam_id)
 
+            instrument_pipeline(pipeline, f"ingest_{cam_id}")
+
             # Start pipeline
             Gst = get_gst()
             ret = pipeline.set_state(Gst.State.PLAYING)
@@ -139,6 +145,7 @@ class IngestManager:
             
             self.pipelines[cam_id] = pipeline
             self.states[cam_id] = "streaming"
+            self.local_frames[cam_id] = local_frames_resolution is not None
             self.pipeline_start_times[cam_id] = time.time()
             self.last_health_check[cam_id] = time.time()
             self.signal_states[cam_id] = True
@@ -169,6 +176,20 @@ class IngestManager:
             self.states[cam_id] = "error"
             return False
 
+    def _get_local_frames_resolution(self) -> Optional[str]:
+        """Get mixer resolution for the local raw-frame branch, or None to use RTSP only."""
+        mixer_config = self.config.mixer
+        if not (mixer_config.enabled and mixer_config.local_frames):
+            return None
+        if not local_frames_supported():
+            logger.debug("intervideosink/intervideosrc not available, mixer will read cameras over RTSP")
+            return None
+        return mixer_config.output_resolution
+
+    def has_local_frames(self, cam_id: str) -> bool:
+        """Check if the mixer can read raw frames for a camera from its ingest pipeline."""
+        return self.states.get(cam_id) == "streaming" and self.local_frames.get(cam_id, False)
+
     def stop_ingest(self, cam_id: str) -> bool:
         """Stop ingest for a specific camera."""
         if cam_id not in self.states:
@@ -0,0 +1,277 @@
+"""Request latency tracing and event-loop stall sampling.
+
+Finds handlers that block the asyncio event loop (the "UI freezes" case):
+
+- Per-route latency is recorded by the HTTP metrics middleware; the tracer
+  keeps recent durations per route to report p50/p99/max.
+- A heartbeat task measures event-loop lag (how late a scheduled wakeup
+  actually ran).
+- A watchdog thread notices when the heartbeat stops and grabs the loop
+  thread's current stack with sys._current_frames(), together with the
+  requests that were in flight at that moment.
+
+When disabled, the middleware does a single attribute check and no task or
+thread runs. Idle cost when enabled is one wakeup per heartbeat interval.
+
+Usage:
+    from .latency_tracer import get_latency_tracer
+
+    tracer = get_latency_tracer()
+    await tracer.start()            # from the running event loop
+    tracer.set_enabled(False)       # runtime switch
+    tracer.get_report()
+"""
+import asyncio
+import itertools
+import logging
+import statistics
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 0.1  # seconds between event-loop lag measurements
+ROUTE_WINDOW = 256  # recent durations kept per route
+MAX_SLOW_SAMPLES = 50
+MAX_STACK_DEPTH = 40
+
+_LOOP_LAG = get_metrics_registry().histogram(
+    "r58_event_loop_lag_seconds",
+    "Delay between scheduled and actual event-loop wakeups",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_LOOP_STALLS = get_metrics_registry().counter(
+    "r58_event_loop_stalls", "Event-loop stalls longer than the slow threshold"
+)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LatencyTracer:
+    """Tracks route latency and samples the event loop when it stalls."""
+
+    def __init__(self, enabled: bool = True, slow_threshold_ms: float = 250.0):
+        """Initialize tracer.
+
+        Args:
+            enabled: Start tracing when start() is called
+            slow_threshold_ms: Loop stall duration that triggers a stack sample
+        """
+        self.enabled = enabled
+        self.slow_threshold = slow_threshold_ms / 1000.0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._generation = 0  # Lets a stale watchdog thread exit after a quick off/on
+        self._heartbeat = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        self._routes: Dict[str, Deque[float]] = {}
+        self._route_counts: Dict[str, int] = {}
+        self._lag: Deque[float] = deque(maxlen=600)  # ~1 minute at 100ms
+        self._max_lag = 0.0
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=MAX_SLOW_SAMPLES)
+        self._open_sample: Optional[Dict[str, Any]] = None
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Start heartbeat and watchdog (call from the running event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if self.enabled:
+            self._start_tracing()
+
+    async def stop(self) -> None:
+        """Stop heartbeat and watchdog."""
+        self._stop_tracing()
+
+    def set_enabled(self, enabled: bool, slow_threshold_ms: Optional[float] = None) -> None:
+        """Switch tracing on or off at runtime."""
+        if slow_threshold_ms is not None:
+            self.slow_threshold = slow_threshold_ms / 1000.0
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            if self._loop:
+                self._loop.call_soon_threadsafe(self._start_tracing)
+        else:
+            self._stop_tracing()
+        logger.info(f"Latency tracing {'enabled' if enabled else 'disabled'}")
+
+    def _start_tracing(self) -> None:
+        if self._running or not self._loop:
+            return
+        self._running = True
+        self._generation += 1
+        self._heartbeat = time.monotonic()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat_loop())
+        self._watchdog_thread = threading.Thread(
+            target=self._watchdog_loop, args=(self._generation,),
+            name="latency-watchdog", daemon=True
+        )
+        self._watchdog_thread.start()
+
+    def _stop_tracing(self) -> None:
+        self._running = False
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._watchdog_thread = None  # Exits on its next poll
+        with self._lock:
+            self._in_flight.clear()
+
+    # Request hooks (called by the HTTP middleware)
+
+    def request_started(self, method: str, path: str) -> Optional[int]:
+        """Register an in-flight request; returns a token for request_finished()."""
+        if not self._running:
+            return None
+        token = next(self._request_ids)
+        with self._lock:
+            self._in_flight[token] = {"method": method, "path": path, "started": time.monotonic()}
+        return token
+
+    def request_finished(self, token: Optional[int], method: str, route: str, duration: float) -> None:
+        """Record a completed request."""
+        if token is None:
+            return
+        key = f"{method} {route}"
+        with self._lock:
+            self._in_flight.pop(token, None)
+            window = self._routes.get(key)
+            if window is None:
+                window = self._routes[key] = deque(maxlen=ROUTE_WINDOW)
+            window.append(duration)
+            self._route_counts[key] = self._route_counts.get(key, 0) + 1
+
+    # Event-loop monitoring
+
+    async def _heartbeat_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._running:
+            scheduled = loop.time() + HEARTBEAT_INTERVAL
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lag = max(0.0, loop.time() - scheduled)
+            self._heartbeat = time.monotonic()
+            _LOOP_LAG.observe(lag)
+            with self._lock:
+                self._lag.append(lag)
+                self._max_lag = max(self._max_lag, lag)
+                if self._open_sample is not None:
+                    # The stall that was sampled has ended: record its full length
+                    self._open_sample["blocked_ms"] = round(lag * 1000, 1)
+                    self._open_sample = None
+
+    def _watchdog_loop(self, generation: int) -> None:
+        sampled_heartbeat = None
+        while self._running and self._generation == generation:
+            time.sleep(max(0.02, self.slow_threshold / 4))
+            heartbeat = self._heartbeat
+            stalled_for = time.monotonic() - heartbeat - HEARTBEAT_INTERVAL
+            if stalled_for < self.slow_threshold or heartbeat == sampled_heartbeat:
+                continue
+            sampled_heartbeat = heartbeat  # One sample per stall
+            self._take_sample(stalled_for)
+
+    def _take_sample(self, stalled_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame, limit=MAX_STACK_DEPTH) if frame else []
+        now = time.monotonic()
+        with self._lock:
+            in_flight = [
+                {
+                    "method": r["method"],
+                    "path": r["path"],
+                    "running_ms": round((now - r["started"]) * 1000, 1),
+                }
+                for r in self._in_flight.values()
+            ]
+            sample = {
+                "at": time.time(),
+                "blocked_ms": round(stalled_for * 1000, 1),
+                "in_flight": in_flight,
+                "stack": [line.rstrip() for line in stack],
+            }
+            self._samples.append(sample)
+            self._open_sample = sample
+        _LOOP_STALLS.inc()
+        culprit = in_flight[0]["path"] if in_flight else "no request in flight"
+        logger.warning(f"Event loop blocked for >{stalled_for * 1000:.0f}ms ({culprit})")
+
+    # Reporting
+
+    def get_report(self, limit: int = 20) -> Dict[str, Any]:
+        """Get latency summary for the admin endpoint."""
+        with self._lock:
+            routes = {key: list(window) for key, window in self._routes.items()}
+            counts = dict(self._route_counts)
+            lag = list(self._lag)
+            samples = list(self._samples)
+            max_lag = self._max_lag
+            in_flight = len(self._in_flight)
+
+        route_stats = []
+        for key, durations in routes.items():
+            route_stats.append({
+                "route": key,
+                "count": counts.get(key, 0),
+                "p50_ms": round(statistics.median(durations) * 1000, 2),
+                "p99_ms": round(_percentile(durations, 99) * 1000, 2),
+                "max_ms": round(max(durations) * 1000, 2),
+            })
+        route_stats.sort(key=lambda r: r["p99_ms"], reverse=True)
+
+        return {
+            "enabled": self.enabled,
+            "running": self._running,
+            "slow_threshold_ms": round(self.slow_threshold * 1000, 1),
+            "in_flight": in_flight,
+            "event_loop_lag": {
+                "current_ms": round(lag[-1] * 1000, 2) if lag else 0.0,
+                "p99_ms": round(_percentile(lag, 99) * 1000, 2),
+                "max_ms": round(max_lag * 1000, 2),
+            },
+            "routes": route_stats[:limit],
+            "slow_samples": samples[-limit:],
+        }
+
+    def reset(self) -> None:
+        """Clear collected latency data and samples."""
+        with self._lock:
+            self._routes.clear()
+            self._route_counts.clear()
+            self._lag.clear()
+            self._samples.clear()
+            self._max_lag = 0.0
+            self._open_sample = None
+
+
+# Global instance for easy access
+_latency_tracer: Optional[LatencyTracer] = None
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """Get the global latency tracer instance."""
+    global _latency_tracer
+    if _latency_tracer is None:
+        _latency_tracer = LatencyTracer()
+    return _latency_tracer
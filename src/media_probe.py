@@ -0,0 +1,393 @@
+"""Background media probing for uploaded files.
+
+After an upload is stored, its metadata (duration, resolution, frame rate,
+container, codecs, keyframe interval) is read on a small worker pool and
+written to the file_metadata table together with a JPEG thumbnail. The
+mixer uses the cached container/codec to build a direct demux ! parse !
+decode chain instead of autoplugging decodebin at scene-switch time.
+
+Probing uses GstPbutils.Discoverer for stream info and a parsebin pass
+(no decoding) for the keyframe interval.
+"""
+import logging
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .gst_utils import get_gst, get_gst_pbutils
+
+logger = logging.getLogger(__name__)
+
+# Probe defaults
+PROBE_TIMEOUT = 15.0  # seconds per GStreamer operation
+THUMBNAIL_WIDTH = 320
+KEYFRAME_SAMPLE_COUNT = 8  # keyframes to sample for the GOP estimate
+
+# Caps name -> short codec name (video/mpeg and audio/mpeg: see codec_name)
+CODEC_NAMES = {
+    "video/x-h264": "h264",
+    "video/x-h265": "h265",
+    "video/x-vp8": "vp8",
+    "video/x-vp9": "vp9",
+    "video/x-av1": "av1",
+    "image/jpeg": "jpeg",
+    "image/png": "png",
+    "audio/x-opus": "opus",
+    "audio/x-vorbis": "vorbis",
+}
+
+# video/mpeg mpegversion -> codec
+MPEG_VIDEO_CODECS = {1: "mpeg1", 2: "mpeg2", 4: "mpeg4"}
+# audio/mpeg mpegversion 1 layer -> codec (mpegversion 2 and 4 are AAC)
+MPEG_AUDIO_LAYERS = {1: "mp1", 2: "mp2", 3: "mp3"}
+
+# Caps name -> short container name
+CONTAINER_NAMES = {
+    "video/quicktime": "mp4",
+    "video/x-matroska": "matroska",
+    "video/webm": "webm",
+    "video/x-msvideo": "avi",
+}
+
+
+def _caps_name(caps) -> Optional[str]:
+    if caps is None or caps.get_size() == 0:
+        return None
+    return caps.get_structure(0).get_name()
+
+
+def _get_int(structure, field: str) -> Optional[int]:
+    ok, value = structure.get_int(field)
+    return value if ok else None
+
+
+def codec_name(caps) -> Optional[str]:
+    """Short codec name of stream caps.
+    
+    video/mpeg and audio/mpeg cover several codecs, told apart by their
+    mpegversion (and layer) fields.
+    """
+    name = _caps_name(caps)
+    if name is None:
+        return None
+    structure = caps.get_structure(0)
+    if name == "video/mpeg":
+        return MPEG_VIDEO_CODECS.get(_get_int(structure, "mpegversion"), name)
+    if name == "audio/mpeg":
+        version = _get_int(structure, "mpegversion")
+        if version in (2, 4):
+            return "aac"
+        if version == 1:
+            return MPEG_AUDIO_LAYERS.get(_get_int(structure, "layer"), name)
+        return name
+    return CODEC_NAMES.get(name, name)
+
+
+def probe_media(file_path: str, timeout: float = PROBE_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Read stream information with GstPbutils.Discoverer.
+
+    Args:
+        file_path: Path to media file
+        timeout: Discoverer timeout in seconds
+
+    Returns:
+        Dict with duration, width, height, framerate, container, video_codec
+        and audio_codec, or None if the file could not be discovered
+    """
+    Gst = get_gst()
+    GstPbutils = get_gst_pbutils()
+    if not Gst or not GstPbutils:
+        return None
+
+    discoverer = GstPbutils.Discoverer.new(int(timeout * Gst.SECOND))
+    info = discoverer.discover_uri(Path(file_path).resolve().as_uri())
+    if info.get_result() != GstPbutils.DiscovererResult.OK:
+        logger.warning(f"Discoverer could not read {file_path}: {info.get_result().value_nick}")
+        return None
+
+    result: Dict[str, Any] = {
+        "duration": None,
+        "width": None,
+        "height": None,
+        "framerate": None,
+        "container": None,
+        "video_codec": None,
+        "audio_codec": None,
+    }
+
+    video_streams = info.get_video_streams()
+    if video_streams:
+        video = video_streams[0]
+        result["width"] = video.get_width()
+        result["height"] = video.get_height()
+        if video.get_framerate_denom() and not video.is_image():
+            result["framerate"] = round(video.get_framerate_num() / video.get_framerate_denom(), 3)
+        result["video_codec"] = codec_name(video.get_caps())
+        if video.is_image():
+            return result
+
+    duration = info.get_duration()
+    if duration and duration != Gst.CLOCK_TIME_NONE:
+        result["duration"] = round(duration / Gst.SECOND, 3)
+
+    audio_streams = info.get_audio_streams()
+    if audio_streams:
+        result["audio_codec"] = codec_name(audio_streams[0].get_caps())
+
+    top = info.get_stream_info()
+    if isinstance(top, GstPbutils.DiscovererContainerInfo):
+        caps_name = _caps_name(top.get_caps())
+        result["container"] = CONTAINER_NAMES.get(caps_name, caps_name)
+
+    return result
+
+
+def measure_keyframe_interval(
+    file_path: str,
+    timeout: float = PROBE_TIMEOUT,
+    sample_count: int = KEYFRAME_SAMPLE_COUNT
+) -> Optional[float]:
+    """Estimate the keyframe interval (seconds) without decoding.
+
+    Runs filesrc ! parsebin ! fakesink as fast as possible and records the
+    timestamps of non-delta video buffers.
+
+    Returns:
+        Median seconds between keyframes, or None if fewer than two were seen
+    """
+    Gst = get_gst()
+    if not Gst:
+        return None
+
+    pipeline = Gst.Pipeline.new("keyframe-probe")
+    src = Gst.ElementFactory.make("filesrc", None)
+    parse = Gst.ElementFactory.make("parsebin", None)
+    sink = Gst.ElementFactory.make("fakesink", None)
+    if not src or not parse or not sink:
+        return None
+    src.set_property("location", str(file_path))
+    sink.set_property("sync", False)
+    for element in (src, parse, sink):
+        pipeline.add(element)
+    src.link(parse)
+
+    keyframes: List[float] = []
+    done = threading.Event()
+    sink_pad = sink.get_static_pad("sink")
+
+    def on_buffer(pad, probe_info):
+        buf = probe_info.get_buffer()
+        if buf and not buf.has_flags(Gst.BufferFlags.DELTA_UNIT) and buf.pts != Gst.CLOCK_TIME_NONE:
+            keyframes.append(buf.pts / Gst.SECOND)
+            if len(keyframes) >= sample_count:
+                done.set()
+                return Gst.PadProbeReturn.REMOVE
+        return Gst.PadProbeReturn.OK
+
+    def on_pad_added(element, pad):
+        caps = pad.get_current_caps() or pad.query_caps(None)
+        name = _caps_name(caps) or ""
+        if not name.startswith("video/") or sink_pad.is_linked():
+            return
+        if pad.link(sink_pad) == Gst.PadLinkReturn.OK:
+            pad.add_probe(Gst.PadProbeType.BUFFER, on_buffer)
+
+    parse.connect("pad-added", on_pad_added)
+
+    try:
+        pipeline.set_state(Gst.State.PLAYING)
+        bus = pipeline.get_bus()
+        deadline = time.time() + timeout
+        while not done.is_set() and time.time() < deadline:
+            msg = bus.timed_pop_filtered(
+                100 * Gst.MSECOND, Gst.MessageType.EOS | Gst.MessageType.ERROR
+            )
+            if msg:
+                break
+    finally:
+        pipeline.set_state(Gst.State.NULL)
+
+    if len(keyframes) < 2:
+        return None
+    keyframes.sort()
+    intervals = [b - a for a, b in zip(keyframes, keyframes[1:]) if b > a]
+    return round(statistics.median(intervals), 3) if intervals else None
+
+
+def generate_thumbnail(
+    file_path: str,
+    thumbnail_path: Path,
+    seek_seconds: float = 0.0,
+    width: int = THUMBNAIL_WIDTH,
+    timeout: float = PROBE_TIMEOUT
+) -> bool:
+    """Write a JPEG thumbnail of a video frame or image.
+
+    Args:
+        file_path: Source media file
+        thumbnail_path: Destination JPEG path
+        seek_seconds: Position to grab (videos only)
+        width: Thumbnail width (height keeps aspect ratio)
+        timeout: Maximum seconds to wait for the frame
+
+    Returns:
+        True if the thumbnail was written
+    """
+    Gst = get_gst()
+    if not Gst:
+        return False
+
+    tmp_path = thumbnail_path.with_suffix(".part")
+    pipeline = Gst.parse_launch(
+        f'filesrc location="{file_path}" ! decodebin ! videoconvert ! videoscale ! '
+        f'video/x-raw,width={width},pixel-aspect-ratio=1/1 ! '
+        f'jpegenc snapshot=true ! filesink location="{tmp_path}"'
+    )
+    success = False
+    try:
+        pipeline.set_state(Gst.State.PAUSED)
+        pipeline.get_state(int(timeout * Gst.SECOND))
+        if seek_seconds > 0:
+            pipeline.seek_simple(
+                Gst.Format.TIME,
+                Gst.SeekFlags.FLUSH | Gst.SeekFlags.KEY_UNIT,
+                int(seek_seconds * Gst.SECOND)
+            )
+        pipeline.set_state(Gst.State.PLAYING)
+        msg = pipeline.get_bus().timed_pop_filtered(
+            int(timeout * Gst.SECOND), Gst.MessageType.EOS | Gst.MessageType.ERROR
+        )
+        if msg and msg.type == Gst.MessageType.EOS:
+            success = True
+        elif msg:
+            err, _ = msg.parse_error()
+            logger.warning(f"Thumbnail failed for {file_path}: {err.message}")
+        else:
+            logger.warning(f"Thumbnail timed out for {file_path}")
+    finally:
+        pipeline.set_state(Gst.State.NULL)
+
+    if success and tmp_path.exists() and tmp_path.stat().st_size > 0:
+        os.replace(tmp_path, thumbnail_path)
+        return True
+    tmp_path.unlink(missing_ok=True)
+    return False
+
+
+class MediaProbe:
+    """Probes uploaded media on a bounded background worker pool."""
+
+    def __init__(
+        self,
+        database=None,
+        thumbnails_dir: str = "uploads/thumbnails",
+        max_workers: int = 1
+    ):
+        """Initialize media probe.
+
+        Args:
+            database: Database instance to store results in
+            thumbnails_dir: Directory for generated thumbnails
+            max_workers: Concurrent probes (keep low; probing competes with live pipelines)
+        """
+        self.database = database
+        self.thumbnails_dir = Path(thumbnails_dir)
+        self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._probed_count = 0
+        self._failed_count = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="media-probe"
+            )
+        return self._executor
+
+    def submit(self, file_id: str, file_path: str, file_type: str) -> bool:
+        """Queue a file for probing.
+
+        Returns:
+            False if the file is already queued
+        """
+        with self._lock:
+            if file_id in self._pending:
+                return False
+            self._pending.add(file_id)
+        self._get_executor().submit(self._probe_file, file_id, file_path, file_type)
+        return True
+
+    def probe_pending(self) -> int:
+        """Queue every stored file that has not been probed yet.
+
+        Returns:
+            Number of files queued
+        """
+        if not self.database:
+            return 0
+        queued = 0
+        for metadata in self.database.list_files():
+            if metadata.get("probe_status") in (None, "pending"):
+                if self.submit(metadata["id"], metadata["file_path"], metadata["file_type"]):
+                    queued += 1
+        if queued:
+            logger.info(f"Queued {queued} file(s) for media probing")
+        return queued
+
+    def _probe_file(self, file_id: str, file_path: str, file_type: str) -> None:
+        """Probe one file and store the results (worker thread)."""
+        start = time.time()
+        updates: Dict[str, Any] = {"probe_status": "failed"}
+        try:
+            info = probe_media(file_path)
+            if info:
+                updates.update(info)
+                updates["probe_status"] = "ok"
+                if file_type == "video":
+                    updates["keyframe_interval"] = measure_keyframe_interval(file_path)
+
+            thumbnail_path = self.thumbnails_dir / f"{file_id}.jpg"
+            seek = min(1.0, (updates.get("duration") or 0) / 10)
+            if generate_thumbnail(file_path, thumbnail_path, seek_seconds=seek):
+                updates["thumbnail_path"] = str(thumbnail_path)
+        except Exception as e:
+            logger.error(f"Media probe failed for {file_id} ({file_path}): {e}")
+            updates["probe_status"] = "failed"
+        finally:
+            with self._lock:
+                self._pending.discard(file_id)
+                if updates["probe_status"] == "ok":
+                    self._probed_count += 1
+                else:
+                    self._failed_count += 1
+
+        if self.database:
+            self.database.update_file_probe(file_id, updates)
+        logger.info(
+            f"Probed {file_type} {file_id} in {time.time() - start:.1f}s: "
+            f"{updates.get('width')}x{updates.get('height')} "
+            f"{updates.get('container')}/{updates.get('video_codec')} "
+            f"gop={updates.get('keyframe_interval')}s ({updates['probe_status']})"
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "probed": self._probed_count,
+                "failed": self._failed_count,
+                "max_workers": self.max_workers,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (queued probes are dropped)."""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,466 @@
+"""In-process metrics registry with OpenMetrics/Prometheus text export.
+
+Components update counters, gauges and histograms as they run; the
+`/metrics` endpoint renders them in the OpenMetrics text format. Updates
+are a dict lookup plus an uncontended lock, so they are safe and cheap to
+call from GStreamer streaming threads. Cache the labelled child
+(`metric.labels(...)`) in hot paths to skip the lookup.
+
+Values that already exist elsewhere (queue levels, kernel disk counters,
+load/memory/temperature) are read by collectors at scrape time instead of
+being pushed continuously.
+
+Usage:
+    from .metrics import get_metrics_registry
+
+    registry = get_metrics_registry()
+    frames = registry.counter("r58_camera_frames", "Frames received", ["camera"])
+    frames.labels("cam0").inc()
+
+    with registry.histogram("r58_ipc_duration_seconds", "IPC latency", ["target"]).labels("mediamtx").time():
+        ...
+"""
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets (seconds) suited to API calls and local IPC
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    def set_total(self, value: float) -> None:
+        """Mirror an externally maintained running total (e.g. kernel counters)."""
+        with self._lock:
+            self._value = float(value)
+
+    def get(self) -> float:
+        return self._value
+
+
+class _GaugeChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)  # Single assignment, no lock needed
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def get(self) -> float:
+        return self._value
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of a with-block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+
+class _Metric:
+    """A metric family: one child per label value combination."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values, **kwargs):
+        """Get (or create) the child for a label value combination."""
+        if kwargs:
+            values = tuple(str(kwargs[n]) for n in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def remove(self, *values) -> None:
+        """Drop the series for a label value combination."""
+        with self._lock:
+            self._children.pop(tuple(str(v) for v in values), None)
+
+    def clear(self) -> None:
+        """Drop all series (e.g. before a collector repopulates them)."""
+        with self._lock:
+            self._children.clear()
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def render(self, openmetrics: bool) -> List[str]:
+        family = self.name
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} {self.type_name}"]
+        for values, child in self._items():
+            lines.append(f"{family}{_format_labels(self.labelnames, values)} {_format_value(child.get())}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value (rendered with a _total suffix)."""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self, openmetrics: bool) -> List[str]:
+        # OpenMetrics names the family without the suffix, Prometheus 0.0.4 with it
+        family = self.name if openmetrics else f"{self.name}_total"
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} counter"]
+        for values, child in self._items():
+            lines.append(f"{self.name}_total{_format_labels(self.labelnames, values)} {_format_value(child.get())}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def render(self, openmetrics: bool) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for values, child in self._items():
+            counts, total, count = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families and scrape-time collectors."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter (name without the _total suffix)."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes metrics right before each scrape."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Run all collectors (errors are logged and skipped)."""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.debug(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Run collectors and render all metrics in text exposition format."""
+        self.collect()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render(openmetrics))
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# Global instance for easy access
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry instance."""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+# GStreamer pipeline helpers
+
+def instrument_pipeline(pipeline, pipeline_name: str) -> int:
+    """Count encoder output bytes for each encoder in a pipeline.
+
+    Adds a buffer probe on every encoder's src pad; the byte counter's
+    rate() is the encoder output bitrate.
+
+    Args:
+        pipeline: GStreamer pipeline
+        pipeline_name: Label value (e.g. "ingest_cam0", "mixer")
+
+    Returns:
+        Number of encoders instrumented
+    """
+    from .gst_utils import get_gst
+    Gst = get_gst()
+    if not Gst or pipeline is None:
+        return 0
+
+    encoder_bytes = get_metrics_registry().counter(
+        "r58_encoder_output_bytes", "Bytes produced by encoders", ["pipeline", "encoder"]
+    )
+    count = 0
+    try:
+        for element in pipeline.iterate_recurse():
+            factory = element.get_factory()
+            if not factory or "Encoder" not in (factory.get_metadata("klass") or ""):
+                continue
+            pad = element.get_static_pad("src")
+            if not pad:
+                continue
+            child = encoder_bytes.labels(pipeline_name, element.get_name())
+
+            def on_buffer(pad, info, child=child):
+                buf = info.get_buffer()
+                if buf:
+                    child.inc(buf.get_size())
+                return Gst.PadProbeReturn.OK
+
+            pad.add_probe(Gst.PadProbeType.BUFFER, on_buffer)
+            count += 1
+    except Exception as e:
+        logger.debug(f"Could not instrument pipeline {pipeline_name}: {e}")
+    return count
+
+
+def collect_queue_levels(pipeline_name: str, pipeline) -> None:
+    """Export fill level (0.0-1.0) of every queue in a pipeline."""
+    queue_fill = get_metrics_registry().gauge(
+        "r58_queue_fill_ratio", "Queue fill level relative to its limit", ["pipeline", "queue"]
+    )
+    for element in pipeline.iterate_recurse():
+        factory = element.get_factory()
+        if not factory or factory.get_name() not in ("queue", "queue2"):
+            continue
+        ratios = []
+        for current, maximum in (("current-level-buffers", "max-size-buffers"),
+                                 ("current-level-bytes", "max-size-bytes"),
+                                 ("current-level-time", "max-size-time")):
+            limit = element.get_property(maximum)
+            if limit:
+                ratios.append(element.get_property(current) / limit)
+        queue_fill.labels(pipeline_name, element.get_name()).set(max(ratios) if ratios else 0.0)
+
+
+# Scrape-time system collectors
+
+def collect_disk_stats() -> None:
+    """Mirror /proc/diskstats read/write counts and time spent.
+
+    rate(r58_disk_io_seconds_total) / rate(r58_disk_ops_total) is the
+    average I/O latency per device.
+    """
+    registry = get_metrics_registry()
+    ops = registry.counter("r58_disk_ops", "Completed disk operations", ["device", "op"])
+    seconds = registry.counter("r58_disk_io_seconds", "Time spent on disk operations", ["device", "op"])
+    try:
+        with open("/proc/diskstats", "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 11:
+            continue
+        device = fields[2]
+        if device.startswith(("loop", "ram", "zram")) or not Path(f"/sys/block/{device}").exists():
+            continue  # Whole disks only
+        reads, read_ms, writes, write_ms = int(fields[3]), int(fields[6]), int(fields[7]), int(fields[10])
+        ops.labels(device, "read").set_total(reads)
+        ops.labels(device, "write").set_total(writes)
+        seconds.labels(device, "read").set_total(read_ms / 1000)
+        seconds.labels(device, "write").set_total(write_ms / 1000)
+
+
+def collect_system_stats() -> None:
+    """Export load average, memory and thermal zone temperatures."""
+    registry = get_metrics_registry()
+    try:
+        with open("/proc/loadavg", "r") as f:
+            load1 = float(f.read().split()[0])
+        registry.gauge("r58_load1", "1-minute load average").set(load1)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        meminfo = {}
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                parts = line.split(":")
+                if len(parts) == 2:
+                    meminfo[parts[0].strip()] = int(parts[1].strip().split()[0]) * 1024
+        memory = registry.gauge("r58_memory_bytes", "Memory usage", ["state"])
+        total = meminfo.get("MemTotal", 0)
+        available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        memory.labels("total").set(total)
+        memory.labels("used").set(total - available)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    thermal = Path("/sys/class/thermal")
+    if thermal.exists():
+        temps = registry.gauge("r58_temperature_celsius", "Thermal zone temperature", ["zone"])
+        for zone in thermal.glob("thermal_zone*"):
+            try:
+                zone_type = (zone / "type").read_text().strip() if (zone / "type").exists() else zone.name
+                temps.labels(zone_type).set(int((zone / "temp").read_text().strip()) / 1000)
+            except (OSError, ValueError):
+                continue
+
+    registry.gauge("r58_process_resident_bytes", "API process resident memory").set(_read_rss_bytes())
+
+
+def _read_rss_bytes() -> float:
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0.0
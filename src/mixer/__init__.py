@@ -4,6 +4,7 @@ Components:
 - MixerCore: GStreamer compositor pipeline
 - SceneManager: Scene configuration management
 - SceneQueue: Automated scene queue with auto-advance
+- Multiview: Optional low-bandwidth program/preview/camera grid stream
 
 Optional dependency on Graphics plugin for presentation/graphics sources.
 
@@ -32,6 +33,7 @@ class MixerPlugin:
         self.core: Optional[Any] = None
         self.scene_manager: Optional[Any] = None
         self.scene_queue: Optional[Any] = None
+        self.multiview: Optional[Any] = None
         self.graphics_plugin: Optional[Any] = None  # Optional dependency
         self._initialized = False
     
@@ -79,10 +81,26 @@ class MixerPlugin:
             on_advance=queue_advance_callback
         )
         
+        # Multiview reads program frames the mixer publishes at its tile size
+        program_frames_resolution = None
+        if config.mixer.multiview_enabled:
+            from .multiview import Multiview
+            self.multiview = Multiview(
+                config=config,
+                ingest_manager=ingest_manager,
+                resolution=config.mixer.multiview_resolution,
+                fps=config.mixer.multiview_fps,
+                bitrate=config.mixer.multiview_bitrate,
+                mediamtx_path=config.mixer.multiview_path,
+            )
+            program_frames_resolution = self.multiview.program_frames_resolution
+        
         # Initialize core mixer with optional graphics
         graphics_renderer = None
+        prerender = None
         if graphics_plugin and graphics_plugin.is_initialized:
             graphics_renderer = graphics_plugin.renderer
+            prerender = graphics_plugin.prerender
             logger.info("Mixer using graphics plugin for presentations/overlays")
         else:
             logger.info("Mixer running without graphics plugin")
@@ -93,6 +111,7 @@ class MixerPlugin:
             ingest_manager=ingest_manager,
             graphics_renderer=graphics_renderer,  # Pass graphics renderer
             cairo_manager=cairo_manager,  # Pass Cairo manager for overlays
+            database=database,  # Probed media info for file sources
             output_resolution=config.mixer.output_resolution,
             output_bitrate=config.mixer.output_bitrate,
             output_codec=config.mixer.output_codec,
@@ -100,7 +119,25 @@ class MixerPlugin:
             recording_path=config.mixer.recording_path,
             mediamtx_enabled=config.mixer.mediamtx_enabled,
             mediamtx_path=config.mixer.mediamtx_path,
+            program_frames_resolution=program_frames_resolution,
+            preview_enabled=config.mixer.preview_enabled,
+            preview_resolution=config.mixer.preview_resolution,
+            preview_bitrate=config.mixer.preview_bitrate,
+            preview_path=config.mixer.preview_path,
+            compositor_backend=config.mixer.compositor_backend,
+            compositor_benchmark_file=config.mixer.compositor_benchmark_file,
+            clip_cache_mb=config.mixer.clip_cache_mb,
+            clip_cache_max_seconds=config.mixer.clip_cache_max_seconds,
+            prerender=prerender,
         )
+        self.core.start_backend_benchmark()
+        if self.multiview:
+            def update_tally(program, preview):
+                self.multiview.set_tally(
+                    [slot.source for slot in program.slots] if program else [],
+                    [slot.source for slot in preview.slots] if preview else [],
+                )
+            self.core.add_scene_listener(update_tally)
         
         self._initialized = True
         logger.info("Mixer plugin initialized")
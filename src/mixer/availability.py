@@ -0,0 +1,147 @@
+"""Source availability for the mixer, without I/O on the scene-change path.
+
+A background thread polls MediaMTX once per interval with a single
+/v3/paths/list call and keeps the set of paths that have a publisher.
+Ingest states are read from the in-process IngestManager. MixerCore asks
+this service (is_path_ready / is_ingest_streaming) while holding its lock,
+so building a pipeline or applying a scene never waits on HTTP.
+
+Listeners registered with add_ready_listener are called (from the poll
+thread) with the names of paths that just started publishing, so the mixer
+can attach guest sources as soon as they go live.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+_IPC_LATENCY = get_metrics_registry().histogram(
+    "r58_ipc_duration_seconds", "Latency of calls to local services", ["target"]
+)
+
+MEDIAMTX_API = "http://127.0.0.1:9997"
+POLL_INTERVAL = 1.0  # seconds
+
+
+def parse_ready_paths(payload: Dict[str, Any]) -> Set[str]:
+    """Names of published paths in a /v3/paths/list response.
+
+    MediaMTX >= 1.0 reports "ready"; older v3 APIs report "sourceReady".
+    """
+    ready = set()
+    for item in payload.get("items") or []:
+        if item.get("ready", item.get("sourceReady", False)):
+            ready.add(item.get("name"))
+    return ready
+
+
+class SourceAvailability:
+    """Continuously refreshed view of MediaMTX paths and ingest states."""
+
+    def __init__(
+        self,
+        ingest_manager: Optional[Any] = None,
+        api_url: str = MEDIAMTX_API,
+        interval: float = POLL_INTERVAL,
+    ):
+        self.ingest_manager = ingest_manager
+        self.api_url = api_url
+        self.interval = interval
+        self._ready_paths: Set[str] = set()
+        self._last_refresh: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop: Optional[threading.Event] = None  # Per run, so a stopped loop never resumes
+
+    def start(self) -> None:
+        """Start polling (idempotent)."""
+        if self._stop is not None and not self._stop.is_set():
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._poll_loop, args=(self._stop,), daemon=True, name="source-availability"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling; the poll thread exits at once (or after a refresh in flight)."""
+        if self._stop is not None:
+            self._stop.set()
+
+    def _poll_loop(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            self.refresh()
+            stop.wait(self.interval)
+
+    def refresh(self) -> None:
+        """Fetch the MediaMTX path list once and notify listeners of new paths."""
+        try:
+            import httpx
+            with _IPC_LATENCY.labels("mediamtx_api").time():
+                response = httpx.get(f"{self.api_url}/v3/paths/list", params={"itemsPerPage": 1000}, timeout=1.0)
+            response.raise_for_status()
+            ready = parse_ready_paths(response.json())
+            error = None
+        except Exception as e:
+            ready = None
+            error = str(e)
+
+        with self._lock:
+            if ready is None:
+                # Keep the last known view; an unreachable API is reported in status
+                if error != self._last_error:
+                    logger.warning(f"MediaMTX path list unavailable: {error}")
+                self._last_error = error
+                return
+            started = ready - self._ready_paths
+            self._ready_paths = ready
+            self._last_refresh = time.monotonic()
+            self._last_error = None
+            listeners = list(self._listeners)
+
+        if started:
+            logger.debug(f"MediaMTX paths ready: {sorted(started)}")
+            for callback in listeners:
+                try:
+                    callback(started)
+                except Exception as e:
+                    logger.warning(f"Source ready listener failed: {e}")
+
+    def ensure_fresh(self, max_age: float = 2.0) -> None:
+        """Refresh now if the view is missing or older than max_age (does I/O)."""
+        with self._lock:
+            stale = self._last_refresh is None or time.monotonic() - self._last_refresh > max_age
+        if stale:
+            self.refresh()
+
+    def add_ready_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Call callback(paths) when MediaMTX paths start publishing."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def is_path_ready(self, path: str) -> bool:
+        """Whether a MediaMTX path has a publisher (last polled view, no I/O)."""
+        with self._lock:
+            return path in self._ready_paths
+
+    def is_ingest_streaming(self, cam_id: str) -> bool:
+        """Whether a camera's ingest pipeline is streaming (in-process, no I/O)."""
+        if not self.ingest_manager:
+            return False
+        return self.ingest_manager.states.get(cam_id) == "streaming"
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready_paths": sorted(self._ready_paths),
+                "age_seconds": (
+                    round(time.monotonic() - self._last_refresh, 1) if self._last_refresh is not None else None
+                ),
+                "error": self._last_error,
+            }
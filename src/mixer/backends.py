@@ -0,0 +1,246 @@
+"""Compositor backends for the mixer.
+
+A backend provides the compositor element that blends the source branches
+and the glue needed to get its output back into system memory for the
+time overlay and the encoder. Available backends:
+
+- software: the `compositor` element (CPU, always available)
+- gl: `glvideomixer` (OpenGL ES, e.g. the Mali GPU on RK3588)
+- rga: placeholder for a Rockchip RGA 2D-engine compositor (no GStreamer
+  element yet, never available)
+
+With mixer.compositor_backend "auto", MixerCore benchmarks every available
+backend on its scenes (videotestsrc inputs, see benchmark_backend) in the
+background when the plugin starts and uses the fastest one from the next
+pipeline build. The result is saved to mixer.compositor_benchmark_file and
+reused until the resolution, the installed backends or GStreamer change.
+scripts/benchmark_compositor_backends.py runs the same benchmark from the
+command line.
+"""
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_FRAMES = 90
+
+
+@dataclass(frozen=True)
+class CompositorBackend:
+    """A compositor element plus the glue around it."""
+    name: str
+    description: str
+    elements: Tuple[str, ...]  # Factories that must be installed
+    mixer: str  # Compositor element description ({name} is substituted)
+    download: str = ""  # Output back to system memory (before the output caps)
+    clock_transitions: bool = True  # Pad properties can be bound to control sources
+    atomic_updates: bool = True  # Emits samples-selected for atomic pad updates
+
+    def is_available(self, Gst) -> bool:
+        return bool(self.elements) and all(Gst.ElementFactory.find(e) for e in self.elements)
+
+    def mixer_str(self, name: str) -> str:
+        return self.mixer.format(name=name)
+
+    def output_str(self, width: int, height: int) -> str:
+        """Compositor output to system memory at the mixer resolution."""
+        caps = f"video/x-raw,width={width},height={height}"
+        return f"{self.download} ! {caps}" if self.download else caps
+
+
+BACKENDS: Dict[str, CompositorBackend] = {
+    "software": CompositorBackend(
+        name="software",
+        description="compositor (CPU)",
+        elements=("compositor",),
+        mixer="compositor name={name} background=black",
+    ),
+    "gl": CompositorBackend(
+        name="gl",
+        description="glvideomixer (OpenGL)",
+        elements=("glvideomixer", "gldownload"),
+        mixer="glvideomixer name={name} background=black",
+        download="gldownload",
+        # glvideomixer is a bin: controllers bound to its pads are not synced
+        # by the inner aggregator and it has no samples-selected signal
+        clock_transitions=False,
+        atomic_updates=False,
+    ),
+    "rga": CompositorBackend(
+        name="rga",
+        description="Rockchip RGA 2D engine (not implemented)",
+        elements=(),
+        mixer="",
+    ),
+}
+DEFAULT_BACKEND = "software"
+
+
+def get_backend(name: str) -> CompositorBackend:
+    """Get a backend by name.
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown compositor backend: {name} (expected one of {', '.join(BACKENDS)})")
+    return BACKENDS[name]
+
+
+def available_backends(Gst) -> List[CompositorBackend]:
+    return [backend for backend in BACKENDS.values() if backend.is_available(Gst)]
+
+
+def select_backend(results: Dict[str, Optional[float]]) -> str:
+    """Pick the backend with the lowest ms/frame (failed runs are None)."""
+    timed = {name: ms for name, ms in results.items() if ms is not None}
+    if not timed:
+        return DEFAULT_BACKEND
+    return min(timed, key=timed.get)
+
+
+def _benchmark_source(coords: Dict[str, int], frames: int) -> str:
+    """videotestsrc producing frames at the slot size, as the slot tails deliver them."""
+    return (
+        f"videotestsrc num-buffers={frames} pattern=smpte ! "
+        f"video/x-raw,format=NV12,width={max(1, coords['w'])},height={max(1, coords['h'])},framerate=30/1"
+    )
+
+
+def build_baseline_pipeline_str(scene, frames: int) -> str:
+    """The benchmark's sources alone, each into a fakesink (cost subtracted from the timings)."""
+    return " ".join(
+        f"{_benchmark_source(scene.get_absolute_coords(slot), frames)} ! fakesink sync=false"
+        for slot in scene.slots
+    )
+
+
+def build_benchmark_pipeline_str(
+    backend: CompositorBackend, scene, output_size: Tuple[int, int], frames: int
+) -> str:
+    """Scene layout fed by slot-sized videotestsrc frames, composited into a fakesink.
+    
+    Sources are generated at their slot size, so the pipeline scales
+    nothing before the compositor and the timing is the compositor's
+    (plus the source baseline, see benchmark_backend).
+    """
+    width, height = output_size
+    pad_props = []
+    branches = []
+    for i, slot in enumerate(scene.slots):
+        coords = scene.get_absolute_coords(slot)
+        branches.append(f"{_benchmark_source(coords, frames)} ! mix.sink_{i}")
+        pad_props.append(
+            f"sink_{i}::xpos={coords['x']} sink_{i}::ypos={coords['y']} "
+            f"sink_{i}::width={coords['w']} sink_{i}::height={coords['h']} sink_{i}::zorder={slot.z}"
+        )
+    return (
+        f"{backend.mixer_str('mix')} {' '.join(pad_props)} ! "
+        f"{backend.output_str(width, height)} ! "
+        f"videoconvert ! video/x-raw,format=NV12 ! fakesink sync=false "
+        + " ".join(branches)
+    )
+
+
+def _time_pipeline(Gst, description: str, frames: int, timeout: float, label: str) -> Optional[float]:
+    """Run a pipeline to EOS and return ms per frame (None on failure)."""
+    try:
+        pipeline = Gst.parse_launch(description)
+    except Exception as e:
+        logger.warning(f"{label}: cannot build benchmark: {e}")
+        return None
+    bus = pipeline.get_bus()
+    start = time.monotonic()
+    pipeline.set_state(Gst.State.PLAYING)
+    msg = bus.timed_pop_filtered(
+        int(timeout * Gst.SECOND), Gst.MessageType.EOS | Gst.MessageType.ERROR
+    )
+    elapsed = time.monotonic() - start
+    pipeline.set_state(Gst.State.NULL)
+    if not msg or msg.type != Gst.MessageType.EOS:
+        detail = msg.parse_error()[0].message if msg else "timeout"
+        logger.warning(f"{label}: benchmark failed: {detail}")
+        return None
+    return 1000.0 * elapsed / frames
+
+
+def benchmark_baselines(
+    Gst, scenes: list, frames: int = BENCHMARK_FRAMES, timeout: float = 30.0
+) -> Dict[str, float]:
+    """ms/frame of each scene's sources alone (scene id -> ms, 0 if it failed)."""
+    baselines = {}
+    for scene in scenes:
+        if scene.slots:
+            description = build_baseline_pipeline_str(scene, frames)
+            baselines[scene.id] = _time_pipeline(Gst, description, frames, timeout, f"{scene.id} sources") or 0.0
+    return baselines
+
+
+def benchmark_backend(
+    Gst, backend: CompositorBackend, scenes: list, output_size: Tuple[int, int],
+    frames: int = BENCHMARK_FRAMES, timeout: float = 30.0,
+    baselines: Optional[Dict[str, float]] = None,
+) -> Optional[float]:
+    """Average ms per output frame of a backend over scenes (None on failure).
+    
+    baselines (see benchmark_baselines) are subtracted per scene, so the
+    result is the compositor and output path without the test sources.
+    """
+    timings = []
+    for scene in scenes:
+        if not scene.slots:
+            continue
+        ms = _time_pipeline(
+            Gst, build_benchmark_pipeline_str(backend, scene, output_size, frames), frames, timeout,
+            f"Backend {backend.name} on {scene.id}",
+        )
+        if ms is None:
+            return None
+        timings.append(max(0.0, ms - (baselines or {}).get(scene.id, 0.0)))
+    if not timings:
+        return None
+    return sum(timings) / len(timings)
+
+
+def benchmark_backends(
+    Gst, scenes: list, output_size: Tuple[int, int], frames: int = BENCHMARK_FRAMES
+) -> Dict[str, Optional[float]]:
+    """ms/frame for every available backend (source baseline subtracted)."""
+    baselines = benchmark_baselines(Gst, scenes, frames)
+    results = {}
+    for backend in available_backends(Gst):
+        results[backend.name] = benchmark_backend(Gst, backend, scenes, output_size, frames, baselines=baselines)
+        logger.info(f"Compositor backend {backend.name}: {results[backend.name]} ms/frame")
+    return results
+
+
+def benchmark_key(Gst, output_size: Tuple[int, int]) -> Dict[str, Any]:
+    """What a saved benchmark result depends on."""
+    return {
+        "resolution": f"{output_size[0]}x{output_size[1]}",
+        "backends": sorted(backend.name for backend in available_backends(Gst)),
+        "gstreamer": Gst.version_string(),
+    }
+
+
+def load_benchmark(path: str, key: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
+    """Saved results for key, or None if missing, stale or unreadable."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key or not isinstance(data.get("results"), dict):
+        return None
+    return data["results"]
+
+
+def save_benchmark(path: str, key: Dict[str, Any], results: Dict[str, Optional[float]]) -> None:
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps({"key": key, "results": results}, indent=2))
+    except OSError as e:
+        logger.warning(f"Could not save compositor benchmark to {path}: {e}")
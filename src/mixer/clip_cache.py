@@ -0,0 +1,264 @@
+"""RAM-resident cache of pre-decoded clips and images for the mixer.
+
+Stingers, short loops and stills are decoded once, in the background, to raw
+frames at the mixer output size and kept in memory (LRU, bounded by a byte
+budget). A cached slot plays through an appsrc that pushes the stored
+buffers (shallow copies, no decode), so the branch delivers its first frame
+immediately and loops are frame-exact: the loop point is just the frame
+index wrapping while timestamps keep counting.
+
+Image sequences (directories of numbered PNGs, e.g. pre-rendered HTML
+graphics, see graphics/prerender.py) are cached as BGRA frames, so their
+transparency survives.
+
+Files that are too long or too large for the budget keep the streaming
+filesrc ! decoder path in MixerCore._build_source_branch (sequences stream
+through build_sequence_source).
+"""
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..gst_utils import get_gst
+
+logger = logging.getLogger(__name__)
+
+CLIP_FRAMERATE = 30
+CLIP_FORMAT = "NV12"
+IMAGE_FORMAT = "BGRA"  # Keeps PNG transparency for the compositor
+DECODE_TIMEOUT = 60.0  # seconds
+
+IMAGE_DECODERS = {".png": "pngdec", ".jpg": "jpegdec", ".jpeg": "jpegdec"}
+SEQUENCE_PATTERN = "%05d.png"  # Frame file names inside an image sequence directory
+
+
+def is_sequence(path: str) -> bool:
+    """Whether path is an image sequence directory (frames named SEQUENCE_PATTERN)."""
+    return Path(path).is_dir()
+
+
+def build_sequence_source(path: str, loop: bool = False) -> str:
+    """Streaming source fragment for an image sequence (PNG decode per frame)."""
+    return (
+        f'multifilesrc location="{Path(path) / SEQUENCE_PATTERN}" index=0 loop={str(loop).lower()} '
+        f'caps="image/png,framerate={CLIP_FRAMERATE}/1" ! pngdec'
+    )
+
+
+def frame_bytes(width: int, height: int, video_format: str = CLIP_FORMAT) -> int:
+    """Size of one raw frame (NV12: 1.5 bytes/pixel, BGRA: 4)."""
+    if video_format == IMAGE_FORMAT:
+        return width * height * 4
+    return width * height * 3 // 2
+
+
+def estimate_clip_bytes(
+    duration_s: float, width: int, height: int, fps: int = CLIP_FRAMERATE, video_format: str = CLIP_FORMAT
+) -> int:
+    return int(duration_s * fps + 1) * frame_bytes(width, height, video_format)
+
+
+@dataclass
+class CachedClip:
+    """Decoded frames of one file at one size."""
+    key: Tuple[str, float, int, int]  # (path, mtime, width, height)
+    caps: str
+    frames: List[Any] = field(repr=False)  # Gst.Buffer, system memory
+    frame_ns: int
+    size_bytes: int
+
+    @property
+    def is_image(self) -> bool:
+        return len(self.frames) == 1
+
+
+class ClipCache:
+    """LRU of decoded clips bounded by budget_bytes."""
+
+    def __init__(self, budget_bytes: int = 512 * 1024 * 1024, max_seconds: float = 15.0):
+        self.budget_bytes = budget_bytes
+        self.max_seconds = max_seconds
+        self._clips: "OrderedDict[Tuple[str, float, int, int], CachedClip]" = OrderedDict()
+        self._used_bytes = 0
+        self._loading: Dict[Tuple[str, float, int, int], threading.Thread] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(path: str, size: Tuple[int, int]) -> Optional[Tuple[str, float, int, int]]:
+        try:
+            mtime = Path(path).stat().st_mtime
+        except OSError:
+            return None
+        return (str(path), mtime, size[0], size[1])
+
+    def is_cacheable(self, path: str, size: Tuple[int, int], duration_s: Optional[float]) -> bool:
+        """Images always; videos and sequences only with a known, short enough duration."""
+        if Path(path).suffix.lower() in IMAGE_DECODERS:
+            return frame_bytes(*size, IMAGE_FORMAT) <= self.budget_bytes
+        if not duration_s or duration_s > self.max_seconds:
+            return False
+        video_format = IMAGE_FORMAT if is_sequence(path) else CLIP_FORMAT
+        return estimate_clip_bytes(duration_s, *size, video_format=video_format) <= self.budget_bytes
+
+    def get(self, path: str, size: Tuple[int, int]) -> Optional[CachedClip]:
+        """Get a decoded clip (and mark it most recently used)."""
+        key = self.make_key(path, size)
+        with self._lock:
+            clip = self._clips.get(key) if key else None
+            if clip:
+                self._clips.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return clip
+
+    def prefetch(self, path: str, size: Tuple[int, int], duration_s: Optional[float] = None) -> None:
+        """Decode a file into the cache in the background (no-op if cached or loading)."""
+        if not self.is_cacheable(path, size, duration_s):
+            return
+        key = self.make_key(path, size)
+        if not key:
+            return
+        with self._lock:
+            if key in self._clips or key in self._loading:
+                return
+            thread = threading.Thread(target=self._load, args=(key,), daemon=True, name="clip-cache")
+            self._loading[key] = thread
+        thread.start()
+
+    def _load(self, key: Tuple[str, float, int, int]) -> None:
+        try:
+            clip = self._decode(key)
+            if clip:
+                self._insert(clip)
+        except Exception as e:
+            logger.warning(f"Clip cache: failed to decode {key[0]}: {e}")
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def _insert(self, clip: CachedClip) -> None:
+        with self._lock:
+            if clip.size_bytes > self.budget_bytes:
+                logger.info(f"Clip cache: {clip.key[0]} ({clip.size_bytes >> 20} MB) exceeds budget, streaming it")
+                return
+            while self._clips and self._used_bytes + clip.size_bytes > self.budget_bytes:
+                _, evicted = self._clips.popitem(last=False)
+                self._used_bytes -= evicted.size_bytes
+                logger.info(f"Clip cache: evicted {evicted.key[0]}")
+            self._clips[clip.key] = clip
+            self._used_bytes += clip.size_bytes
+        logger.info(f"Clip cache: {clip.key[0]} ready ({len(clip.frames)} frames, {clip.size_bytes >> 20} MB)")
+
+    def _decode(self, key: Tuple[str, float, int, int]) -> Optional[CachedClip]:
+        """Decode a file to raw frames at the cache size (blocking)."""
+        Gst = get_gst()
+        path, _, width, height = key
+        decoder = IMAGE_DECODERS.get(Path(path).suffix.lower())
+        source = f'filesrc location="{path}"'
+        if is_sequence(path):
+            caps = (
+                f"video/x-raw,format={IMAGE_FORMAT},width={width},height={height},"
+                f"pixel-aspect-ratio=1/1,framerate={CLIP_FRAMERATE}/1"
+            )
+            source = build_sequence_source(path)
+            chain = f"videoconvert ! videoscale add-borders=false ! {caps}"
+        elif decoder:
+            caps = f"video/x-raw,format={IMAGE_FORMAT},width={width},height={height},pixel-aspect-ratio=1/1"
+            chain = f"{decoder} ! videoconvert ! videoscale add-borders=false ! {caps}"
+        else:
+            caps = (
+                f"video/x-raw,format={CLIP_FORMAT},width={width},height={height},"
+                f"pixel-aspect-ratio=1/1,framerate={CLIP_FRAMERATE}/1"
+            )
+            chain = f"decodebin ! videoconvert ! videoscale add-borders=false ! videorate ! {caps}"
+        pipeline = Gst.parse_launch(
+            f"{source} ! {chain} ! appsink name=sink sync=false emit-signals=false"
+        )
+        sink = pipeline.get_by_name("sink")
+        budget = self.budget_bytes
+        frames = []
+        size_bytes = 0
+        pipeline.set_state(Gst.State.PLAYING)
+        try:
+            while True:
+                sample = sink.emit("try-pull-sample", int(DECODE_TIMEOUT * Gst.SECOND))
+                if sample is None:
+                    break
+                # Deep copy: decoder pool buffers must go back to the decoder
+                buffer = sample.get_buffer().copy_deep()
+                size_bytes += buffer.get_size()
+                if size_bytes > budget:
+                    logger.info(f"Clip cache: {path} exceeds the cache budget, streaming it")
+                    return None
+                frames.append(buffer)
+            bus = pipeline.get_bus()
+            error = bus.pop_filtered(Gst.MessageType.ERROR)
+            if error:
+                raise RuntimeError(error.parse_error()[0].message)
+        finally:
+            pipeline.set_state(Gst.State.NULL)
+        if not frames:
+            return None
+        return CachedClip(
+            key=key,
+            caps=caps,
+            frames=frames,
+            frame_ns=Gst.SECOND // CLIP_FRAMERATE,
+            size_bytes=size_bytes,
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clips": len(self._clips),
+                "loading": len(self._loading),
+                "used_mb": round(self._used_bytes / (1 << 20), 1),
+                "budget_mb": round(self.budget_bytes / (1 << 20), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def build_clip_source(clip: CachedClip) -> str:
+    """appsrc fragment for a cached clip (the player feeds it by name)."""
+    return (
+        f'appsrc name=clip_src format=time is-live=false '
+        f'max-bytes={2 * clip.frames[0].get_size()} caps="{clip.caps}"'
+    )
+
+
+class ClipPlayer:
+    """Feeds a cached clip into an appsrc, looping on exact frame boundaries.
+
+    Timestamps keep increasing across loop points, so downstream sees one
+    continuous stream. Images repeat their single frame at CLIP_FRAMERATE.
+    """
+
+    def __init__(self, appsrc, clip: CachedClip, loop: bool, max_frames: Optional[int] = None):
+        self.clip = clip
+        self.loop = loop or clip.is_image
+        self.max_frames = max_frames
+        self._frame = 0
+        appsrc.connect("need-data", self._on_need_data)
+
+    def _on_need_data(self, appsrc, length) -> None:
+        frames = self.clip.frames
+        done = (
+            (not self.loop and self._frame >= len(frames))
+            or (self.max_frames is not None and self._frame >= self.max_frames)
+        )
+        if done:
+            appsrc.emit("end-of-stream")
+            return
+        buffer = frames[self._frame % len(frames)].copy()  # Shallow: shares the frame memory
+        buffer.pts = self._frame * self.clip.frame_ns
+        buffer.dts = buffer.pts
+        buffer.duration = self.clip.frame_ns
+        self._frame += 1
+        appsrc.emit("push-buffer", buffer)
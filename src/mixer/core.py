@@ -1,17 +1,44 @@
 """Mixer Core - GStreamer compositor pipeline for scene-based mixing."""
+import json
 import logging
 import time
 import threading
 import subprocess
 import os
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
-from .scenes import SceneManager, Scene
+from .scenes import SceneManager, Scene, ScenePlan, compile_scene, diff_plan
 from .watchdog import MixerWatchdog, HealthStatus
+from .availability import SourceAvailability
+from .clip_cache import CLIP_FRAMERATE, ClipCache, ClipPlayer, build_clip_source, build_sequence_source
+from .backends import (
+    DEFAULT_BACKEND,
+    CompositorBackend,
+    benchmark_backends,
+    benchmark_key,
+    get_backend,
+    load_benchmark,
+    save_benchmark,
+    select_backend,
+)
 from .graphics import GraphicsRenderer
-from ..gst_utils import ensure_gst_initialized, get_gst, get_glib
+from ..cairo_graphics.layer import GraphicsLayer, build_graphics_source
+from .transitions import (
+    DEFAULT_DURATIONS_MS,
+    DIP_COLOURS,
+    PadState,
+    bind_keyframes,
+    duration_frames,
+    frame_aligned_start,
+    normalize_transition,
+    plan_transition,
+    value_at,
+)
+from ..gst_utils import ensure_gst_initialized, get_gst, get_gst_controller
+from ..metrics import instrument_pipeline
+from ..pipelines import build_local_frame_source, get_local_frame_branch, get_local_frame_channel
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +48,15 @@ os.environ["GST_VIDEO_CONVERT_USE_RGA"] = "1"
 # Timeout for state transitions (seconds)
 STATE_CHANGE_TIMEOUT = 10.0
 
+# Dynamic sources: wait this long for a new branch's first frame (seconds)
+SOURCE_START_TIMEOUT = 5.0
+# Hidden source branches are removed after this long unused (seconds)
+IDLE_SOURCE_GRACE = 30.0
+# Added to incoming pads' zorder during covering transitions (wipe/slide/zoom)
+TRANSITION_ZORDER_BOOST = 100
+# Queued pad updates are applied directly if no frame is aggregated in time (seconds)
+PAD_UPDATE_TIMEOUT = 0.2
+
 
 def _detect_hardware_decoder() -> Optional[str]:
     """Detect available hardware H.264 decoder.
@@ -69,6 +105,151 @@ def _build_decoder_string(hardware_decoder: Optional[str] = None) -> str:
         return "decodebin ! videoconvert"
 
 
+# Cached container name -> demuxer (from media probe)
+FILE_DEMUXERS = {
+    "mp4": "qtdemux",
+    "matroska": "matroskademux",
+    "webm": "matroskademux",
+    "avi": "avidemux",
+}
+
+
+def _build_file_decoder_string(
+    media_info: Optional[Dict[str, Any]],
+    hardware_decoder: Optional[str] = None
+) -> str:
+    """Build a direct demux/parse/decode chain from probed media info.
+    
+    Avoids decodebin autoplugging (typefinding and registry lookups) when a
+    file source is added at scene-switch time. Falls back to decodebin when
+    the file has not been probed or uses an unknown container/codec.
+    
+    Args:
+        media_info: File metadata with "container" and "video_codec"
+        hardware_decoder: Hardware decoder element name (from _detect_hardware_decoder)
+    
+    Returns:
+        GStreamer pipeline fragment that outputs raw video
+    """
+    if not media_info or media_info.get("probe_status") != "ok":
+        return "decodebin"
+    
+    demuxer = FILE_DEMUXERS.get(media_info.get("container") or "")
+    codec = media_info.get("video_codec")
+    if not demuxer:
+        return "decodebin"
+    
+    if codec == "h264":
+        decoder = f"h264parse ! {hardware_decoder or 'avdec_h264'}"
+    elif codec == "h265":
+        hw = hardware_decoder if hardware_decoder == "mppvideodec" else None
+        decoder = f"h265parse ! {hw or 'avdec_h265'}"
+    elif codec == "vp8":
+        decoder = "vp8dec"
+    elif codec == "vp9":
+        decoder = "vp9dec"
+    else:
+        return "decodebin"
+    
+    return f"{demuxer} ! {decoder}"
+
+
+SLOT_QUEUE = "queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
+# Stretch to the slot like the compositor pads did; videoscale otherwise
+# letterboxes sources whose aspect ratio differs from the slot's
+SLOT_SCALE = "videoscale add-borders=false"
+
+
+# Slot types played from non-live sources (files, stills, pre-rendered clips):
+# their timestamps start at 0, so a branch added to a running pipeline is
+# offset to the current running time (see MixerCore._attach_source_branch)
+NON_LIVE_SOURCE_TYPES = frozenset({"file", "image", "template"})
+
+
+def _needs_running_time_offset(slot) -> bool:
+    return slot.source_type in NON_LIVE_SOURCE_TYPES
+
+
+def _has_crop(slot) -> bool:
+    return slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0
+
+
+def _compute_crop(slot, source_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """Convert a slot's relative crop to videocrop (left, top, right, bottom) pixels."""
+    source_width, source_height = source_size
+    left = int(slot.crop_x * source_width)
+    top = int(slot.crop_y * source_height)
+    right = max(0, int((1.0 - slot.crop_x - slot.crop_w) * source_width))
+    bottom = max(0, int((1.0 - slot.crop_y - slot.crop_h) * source_height))
+    return left, top, right, bottom
+
+
+def _slot_caps(coords: Dict[str, int]) -> str:
+    """Caps that make a source branch negotiate directly to its slot size."""
+    return f"video/x-raw,width={max(1, coords['w'])},height={max(1, coords['h'])},pixel-aspect-ratio=1/1"
+
+
+def _build_slot_tail(
+    pad_index: int,
+    slot,
+    coords: Dict[str, int],
+    source_size: Optional[Tuple[int, int]],
+    output_size: Tuple[int, int],
+) -> str:
+    """Build the crop/scale tail of a source branch.
+    
+    Frames are cropped first and then scaled once, straight to the slot's
+    pixel size, so the compositor blends them without scaling again (a quad
+    scene scales four 1080p inputs to 960x540 instead of 1080p -> 1080p ->
+    960x540). The capsfilter is named slot_caps_<pad> so a scene change can
+    renegotiate it (see MixerCore._set_slot_geometry).
+    
+    Args:
+        pad_index: Compositor sink pad index
+        slot: SceneSlot
+        coords: Slot rectangle from Scene.get_absolute_coords
+        source_size: Decoded frame size of the branch, if known
+        output_size: Mixer output size (used to normalize unknown sources before cropping)
+    """
+    parts = []
+    if _has_crop(slot):
+        if source_size is None:
+            # Unknown input size: normalize first so relative crops stay correct
+            parts.append(f"videoscale ! video/x-raw,width={output_size[0]},height={output_size[1]}")
+            source_size = output_size
+        left, top, right, bottom = _compute_crop(slot, source_size)
+        parts.append(f"videocrop name=slot_crop_{pad_index} left={left} top={top} right={right} bottom={bottom}")
+    parts.append(SLOT_SCALE)
+    parts.append("videoconvert")
+    parts.append(f'capsfilter name=slot_caps_{pad_index} caps="{_slot_caps(coords)}"')
+    parts.append(SLOT_QUEUE)
+    return " ! ".join(parts)
+
+
+def _build_preview_tail(
+    pad_index: int,
+    slot,
+    coords: Dict[str, int],
+    source_size: Optional[Tuple[int, int]],
+) -> str:
+    """Build the preview bus branch of a source (after the source tee).
+    
+    Starts with a leaky queue so a slow preview composite never stalls the
+    program branch. Crops need the decoded size, so sources of unknown size
+    are shown uncropped on preview. Ends in preview_out_<pad>, which
+    MixerCore._attach_source_branch ghosts as the bin's preview_src pad.
+    """
+    parts = [SLOT_QUEUE]
+    if source_size and _has_crop(slot):
+        left, top, right, bottom = _compute_crop(slot, source_size)
+        parts.append(f"videocrop name=preview_crop_{pad_index} left={left} top={top} right={right} bottom={bottom}")
+    parts.append(SLOT_SCALE)
+    parts.append("videoconvert")
+    parts.append(f'capsfilter name=preview_caps_{pad_index} caps="{_slot_caps(coords)}"')
+    parts.append(f"queue name=preview_out_{pad_index} max-size-buffers=2 max-size-time=0 max-size-bytes=0")
+    return " ! ".join(parts)
+
+
 class MixerCore:
     """Manages GStreamer compositor pipeline for mixing multiple video sources."""
 
@@ -79,6 +260,7 @@ class MixerCore:
         ingest_manager: Optional[Any] = None,  # IngestManager instance
         graphics_renderer: Optional[Any] = None,  # Optional GraphicsRenderer from graphics plugin
         cairo_manager: Optional[Any] = None,  # Optional CairoGraphicsManager
+        database: Optional[Any] = None,  # Database with probed file metadata
         output_resolution: str = "1920x1080",
         output_bitrate: int = 8000,
         output_codec: str = "h264",
@@ -86,6 +268,16 @@ class MixerCore:
         recording_path: Optional[str] = None,
         mediamtx_enabled: bool = True,
         mediamtx_path: Optional[str] = None,
+        program_frames_resolution: Optional[str] = None,
+        preview_enabled: bool = False,
+        preview_resolution: str = "640x360",
+        preview_bitrate: int = 800,
+        preview_path: str = "mixer_preview",
+        compositor_backend: str = "auto",
+        compositor_benchmark_file: str = "compositor_benchmark.json",
+        clip_cache_mb: int = 512,
+        clip_cache_max_seconds: float = 15.0,
+        prerender: Optional[Any] = None,  # Optional PrerenderFarm from graphics plugin
     ):
         """Initialize mixer core.
         
@@ -95,6 +287,7 @@ class MixerCore:
             ingest_manager: Ingest manager instance (for checking stream availability)
             graphics_renderer: Optional graphics renderer from graphics plugin
             cairo_manager: Optional Cairo graphics manager for overlays
+            database: Optional database for probed file metadata (direct decoder selection)
             output_resolution: Output resolution (e.g., "1920x1080")
             output_bitrate: Output bitrate in kbps
             output_codec: Codec ("h264" or "h265")
@@ -102,12 +295,27 @@ class MixerCore:
             recording_path: Path template for recordings (supports strftime)
             mediamtx_enabled: Enable MediaMTX streaming
             mediamtx_path: MediaMTX path (e.g., "mixer_program")
+            program_frames_resolution: Publish raw program frames at this size
+                (intervideo channels "program" and "preview", read by the multiview)
+            preview_enabled: Run a second compositor bus for the staged scene
+            preview_resolution: Preview bus resolution
+            preview_bitrate: Preview bus bitrate in kbps
+            preview_path: MediaMTX path of the preview bus
+            compositor_backend: "auto" (benchmark in the background, see
+                start_backend_benchmark) or a backend name from
+                backends.BACKENDS ("software", "gl")
+            compositor_benchmark_file: Where the "auto" benchmark result is saved
+            clip_cache_mb: Memory budget for pre-decoded clips and images
+            clip_cache_max_seconds: Longest video kept in the clip cache
+            prerender: Optional template pre-render farm (plays "template" slots)
         """
         self.config = config
         self.scene_manager = scene_manager
         self.ingest_manager = ingest_manager
         self.graphics_renderer = graphics_renderer  # Store optional graphics renderer
         self.cairo_manager = cairo_manager  # Store optional Cairo graphics manager
+        self._graphics_layer: Optional[GraphicsLayer] = None  # Cairo graphics as a compositor input
+        self.database = database
         self.output_resolution = output_resolution
         self.output_bitrate = output_bitrate
         self.output_codec = output_codec
@@ -115,18 +323,69 @@ class MixerCore:
         self.recording_path = recording_path
         self.mediamtx_enabled = mediamtx_enabled
         self.mediamtx_path = mediamtx_path or "mixer_program"
+        self.program_frames_resolution = program_frames_resolution
+        self.preview_enabled = preview_enabled
+        self.preview_resolution = preview_resolution
+        self.preview_bitrate = preview_bitrate
+        self.preview_path = preview_path
+        self._scene_listeners: list = []  # callables(program_scene, preview_scene), e.g. multiview tally
+        
+        # Compositor backend (see backends.py), chosen at each pipeline build
+        self.compositor_backend = compositor_backend
+        self.compositor_benchmark_file = compositor_benchmark_file
+        self._backend: Optional[CompositorBackend] = None
+        self._backend_benchmark: Dict[str, Optional[float]] = {}  # backend -> ms/frame
+        self._benchmark_thread: Optional[threading.Thread] = None
+        
+        # Short clips and images play from RAM (see clip_cache.py)
+        self.clip_cache = ClipCache(clip_cache_mb * 1024 * 1024, clip_cache_max_seconds)
+        self._pending_clips: Dict[str, Tuple[Any, bool, Optional[int]]] = {}  # source -> player args
+        self._clip_players: Dict[int, ClipPlayer] = {}  # pad index -> player
+        
+        # HTML template slots play pre-rendered clips (see graphics/prerender.py)
+        self.prerender = prerender
+        # Template slot spec -> pre-render key, filled outside the lock (see _prepare_scene_sources)
+        self._template_keys: Dict[Tuple[str, str, float], str] = {}
+        # File slot (file ID, path) -> probed media info from the database, filled the same way
+        self._media_info: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {}
+        
+        # Polled MediaMTX/ingest view: availability checks under the lock do no I/O
+        self.availability = SourceAvailability(ingest_manager)
+        self.availability.add_ready_listener(self._on_paths_ready)
+        if prerender:
+            # Template slots waiting for their render attach like sources going live
+            prerender.add_ready_listener(self._on_paths_ready)
 
         # Pipeline state
         self.pipeline = None  # self.Gst.Pipeline
         self.current_scene: Optional[Scene] = None
+        self.preview_scene: Optional[Scene] = None  # Staged scene on the preview bus
         self.state: str = "NULL"
         self.last_error: Optional[str] = None
         self._lock = threading.Lock()
         self._gst_ready = False
         
-        # Pre-allocation mode: build pipeline with all available sources
-        # This eliminates pipeline rebuilds at the cost of more resources
-        self.preallocate_sources = True  # Enable by default for best latency
+        # Dynamic sources: scene changes attach/detach source bins on compositor
+        # request pads of the running pipeline. Unused branches stay attached
+        # (hidden) for idle_source_grace seconds so switching back is instant.
+        self.idle_source_grace = IDLE_SOURCE_GRACE
+        self._source_pads: Dict[str, int] = {}  # source -> compositor pad index
+        self._next_pad_index = 0
+        self._scene_request = 0
+        self._removal_timers: Dict[str, threading.Timer] = {}
+        
+        # Scene changes apply precompiled plans (SceneManager.get_plan) and
+        # only set pad properties that differ from the last values we set.
+        # Updates are committed together between two output frames. Both
+        # are kept per compositor ("compositor" = program, "preview_compositor").
+        self._pad_state: Dict[str, Dict[int, Dict[str, Any]]] = {}  # bus -> pad index -> last set properties
+        self._pad_updates: Dict[str, Dict[int, Dict[str, Any]]] = {}  # bus -> pad index -> awaiting commit
+        self._pad_updates_lock = threading.Lock()
+        self._pad_updates_handlers: Dict[str, int] = {}  # bus -> samples-selected handler id
+        
+        # Active clock-driven transition (see _start_clock_transition)
+        self._transition: Optional[Dict[str, Any]] = None
+        self._transition_bindings: list = []  # (pad, control binding)
         
         # Overlay layer support (for Reveal.js and other graphics)
         self.overlay_enabled: bool = False
@@ -145,15 +404,25 @@ class MixerCore:
         # Don't initialize GStreamer here - lazy load when needed
         self._Gst = None  # Will be set by _ensure_gst
         self._hardware_decoder = None  # Will be detected when GStreamer is ready
+        self._slot_source_sizes: Dict[int, Tuple[int, int]] = {}  # pad index -> decoded size (for crop)
 
         # Get camera devices from config
         self.camera_devices = {}
         for cam_id, cam_config in config.cameras.items():
             self.camera_devices[cam_id] = cam_config.device
 
+        width, height = output_resolution.split("x")
+        self.scene_manager.add_plan_resolution((int(width), int(height)))
+        if preview_enabled:
+            self.scene_manager.add_plan_resolution(self._preview_size)
+
         logger.info(f"MixerCore initialized: {len(self.camera_devices)} cameras, "
                    f"output={output_resolution}, bitrate={output_bitrate}kbps")
     
+    @property
+    def _graphics_enabled(self) -> bool:
+        return bool(self.cairo_manager and self.cairo_manager.enabled)
+
     @property
     def Gst(self):
         """Get GStreamer module (lazy initialization)."""
@@ -182,6 +451,11 @@ class MixerCore:
             logger.error("Cannot start mixer - GStreamer not available")
             return False
         
+        # Fetch the path list and resolve slot files before taking the lock
+        self.availability.start()
+        self.availability.ensure_fresh()
+        self._prepare_scene_sources()
+        
         with self._lock:
             if self.pipeline and self.state == "PLAYING":
                 logger.warning("Mixer pipeline already running")
@@ -223,19 +497,7 @@ class MixerCore:
                 if not self.pipeline:
                     return False
 
-                # Set up bus message handler BEFORE state change
-                bus = self.pipeline.get_bus()
-                bus.add_signal_watch()
-                bus.connect("message", self._on_bus_message)
-                
-                # Connect Cairo graphics overlay if available
-                if self.cairo_manager and self.cairo_manager.enabled:
-                    overlay = self.pipeline.get_by_name("graphics_overlay")
-                    if overlay:
-                        overlay.connect("draw", self.cairo_manager.draw_callback)
-                        logger.info("Cairo graphics overlay connected")
-                    else:
-                        logger.warning("Cairo overlay element not found in pipeline")
+                bus = self._prepare_pipeline()
 
                 # Start pipeline with timeout (will check bus for errors)
                 if not self._set_state_with_timeout(self.Gst.State.PLAYING):
@@ -266,7 +528,7 @@ class MixerCore:
                     self._stop_pipeline_internal()
                     return False
 
-                self.state = "PLAYING"
+                self._on_pipeline_playing()
                 self.watchdog.start()
                 self._start_health_check()
                 logger.info(f"Mixer pipeline started with scene: {self.current_scene.id}")
@@ -279,8 +541,106 @@ class MixerCore:
                     self._stop_pipeline_internal()
                 return False
 
+    def _prepare_pipeline(self):
+        """Set up a freshly built pipeline before it goes to PLAYING (must be called with lock).
+        
+        Shared by start() and _recover_pipeline(), so a recovered pipeline
+        gets the same setup as a started one. Returns the pipeline bus.
+        """
+        # Set up bus message handler BEFORE state change
+        bus = self.pipeline.get_bus()
+        bus.add_signal_watch()
+        bus.connect("message", self._on_bus_message)
+        
+        # Connect the Cairo graphics layer if available
+        self._graphics_layer = None
+        if self._graphics_enabled:
+            width, height = self.output_resolution.split("x")
+            layer = GraphicsLayer(self.cairo_manager, int(width), int(height))
+            if layer.attach(self.pipeline):
+                self._graphics_layer = layer
+                logger.info("Cairo graphics layer connected")
+        return bus
+
+    def _on_pipeline_playing(self) -> None:
+        """Finish setting up a pipeline that reached PLAYING (must be called with lock)."""
+        self.state = "PLAYING"
+        self._prefetch_clips()
+        if self.preview_enabled and self.preview_scene:
+            # The build only wires the program scene's sources
+            self._add_scene_sources(self.preview_scene)
+            self._apply_preview_pads(self.preview_scene)
+
+    def start_backend_benchmark(self) -> None:
+        """Benchmark the compositor backends in the background ("auto" only).
+        
+        Called once at plugin init. Pipelines built before the result is in
+        use the software compositor; later builds (restarts, recovery) use
+        the fastest backend. A saved result for the same resolution,
+        backends and GStreamer version is reused without benchmarking.
+        """
+        if self.compositor_backend != "auto" or self._benchmark_thread:
+            return
+        self._benchmark_thread = threading.Thread(
+            target=self._run_backend_benchmark, name="compositor-benchmark", daemon=True
+        )
+        self._benchmark_thread.start()
+
+    def _run_backend_benchmark(self) -> None:
+        if not self._ensure_gst():
+            return
+        Gst = self.Gst
+        width, height = self.output_resolution.split("x")
+        output_size = (int(width), int(height))
+        key = benchmark_key(Gst, output_size)
+        results = load_benchmark(self.compositor_benchmark_file, key)
+        if results is not None:
+            logger.info(f"Using saved compositor benchmark from {self.compositor_benchmark_file}")
+        else:
+            # The default scene and the one with the most slots (the worst case)
+            scenes = self.scene_manager.scenes.values()
+            largest = max(scenes, key=lambda scene: len(scene.slots), default=None)
+            default = self.scene_manager.get_scene("cam1_full")
+            benchmark_scenes = [scene for scene in (default, largest) if scene]
+            if default and largest and default.id == largest.id:
+                benchmark_scenes = [largest]
+            started = time.monotonic()
+            results = benchmark_backends(Gst, benchmark_scenes, output_size)
+            logger.info(f"Compositor benchmark took {time.monotonic() - started:.1f}s")
+            save_benchmark(self.compositor_benchmark_file, key, results)
+        self._backend_benchmark = results
+        logger.info(f"Compositor benchmark picked {select_backend(results)}, used from the next pipeline build")
+
+    def _select_backend(self) -> None:
+        """Pick the compositor backend (must be called with lock).
+        
+        "auto" uses the fastest backend of the background benchmark (see
+        start_backend_benchmark), or the software compositor while it runs.
+        A configured backend that is not installed falls back to the
+        software compositor.
+        """
+        Gst = self.Gst
+        if self.compositor_backend != "auto":
+            try:
+                backend = get_backend(self.compositor_backend)
+            except ValueError as e:
+                logger.error(f"{e}, using {DEFAULT_BACKEND}")
+                backend = get_backend(DEFAULT_BACKEND)
+            if not backend.is_available(Gst):
+                logger.warning(f"Compositor backend {backend.name} not available, using {DEFAULT_BACKEND}")
+                backend = get_backend(DEFAULT_BACKEND)
+        elif self._backend_benchmark:
+            backend = get_backend(select_backend(self._backend_benchmark))
+        else:
+            logger.info(f"Compositor benchmark not finished, using {DEFAULT_BACKEND}")
+            backend = get_backend(DEFAULT_BACKEND)
+        if backend is not self._backend:
+            logger.info(f"Mixer compositor backend: {backend.name} ({backend.description})")
+        self._backend = backend
+
     def stop(self) -> bool:
         """Stop the mixer pipeline."""
+        self.availability.stop()
         with self._lock:
             self._stop_health_check()
             self.watchdog.stop()
@@ -288,6 +648,11 @@ class MixerCore:
 
     def _stop_pipeline_internal(self) -> bool:
         """Internal method to stop pipeline (must be called with lock)."""
+        self._cancel_all_source_removals()
+        self._source_pads = {}
+        self._reset_pad_state()
+        self._transition_bindings = []
+        self._transition = None
         if not self.pipeline:
             return True
 
@@ -308,6 +673,7 @@ class MixerCore:
             # Clean up
             if self.pipeline:
                 self.pipeline = None
+            self._graphics_layer = None
             self.state = "NULL"
             logger.info("Mixer pipeline stopped")
             return True
@@ -321,6 +687,7 @@ class MixerCore:
                     self.pipeline = None
             except:
                 pass
+            self._graphics_layer = None
             self.state = "NULL"
             return False
 
@@ -337,6 +704,7 @@ class MixerCore:
         if not scene:
             logger.error(f"Scene not found: {scene_id}")
             return False
+        self._prepare_scene_sources([scene])
 
         with self._lock:
             if not self.pipeline or self.state != "PLAYING":
@@ -345,182 +713,19 @@ class MixerCore:
                 logger.info(f"Scene stored (will apply on start): {scene_id}")
                 return True
 
-            # Check if scene requires different sources (need pipeline rebuild)
-            current_sources = {slot.source for slot in self.current_scene.slots} if self.current_scene else set()
-            new_sources = {slot.source for slot in scene.slots}
-            
-            # Check if new scene requires sources we don't have
-            sources_to_add = new_sources - current_sources
-            sources_to_remove = current_sources - new_sources
-            
-            if sources_to_add:
-                # Need to add new sources - rebuild with superset if preallocate_sources enabled
-                if self.preallocate_sources:
-                    # Build pipeline with union of current and new sources (superset strategy)
-                    # This allows future scene changes to be fast if they use these sources
-                    superset_sources = current_sources | new_sources
-                    logger.info(f"Scene {scene_id} requires pipeline rebuild (superset strategy)")
-                    logger.info(f"  Building pipeline with {len(superset_sources)} sources (superset)")
-                    logger.info(f"  Current: {current_sources}")
-                    logger.info(f"  New: {new_sources}")
-                    logger.info(f"  Superset: {superset_sources}")
-                else:
-                    logger.info(f"Scene {scene_id} requires pipeline rebuild")
-                    logger.info(f"  Current sources: {current_sources}")
-                    logger.info(f"  New sources: {new_sources}")
-                    logger.info(f"  Sources to add: {sources_to_add}")
-                
-                was_playing = (self.state == "PLAYING")
-                
-                # Stop current pipeline
-                self._stop_pipeline_internal()
-                time.sleep(0.5)  # Give device time to release
-                
-                # If using superset strategy, temporarily create a merged scene for pipeline build
-                if self.preallocate_sources and self.current_scene:
-                    # Create a temporary scene with all sources for pipeline building
-                    # We'll apply the actual scene properties after pipeline is built
-                    merged_scene = Scene(
-                        id=f"_merged_{scene_id}",
-                        label="Temporary merged scene",
-                        resolution=scene.resolution,
-                        slots=list(self.current_scene.slots) + [
-                            slot for slot in scene.slots 
-                            if slot.source not in current_sources
-                        ]
-                    )
-                    self.current_scene = merged_scene
-                    logger.debug(f"Built merged scene with {len(merged_scene.slots)} slots")
-                else:
-                    self.current_scene = scene
-                
-                # Rebuild pipeline
-                self.pipeline = self._build_pipeline()
-                
-                if not self.pipeline:
-                    logger.error("Failed to rebuild pipeline for new scene")
-                    return False
-                
-                # Restart pipeline
-                bus = self.pipeline.get_bus()
-                bus.add_signal_watch()
-                bus.connect("message", self._on_bus_message)
-                
-                if self._set_state_with_timeout(self.Gst.State.PLAYING):
-                    self.state = "PLAYING"
-                    logger.info(f"Pipeline rebuilt and started with scene: {scene_id}")
-                    
-                    # Now apply the actual scene properties (will use fast path since sources exist)
-                    if self.preallocate_sources and self.current_scene.id != scene_id:
-                        # Keep merged scene as current so future changes can use fast path
-                        # But we need to update the pad properties to match the target scene
-                        # Don't recursively call apply_scene - just update pads directly
-                        logger.info(f"Applying target scene properties to superset pipeline")
-                        
-                        try:
-                            compositor = self.pipeline.get_by_name("compositor")
-                            if not compositor:
-                                logger.error("Compositor element not found")
-                                return False
-                            
-                            # Build mapping of source to pad index in merged scene
-                            merged_source_to_pad = {}
-                            for i, slot in enumerate(merged_scene.slots):
-                                merged_source_to_pad[slot.source] = i
-                            
-                            # Hide all pads first
-                            for i in range(len(merged_scene.slots)):
-                                pad = compositor.get_static_pad(f"sink_{i}")
-                                if pad:
-                                    pad.set_property("alpha", 0.0)
-                            
-                            # Update pads for target scene slots
-                            for slot in scene.slots:
-                                if slot.source not in merged_source_to_pad:
-                                    logger.warning(f"Source {slot.source} not in merged pipeline")
-                                    continue
-                                
-                                pad_index = merged_source_to_pad[slot.source]
-                                pad = compositor.get_static_pad(f"sink_{pad_index}")
-                                if not pad:
-                                    continue
-                                
-                                coords = scene.get_absolute_coords(slot)
-                                pad.set_property("xpos", coords["x"])
-                                pad.set_property("ypos", coords["y"])
-                                pad.set_property("width", coords["w"])
-                                pad.set_property("height", coords["h"])
-                                pad.set_property("zorder", slot.z)
-                                pad.set_property("alpha", slot.alpha)
-                            
-                            logger.info(f"Target scene properties applied to superset pipeline")
-                        except Exception as e:
-                            logger.error(f"Failed to apply target scene properties: {e}")
-                            return False
-                    
-                    return True
-                else:
-                    logger.error("Failed to restart pipeline after scene change")
-                    return False
-            
-            # If we're here, new scene uses subset or same sources as current
-            # We can update pad properties and hide unused sources with alpha=0
-            if sources_to_remove:
-                logger.info(f"Scene {scene_id} uses subset of current sources, updating pads (fast path)")
-                logger.info(f"  Hiding unused sources: {sources_to_remove}")
-
-            # Update pad properties (fast path - no pipeline rebuild)
             try:
-                compositor = self.pipeline.get_by_name("compositor")
-                if not compositor:
-                    logger.error("Compositor element not found")
-                    return False
-
-                # Build mapping of source to current pad index
-                current_source_to_pad = {}
-                if self.current_scene:
-                    for i, slot in enumerate(self.current_scene.slots):
-                        current_source_to_pad[slot.source] = i
-                
-                # Update pads for new scene slots
-                for i, slot in enumerate(scene.slots):
-                    # Find which pad has this source
-                    if slot.source not in current_source_to_pad:
-                        logger.error(f"Source {slot.source} not in current pipeline (should not happen)")
-                        continue
-                    
-                    pad_index = current_source_to_pad[slot.source]
-                    pad_name = f"sink_{pad_index}"
-                    pad = compositor.get_static_pad(pad_name)
-                    if not pad:
-                        logger.warning(f"Pad {pad_name} not found for source {slot.source}")
-                        continue
-
-                    coords = scene.get_absolute_coords(slot)
-                    
-                    # Set pad properties
-                    pad.set_property("xpos", coords["x"])
-                    pad.set_property("ypos", coords["y"])
-                    pad.set_property("width", coords["w"])
-                    pad.set_property("height", coords["h"])
-                    pad.set_property("zorder", slot.z)
-                    pad.set_property("alpha", slot.alpha)
-
-                    logger.debug(f"Updated pad {pad_name} ({slot.source}): "
-                               f"x={coords['x']}, y={coords['y']}, "
-                               f"w={coords['w']}, h={coords['h']}, z={slot.z}, alpha={slot.alpha}")
+                request = self._begin_scene_request()
+                added = self._add_scene_sources(scene)
+                if added:
+                    # New branches start hidden on the running pipeline; the
+                    # layout switches once they deliver their first frame, so
+                    # program output never stops or shows an empty slot
+                    logger.info(f"Scene {scene_id}: starting {sorted(added)} on the running pipeline")
+                    self._when_sources_ready(request, added, lambda: self._apply_scene_pads(scene))
+                    return True
                 
-                # Hide pads for sources not in new scene (set alpha=0)
-                for source in sources_to_remove:
-                    if source in current_source_to_pad:
-                        pad_index = current_source_to_pad[source]
-                        pad_name = f"sink_{pad_index}"
-                        pad = compositor.get_static_pad(pad_name)
-                        if pad:
-                            pad.set_property("alpha", 0.0)
-                            logger.debug(f"Hidden pad {pad_name} ({source}) with alpha=0")
-
-                self.current_scene = scene
+                if not self._apply_scene_pads(scene):
+                    return False
                 logger.info(f"Scene applied (fast path): {scene_id}")
                 return True
 
@@ -529,226 +734,581 @@ class MixerCore:
                 self.last_error = str(e)
                 return False
 
+    def set_preview_scene(self, scene_id: str) -> bool:
+        """Stage a scene on the preview bus.
+        
+        Missing sources are attached (hidden on program) and shared with the
+        program bus, so a later take() needs no new decode.
+        """
+        scene = self.scene_manager.get_scene(scene_id)
+        if not scene:
+            logger.error(f"Scene not found: {scene_id}")
+            return False
+        self._prepare_scene_sources([scene])
+
+        with self._lock:
+            if not self.preview_enabled:
+                logger.error("Preview bus not enabled")
+                return False
+            if not self.pipeline or self.state != "PLAYING":
+                self.preview_scene = scene
+                logger.info(f"Preview scene stored (will apply on start): {scene_id}")
+                return True
+            try:
+                self._add_scene_sources(scene)
+                return self._apply_preview_pads(scene)
+            except Exception as e:
+                logger.error(f"Failed to set preview scene {scene_id}: {e}")
+                self.last_error = str(e)
+                return False
+
+    def take(self, transition_type: str = "cut", duration_ms: Optional[int] = None, color: str = "black") -> bool:
+        """Swap buses: the preview scene goes on program and program on preview.
+        
+        A cut applies the whole layout on the next output frame; other types
+        run as clock transitions (see transition_to_scene). The preview
+        scene's sources already run on the program compositor, so nothing has
+        to start first.
+        """
+        with self._lock:
+            program, preview = self.current_scene, self.preview_scene
+        if not preview:
+            logger.error("No scene on preview")
+            return False
+        
+        try:
+            kind = normalize_transition(transition_type)
+        except ValueError:
+            logger.warning(f"Unknown transition type: {transition_type}, using cut")
+            kind = "cut"
+        if duration_ms is None:
+            duration_ms = DEFAULT_DURATIONS_MS[kind]
+        
+        if not self.transition_to_scene(preview.id, kind, duration_ms, color):
+            return False
+        if program and program.id != preview.id:
+            self.set_preview_scene(program.id)
+        return True
+
     def transition_to_scene(
         self, 
         scene_id: str, 
         transition_type: str = "cut",
-        duration_ms: int = 500
+        duration_ms: int = 500,
+        color: str = "black",
     ) -> bool:
         """Transition to a new scene with animation.
         
         Args:
             scene_id: Target scene ID
-            transition_type: "cut" (instant), "mix" (crossfade), "auto" (timed mix)
-            duration_ms: Transition duration in milliseconds (for mix/auto)
+            transition_type: "cut", "mix" ("auto"), "dip", "wipe", "slide" or "zoom"
+            duration_ms: Transition duration in milliseconds (rounded to whole frames)
+            color: Dip colour ("black" or "white")
         
         Returns:
             True if transition started successfully
         """
-        if transition_type == "cut":
-            return self.apply_scene(scene_id)
+        try:
+            kind = normalize_transition(transition_type)
+        except ValueError:
+            logger.warning(f"Unknown transition type: {transition_type}, using cut")
+            kind = "cut"
         
-        if transition_type in ("mix", "auto"):
-            return self._crossfade_transition(scene_id, duration_ms)
+        if kind == "cut" or duration_ms <= 0:
+            return self.apply_scene(scene_id)
         
-        logger.warning(f"Unknown transition type: {transition_type}, using cut")
-        return self.apply_scene(scene_id)
+        return self._clock_transition(scene_id, kind, duration_ms, color)
 
-    def _crossfade_transition(self, scene_id: str, duration_ms: int) -> bool:
-        """Perform crossfade transition by animating alpha values.
+    def _clock_transition(self, scene_id: str, kind: str, duration_ms: int, color: str) -> bool:
+        """Run a transition as control sources on the compositor pads.
         
         Args:
             scene_id: Target scene ID
-            duration_ms: Duration of crossfade in milliseconds
+            kind: Normalized transition type
+            duration_ms: Duration in milliseconds
+            color: Dip colour
         
         Returns:
-            True if transition started successfully
+            True if transition started (or is waiting for new sources)
         """
-        GLib = get_glib()
-        Gst = get_gst()
-        
         scene = self.scene_manager.get_scene(scene_id)
         if not scene:
             logger.error(f"Scene not found: {scene_id}")
             return False
+        self._prepare_scene_sources([scene])
 
         with self._lock:
             if not self.pipeline or self.state != "PLAYING":
                 logger.error("Cannot transition: mixer not playing")
                 return False
             
-            compositor = self.pipeline.get_by_name("compositor")
-            if not compositor:
-                logger.error("Compositor element not found")
-                return False
-            
-            # Get current scene sources
-            current_sources = set()
-            if self.current_scene:
-                current_sources = {slot.source for slot in self.current_scene.slots}
-            
-            # Get new scene sources
-            new_sources = {slot.source for slot in scene.slots}
-            
-            # Check if we need to rebuild pipeline (new sources not in current)
-            if not new_sources.issubset(current_sources):
-                # Need to rebuild pipeline first with merged sources
-                logger.info(f"Crossfade requires pipeline rebuild (new sources: {new_sources - current_sources})")
-                
-                # Build merged scene with all sources
-                merged_sources = current_sources.union(new_sources)
-                merged_scene = self._create_merged_scene(scene, merged_sources)
-                
-                # Rebuild pipeline
-                if not self._rebuild_pipeline_with_scene(merged_scene):
-                    logger.error("Failed to rebuild pipeline for crossfade")
-                    return False
-            
-            # Now perform crossfade animation
-            # Build mapping of source to pad index
-            source_to_pad = {}
-            if self.current_scene:
-                for i, slot in enumerate(self.current_scene.slots):
-                    source_to_pad[slot.source] = i
-            
-            # Animation parameters
-            fps = 30  # 30 frames per second
-            total_frames = int((duration_ms / 1000.0) * fps)
-            frame_interval_ms = int(1000 / fps)
-            current_frame = [0]  # Use list for mutable closure
-            
-            # Store target alpha values for each source
-            target_alphas = {}
-            for slot in scene.slots:
-                target_alphas[slot.source] = slot.alpha
-            
-            # Sources to fade out (in current but not in new)
-            sources_to_fade_out = current_sources - new_sources
-            
-            def animate_frame():
-                """Animate one frame of the crossfade."""
-                current_frame[0] += 1
-                progress = current_frame[0] / total_frames
-                
-                try:
-                    # Update alpha for sources in new scene (fade in)
-                    for slot in scene.slots:
-                        if slot.source in source_to_pad:
-                            pad_index = source_to_pad[slot.source]
-                            pad = compositor.get_static_pad(f"sink_{pad_index}")
-                            if pad:
-                                # Interpolate alpha from current to target
-                                new_alpha = progress * target_alphas[slot.source]
-                                pad.set_property("alpha", new_alpha)
-                                
-                                # Also update position/size
-                                coords = scene.get_absolute_coords(slot)
-                                pad.set_property("xpos", coords["x"])
-                                pad.set_property("ypos", coords["y"])
-                                pad.set_property("width", coords["w"])
-                                pad.set_property("height", coords["h"])
-                                pad.set_property("zorder", slot.z)
-                    
-                    # Fade out sources not in new scene
-                    for source in sources_to_fade_out:
-                        if source in source_to_pad:
-                            pad_index = source_to_pad[source]
-                            pad = compositor.get_static_pad(f"sink_{pad_index}")
-                            if pad:
-                                # Fade out from 1.0 to 0.0
-                                new_alpha = 1.0 - progress
-                                pad.set_property("alpha", new_alpha)
-                    
-                    # Continue animation if not finished
-                    if current_frame[0] < total_frames:
-                        return True  # Continue timeout
-                    else:
-                        # Animation complete, update current scene
-                        self.current_scene = scene
-                        logger.info(f"Crossfade transition complete: {scene_id}")
-                        return False  # Stop timeout
-                        
-                except Exception as e:
-                    logger.error(f"Error during crossfade animation: {e}")
-                    return False  # Stop on error
-            
-            # Start animation
-            GLib.timeout_add(frame_interval_ms, animate_frame)
-            logger.info(f"Started crossfade transition to {scene_id} ({duration_ms}ms, {total_frames} frames)")
-            return True
+            # Sources missing from the running pipeline are attached hidden;
+            # the transition starts once they deliver their first frame
+            request = self._begin_scene_request()
+            added = self._add_scene_sources(scene)
+            start = lambda: self._start_clock_transition(request, scene, kind, duration_ms, color)
+            if added:
+                logger.info(f"Transition to {scene_id}: starting {sorted(added)} on the running pipeline")
+                self._when_sources_ready(request, added, start)
+                return True
+            return start()
 
-    def _create_merged_scene(self, target_scene: "Scene", sources: set) -> "Scene":
-        """Create a temporary scene that includes all specified sources.
+    def _start_clock_transition(self, request: int, scene: Scene, kind: str, duration_ms: int, color: str) -> bool:
+        """Bind transition keyframes to the compositor pads (must be called with lock).
         
-        Args:
-            target_scene: The target scene to transition to
-            sources: Set of all source IDs to include
+        The transition starts on a frame boundary START_LEAD_FRAMES after the
+        compositor's current position and lasts a whole number of frames, so
+        every step lands on an exact output frame.
+        """
+        Gst = self.Gst
+        GstController = get_gst_controller()
+        compositor = self.pipeline.get_by_name("compositor")
+        if not compositor:
+            logger.error("Compositor element not found")
+            return False
+        
+        if not self._backend.clock_transitions:
+            logger.info(f"{self._backend.name} backend has no clock transitions, cutting to {scene.id}")
+            return self._apply_scene_pads(scene)
+        
+        ok, position = compositor.query_position(Gst.Format.TIME)
+        if not GstController or not ok or position < 0:
+            logger.warning(f"Clock position unavailable, cutting to {scene.id}")
+            return self._apply_scene_pads(scene)
+        
+        self._clear_transition()
+        
+        fps = self._get_output_fps(compositor)
+        frame_ns = int(round(Gst.SECOND / fps))
+        frames = duration_frames(duration_ms, fps)
+        duration_ns = frames * frame_ns
+        start_ns = frame_aligned_start(position, frame_ns)
+        
+        outgoing = {}
+        for source, pad_index in self._source_pads.items():
+            pad = compositor.get_static_pad(f"sink_{pad_index}")
+            if pad:
+                outgoing[source] = PadState(
+                    x=pad.get_property("xpos"), y=pad.get_property("ypos"),
+                    w=pad.get_property("width"), h=pad.get_property("height"),
+                    alpha=pad.get_property("alpha"),
+                )
+        # Control bindings and the zorder boost bypass the pad state cache,
+        # so the next scene change sets every property again
+        self._pad_state.pop("compositor", None)
+        
+        scene_plan = self._get_scene_plan(scene)
+        incoming = {}
+        for source, pad_plan in scene_plan.pads.items():
+            pad_index = self._source_pads.get(source)
+            if pad_index is None:
+                continue
+            incoming[source] = PadState(
+                x=pad_plan.xpos, y=pad_plan.ypos, w=pad_plan.width, h=pad_plan.height, alpha=pad_plan.alpha
+            )
+            self._set_slot_geometry(pad_index, pad_plan.slot, self._plan_coords(pad_plan))
+            
+            # Covering transitions draw the incoming scene above the outgoing one
+            pad = compositor.get_static_pad(f"sink_{pad_index}")
+            if pad:
+                boost = TRANSITION_ZORDER_BOOST if kind in ("wipe", "slide", "zoom") else 0
+                pad.set_property("zorder", pad_plan.zorder + boost)
+        
+        plan = plan_transition(kind, outgoing, incoming, scene_plan.output_size)
+        
+        if kind == "dip":
+            Gst.util_set_object_arg(compositor, "background", color if color in DIP_COLOURS else "black")
+        
+        for source, props in plan.items():
+            pad = compositor.get_static_pad(f"sink_{self._source_pads[source]}")
+            if not pad:
+                continue
+            for prop, keyframes in props.items():
+                # Static value until the control source takes over at start_ns
+                value = value_at(keyframes, 0.0)
+                pad.set_property(prop, value if prop == "alpha" else int(round(value)))
+                binding = bind_keyframes(GstController, pad, prop, keyframes, start_ns, duration_ns)
+                self._transition_bindings.append((pad, binding))
+        
+        self._transition = {
+            "type": kind,
+            "scene_id": scene.id,
+            "start_ns": start_ns,
+            "duration_frames": frames,
+            "fps": fps,
+        }
+        
+        # Hand the pads back to static properties once the last frame is out
+        remaining = (start_ns - position + duration_ns) / Gst.SECOND
+        timer = threading.Timer(remaining + 0.1, self._finish_transition, args=(request, scene))
+        timer.daemon = True
+        timer.start()
+        
+        logger.info(f"Started {kind} transition to {scene.id} ({frames} frames at {fps:g} fps)")
+        return True
+
+    def _finish_transition(self, request: int, scene: Scene) -> None:
+        with self._lock:
+            if request != self._scene_request or not self.pipeline:
+                return  # Superseded by a newer scene change
+            self._apply_scene_pads(scene)
+            logger.info(f"Transition complete: {scene.id}")
+
+    def _clear_transition(self) -> None:
+        """Remove transition control bindings (must be called with lock)."""
+        if not self._transition_bindings and not self._transition:
+            return
+        for pad, binding in self._transition_bindings:
+            try:
+                pad.remove_control_binding(binding)
+            except Exception as e:
+                logger.debug(f"Failed to remove control binding: {e}")
+        self._transition_bindings = []
+        if self._transition and self._transition["type"] == "dip" and self.pipeline:
+            compositor = self.pipeline.get_by_name("compositor")
+            if compositor:
+                self.Gst.util_set_object_arg(compositor, "background", "black")
+        self._transition = None
+
+    def _get_output_fps(self, compositor) -> float:
+        """Get negotiated compositor output frame rate (defaults to 30)."""
+        try:
+            caps = compositor.get_static_pad("src").get_current_caps()
+            if caps:
+                ok, num, den = caps.get_structure(0).get_fraction("framerate")
+                if ok and num > 0 and den > 0:
+                    return num / den
+        except Exception as e:
+            logger.debug(f"Could not read compositor framerate: {e}")
+        return 30.0
+
+    def _begin_scene_request(self) -> int:
+        """Start a new scene change; readiness callbacks of older ones are dropped."""
+        self._scene_request += 1
+        return self._scene_request
+
+    def _add_scene_sources(self, scene: Scene) -> Dict[str, int]:
+        """Attach hidden branches for scene sources missing from the running pipeline.
         
         Returns:
-            A new Scene object with merged sources
+            Mapping of added source -> compositor pad index
         """
-        from .scenes import Scene, SceneSlot
-        
-        merged_slots = []
-        for source_id in sources:
-            # Try to find existing slot in target scene
-            existing_slot = next((s for s in target_scene.slots if s.source == source_id), None)
-            if existing_slot:
-                merged_slots.append(existing_slot)
-            else:
-                # Create hidden slot for sources not in target
-                merged_slots.append(SceneSlot(
-                    source=source_id,
-                    source_type="camera",
-                    x_rel=0.0, y_rel=0.0, w_rel=0.01, h_rel=0.01,
-                    z=0, alpha=0.0  # Hidden
-                ))
-        
-        # Create merged scene
-        import time
-        merged_scene_id = f"merged_{int(time.time() * 1000)}"
-        return Scene(
-            id=merged_scene_id,
-            label=f"Merged for {target_scene.id}",
-            resolution=target_scene.resolution,
-            slots=merged_slots
-        )
-    
-    def _rebuild_pipeline_with_scene(self, scene: "Scene") -> bool:
-        """Rebuild pipeline with a specific scene.
+        added = {}
+        for slot in scene.slots:
+            if slot.source in self._source_pads or slot.source in added:
+                continue
+            branch = self._build_source_branch(slot)
+            if not branch:
+                continue
+            pad_index = self._attach_source_branch(
+                self.pipeline, slot, scene.get_absolute_coords(slot), branch[0], branch[1], alpha=0.0
+            )
+            if pad_index is not None:
+                added[slot.source] = pad_index
+        return added
+
+    def _when_sources_ready(self, request: int, sources: Dict[str, int], on_ready) -> None:
+        """Call on_ready (with the lock held) once all sources delivered a frame.
         
-        Args:
-            scene: Scene to build pipeline for
+        Waits at most SOURCE_START_TIMEOUT; a source that is still silent then
+        stays hidden in its slot until frames arrive. Superseded requests (a
+        newer scene change or a rebuilt pipeline) are dropped.
+        """
+        Gst = self.Gst
+        pipeline = self.pipeline
+        compositor = pipeline.get_by_name("compositor")
+        waiting = set(sources)
+        finished = [False]
+        state_lock = threading.Lock()
         
-        Returns:
-            True if rebuild successful
+        def finish(timed_out: bool):
+            with state_lock:
+                if finished[0]:
+                    return
+                finished[0] = True
+                silent = sorted(waiting)
+            if timed_out:
+                logger.warning(f"No frames from {silent} after {SOURCE_START_TIMEOUT}s, switching anyway")
+            with self._lock:
+                if request != self._scene_request or self.pipeline is not pipeline:
+                    logger.debug("Scene change superseded before its sources were ready")
+                    return
+                on_ready()
+        
+        def make_probe(source: str):
+            def on_first_buffer(pad, info):
+                with state_lock:
+                    waiting.discard(source)
+                    ready = not waiting
+                if ready:
+                    # Leave the streaming thread before taking the mixer lock
+                    threading.Thread(target=finish, args=(False,), daemon=True).start()
+                return Gst.PadProbeReturn.REMOVE
+            return on_first_buffer
+        
+        for source, pad_index in sources.items():
+            pad = compositor.get_static_pad(f"sink_{pad_index}")
+            if pad:
+                pad.add_probe(Gst.PadProbeType.BUFFER, make_probe(source))
+        
+        timer = threading.Timer(SOURCE_START_TIMEOUT, finish, args=(True,))
+        timer.daemon = True
+        timer.start()
+
+    def _apply_scene_pads(self, scene: Scene) -> bool:
+        """Set compositor pads to a scene layout (must be called with lock).
+        
+        The scene's precompiled plan is diffed against the pad properties we
+        last set, and only the changed ones are committed, all in the same
+        output frame (see _commit_pad_updates). Sources not in the scene are
+        hidden and removed after the idle grace period unless a later scene
+        uses them again.
         """
-        try:
-            # Stop current pipeline
-            if self.pipeline:
-                self.pipeline.set_state(get_gst().State.NULL)
-                self.pipeline = None
-            
-            # Build new pipeline
-            self.current_scene = scene
-            self.pipeline = self._build_pipeline()
-            
-            if not self.pipeline:
-                logger.error("Failed to build new pipeline")
-                return False
-            
-            # Start pipeline
-            ret = self.pipeline.set_state(get_gst().State.PLAYING)
-            if ret == get_gst().StateChangeReturn.FAILURE:
-                logger.error("Failed to start rebuilt pipeline")
-                return False
-            
-            logger.info(f"Pipeline rebuilt successfully with scene: {scene.id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error rebuilding pipeline: {e}")
+        compositor = self.pipeline.get_by_name("compositor") if self.pipeline else None
+        if not compositor:
+            logger.error("Compositor element not found")
             return False
+        self._clear_transition()
+
+        plan = self._get_scene_plan(scene)
+        for source in plan.pads:
+            if source not in self._source_pads:
+                logger.warning(f"Source {source} not available, slot left empty")
+        
+        pad_state = self._pad_state.setdefault("compositor", {})
+        live = {source: pad_state.get(pad_index, {}) for source, pad_index in self._source_pads.items()}
+        changes = diff_plan(plan, live)
+        
+        updates = {}
+        for source, props in changes.items():
+            pad_index = self._source_pads.get(source)
+            if pad_index is None:
+                continue
+            pad_plan = plan.pads.get(source)
+            if pad_plan and ("width" in props or "height" in props):
+                self._set_slot_geometry(pad_index, pad_plan.slot, self._plan_coords(pad_plan))
+            updates[pad_index] = props
+            logger.debug(f"Updating pad sink_{pad_index} ({source}): {props}")
+        
+        # Crops are not pad properties: re-apply them for cropped slots
+        for source, pad_plan in plan.pads.items():
+            pad_index = self._source_pads.get(source)
+            if pad_index is not None and _has_crop(pad_plan.slot) and pad_index not in updates:
+                self._set_slot_geometry(pad_index, pad_plan.slot, self._plan_coords(pad_plan))
+        
+        if updates:
+            self._commit_pad_updates(compositor, updates)
+
+        self.current_scene = scene
+        self._update_source_removals()
+        self._notify_scene_listeners()
+        return True
+
+    def _apply_preview_pads(self, scene: Scene) -> bool:
+        """Set preview bus pads to a scene layout (must be called with lock)."""
+        compositor = self.pipeline.get_by_name("preview_compositor") if self.pipeline else None
+        if not compositor:
+            logger.error("Preview compositor element not found")
+            return False
+        
+        plan = self._get_scene_plan(scene, self._preview_size)
+        pad_state = self._pad_state.setdefault("preview_compositor", {})
+        live = {source: pad_state.get(pad_index, {}) for source, pad_index in self._source_pads.items()}
+        updates = {}
+        for source, props in diff_plan(plan, live).items():
+            pad_index = self._source_pads.get(source)
+            if pad_index is None:
+                continue
+            pad_plan = plan.pads.get(source)
+            if pad_plan and ("width" in props or "height" in props or _has_crop(pad_plan.slot)):
+                self._set_preview_geometry(pad_index, pad_plan.slot, self._plan_coords(pad_plan))
+            updates[pad_index] = props
+        if updates:
+            self._commit_pad_updates(compositor, updates)
+        
+        self.preview_scene = scene
+        self._update_source_removals()
+        self._notify_scene_listeners()
+        return True
+
+    def _update_source_removals(self) -> None:
+        """Schedule removal of sources on neither bus (must be called with lock)."""
+        in_use = set()
+        for scene in (self.current_scene, self.preview_scene):
+            if scene:
+                in_use.update(slot.source for slot in scene.slots)
+        for source in self._source_pads:
+            if source in in_use:
+                self._cancel_source_removal(source)
+            else:
+                self._schedule_source_removal(source)
+
+    def add_scene_listener(self, callback) -> None:
+        """Call callback(program_scene, preview_scene) whenever either bus changes scene."""
+        self._scene_listeners.append(callback)
+
+    def _notify_scene_listeners(self) -> None:
+        for callback in self._scene_listeners:
+            try:
+                callback(self.current_scene, self.preview_scene)
+            except Exception as e:
+                logger.warning(f"Scene listener failed: {e}")
+
+    @property
+    def _preview_size(self) -> Tuple[int, int]:
+        width, height = self.preview_resolution.split("x")
+        return int(width), int(height)
+
+    def _get_scene_plan(self, scene: Scene, output_size: Optional[Tuple[int, int]] = None) -> ScenePlan:
+        """Get the precompiled plan of a scene (default: at the mixer output resolution)."""
+        if output_size is None:
+            width, height = self.output_resolution.split("x")
+            output_size = (int(width), int(height))
+        if self.scene_manager.get_scene(scene.id) is scene:
+            plan = self.scene_manager.get_plan(scene.id, output_size)
+            if plan:
+                return plan
+        # Scene was edited since it was applied (or is not managed): compile it now
+        return compile_scene(scene, output_size)
+
+    @staticmethod
+    def _plan_coords(pad_plan) -> Dict[str, int]:
+        return {"x": pad_plan.xpos, "y": pad_plan.ypos, "w": pad_plan.width, "h": pad_plan.height}
+
+    def _commit_pad_updates(self, compositor, updates: Dict[int, Dict[str, Any]]) -> None:
+        """Apply pad property changes to the compositor as one atomic update.
+        
+        The changes are queued and set from the compositor's samples-selected
+        signal, which fires in its streaming thread after it picked the input
+        frames and before it blends them, so a frame never shows half of a
+        layout change. Falls back to setting them directly when the signal is
+        unavailable (GStreamer < 1.18) or no frame is aggregated within
+        PAD_UPDATE_TIMEOUT (e.g. the pipeline is paused).
+        """
+        bus = compositor.get_name()
+        pad_state = self._pad_state.setdefault(bus, {})
+        for pad_index, props in updates.items():
+            pad_state.setdefault(pad_index, {}).update(props)
+        
+        if not self._backend.atomic_updates or not compositor.find_property("emit-signals"):
+            self._set_pad_properties(compositor, updates)
+            return
+        
+        with self._pad_updates_lock:
+            pending = self._pad_updates.setdefault(bus, {})
+            for pad_index, props in updates.items():
+                pending.setdefault(pad_index, {}).update(props)
+            if bus not in self._pad_updates_handlers:
+                compositor.set_property("emit-signals", True)
+                self._pad_updates_handlers[bus] = compositor.connect("samples-selected", self._on_samples_selected)
+        
+        timer = threading.Timer(PAD_UPDATE_TIMEOUT, self._flush_pad_updates, args=(compositor,))
+        timer.daemon = True
+        timer.start()
+
+    def _on_samples_selected(self, compositor, *args) -> None:
+        """Compositor streaming thread: commit queued pad updates before blending."""
+        self._flush_pad_updates(compositor)
+
+    def _flush_pad_updates(self, compositor) -> None:
+        bus = compositor.get_name()
+        with self._pad_updates_lock:
+            updates = self._pad_updates.pop(bus, {})
+            handler = self._pad_updates_handlers.pop(bus, None)
+            if handler is not None:
+                compositor.disconnect(handler)
+        if updates:
+            self._set_pad_properties(compositor, updates)
+
+    def _set_pad_properties(self, compositor, updates: Dict[int, Dict[str, Any]]) -> None:
+        for pad_index, props in updates.items():
+            pad = compositor.get_static_pad(f"sink_{pad_index}")
+            if not pad:
+                continue  # Released since the update was queued
+            for prop, value in props.items():
+                pad.set_property(prop, value)
+
+    def _reset_pad_state(self) -> None:
+        """Forget pad state and drop queued updates (pipeline rebuilt or stopped)."""
+        self._pad_state = {}
+        with self._pad_updates_lock:
+            self._pad_updates = {}
+            self._pad_updates_handlers = {}
+
+    def _schedule_source_removal(self, source: str) -> None:
+        """Remove a hidden source branch after the idle grace period."""
+        if source in self._removal_timers:
+            return
+        timer = threading.Timer(self.idle_source_grace, self._remove_idle_source, args=(source,))
+        timer.daemon = True
+        self._removal_timers[source] = timer
+        timer.start()
+
+    def _cancel_source_removal(self, source: str) -> None:
+        timer = self._removal_timers.pop(source, None)
+        if timer:
+            timer.cancel()
+
+    def _cancel_all_source_removals(self) -> None:
+        for timer in self._removal_timers.values():
+            timer.cancel()
+        self._removal_timers.clear()
+
+    def _remove_idle_source(self, source: str) -> None:
+        """Detach a source branch that is still unused after its grace period."""
+        with self._lock:
+            self._removal_timers.pop(source, None)
+            if not self.pipeline or source not in self._source_pads:
+                return
+            for scene in (self.current_scene, self.preview_scene):
+                if scene and any(slot.source == source for slot in scene.slots):
+                    return
+            if len(self._source_pads) <= 1:
+                return  # Keep at least one input on the compositor
+            pad_index = self._source_pads.pop(source)
+            self._slot_source_sizes.pop(pad_index, None)
+            self._clip_players.pop(pad_index, None)
+            for pad_state in self._pad_state.values():
+                pad_state.pop(pad_index, None)
+            self._detach_source_branch(pad_index)
+            logger.info(f"Removed idle mixer source {source} (pad sink_{pad_index})")
+
+    def _detach_source_branch(self, pad_index: int) -> None:
+        """Unlink and drop a source bin without stopping the pipeline.
+        
+        The bin is unlinked from an IDLE probe (no buffer in flight), then
+        shut down and its compositor request pad released off the streaming
+        thread.
+        """
+        Gst = self.Gst
+        pipeline = self.pipeline
+        compositor = pipeline.get_by_name("compositor")
+        source_bin = pipeline.get_by_name(f"source_{pad_index}")
+        if not source_bin or not compositor:
+            return
+        sink_pad = compositor.get_static_pad(f"sink_{pad_index}")
+        src_pad = source_bin.get_static_pad("src")
+        preview_compositor = pipeline.get_by_name("preview_compositor")
+        preview_sink = preview_compositor.get_static_pad(f"sink_{pad_index}") if preview_compositor else None
+        preview_src = source_bin.get_static_pad("preview_src")
+        
+        def finish():
+            source_bin.set_state(Gst.State.NULL)
+            pipeline.remove(source_bin)
+            if sink_pad:
+                compositor.release_request_pad(sink_pad)
+            if preview_sink:
+                preview_compositor.release_request_pad(preview_sink)
+        
+        def on_idle(pad, info):
+            if sink_pad:
+                pad.unlink(sink_pad)
+            if preview_src and preview_sink:
+                preview_src.unlink(preview_sink)
+            threading.Thread(target=finish, daemon=True).start()
+            return Gst.PadProbeReturn.REMOVE
+        
+        src_pad.add_probe(Gst.PadProbeType.IDLE, on_idle)
 
     def get_status(self) -> Dict[str, Any]:
         """Get mixer status."""
@@ -777,6 +1337,18 @@ class MixerCore:
             return {
                 "state": actual_state,
                 "current_scene": self.current_scene.id if self.current_scene else None,
+                "preview_scene": self.preview_scene.id if self.preview_scene else None,
+                "preview_enabled": self.preview_enabled,
+                "clip_cache": self.clip_cache.get_status(),
+                "graphics_layer": self._graphics_layer.get_status() if self._graphics_layer else None,
+                "source_availability": self.availability.get_status(),
+                "compositor_backend": {
+                    "name": self._backend.name if self._backend else None,
+                    "configured": self.compositor_backend,
+                    "benchmark_ms_per_frame": dict(self._backend_benchmark),
+                },
+                "active_sources": sorted(self._source_pads),
+                "transition": dict(self._transition) if self._transition else None,
                 "health": watchdog_status["health"],
                 "last_error": self.last_error or watchdog_status["last_error"],
                 "last_buffer_seconds_ago": watchdog_status["last_buffer_seconds_ago"],
@@ -858,7 +1430,7 @@ class MixerCore:
             return False
     
     def _check_ingest_status(self, cam_id: str) -> bool:
-        """Check if a camera's ingest stream is available.
+        """Check if a camera's ingest stream is available (no I/O).
         
         Args:
             cam_id: Camera identifier
@@ -869,23 +1441,97 @@ class MixerCore:
         if not self.ingest_manager:
             logger.warning("No ingest manager available, cannot check ingest status")
             return False
+        is_streaming = self.availability.is_ingest_streaming(cam_id)
+        logger.debug(f"Ingest check for {cam_id}: streaming={is_streaming}")
+        return is_streaming
+    
+    def _set_slot_geometry(self, pad_index: int, slot, coords: Dict[str, int]) -> None:
+        """Renegotiate a source branch to a new slot size and crop.
         
+        Updating the slot capsfilter sends a reconfigure upstream, so
+        videoscale switches to the new size on the next frame without
+        rebuilding the pipeline. Crops can only change on branches that were
+        built with a videocrop element.
+        """
+        if not self.pipeline:
+            return
         try:
-            # Query ingest manager directly for camera status
-            ingest_status = self.ingest_manager.get_camera_status(cam_id)
-            if not ingest_status:
-                logger.debug(f"Ingest check for {cam_id}: no status available")
-                return False
+            capsfilter = self.pipeline.get_by_name(f"slot_caps_{pad_index}")
+            if capsfilter:
+                caps = self.Gst.Caps.from_string(_slot_caps(coords))
+                current = capsfilter.get_property("caps")
+                if not current or not current.is_equal(caps):
+                    capsfilter.set_property("caps", caps)
             
-            is_streaming = ingest_status.status == "streaming"
-            logger.debug(f"Ingest check for {cam_id}: status={ingest_status.status}, streaming={is_streaming}")
-            return is_streaming
+            crop = self.pipeline.get_by_name(f"slot_crop_{pad_index}")
+            source_size = self._slot_source_sizes.get(pad_index)
+            if crop and source_size:
+                left, top, right, bottom = _compute_crop(slot, source_size)
+                crop.set_property("left", left)
+                crop.set_property("top", top)
+                crop.set_property("right", right)
+                crop.set_property("bottom", bottom)
+            elif _has_crop(slot):
+                logger.debug(f"Slot {pad_index} ({slot.source}) has no crop element, crop applies on next rebuild")
         except Exception as e:
-            logger.warning(f"Error checking ingest status for {cam_id}: {e}")
+            logger.warning(f"Failed to update slot {pad_index} geometry: {e}")
+    
+    def _set_preview_geometry(self, pad_index: int, slot, coords: Dict[str, int]) -> None:
+        """Renegotiate a source's preview branch to a new slot size and crop."""
+        if not self.pipeline:
+            return
+        try:
+            capsfilter = self.pipeline.get_by_name(f"preview_caps_{pad_index}")
+            if capsfilter:
+                caps = self.Gst.Caps.from_string(_slot_caps(coords))
+                current = capsfilter.get_property("caps")
+                if not current or not current.is_equal(caps):
+                    capsfilter.set_property("caps", caps)
+            
+            crop = self.pipeline.get_by_name(f"preview_crop_{pad_index}")
+            source_size = self._slot_source_sizes.get(pad_index)
+            if crop and source_size:
+                left, top, right, bottom = _compute_crop(slot, source_size)
+                crop.set_property("left", left)
+                crop.set_property("top", top)
+                crop.set_property("right", right)
+                crop.set_property("bottom", bottom)
+        except Exception as e:
+            logger.warning(f"Failed to update preview slot {pad_index} geometry: {e}")
+    
+    def _preview_pad_props(self, slot) -> Dict[str, Any]:
+        """Preview bus pad properties for a newly attached source."""
+        if self.preview_scene:
+            pad_plan = self._get_scene_plan(self.preview_scene, self._preview_size).pads.get(slot.source)
+            if pad_plan:
+                return pad_plan.props()
+        # Not on the staged scene: keep the slot layout, hidden
+        width, height = self._preview_size
+        return {
+            "xpos": int(slot.x_rel * width), "ypos": int(slot.y_rel * height),
+            "width": int(slot.w_rel * width), "height": int(slot.h_rel * height),
+            "zorder": slot.z, "alpha": 0.0,
+        }
+    
+    def _has_local_frames(self, cam_id: str) -> bool:
+        """Check if ingest publishes raw frames for a camera at mixer resolution.
+        
+        Falls back to RTSP (False) when the feature is off, intervideo is not
+        installed, or the ingest pipeline was started without the local branch.
+        """
+        if not self.config.mixer.local_frames or not self.ingest_manager:
+            return False
+        has_local_frames = getattr(self.ingest_manager, "has_local_frames", None)
+        if has_local_frames is None:
+            return False
+        try:
+            return bool(has_local_frames(cam_id))
+        except Exception as e:
+            logger.debug(f"Error checking local frames for {cam_id}: {e}")
             return False
     
     def _check_mediamtx_stream(self, stream_path: str) -> bool:
-        """Check if a stream is available via MediaMTX API.
+        """Check if a stream is published on MediaMTX (last polled view, no I/O).
         
         Args:
             stream_path: MediaMTX path (e.g., "guest1", "guest2")
@@ -893,305 +1539,383 @@ class MixerCore:
         Returns:
             True if stream is available, False otherwise
         """
+        source_ready = self.availability.is_path_ready(stream_path)
+        logger.debug(f"MediaMTX stream check for {stream_path}: ready={source_ready}")
+        return source_ready
+
+    def _get_slot_path(self, slot) -> Optional[str]:
+        """MediaMTX path a live slot is published on (None for files/graphics).
+        
+        Template slots wait on their pre-render key instead.
+        """
+        if slot.source_type == "template":
+            return self._template_keys.get(self._template_spec(slot))
+        if slot.source == "slides" or slot.source_type == "reveal":
+            return self.config.reveal.mediamtx_path
+        if slot.source_type == "camera":
+            return slot.source  # Guests and ingest both publish under the source ID
+        return None
+
+    def _on_paths_ready(self, paths) -> None:
+        """Attach scene sources whose MediaMTX path just started publishing.
+        
+        Called from the availability poll thread. The new branch starts
+        hidden and its slot is shown once it delivers a frame, like a scene
+        change that adds a source.
+        """
+        with self._lock:
+            if not self.pipeline or self.state != "PLAYING":
+                return
+            buses = [(self.current_scene, self._apply_scene_pads)]
+            if self.preview_enabled:
+                buses.append((self.preview_scene, self._apply_preview_pads))
+            for scene, apply in buses:
+                if not scene:
+                    continue
+                waiting = [
+                    slot.source for slot in scene.slots
+                    if slot.source not in self._source_pads and self._get_slot_path(slot) in paths
+                ]
+                if not waiting:
+                    continue
+                if apply == self._apply_scene_pads and self._transition:
+                    logger.info(f"{waiting} went live during a transition, not added")
+                    continue
+                added = self._add_scene_sources(scene)
+                if added:
+                    logger.info(f"Sources went live, adding to {scene.id}: {sorted(added)}")
+                    self._when_sources_ready(self._scene_request, added, lambda scene=scene, apply=apply: apply(scene))
+
+    def _load_file_media_info(self, slot) -> Optional[Dict[str, Any]]:
+        """Look up probed metadata for a file slot (by file ID, then path)."""
+        if not self.database:
+            return None
         try:
-            import httpx
-            # MediaMTX API is on port 9997 by default
-            response = httpx.get(
-                f"http://127.0.0.1:9997/v3/paths/get/{stream_path}",
-                timeout=1.0
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Check if source is ready (someone is publishing)
-                source_ready = data.get("sourceReady", False)
-                logger.debug(f"MediaMTX stream check for {stream_path}: sourceReady={source_ready}")
-                return source_ready
+            return (self.database.get_file_metadata(slot.source)
+                    or self.database.find_file_by_path(slot.file_path))
         except Exception as e:
-            logger.debug(f"Error checking MediaMTX stream {stream_path}: {e}")
-        return False
+            logger.debug(f"No media info for {slot.file_path}: {e}")
+            return None
 
-    def _build_pipeline(self):
-        """Build the GStreamer compositor pipeline."""
+    def _get_file_media_info(self, slot) -> Optional[Dict[str, Any]]:
+        """Probed metadata of a file slot (from _prepare_scene_sources, no database access)."""
+        return self._media_info.get((slot.source, slot.file_path))
+
+    def _get_clip_source(self, slot, duration_s: Optional[float], path: Optional[str] = None) -> Optional[str]:
+        """appsrc fragment for a file/image slot held in the clip cache.
+        
+        On a miss the file is decoded into the cache in the background (when
+        it is short enough) and this branch streams from disk.
+        """
+        path = path or slot.file_path
         width, height = self.output_resolution.split("x")
-        scene = self.current_scene
+        size = (int(width), int(height))
+        clip = self.clip_cache.get(path, size)
+        if not clip:
+            self.clip_cache.prefetch(path, size, duration_s)
+            return None
+        max_frames = None
+        if clip.is_image and slot.duration:
+            max_frames = int(slot.duration * CLIP_FRAMERATE)
+        self._pending_clips[slot.source] = (clip, slot.loop, max_frames)
+        return build_clip_source(clip)
+
+    @staticmethod
+    def _template_spec(slot) -> Tuple[str, str, float]:
+        """(template ID, bound data, duration) of a template slot (no I/O).
+        
+        The slot names the template in source_data["template_id"] (or as
+        "template:<id>"), with source_data["data"] bound into it and
+        source_data["duration"] (or the slot duration) in seconds.
+        """
+        source_data = slot.source_data or {}
+        template_id = source_data.get("template_id") or slot.source.split(":", 1)[-1]
+        duration = float(source_data.get("duration") or slot.duration or 5.0)
+        data = json.dumps(source_data.get("data") or {}, sort_keys=True, default=str)
+        return template_id, data, duration
+
+    def _prepare_scene_sources(self, scenes=None) -> None:
+        """Resolve what scene slots need from disk, before the lock is taken.
+        
+        Template slots get their pre-render key (reading the template and
+        its assets, and starting the render if there is no clip yet), file
+        slots their probed media info from the database. Called when the
+        mixer starts (all scenes) and before a scene is applied, staged or
+        transitioned to, so scene changes and availability callbacks under
+        the lock only read these caches.
+        """
+        if scenes is None:
+            scenes = list(self.scene_manager.scenes.values())
+        width, height = self.output_resolution.split("x")
+        for scene in scenes:
+            for slot in scene.slots:
+                if slot.source_type == "template" and self.prerender:
+                    spec = self._template_spec(slot)
+                    template_id, data, duration = spec
+                    try:
+                        key, _ = self.prerender.request(template_id, json.loads(data), duration, (int(width), int(height)))
+                    except Exception as e:
+                        logger.warning(f"Template source {slot.source} unavailable: {e}")
+                        continue
+                    self._template_keys[spec] = key
+                elif slot.source_type == "file":
+                    self._media_info[(slot.source, slot.file_path)] = self._load_file_media_info(slot)
 
-        # Build source branches for each slot
-        source_branches = []
-        for i, slot in enumerate(scene.slots):
-            # Handle file sources (uploaded videos)
-            if slot.source_type == "file" and slot.file_path:
-                file_path = Path(slot.file_path)
-                if not file_path.exists():
-                    logger.warning(f"File source not found: {file_path}, skipping")
-                    continue
-                
-                # Build file source pipeline
-                if slot.loop:
-                    # Looping video
-                    source_str = (
-                        f"filesrc location={file_path} loop=true ! "
-                        f"decodebin ! "
-                        f"videoconvert ! "
-                        f"videoscale ! "
-                        f"video/x-raw,width={width},height={height} ! "
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                else:
-                    # Play once
-                    source_str = (
-                        f"filesrc location={file_path} ! "
-                        f"decodebin ! "
-                        f"videoconvert ! "
-                        f"videoscale ! "
-                        f"video/x-raw,width={width},height={height} ! "
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                
-                # Apply crop if specified
-                if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                    crop_left = int(slot.crop_x * int(width))
-                    crop_top = int(slot.crop_y * int(height))
-                    crop_right = int((1.0 - slot.crop_x - slot.crop_w) * int(width))
-                    crop_bottom = int((1.0 - slot.crop_y - slot.crop_h) * int(height))
-                    source_str = source_str.replace(
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream",
-                        f"videocrop left={crop_left} top={crop_top} right={crop_right} bottom={crop_bottom} ! queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                
-                source_branches.append((i, source_str, slot))
-                logger.info(f"Added file source branch: {file_path}")
-                continue
-            
-            # Handle image sources (uploaded images)
-            if slot.source_type == "image" and slot.file_path:
-                file_path = Path(slot.file_path)
-                if not file_path.exists():
-                    logger.warning(f"Image source not found: {file_path}, skipping")
+    def _get_template_clip(self, slot) -> Tuple[Optional[str], Optional[Any]]:
+        """Pre-render key and finished clip of a template slot (from _prepare_scene_sources).
+        
+        Never starts a render: a slot whose key was not prepared yet is
+        treated as still rendering.
+        """
+        if not self.prerender:
+            return None, None
+        key = self._template_keys.get(self._template_spec(slot))
+        if not key:
+            return None, None
+        return key, self.prerender.get(key)
+
+    def _prefetch_clips(self) -> None:
+        """Start decoding every file/image slot of every scene into the clip cache.
+        
+        Template slots are pre-rendered (and their clips cached) the same way.
+        """
+        width, height = self.output_resolution.split("x")
+        for scene in list(self.scene_manager.scenes.values()):
+            for slot in scene.slots:
+                if slot.source_type == "template":
+                    key, clip = self._get_template_clip(slot)
+                    if clip:
+                        self.clip_cache.prefetch(str(clip.path), (int(width), int(height)), clip.duration)
                     continue
-                
-                # Determine image decoder based on extension
-                ext = file_path.suffix.lower()
-                if ext in [".png"]:
-                    decoder = "pngdec"
-                elif ext in [".jpg", ".jpeg"]:
-                    decoder = "jpegdec"
-                else:
-                    decoder = "decodebin"  # Fallback
-                
-                # Duration for image (default 10 seconds if not specified)
-                duration = slot.duration if slot.duration else 10
-                
-                # Build image source pipeline
-                source_str = (
-                    f"filesrc location={file_path} ! "
-                    f"{decoder} ! "
-                    f"imagefreeze duration={duration} ! "
-                    f"videoconvert ! "
-                    f"videoscale ! "
-                    f"video/x-raw,width={width},height={height} ! "
-                    f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                )
-                
-                # Apply crop if specified
-                if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                    crop_left = int(slot.crop_x * int(width))
-                    crop_top = int(slot.crop_y * int(height))
-                    crop_right = int((1.0 - slot.crop_x - slot.crop_w) * int(width))
-                    crop_bottom = int((1.0 - slot.crop_y - slot.crop_h) * int(height))
-                    source_str = source_str.replace(
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream",
-                        f"videocrop left={crop_left} top={crop_top} right={crop_right} bottom={crop_bottom} ! queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                
-                source_branches.append((i, source_str, slot))
-                logger.info(f"Added image source branch: {file_path}")
-                continue
-            
-            # Handle Reveal.js slides source (MUST come before generic graphics handler)
-            if slot.source == "slides" or slot.source_type == "reveal":
-                # Check if Reveal.js is enabled and streaming
-                if not self.config.reveal.enabled:
-                    logger.debug("Reveal.js source disabled in config, skipping")
+                if slot.source_type not in ("file", "image") or not slot.file_path:
                     continue
-                
-                # Check if slides stream is available via MediaMTX API
-                if not self._check_mediamtx_stream(self.config.reveal.mediamtx_path):
-                    logger.info(f"Reveal.js stream not available at {self.config.reveal.mediamtx_path}, skipping")
+                if not Path(slot.file_path).exists():
                     continue
-                
-                rtsp_port = self.config.mediamtx.rtsp_port
-                rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{self.config.reveal.mediamtx_path}"
-                
-                logger.info(f"Using RTSP source for Reveal.js slides from MediaMTX: {rtsp_url}")
-                
-                # Source from MediaMTX RTSP stream - use decodebin for automatic codec detection
-                source_str = (
-                    f"rtspsrc location={rtsp_url} latency=50 protocols=tcp buffer-mode=auto ! "
-                    f"decodebin ! "
-                    f"videoconvert ! "
-                    f"videoscale ! "
-                    f"video/x-raw,width={width},height={height} ! "
-                    f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                )
-                
-                # Apply crop if specified
-                if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                    source_width = int(width)
-                    source_height = int(height)
-                    crop_left = int(slot.crop_x * source_width)
-                    crop_top = int(slot.crop_y * source_height)
-                    crop_right = int((1.0 - slot.crop_x - slot.crop_w) * source_width)
-                    crop_bottom = int((1.0 - slot.crop_y - slot.crop_h) * source_height)
-                    source_str = source_str.replace(
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream",
-                        f"videocrop left={crop_left} top={crop_top} right={crop_right} bottom={crop_bottom} ! queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                
-                source_branches.append((i, source_str, slot))
-                logger.info(f"Added Reveal.js slides source branch from RTSP")
-                continue
+                duration = None
+                if slot.source_type == "file":
+                    duration = (self._get_file_media_info(slot) or {}).get("duration")
+                self.clip_cache.prefetch(slot.file_path, (int(width), int(height)), duration)
+
+    def _build_source_branch(self, slot) -> Optional[Tuple[str, Optional[Tuple[int, int]]]]:
+        """Build the source part of a compositor branch for a scene slot.
+        
+        Branches end at the decoded frames; _build_slot_tail() crops and
+        scales them to the slot size.
+        
+        Returns:
+            (pipeline fragment, decoded frame size if known), or None if the
+            source is unavailable
+        """
+        width, height = self.output_resolution.split("x")
+        source_size = None
+        
+        # Handle file sources (uploaded videos)
+        if slot.source_type == "file" and slot.file_path:
+            file_path = Path(slot.file_path)
+            if not file_path.exists():
+                logger.warning(f"File source not found: {file_path}, skipping")
+                return None
             
-            # Handle graphics sources (image, presentation, lower_third, graphics)
-            # Note: "reveal" type is handled above, so this won't catch it
-            if slot.source_type not in ["camera", "file", "image", "reveal"]:
-                graphics_pipeline = self.graphics_renderer.get_source_pipeline(slot.source)
-                if graphics_pipeline:
-                    # Apply crop if specified
-                    if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                        # Add videocrop element
-                        crop_x = int(slot.crop_x * int(width))
-                        crop_y = int(slot.crop_y * int(height))
-                        crop_w = int(slot.crop_w * int(width))
-                        crop_h = int(slot.crop_h * int(height))
-                        source_str = f"{graphics_pipeline} ! videocrop left={crop_x} top={crop_y} right={int(width) - crop_x - crop_w} bottom={int(height) - crop_y - crop_h} ! "
-                    else:
-                        source_str = f"{graphics_pipeline} ! "
-                    
-                    source_str += (
-                        f"videoscale ! "
-                        f"video/x-raw,width={width},height={height} ! "
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                    source_branches.append((i, source_str, slot))
-                    logger.info(f"Added graphics source branch: {slot.source} (type: {slot.source_type})")
-                else:
-                    logger.warning(f"Failed to create graphics source for {slot.source}")
-                continue
+            # Use cached probe results to skip decodebin autoplugging
+            media_info = self._get_file_media_info(slot)
+            clip_source = self._get_clip_source(slot, (media_info or {}).get("duration"))
+            if clip_source:
+                logger.info(f"Added file source branch: {file_path} (from clip cache)")
+                return clip_source, (int(width), int(height))
+            decoder = _build_file_decoder_string(media_info, self._hardware_decoder)
+            if media_info and media_info.get("width") and media_info.get("height"):
+                source_size = (media_info["width"], media_info["height"])
             
-            # Handle guest sources (remote guests via WHIP)
-            if slot.source.startswith("guest"):
-                guest_id = slot.source
-                
-                # Check if guest is configured
-                if guest_id not in self.config.guests:
-                    logger.debug(f"Guest {guest_id} not found in config, skipping")
-                    continue
-                
-                guest_config = self.config.guests[guest_id]
-                if not guest_config.enabled:
-                    logger.debug(f"Guest {guest_id} is disabled, skipping")
-                    continue
-                
-                # Check if guest is currently streaming via MediaMTX API
-                if not self._check_mediamtx_stream(guest_id):
-                    logger.info(f"Guest {guest_id} not streaming, skipping")
-                    continue
-                
-                rtsp_port = self.config.mediamtx.rtsp_port
-                rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{guest_id}"
-                
-                logger.info(f"Using RTSP source for guest {guest_id} from MediaMTX: {rtsp_url}")
-                
-                # Build decoder string with hardware acceleration if available
-                decoder_str = _build_decoder_string(self._hardware_decoder)
-                
-                # Source from MediaMTX RTSP stream - use decodebin for automatic codec detection
-                source_str = (
-                    f"rtspsrc location={rtsp_url} latency=50 protocols=tcp buffer-mode=auto ! "
-                    f"decodebin ! "
-                    f"videoconvert ! "
-                    f"videoscale ! "
-                    f"video/x-raw,width={width},height={height} ! "
-                    f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                )
-                
-                # Apply crop if specified
-                if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                    source_width = int(width)
-                    source_height = int(height)
-                    crop_left = int(slot.crop_x * source_width)
-                    crop_top = int(slot.crop_y * source_height)
-                    crop_right = int((1.0 - slot.crop_x - slot.crop_w) * source_width)
-                    crop_bottom = int((1.0 - slot.crop_y - slot.crop_h) * source_height)
-                    source_str = source_str.replace(
-                        f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream",
-                        f"videocrop left={crop_left} top={crop_top} right={crop_right} bottom={crop_bottom} ! queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                    )
-                
-                source_branches.append((i, source_str, slot))
-                logger.info(f"Added guest source branch for {guest_id} from RTSP")
-                continue
+            # Build file source pipeline
+            if slot.loop:
+                # Looping video
+                source_str = f"filesrc location={file_path} loop=true ! {decoder}"
+            else:
+                # Play once
+                source_str = f"filesrc location={file_path} ! {decoder}"
             
-            # Handle camera sources
-            if slot.source_type != "camera":
-                logger.warning(f"Unknown source type: {slot.source_type}, skipping")
-                continue
+            logger.info(f"Added file source branch: {file_path} ({decoder})")
+            return source_str, source_size
+        
+        # Handle image sources (uploaded images)
+        if slot.source_type == "image" and slot.file_path:
+            file_path = Path(slot.file_path)
+            if not file_path.exists():
+                logger.warning(f"Image source not found: {file_path}, skipping")
+                return None
             
-            cam_id = slot.source
-            if cam_id not in self.camera_devices:
-                logger.debug(f"Camera {cam_id} not found in config, skipping")
-                continue
-
-            logger.debug(f"Processing camera {cam_id}")
+            clip_source = self._get_clip_source(slot, None)
+            if clip_source:
+                logger.info(f"Added image source branch: {file_path} (from clip cache)")
+                return clip_source, (int(width), int(height))
             
-            # Mixer always sources from MediaMTX RTSP streams
-            # This avoids device conflicts with the always-on ingest pipelines
-            if not self.config.mediamtx.enabled:
-                logger.error("MediaMTX is required for mixer operation")
-                continue
+            # Determine image decoder based on extension
+            ext = file_path.suffix.lower()
+            if ext in [".png"]:
+                decoder = "pngdec"
+            elif ext in [".jpg", ".jpeg"]:
+                decoder = "jpegdec"
+            else:
+                decoder = "decodebin"  # Fallback
             
-            # Check if ingest is streaming for this camera
-            if not self._check_ingest_status(cam_id):
-                logger.warning(f"Ingest not streaming for {cam_id}, skipping")
-                continue
+            # Duration for image (default 10 seconds if not specified)
+            duration = slot.duration if slot.duration else 10
+            
+            # Build image source pipeline
+            source_str = (
+                f"filesrc location={file_path} ! "
+                f"{decoder} ! "
+                f"imagefreeze duration={duration}"
+            )
+            
+            logger.info(f"Added image source branch: {file_path}")
+            return source_str, source_size
+        
+        # Handle pre-rendered HTML template sources (never a live browser)
+        if slot.source_type == "template":
+            key, clip = self._get_template_clip(slot)
+            if not clip:
+                logger.info(f"Template source {slot.source} is still rendering ({key}), skipping")
+                return None
+            clip_source = self._get_clip_source(slot, clip.duration, path=str(clip.path))
+            if clip_source:
+                logger.info(f"Added template source branch: {slot.source} (from clip cache)")
+                return clip_source, (int(width), int(height))
+            logger.info(f"Added template source branch: {slot.source} (PNG sequence {clip.path})")
+            return build_sequence_source(str(clip.path), slot.loop), (clip.width, clip.height)
+        
+        # Handle Reveal.js slides source (MUST come before generic graphics handler)
+        if slot.source == "slides" or slot.source_type == "reveal":
+            # Check if Reveal.js is enabled and streaming
+            if not self.config.reveal.enabled:
+                logger.debug("Reveal.js source disabled in config, skipping")
+                return None
+            
+            # Check if slides stream is available via MediaMTX API
+            if not self._check_mediamtx_stream(self.config.reveal.mediamtx_path):
+                logger.info(f"Reveal.js stream not available at {self.config.reveal.mediamtx_path}, skipping")
+                return None
             
             rtsp_port = self.config.mediamtx.rtsp_port
-            rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{cam_id}"
+            rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{self.config.reveal.mediamtx_path}"
             
-            logger.info(f"Using RTSP source for {cam_id} from MediaMTX: {rtsp_url}")
+            logger.info(f"Using RTSP source for Reveal.js slides from MediaMTX: {rtsp_url}")
+            
+            # Source from MediaMTX RTSP stream - use decodebin for automatic codec detection
+            source_str = (
+                f"rtspsrc location={rtsp_url} latency=50 protocols=tcp buffer-mode=auto ! "
+                f"decodebin"
+            )
+            
+            logger.info(f"Added Reveal.js slides source branch from RTSP")
+            return source_str, source_size
+        
+        # Handle graphics sources (image, presentation, lower_third, graphics)
+        # Note: "reveal" type is handled above, so this won't catch it
+        if slot.source_type not in ["camera", "file", "image", "reveal", "template"]:
+            graphics_pipeline = self.graphics_renderer.get_source_pipeline(slot.source)
+            if graphics_pipeline:
+                source_str = graphics_pipeline
+                logger.info(f"Added graphics source branch: {slot.source} (type: {slot.source_type})")
+                return source_str, source_size
+            else:
+                logger.warning(f"Failed to create graphics source for {slot.source}")
+            return None
+        
+        # Handle guest sources (remote guests via WHIP)
+        if slot.source.startswith("guest"):
+            guest_id = slot.source
+            
+            # Check if guest is configured
+            if guest_id not in self.config.guests:
+                logger.debug(f"Guest {guest_id} not found in config, skipping")
+                return None
+            
+            guest_config = self.config.guests[guest_id]
+            if not guest_config.enabled:
+                logger.debug(f"Guest {guest_id} is disabled, skipping")
+                return None
+            
+            # Check if guest is currently streaming via MediaMTX API
+            if not self._check_mediamtx_stream(guest_id):
+                logger.info(f"Guest {guest_id} not streaming, skipping")
+                return None
+            
+            rtsp_port = self.config.mediamtx.rtsp_port
+            rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{guest_id}"
+            
+            logger.info(f"Using RTSP source for guest {guest_id} from MediaMTX: {rtsp_url}")
             
             # Build decoder string with hardware acceleration if available
             decoder_str = _build_decoder_string(self._hardware_decoder)
             
+            # Source from MediaMTX RTSP stream - use decodebin for automatic codec detection
+            source_str = (
+                f"rtspsrc location={rtsp_url} latency=50 protocols=tcp buffer-mode=auto ! "
+                f"decodebin"
+            )
+            
+            logger.info(f"Added guest source branch for {guest_id} from RTSP")
+            return source_str, source_size
+        
+        # Handle camera sources
+        if slot.source_type != "camera":
+            logger.warning(f"Unknown source type: {slot.source_type}, skipping")
+            return None
+        
+        cam_id = slot.source
+        if cam_id not in self.camera_devices:
+            logger.debug(f"Camera {cam_id} not found in config, skipping")
+            return None
+
+        logger.debug(f"Processing camera {cam_id}")
+        
+        # Mixer always sources from MediaMTX RTSP streams
+        # This avoids device conflicts with the always-on ingest pipelines
+        if not self.config.mediamtx.enabled:
+            logger.error("MediaMTX is required for mixer operation")
+            return None
+        
+        # Check if ingest is streaming for this camera
+        if not self._check_ingest_status(cam_id):
+            logger.warning(f"Ingest not streaming for {cam_id}, skipping")
+            return None
+        
+        if self._has_local_frames(cam_id):
+            # Raw frames published by the ingest pipeline in this process:
+            # no H.264 decode, and no encode/RTSP hop between ingest and mixer
+            logger.info(f"Using local raw frames for {cam_id} ({get_local_frame_channel(cam_id)})")
+            source_str = build_local_frame_source(cam_id, self.output_resolution)
+            source_size = (int(width), int(height))
+        else:
+            rtsp_port = self.config.mediamtx.rtsp_port
+            rtsp_url = f"rtsp://127.0.0.1:{rtsp_port}/{cam_id}"
+            
+            logger.info(f"Using RTSP source for {cam_id} from MediaMTX: {rtsp_url}")
+            
             # Source from MediaMTX RTSP stream with optimized low latency settings
             # Ingest pipelines output H.264 baseline profile (mpph264enc)
             # Use decodebin for automatic codec detection and hardware decoder selection
             source_str = (
                 f"rtspsrc location={rtsp_url} latency=50 protocols=tcp buffer-mode=auto ! "
-                f"decodebin ! "
-                f"videoconvert ! "
-                f"videoscale ! "
-                f"video/x-raw,width={width},height={height} ! "
-                f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
+                f"decodebin"
             )
-            
-            # Apply crop if specified (for video sources)
-            if slot.crop_w < 1.0 or slot.crop_h < 1.0 or slot.crop_x > 0.0 or slot.crop_y > 0.0:
-                # Calculate crop values in pixels
-                source_width = int(width)
-                source_height = int(height)
-                crop_left = int(slot.crop_x * source_width)
-                crop_top = int(slot.crop_y * source_height)
-                crop_right = int((1.0 - slot.crop_x - slot.crop_w) * source_width)
-                crop_bottom = int((1.0 - slot.crop_y - slot.crop_h) * source_height)
-                # Insert videocrop before the final queue
-                source_str = source_str.replace(
-                    f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream",
-                    f"videocrop left={crop_left} top={crop_top} right={crop_right} bottom={crop_bottom} ! queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream"
-                )
 
-            source_branches.append((i, source_str, slot))
-            logger.info(f"Added source branch for {cam_id} from RTSP")
+        logger.info(f"Added source branch for {cam_id}")
+        return source_str, source_size
+
+    def _build_pipeline(self):
+        """Build the GStreamer compositor pipeline."""
+        width, height = self.output_resolution.split("x")
+        scene = self.current_scene
+        if not self._backend or self.compositor_backend == "auto":
+            self._select_backend()
+
+        source_branches = []
+        for i, slot in enumerate(scene.slots):
+            branch = self._build_source_branch(slot)
+            if branch:
+                source_branches.append((i, branch[0], slot, branch[1]))
 
         if not source_branches:
             logger.warning("No valid source branches to build - all cameras are unavailable or not configured")
@@ -1255,42 +1979,19 @@ class MixerCore:
             # Add fakesink as fallback
             output_branches.append("fakesink")
 
-        # Build source branches connecting to compositor
-        source_parts = []
-        for i, (_, source_str, slot) in enumerate(source_branches):
-            source_parts.append(f"{source_str} ! compositor.sink_{i}")
-
-        # Build compositor with pad properties
-        compositor_pad_props = []
-        for i, (_, _, slot) in enumerate(source_branches):
-            coords = scene.get_absolute_coords(slot)
-            # Build pad properties with styling support
-            pad_props = [
-                f"sink_{i}::xpos={coords['x']}",
-                f"sink_{i}::ypos={coords['y']}",
-                f"sink_{i}::width={coords['w']}",
-                f"sink_{i}::height={coords['h']}",
-                f"sink_{i}::zorder={slot.z}",
-                f"sink_{i}::alpha={slot.alpha}"
-            ]
-            
-            # Note: GStreamer compositor doesn't natively support borders/border-radius
-            # These would need to be applied via a separate overlay element or cairooverlay
-            # For now, we store the values but don't apply them in the pipeline
-            # TODO: Add cairooverlay or similar for border/border-radius rendering
-            
-            compositor_pad_props.append(" ".join(pad_props))
-
-        # Build complete pipeline with Cairo overlay
-        # Cairo overlay is inserted after compositor for broadcast graphics
-        # videoconvert is needed after timeoverlay because overlay elements output RGBA
-        # but hardware/software encoders need NV12/I420
+        # Build complete pipeline
+        # Cairo graphics are a compositor input of their own (see
+        # cairo_graphics/layer.py), re-rendered only when they change, so
+        # the program frame is not drawn on when there are no graphics.
+        # videoconvert is needed because the compositor blends in an alpha
+        # format but hardware/software encoders need NV12/I420
+        # Sources are attached as bins on compositor request pads (see
+        # _attach_source_branch) so scene changes can add/remove them live.
         pipeline_str = (
-            " ".join(source_parts) + " "
-            f"compositor name=compositor {' '.join(compositor_pad_props)} ! "
-            f"video/x-raw,width={width},height={height} ! "
-            f"cairooverlay name=graphics_overlay ! "
+            f"{self._backend.mixer_str('compositor')} ! "
+            f"{self._backend.output_str(int(width), int(height))} ! "
             f"timeoverlay ! "
+            f"{'tee name=program_frames ! queue ! ' if self.program_frames_resolution else ''}"
             f"videoconvert ! "
             f"video/x-raw,format=NV12 ! "
             f"{encoder_str} ! "
@@ -1301,17 +2002,181 @@ class MixerCore:
         # Add output branches
         for branch in output_branches:
             pipeline_str += f" t. ! {branch}"
+        if self._graphics_enabled:
+            pipeline_str += f" {build_graphics_source(int(width), int(height))}"
+        if self.program_frames_resolution:
+            pipeline_str += (
+                f" program_frames. ! {get_local_frame_branch('program', self.program_frames_resolution)}"
+            )
+        
+        # Preview bus: a second compositor fed from the same source branches
+        # (tee'd in _attach_source_branch), encoded small for the operator UI
+        if self.preview_enabled:
+            preview_width, preview_height = self._preview_size
+            if self.Gst.ElementFactory.find("mpph264enc"):
+                preview_encoder = (
+                    f"mpph264enc qp-init=30 gop=30 profile=baseline rc-mode=cbr bps={self.preview_bitrate * 1000}"
+                )
+            else:
+                preview_encoder = f"x264enc tune=zerolatency bitrate={self.preview_bitrate} speed-preset=ultrafast"
+            pipeline_str += (
+                f" {self._backend.mixer_str('preview_compositor')} ! "
+                f"{self._backend.output_str(preview_width, preview_height)} ! "
+                f"{'tee name=preview_frames ! queue ! ' if self.program_frames_resolution else ''}"
+                f"videoconvert ! video/x-raw,format=NV12 ! {preview_encoder} ! {caps_str} ! "
+                f"queue ! {parse_str} ! flvmux streamable=true ! "
+                f"rtmpsink location=rtmp://127.0.0.1:1935/{self.preview_path} sync=false"
+            )
+            if self.program_frames_resolution:
+                pipeline_str += (
+                    f" preview_frames. ! {get_local_frame_branch('preview', self.program_frames_resolution)}"
+                )
+            logger.info(f"Mixer preview bus: {self.preview_resolution} -> {self.preview_path}")
 
         logger.info(f"Building mixer pipeline: {len(source_branches)} sources")
         logger.debug(f"Pipeline string: {pipeline_str[:500]}...")
 
         try:
             pipeline = self.Gst.parse_launch(pipeline_str)
-            return pipeline
         except Exception as e:
             logger.error(f"Failed to parse pipeline: {e}")
             return None
 
+        self._source_pads = {}
+        self._slot_source_sizes = {}
+        self._clip_players = {}
+        self._reset_pad_state()
+        self._next_pad_index = 0
+        for _, source_str, slot, source_size in source_branches:
+            coords = scene.get_absolute_coords(slot)
+            if self._attach_source_branch(pipeline, slot, coords, source_str, source_size, slot.alpha) is None:
+                logger.warning(f"Failed to attach source branch for {slot.source}")
+
+        if not self._source_pads:
+            logger.error("No source branches could be attached to the compositor")
+            return None
+
+        instrument_pipeline(pipeline, "mixer")
+        return pipeline
+
+    def _attach_source_branch(
+        self,
+        pipeline,
+        slot,
+        coords: Dict[str, int],
+        source_str: str,
+        source_size: Optional[Tuple[int, int]],
+        alpha: float,
+    ) -> Optional[int]:
+        """Add a source bin to the compositor on a new request pad.
+        
+        Works on a stopped pipeline (initial build) and on a running one
+        (dynamic add): the bin is synced to the pipeline state and non-live
+        sources are offset to the current running time so the compositor
+        does not drop their first frames as late.
+        
+        Returns:
+            Compositor pad index, or None on failure
+        """
+        Gst = self.Gst
+        compositor = pipeline.get_by_name("compositor")
+        if not compositor:
+            return None
+        
+        pad_index = self._next_pad_index
+        self._next_pad_index += 1
+        width, height = self.output_resolution.split("x")
+        tail = _build_slot_tail(pad_index, slot, coords, source_size, (int(width), int(height)))
+        
+        # With a preview bus, the decoded source is tee'd to both compositors
+        preview_compositor = pipeline.get_by_name("preview_compositor")
+        preview_props = self._preview_pad_props(slot) if preview_compositor else None
+        try:
+            if preview_compositor:
+                preview_coords = {
+                    "x": preview_props["xpos"], "y": preview_props["ypos"],
+                    "w": preview_props["width"], "h": preview_props["height"],
+                }
+                preview_tail = _build_preview_tail(pad_index, slot, preview_coords, source_size)
+                source_bin = Gst.parse_bin_from_description(
+                    f"{source_str} ! tee name=source_tee_{pad_index} ! {tail} "
+                    f"source_tee_{pad_index}. ! {preview_tail}",
+                    False,
+                )
+                preview_out = source_bin.get_by_name(f"preview_out_{pad_index}")
+                source_bin.add_pad(Gst.GhostPad.new("preview_src", preview_out.get_static_pad("src")))
+                source_bin.add_pad(Gst.GhostPad.new("src", source_bin.find_unlinked_pad(Gst.PadDirection.SRC)))
+            else:
+                source_bin = Gst.parse_bin_from_description(f"{source_str} ! {tail}", True)
+        except Exception as e:
+            logger.error(f"Failed to parse source branch for {slot.source}: {e}")
+            return None
+        source_bin.set_name(f"source_{pad_index}")
+        
+        appsrc = source_bin.get_by_name("clip_src")
+        pending_clip = self._pending_clips.pop(slot.source, None)
+        if appsrc and pending_clip:
+            self._clip_players[pad_index] = ClipPlayer(appsrc, *pending_clip)
+        
+        sink_pad = compositor.request_pad(
+            compositor.get_pad_template("sink_%u"), f"sink_{pad_index}", None
+        )
+        if not sink_pad:
+            logger.error(f"Compositor refused pad sink_{pad_index} for {slot.source}")
+            return None
+        sink_pad.set_property("xpos", coords["x"])
+        sink_pad.set_property("ypos", coords["y"])
+        sink_pad.set_property("width", coords["w"])
+        sink_pad.set_property("height", coords["h"])
+        sink_pad.set_property("zorder", slot.z)
+        sink_pad.set_property("alpha", alpha)
+        self._pad_state.setdefault("compositor", {})[pad_index] = {
+            "xpos": coords["x"], "ypos": coords["y"], "width": coords["w"],
+            "height": coords["h"], "zorder": slot.z, "alpha": alpha,
+        }
+        
+        # Note: GStreamer compositor doesn't natively support borders/border-radius
+        # These would need to be applied via a separate overlay element or cairooverlay
+        # For now, we store the values but don't apply them in the pipeline
+        # TODO: Add cairooverlay or similar for border/border-radius rendering
+        
+        pipeline.add(source_bin)
+        src_pad = source_bin.get_static_pad("src")
+        if src_pad.link(sink_pad) != Gst.PadLinkReturn.OK:
+            logger.error(f"Failed to link source branch for {slot.source}")
+            pipeline.remove(source_bin)
+            compositor.release_request_pad(sink_pad)
+            return None
+        
+        src_pads = [src_pad]
+        if preview_compositor:
+            preview_src = source_bin.get_static_pad("preview_src")
+            preview_sink = preview_compositor.request_pad(
+                preview_compositor.get_pad_template("sink_%u"), f"sink_{pad_index}", None
+            )
+            if preview_sink:
+                for prop, value in preview_props.items():
+                    preview_sink.set_property(prop, value)
+                if preview_src.link(preview_sink) == Gst.PadLinkReturn.OK:
+                    self._pad_state.setdefault("preview_compositor", {})[pad_index] = preview_props
+                    src_pads.append(preview_src)
+                else:
+                    logger.warning(f"Failed to link {slot.source} to the preview bus")
+                    preview_compositor.release_request_pad(preview_sink)
+        
+        _, state, _ = pipeline.get_state(0)
+        if state in (Gst.State.PAUSED, Gst.State.PLAYING):
+            if _needs_running_time_offset(slot):
+                running_time = pipeline.get_current_running_time()
+                if running_time != Gst.CLOCK_TIME_NONE:
+                    for pad in src_pads:
+                        pad.set_offset(running_time)
+            source_bin.sync_state_with_parent()
+        
+        self._source_pads[slot.source] = pad_index
+        self._slot_source_sizes[pad_index] = source_size or (int(width), int(height))
+        return pad_index
+
     def _set_state_with_timeout(self, state) -> bool:
         """Set pipeline state with timeout.
         
@@ -1450,12 +2315,10 @@ class MixerCore:
                     logger.error("Failed to rebuild pipeline during recovery")
                     return
                 
-                bus = self.pipeline.get_bus()
-                bus.add_signal_watch()
-                bus.connect("message", self._on_bus_message)
+                self._prepare_pipeline()
                 
                 if self._set_state_with_timeout(self.Gst.State.PLAYING):
-                    self.state = "PLAYING"
+                    self._on_pipeline_playing()
                     logger.info("Pipeline recovered successfully")
                 else:
                     logger.error("Failed to restart pipeline during recovery")
@@ -0,0 +1,251 @@
+"""Multiviewer - one low-resolution grid of program, preview and all cameras.
+
+The operator UI otherwise opens a WHEP session per camera plus program. The
+multiview composites everything into a single small frame with labels and
+tally borders, encodes it once and publishes it to MediaMTX (`multiview`).
+
+Frames are reused from the rest of the process where possible: cameras are
+read from the raw frames ingest already publishes for the mixer, program
+(and preview) from the mixer's own raw frame channel, both via intervideosrc.
+Cameras without local frames fall back to decoding their RTSP stream.
+
+Layout and pipeline strings are plain functions (unit tested without
+GStreamer); Multiview owns the running pipeline.
+"""
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..gst_utils import ensure_gst_initialized, get_gst
+from ..pipelines import build_local_frame_source
+
+logger = logging.getLogger(__name__)
+
+BORDER = 4  # Tally border width (pixels at multiview resolution)
+# videobox fill values
+TALLY_FILLS = {"program": 3, "preview": 1, None: 0}  # red, green, black
+PROGRAM_TILES = ("program", "preview")
+
+
+@dataclass(frozen=True)
+class Tile:
+    """One multiview cell (outer rectangle, including the tally border)."""
+    name: str
+    label: str
+    x: int
+    y: int
+    w: int
+    h: int
+
+    @property
+    def inner_size(self) -> Tuple[int, int]:
+        return self.w - 2 * BORDER, self.h - 2 * BORDER
+
+
+def _even(value: float) -> int:
+    return int(value) // 2 * 2
+
+
+def multiview_layout(cameras: List[str], size: Tuple[int, int]) -> List[Tile]:
+    """Lay out program and preview side by side on top, cameras below.
+
+    Camera cells keep 16:9 and use up to four columns; more cameras add rows
+    in the lower half.
+    """
+    width, height = size
+    half_w, half_h = _even(width / 2), _even(height / 2)
+    tiles = [
+        Tile("program", "PROGRAM", 0, 0, half_w, half_h),
+        Tile("preview", "PREVIEW", half_w, 0, half_w, half_h),
+    ]
+    if not cameras:
+        return tiles
+
+    cols = min(len(cameras), 4)
+    rows = math.ceil(len(cameras) / cols)
+    cell_w = _even(width / cols)
+    cell_h = min(_even(cell_w * 9 / 16), _even((height - half_h) / rows))
+    for i, cam_id in enumerate(cameras):
+        row, col = divmod(i, cols)
+        tiles.append(Tile(cam_id, cam_id.upper(), col * cell_w, half_h + row * cell_h, cell_w, cell_h))
+    return tiles
+
+
+def program_frames_resolution(cameras: List[str], size: Tuple[int, int]) -> str:
+    """Size the mixer publishes program frames at (the program tile's inner size)."""
+    w, h = multiview_layout(cameras, size)[0].inner_size
+    return f"{w}x{h}"
+
+
+def build_tile_branch(tile: Tile, source_str: str, fps: int, pad_index: int) -> str:
+    """Scale, label and frame one source for the multiview compositor."""
+    w, h = tile.inner_size
+    return (
+        f"{source_str} ! "
+        f"videorate drop-only=true max-rate={fps} ! "
+        f"videoscale ! videoconvert ! video/x-raw,format=I420,width={w},height={h} ! "
+        f'textoverlay text="{tile.label}" valignment=bottom halignment=left '
+        f'font-desc="Sans Bold 10" shaded-background=true ! '
+        f"videobox name=tally_{tile.name} top=-{BORDER} bottom=-{BORDER} "
+        f"left=-{BORDER} right=-{BORDER} fill={TALLY_FILLS[None]} ! "
+        f"queue max-size-buffers=1 leaky=downstream ! mv.sink_{pad_index}"
+    )
+
+
+def build_multiview_pipeline_str(
+    tiles: List[Tile],
+    sources: Dict[str, str],
+    size: Tuple[int, int],
+    fps: int,
+    encoder_str: str,
+    rtsp_url: str,
+) -> str:
+    """Build the multiview pipeline (tiles without a source are skipped)."""
+    width, height = size
+    pad_props = []
+    branches = []
+    for tile in tiles:
+        source_str = sources.get(tile.name)
+        if not source_str:
+            continue
+        i = len(branches)
+        branches.append(build_tile_branch(tile, source_str, fps, i))
+        pad_props.append(f"sink_{i}::xpos={tile.x} sink_{i}::ypos={tile.y}")
+    return (
+        f"compositor name=mv background=black {' '.join(pad_props)} ! "
+        f"video/x-raw,width={width},height={height},framerate={fps}/1 ! "
+        f"videoconvert ! video/x-raw,format=NV12 ! "
+        f"{encoder_str} ! video/x-h264,stream-format=byte-stream ! h264parse ! "
+        f"rtspclientsink location={rtsp_url} protocols=tcp latency=0 "
+        + " ".join(branches)
+    )
+
+
+class Multiview:
+    """Runs the multiview pipeline and keeps its tally borders current."""
+
+    def __init__(
+        self,
+        config: Any,  # AppConfig
+        ingest_manager: Optional[Any] = None,
+        resolution: str = "960x540",
+        fps: int = 15,
+        bitrate: int = 1500,
+        mediamtx_path: str = "multiview",
+    ):
+        self.config = config
+        self.ingest_manager = ingest_manager
+        width, height = resolution.split("x")
+        self.size = (int(width), int(height))
+        self.fps = fps
+        self.bitrate = bitrate
+        self.mediamtx_path = mediamtx_path
+        self.cameras = [cam_id for cam_id, cam in config.cameras.items() if cam.enabled]
+        self.tiles = multiview_layout(self.cameras, self.size)
+
+        self.pipeline = None
+        self._lock = threading.Lock()
+        self._tally: Dict[str, Optional[str]] = {}  # camera -> "program" / "preview" / None
+
+    @property
+    def program_frames_resolution(self) -> str:
+        return program_frames_resolution(self.cameras, self.size)
+
+    def _get_encoder(self, Gst) -> str:
+        if Gst.ElementFactory.find("mpph264enc"):
+            return (
+                f"mpph264enc qp-init=30 gop={self.fps * 2} profile=baseline "
+                f"rc-mode=cbr bps={self.bitrate * 1000}"
+            )
+        return (
+            f"x264enc tune=zerolatency speed-preset=ultrafast bitrate={self.bitrate} "
+            f"key-int-max={self.fps * 2} bframes=0"
+        )
+
+    def _get_sources(self) -> Dict[str, str]:
+        mixer_resolution = self.config.mixer.output_resolution
+        tile_resolution = self.program_frames_resolution
+        sources = {name: build_local_frame_source(name, tile_resolution) for name in PROGRAM_TILES}
+        for cam_id in self.cameras:
+            if self.ingest_manager and self.ingest_manager.has_local_frames(cam_id):
+                sources[cam_id] = build_local_frame_source(cam_id, mixer_resolution)
+            else:
+                logger.info(f"Multiview: no local frames for {cam_id}, decoding its RTSP stream")
+                sources[cam_id] = (
+                    f"rtspsrc location=rtsp://127.0.0.1:8554/{cam_id} latency=50 protocols=tcp ! decodebin"
+                )
+        return sources
+
+    def start(self) -> bool:
+        """Start the multiview pipeline and publish it to MediaMTX."""
+        with self._lock:
+            if self.pipeline:
+                return True
+            if not ensure_gst_initialized():
+                logger.error("Multiview: GStreamer not available")
+                return False
+            Gst = get_gst()
+            pipeline_str = build_multiview_pipeline_str(
+                self.tiles,
+                self._get_sources(),
+                self.size,
+                self.fps,
+                self._get_encoder(Gst),
+                f"rtsp://127.0.0.1:8554/{self.mediamtx_path}",
+            )
+            try:
+                pipeline = Gst.parse_launch(pipeline_str)
+            except Exception as e:
+                logger.error(f"Multiview: failed to parse pipeline: {e}")
+                return False
+            if pipeline.set_state(Gst.State.PLAYING) == Gst.StateChangeReturn.FAILURE:
+                logger.error("Multiview: failed to start pipeline")
+                pipeline.set_state(Gst.State.NULL)
+                return False
+            self.pipeline = pipeline
+            self._apply_tally()
+            logger.info(f"Multiview started: {self.size[0]}x{self.size[1]}@{self.fps} -> {self.mediamtx_path}")
+            return True
+
+    def stop(self) -> bool:
+        """Stop the multiview pipeline."""
+        with self._lock:
+            if not self.pipeline:
+                return True
+            self.pipeline.set_state(get_gst().State.NULL)
+            self.pipeline = None
+            logger.info("Multiview stopped")
+            return True
+
+    def set_tally(self, program: Iterable[str], preview: Iterable[str] = ()) -> None:
+        """Update camera tally borders (program wins over preview)."""
+        program, preview = set(program), set(preview)
+        with self._lock:
+            self._tally = {
+                cam_id: "program" if cam_id in program else "preview" if cam_id in preview else None
+                for cam_id in self.cameras
+            }
+            self._apply_tally()
+
+    def _apply_tally(self) -> None:
+        """Set videobox fills (must be called with lock)."""
+        if not self.pipeline:
+            return
+        states = dict(self._tally, program="program", preview="preview")
+        for name, state in states.items():
+            videobox = self.pipeline.get_by_name(f"tally_{name}")
+            if videobox:
+                videobox.set_property("fill", TALLY_FILLS[state])
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self.pipeline is not None,
+                "path": self.mediamtx_path,
+                "resolution": f"{self.size[0]}x{self.size[1]}",
+                "fps": self.fps,
+                "bitrate": self.bitrate,
+                "tally": {cam_id: state for cam_id, state in self._tally.items() if state},
+            }
@@ -2,7 +2,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class SceneSlot:
     w_rel: float  # 0.0-1.0
     h_rel: float  # 0.0-1.0
     # Optional fields with defaults (must come after required fields)
-    source_type: str = "camera"  # "camera", "file", "image"
+    source_type: str = "camera"  # "camera", "file", "image", "template" (pre-rendered HTML graphic)
     file_path: Optional[str] = None  # Path to uploaded file (for file/image sources)
     loop: bool = False  # Whether video file should loop
     duration: Optional[float] = None  # Display duration for images (seconds)
@@ -110,6 +110,82 @@ class Scene:
         }
 
 
+# Compositor pad properties a scene plan sets
+PAD_PROPS = ("xpos", "ypos", "width", "height", "zorder", "alpha")
+DEFAULT_PLAN_SIZE = (1920, 1080)
+
+
+@dataclass(frozen=True)
+class PadPlan:
+    """Absolute compositor pad properties for one slot."""
+    source: str
+    xpos: int
+    ypos: int
+    width: int
+    height: int
+    zorder: int
+    alpha: float
+    slot: SceneSlot = field(compare=False, repr=False)
+
+    def props(self) -> Dict[str, Any]:
+        return {prop: getattr(self, prop) for prop in PAD_PROPS}
+
+
+@dataclass(frozen=True)
+class ScenePlan:
+    """A scene compiled for one output resolution (source -> pad properties)."""
+    scene_id: str
+    output_size: Tuple[int, int]
+    pads: Dict[str, PadPlan]
+
+
+def compile_scene(scene: Scene, output_size: Tuple[int, int]) -> ScenePlan:
+    """Compile a scene's relative layout to absolute pad properties.
+    
+    Slots are placed relative to the output size, so a scene authored at
+    1920x1080 lands correctly on a 1280x720 mixer. When a scene lists the
+    same source twice, the last slot wins (one compositor pad per source).
+    """
+    width, height = output_size
+    pads = {}
+    for slot in scene.slots:
+        pads[slot.source] = PadPlan(
+            source=slot.source,
+            xpos=int(slot.x_rel * width),
+            ypos=int(slot.y_rel * height),
+            width=int(slot.w_rel * width),
+            height=int(slot.h_rel * height),
+            zorder=slot.z,
+            alpha=slot.alpha,
+            slot=slot,
+        )
+    return ScenePlan(scene_id=scene.id, output_size=(width, height), pads=pads)
+
+
+def diff_plan(plan: ScenePlan, live: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Get the pad properties that must change to go from live state to a plan.
+    
+    Args:
+        plan: Target scene plan
+        live: source -> last known pad properties (missing or partial
+            entries are treated as unknown and set in full)
+    
+    Returns:
+        source -> {property: value} for changed properties only. Live
+        sources that are not in the plan are hidden (alpha 0).
+    """
+    changes: Dict[str, Dict[str, Any]] = {}
+    for source, pad in plan.pads.items():
+        current = live.get(source, {})
+        changed = {prop: value for prop, value in pad.props().items() if current.get(prop) != value}
+        if changed:
+            changes[source] = changed
+    for source, current in live.items():
+        if source not in plan.pads and current.get("alpha") != 0.0:
+            changes[source] = {"alpha": 0.0}
+    return changes
+
+
 class SceneManager:
     """Manages scene definitions and loading."""
 
@@ -121,6 +197,9 @@ class SceneManager:
         """
         self.scenes_dir = Path(scenes_dir)
         self.scenes: Dict[str, Scene] = {}
+        # Compiled plans per (scene_id, output size); rebuilt on load/save
+        self._plan_sizes = {DEFAULT_PLAN_SIZE}
+        self._plans: Dict[Tuple[str, Tuple[int, int]], ScenePlan] = {}
         self._load_scenes()
 
     def _load_scenes(self) -> None:
@@ -143,6 +222,7 @@ class SceneManager:
                     data = json.load(f)
                     scene = Scene.from_dict(data)
                     self.scenes[scene.id] = scene
+                    self._compile(scene)
                     logger.info(f"Loaded scene: {scene.id} - {scene.label}")
             except Exception as e:
                 logger.error(f"Failed to load scene from {scene_file}: {e}")
@@ -218,6 +298,7 @@ class SceneManager:
         for scene_data in default_scenes:
             scene = Scene.from_dict(scene_data)
             self.scenes[scene.id] = scene
+            self._compile(scene)
             # Save to file
             scene_file = self.scenes_dir / f"{scene.id}.json"
             with open(scene_file, "w") as f:
@@ -244,6 +325,7 @@ class SceneManager:
         """Create or update a scene."""
         try:
             self.scenes[scene.id] = scene
+            self._compile(scene)
             scene_file = self.scenes_dir / f"{scene.id}.json"
             with open(scene_file, "w") as f:
                 json.dump(scene.to_dict(), f, indent=2)
@@ -263,9 +345,35 @@ class SceneManager:
             if scene_file.exists():
                 scene_file.unlink()
             del self.scenes[scene_id]
+            for size in self._plan_sizes:
+                self._plans.pop((scene_id, size), None)
             logger.info(f"Deleted scene: {scene_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to delete scene {scene_id}: {e}")
             return False
 
+    def _compile(self, scene: Scene) -> None:
+        for size in self._plan_sizes:
+            self._plans[(scene.id, size)] = compile_scene(scene, size)
+
+    def add_plan_resolution(self, output_size: Tuple[int, int]) -> None:
+        """Precompile every scene for an output resolution (e.g. the mixer's)."""
+        output_size = tuple(output_size)
+        if output_size in self._plan_sizes:
+            return
+        self._plan_sizes.add(output_size)
+        for scene in self.scenes.values():
+            self._plans[(scene.id, output_size)] = compile_scene(scene, output_size)
+
+    def get_plan(self, scene_id: str, output_size: Tuple[int, int]) -> Optional[ScenePlan]:
+        """Get the compiled plan of a scene for an output resolution."""
+        output_size = tuple(output_size)
+        plan = self._plans.get((scene_id, output_size))
+        if plan is None:
+            scene = self.scenes.get(scene_id)
+            if not scene:
+                return None
+            plan = compile_scene(scene, output_size)
+            self._plans[(scene_id, output_size)] = plan
+        return plan
@@ -0,0 +1,236 @@
+"""Clock-driven scene transitions for the mixer compositor.
+
+A transition is planned as keyframes per compositor pad property (xpos,
+ypos, width, height, alpha) at fractions of its duration, then bound to the
+pads as GstController interpolation control sources on the pipeline clock.
+The compositor syncs the values for every output frame in its streaming
+thread, so no Python runs while a transition is in flight and each step
+lands on an exact frame.
+
+Planning (plan_transition, frame_aligned_start) has no GStreamer dependency
+and is unit tested on its own; bind_keyframes does the GstController part.
+"""
+import logging
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRANSITION_TYPES = ("cut", "mix", "dip", "wipe", "slide", "zoom")
+TRANSITION_ALIASES = {"auto": "mix", "crossfade": "mix", "fade": "mix"}
+DEFAULT_DURATIONS_MS = {"cut": 0, "mix": 500, "dip": 1000, "wipe": 750, "slide": 750, "zoom": 600}
+DIP_COLOURS = ("black", "white")  # compositor background values
+
+ANIMATED_PROPS = ("xpos", "ypos", "width", "height", "alpha")
+EASE_STEPS = 8  # keyframes per eased move (linear interpolation between them)
+START_LEAD_FRAMES = 2  # frames between request and first animated frame
+
+Keyframes = List[Tuple[float, float]]  # (fraction of duration, value)
+
+
+@dataclass(frozen=True)
+class PadState:
+    """Geometry and opacity of one compositor pad."""
+    x: int
+    y: int
+    w: int
+    h: int
+    alpha: float
+
+    def value(self, prop: str) -> float:
+        return {
+            "xpos": self.x, "ypos": self.y, "width": self.w, "height": self.h, "alpha": self.alpha,
+        }[prop]
+
+
+def normalize_transition(kind: str) -> str:
+    """Resolve aliases ("auto" -> "mix") and validate a transition type.
+
+    Raises:
+        ValueError: If the transition type is unknown
+    """
+    kind = TRANSITION_ALIASES.get(kind, kind)
+    if kind not in TRANSITION_TYPES:
+        raise ValueError(f"Unknown transition type: {kind} (expected one of {', '.join(TRANSITION_TYPES)})")
+    return kind
+
+
+def duration_frames(duration_ms: int, fps: float) -> int:
+    """Transition length in whole output frames (at least one)."""
+    return max(1, int(round(duration_ms / 1000.0 * fps)))
+
+
+def frame_aligned_start(position_ns: int, frame_ns: int, lead_frames: int = START_LEAD_FRAMES) -> int:
+    """First frame boundary at least lead_frames after the current position."""
+    next_frame = -(-position_ns // frame_ns) * frame_ns
+    return next_frame + lead_frames * frame_ns
+
+
+def _smoothstep(t: float) -> float:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _ramp(start: float, end: float, eased: bool) -> Keyframes:
+    if start == end or not eased:
+        return [(0.0, start), (1.0, end)]
+    points = []
+    for step in range(EASE_STEPS + 1):
+        t = step / EASE_STEPS
+        points.append((t, start + (end - start) * _smoothstep(t)))
+    return points
+
+
+def _hold_then(start: float, end: float, at: float) -> Keyframes:
+    """Hold start until fraction `at`, then ramp linearly to end."""
+    return [(0.0, start), (at, start), (1.0, end)]
+
+
+def _ramp_until(start: float, end: float, at: float) -> Keyframes:
+    """Ramp linearly to end by fraction `at`, then hold."""
+    return [(0.0, start), (at, end), (1.0, end)]
+
+
+def _hold(state: PadState) -> Dict[str, Keyframes]:
+    return {prop: [(0.0, state.value(prop)), (1.0, state.value(prop))] for prop in ANIMATED_PROPS}
+
+
+def _move(before: PadState, after: PadState, eased: bool) -> Dict[str, Keyframes]:
+    return {prop: _ramp(before.value(prop), after.value(prop), eased) for prop in ANIMATED_PROPS}
+
+
+def plan_transition(
+    kind: str,
+    outgoing: Dict[str, PadState],
+    incoming: Dict[str, PadState],
+    output_size: Tuple[int, int],
+) -> Dict[str, Dict[str, Keyframes]]:
+    """Plan keyframes for every pad taking part in a transition.
+
+    Args:
+        kind: Transition type (see TRANSITION_TYPES)
+        outgoing: Current state of every attached source (alpha 0 = hidden)
+        incoming: Target state of every attached source (alpha 0 = hidden)
+        output_size: Compositor output (width, height)
+
+    Returns:
+        source -> pad property -> keyframes. The value at fraction 0 always
+        matches the outgoing picture and the value at 1 the target scene, so
+        the pads can be set to the fraction-0 values before the transition
+        starts and to the target scene after it ends without a visible jump
+        (sources leaving the scene end hidden or off-screen).
+
+    Notes:
+        - mix: sources in both scenes move and fade to their new layout,
+          others fade in/out
+        - dip: outgoing fades to the compositor background in the first
+          half, incoming fades in during the second half
+        - wipe: incoming scene covers the outgoing one from the left with a
+          hard edge (compositor pads cannot crop, so this is a cover wipe)
+        - slide: incoming pushes the outgoing scene out to the left
+        - zoom: incoming grows from the centre of its slot while fading in
+    """
+    kind = normalize_transition(kind)
+    out_w, _ = output_size
+    plan: Dict[str, Dict[str, Keyframes]] = {}
+
+    for source in set(outgoing) | set(incoming):
+        before = outgoing.get(source)
+        after = incoming.get(source)
+        if before is None:
+            before = replace(after, alpha=0.0)
+        if after is None:
+            after = replace(before, alpha=0.0)
+        visible_before = before.alpha > 0.0
+        visible_after = after.alpha > 0.0
+
+        if not visible_before and not visible_after:
+            continue
+
+        if kind == "cut":
+            plan[source] = _hold(after)
+            continue
+
+        if kind == "mix" or (visible_before and visible_after and kind in ("wipe", "zoom")):
+            # Shared sources move to their new slot; the rest cross-fade
+            start = before if visible_before else replace(after, alpha=0.0)
+            end = after if visible_after else replace(before, alpha=0.0)
+            plan[source] = _move(start, end, eased=visible_before and visible_after)
+            continue
+
+        if kind == "dip":
+            # Keep the old geometry while fading out
+            props = _hold(before if visible_before else after)
+            if visible_before:
+                props["alpha"] = _ramp_until(before.alpha, 0.0, 0.5)
+            if visible_after:
+                if visible_before:
+                    for prop in ("xpos", "ypos", "width", "height"):
+                        props[prop] = [(0.0, before.value(prop)), (0.5, before.value(prop)),
+                                       (0.5, after.value(prop)), (1.0, after.value(prop))]
+                props["alpha"] = (
+                    [(0.0, before.alpha), (0.5, 0.0), (1.0, after.alpha)]
+                    if visible_before else _hold_then(0.0, after.alpha, 0.5)
+                )
+            plan[source] = props
+            continue
+
+        if kind == "slide":
+            if visible_before and visible_after:
+                plan[source] = _move(before, after, eased=True)
+            elif visible_before:
+                plan[source] = _move(before, replace(before, x=before.x - out_w), eased=True)
+            else:
+                plan[source] = _move(replace(after, x=after.x + out_w), after, eased=True)
+            continue
+
+        if kind == "wipe":
+            if visible_after:
+                plan[source] = _move(replace(after, x=after.x - out_w), after, eased=True)
+            else:
+                # Outgoing stays put under the incoming scene, hidden on the last frame
+                plan[source] = _hold(before)
+                plan[source]["alpha"] = _hold_then(before.alpha, 0.0, 1.0)
+            continue
+
+        if kind == "zoom":
+            if visible_after:
+                seed = replace(after, x=after.x + after.w // 2, y=after.y + after.h // 2, w=1, h=1, alpha=0.0)
+                plan[source] = _move(seed, after, eased=True)
+            else:
+                plan[source] = _hold(before)
+                plan[source]["alpha"] = _ramp(before.alpha, 0.0, eased=False)
+            continue
+
+    return plan
+
+
+def value_at(keyframes: Keyframes, fraction: float) -> float:
+    """Linear interpolation of keyframes (same as GST_INTERPOLATION_MODE_LINEAR)."""
+    if fraction <= keyframes[0][0]:
+        return keyframes[0][1]
+    for (t0, v0), (t1, v1) in zip(keyframes, keyframes[1:]):
+        if fraction <= t1:
+            if t1 == t0:
+                return v1
+            return v0 + (v1 - v0) * (fraction - t0) / (t1 - t0)
+    return keyframes[-1][1]
+
+
+def bind_keyframes(GstController, pad, prop: str, keyframes: Keyframes, start_ns: int, duration_ns: int):
+    """Bind keyframes to a pad property on the pipeline clock.
+
+    Returns:
+        The control binding (remove it with pad.remove_control_binding)
+    """
+    source = GstController.InterpolationControlSource()
+    source.set_property("mode", GstController.InterpolationMode.LINEAR)
+    last_time: Optional[int] = None
+    for fraction, value in keyframes:
+        timestamp = start_ns + int(round(fraction * duration_ns))
+        if timestamp == last_time:
+            timestamp += 1  # Control points need distinct times (hard steps)
+        source.set(timestamp, float(value))
+        last_time = timestamp
+    binding = GstController.DirectControlBinding.new_absolute(pad, prop, source)
+    pad.add_control_binding(binding)
+    return binding
@@ -5,8 +5,14 @@ import time
 from typing import Optional, Callable
 from enum import Enum
 
+from ..metrics import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
+_registry = get_metrics_registry()
+_HEALTH = _registry.gauge("r58_mixer_health", "Mixer health (1 for the current state)", ["state"])
+_ERRORS = _registry.counter("r58_mixer_errors", "Errors reported by the mixer pipeline")
+
 
 class HealthStatus(Enum):
     """Pipeline health status."""
@@ -16,6 +22,11 @@ class HealthStatus(Enum):
     FAILED = "failed"
 
 
+def _export_health(status: HealthStatus) -> None:
+    for state in HealthStatus:
+        _HEALTH.labels(state.value).set(1 if state is status else 0)
+
+
 class MixerWatchdog:
     """Monitors mixer pipeline health and triggers recovery."""
 
@@ -68,15 +79,18 @@ class MixerWatchdog:
                 logger.info("Pipeline recovered - buffers flowing again")
                 self._health_status = HealthStatus.HEALTHY
                 self._last_error = None
+                _export_health(self._health_status)
 
     def record_error(self, error: str) -> None:
         """Record an error from the pipeline."""
+        _ERRORS.inc()
         with self._lock:
             self._last_error = error
             if self._health_status == HealthStatus.HEALTHY:
                 self._health_status = HealthStatus.DEGRADED
             elif self._health_status == HealthStatus.DEGRADED:
                 self._health_status = HealthStatus.UNHEALTHY
+            _export_health(self._health_status)
 
     def check_health(self, pipeline_state: str, expected_state: str = "PLAYING") -> HealthStatus:
         """Check pipeline health based on state and buffer activity.
@@ -109,6 +123,7 @@ class MixerWatchdog:
                         self._health_status = HealthStatus.UNHEALTHY
                         logger.error(f"No buffers for {time_since_buffer:.1f}s - pipeline may be hung")
             
+            _export_health(self._health_status)
             return self._health_status
 
     def get_status(self) -> dict:
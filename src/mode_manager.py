@@ -20,7 +20,7 @@ import asyncio
 import logging
 import json
 import subprocess
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -57,7 +57,9 @@ class ModeManager:
     MODES = ["recorder", "mixer"]
     STATE_FILE = Path("/tmp/r58_mode_state.json")
     
-    def __init__(self, ingest_manager=None, recorder=None, mixer_core=None, config=None):
+    def __init__(self, ingest_manager=None, recorder=None, mixer_core=None, config=None,
+                 mixer_core_factory: Optional[Callable[[], Any]] = None,
+                 mixer_core_peek: Optional[Callable[[], Any]] = None):
         """Initialize mode manager.
         
         Args:
@@ -65,10 +67,16 @@ class ModeManager:
             recorder: Reference to Recorder instance (for stopping recordings)
             mixer_core: Reference to MixerCore instance (for starting/stopping mixer)
             config: Application configuration object
+            mixer_core_factory: Creates the MixerCore on first use (instead of
+                mixer_core); only called when switching to mixer mode
+            mixer_core_peek: Returns the MixerCore only if it already exists
+                (status checks never construct the mixer)
         """
         self.ingest_manager = ingest_manager
         self.recorder = recorder
-        self.mixer_core = mixer_core
+        self._mixer_core = mixer_core
+        self._mixer_core_factory = mixer_core_factory
+        self._mixer_core_peek = mixer_core_peek
         self.config = config
         self._current_mode: str = "recorder"
         self._load_state()
@@ -99,6 +107,20 @@ class ModeManager:
         except Exception as e:
             logger.error(f"Failed to save mode state: {e}")
     
+    @property
+    def mixer_core(self):
+        """The MixerCore if it has been created (never constructs it)."""
+        if self._mixer_core is None and self._mixer_core_peek:
+            self._mixer_core = self._mixer_core_peek()
+        return self._mixer_core
+    
+    async def _ensure_mixer_core(self):
+        """Get the MixerCore, creating it off the event loop on first use."""
+        if self.mixer_core is None and self._mixer_core_factory:
+            # First construction imports GStreamer and loads scenes
+            self._mixer_core = await asyncio.to_thread(self._mixer_core_factory)
+        return self._mixer_core
+    
     async def get_current_mode(self) -> str:
         """Get the current active mode."""
         return self._current_mode
@@ -256,6 +278,10 @@ class ModeManager:
         
         logger.info("Switching to mixer mode...")
         
+        # Create the mixer now (not when the mode manager is first used)
+        if not await self._ensure_mixer_core():
+            logger.warning("Mixer not available, switching mode anyway")
+        
         # Stop all individual recordings
         if self.recorder:
             try:
@@ -50,6 +50,55 @@ def connect_fps_monitor(pipeline, cam_id: str) -> bool:
         logger.warning(f"Could not connect FPS monitor for {cam_id}: {e}")
         return False
 
+# Local raw-frame path: ingest publishes decoded frames at mixer resolution
+# over intervideosink, the mixer reads them with intervideosrc (same process),
+# skipping encode -> RTSP -> decode for compositing.
+LOCAL_FRAME_FORMAT = "NV12"
+LOCAL_FRAME_FRAMERATE = 30
+LOCAL_FRAME_TIMEOUT_NS = 1_000_000_000  # intervideosrc shows black after 1s without frames
+
+
+def get_local_frame_channel(cam_id: str) -> str:
+    """Get the intervideo channel name for a camera (or the mixer's "program")."""
+    return f"r58_{cam_id}"
+
+
+def local_frames_supported() -> bool:
+    """Check if intervideosink/intervideosrc (gst-plugins-bad) are installed."""
+    Gst = get_gst()
+    if not Gst:
+        return False
+    return bool(Gst.ElementFactory.find("intervideosink") and Gst.ElementFactory.find("intervideosrc"))
+
+
+def get_local_frame_branch(cam_id: str, resolution: str) -> str:
+    """Get tee branch that publishes raw frames for the mixer (or multiview).
+    
+    videorate/videoscale/videoconvert are passthrough when the producer
+    already runs at the target rate and resolution in NV12. The leaky
+    single-buffer queue keeps a slow or absent consumer from ever stalling
+    the encoder branch.
+    """
+    width, height = resolution.split("x")
+    return (
+        f"queue max-size-buffers=1 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
+        f"videorate ! videoscale ! videoconvert ! "
+        f"video/x-raw,format={LOCAL_FRAME_FORMAT},width={width},height={height},"
+        f"framerate={LOCAL_FRAME_FRAMERATE}/1 ! "
+        f"intervideosink channel={get_local_frame_channel(cam_id)} sync=false"
+    )
+
+
+def build_local_frame_source(cam_id: str, resolution: str) -> str:
+    """Get mixer source string that reads raw frames published by ingest."""
+    width, height = resolution.split("x")
+    return (
+        f"intervideosrc channel={get_local_frame_channel(cam_id)} timeout={LOCAL_FRAME_TIMEOUT_NS} ! "
+        f"video/x-raw,format={LOCAL_FRAME_FORMAT},width={width},height={height},"
+        f"framerate={LOCAL_FRAME_FRAMERATE}/1"
+    )
+
+
 # Note: Previously used RTP_PORT_MAP for raw UDP streaming
 # Now using rtspclientsink which handles RTSP publishing automatically
 
@@ -342,25 +391,32 @@ def build_ingest_pipeline(
     bitrate: int = 8000,
     codec: str = "h264",
     mediamtx_path: Optional[str] = None,
+    local_frames_resolution: Optional[str] = None,
 ):
     """Build always-on ingest pipeline (streaming only, no recording).
     
     This pipeline captures from device and streams to MediaMTX.
-    All consumers (preview, recording, mixer) subscribe to the MediaMTX stream.
+    Preview and recording subscribe to the MediaMTX stream. When
+    local_frames_resolution is set, raw frames are also published on an
+    intervideo channel for the mixer (see get_local_frame_branch).
     """
     if platform == "macos":
         # Mock ingest pipeline for development
         width, height = resolution.split("x")
         fps_element = get_fps_identity_element(cam_id)
+        local_tee = "tee name=ingest_tee ! " if local_frames_resolution else ""
         pipeline_str = (
             f"videotestsrc pattern=ball is-live=true ! "
             f"video/x-raw,width={width},height={height},framerate=30/1 ! "
             f"{fps_element}"  # FPS monitoring
+            f"{local_tee}"
             f"x264enc bitrate={bitrate} speed-preset=ultrafast tune=zerolatency ! "
             f"video/x-h264,profile=baseline ! "
             f"flvmux streamable=true ! "
             f"rtmpsink location={mediamtx_path or f'rtmp://127.0.0.1:1935/{cam_id}'}"
         )
+        if local_frames_resolution:
+            pipeline_str += f" ingest_tee. ! {get_local_frame_branch(cam_id, local_frames_resolution)}"
         Gst = get_gst()
         pipeline = Gst.parse_launch(pipeline_str)
         connect_fps_monitor(pipeline, cam_id)
@@ -373,6 +429,7 @@ def build_ingest_pipeline(
             bitrate=bitrate,
             codec=codec,
             mediamtx_path=mediamtx_path,
+            local_frames_resolution=local_frames_resolution,
         )
 
 
@@ -383,8 +440,9 @@ def build_r58_ingest_pipeline(
     bitrate: int = 8000,
     codec: str = "h264",
     mediamtx_path: Optional[str] = None,
+    local_frames_resolution: Optional[str] = None,
 ):
-    """Build always-on ingest pipeline for R58 (streaming to MediaMTX only)."""
+    """Build always-on ingest pipeline for R58 (streaming to MediaMTX, optional local raw frames)."""
     width, height = resolution.split("x")
 
     # Video source - reuse device detection logic
@@ -500,9 +558,12 @@ def build_r58_ingest_pipeline(
     # config-interval=-1 ensures SPS/PPS sent with every keyframe
     # TCP transport prevents packet loss that causes DTS errors
     # FPS monitor identity element placed after videorate for accurate output fps
+    # Local raw-frame branch for the mixer splits off before the encoder
+    local_tee = "tee name=ingest_tee ! " if local_frames_resolution else ""
     pipeline_str = (
         f"{source_str} ! "
         f"{fps_element}"  # FPS monitoring after source/videorate
+        f"{local_tee}"
         f"queue max-size-buffers=5 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
         f"{encoder_str} ! "
         f"{caps_str} ! "
@@ -510,6 +571,8 @@ def build_r58_ingest_pipeline(
         f"{parse_str} config-interval=-1 ! "
         f"rtspclientsink location=rtsp://127.0.0.1:8554/{cam_id} protocols=tcp latency=0"
     )
+    if local_frames_resolution:
+        pipeline_str += f" ingest_tee. ! {get_local_frame_branch(cam_id, local_frames_resolution)}"
 
     logger.info(f"Building ingest pipeline for {cam_id}: {pipeline_str}")
     Gst = get_gst()
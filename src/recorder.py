@@ -16,9 +16,21 @@ from .config import AppConfig, CameraConfig
 from .pipelines import build_recording_subscriber_pipeline
 from .gst_utils import ensure_gst_initialized, get_gst, get_glib
 from .webhooks import WebhookManager
+from .metrics import get_metrics_registry, instrument_pipeline
 
 logger = logging.getLogger(__name__)
 
+_registry = get_metrics_registry()
+_BYTES_WRITTEN = _registry.counter(
+    "r58_recording_bytes_written", "Bytes written to recording files", ["camera"]
+)
+_FILE_BYTES = _registry.gauge(
+    "r58_recording_file_bytes", "Size of the current recording file", ["camera"]
+)
+_IPC_LATENCY = _registry.histogram(
+    "r58_ipc_duration_seconds", "Latency of calls to local services", ["target"]
+)
+
 
 class Recorder:
     """Manages recording pipelines for multiple cameras.
@@ -86,10 +98,11 @@ class Recorder:
         """Check if MediaMTX is responding."""
         try:
             # Check WebRTC endpoint (MediaMTX health indicator)
-            response = httpx.get(
-                f"http://localhost:8889/",
-                timeout=2.0
-            )
+            with _IPC_LATENCY.labels("mediamtx_webrtc").time():
+                response = httpx.get(
+                    f"http://localhost:8889/",
+                    timeout=2.0
+                )
             return response.status_code < 500
         except Exception:
             logger.error("MediaMTX not responding")
@@ -124,6 +137,10 @@ class Recorder:
                     current_size = os.path.getsize(file_path)
                     last_size = last_sizes.get(cam_id, 0)
                     
+                    _FILE_BYTES.labels(cam_id).set(current_size)
+                    if current_size > last_size:
+                        _BYTES_WRITTEN.labels(cam_id).inc(current_size - last_size)
+                    
                     if current_size == last_size and last_size > 0:
                         # File not growing
                         stall_counts[cam_id] = stall_counts.get(cam_id, 0) + 1
@@ -308,6 +325,8 @@ class Recorder:
             bus.add_signal_watch()
             bus.connect("message", self._on_bus_message, cam_id)
 
+            instrument_pipeline(pipeline, f"recorder_{cam_id}")
+
             # Start pipeline
             Gst = get_gst()
             pipeline.set_state(Gst.State.PLAYING)
@@ -0,0 +1,266 @@
+"""Shared WPE renderer for Reveal.js outputs showing the same page.
+
+Outputs that show the same presentation at the same slide (the same URL,
+including the slide hash) share one wpesrc instead of running a browser
+each:
+
+    wpesrc ! [identity name=damage] ! tee name=render_tee
+        render_tee. ! queue ! videoconvert ! videoscale ! NV12 WxH ! encoder ! parse ! tee
+            tee. ! queue ! rtspclientsink (output 1)
+            tee. ! queue ! rtspclientsink (output 2, same size: same encoder)
+        render_tee. ! ... (another output size: its own scaler and encoder)
+
+Branches are added to and removed from the running pipeline (tee request
+pads, IDLE probes for removal, like mixer source branches), so an output
+joining or leaving, e.g. when navigation makes the outputs diverge, does
+not interrupt the other outputs of the renderer.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .damage import KEYFRAME_INTERVAL, DamageGate
+    from .gst_utils import get_gst
+    from .pipelines import get_h265_encoder
+except ImportError:
+    # Fallback for direct execution
+    from damage import KEYFRAME_INTERVAL, DamageGate
+    from gst_utils import get_gst
+    from pipelines import get_h265_encoder
+
+logger = logging.getLogger(__name__)
+
+QUEUE = "queue max-size-buffers=5 max-size-time=0 max-size-bytes=0 leaky=downstream"
+
+
+def build_encoder(bitrate: int, framerate: int, variable_framerate: bool) -> Tuple[str, str, str]:
+    """H.265 encoder for rendered content (encoder_str, caps_str, parse_str).
+
+    VBR lets static and low-motion pages drop to a few kbit of skipped blocks.
+    With variable framerate, frames only arrive on change (see DamageGate):
+    the GOP in frames would span minutes of static content, so it is made
+    long and keyframes are forced by the gate instead.
+    """
+    encoder_str, caps_str, parse_str = get_h265_encoder(bitrate)
+    encoder_str += " rc-mode=vbr"
+    if variable_framerate:
+        encoder_str += f" gop={framerate * KEYFRAME_INTERVAL * 5:.0f}"
+    return encoder_str, caps_str, parse_str
+
+
+def build_render_source(url: str, resolution: str, framerate: int, variable_framerate: bool) -> str:
+    """wpesrc rendering a page into render_tee (identity "damage" is where DamageGate drops frames)."""
+    width, height = resolution.split("x")
+    damage_str = "identity name=damage ! " if variable_framerate else ""
+    # draw-background=false makes background transparent (useful for overlays)
+    return (
+        f"wpesrc location=\"{url}\" draw-background=false ! "
+        f"video/x-raw,width={width},height={height},framerate={framerate}/1 ! "
+        f"{damage_str}"
+        f"tee name=render_tee allow-not-linked=true"
+    )
+
+
+def build_encode_branch(resolution: str, encoder: Tuple[str, str, str]) -> str:
+    """Scale and encode rendered frames at an output size."""
+    width, height = resolution.split("x")
+    encoder_str, caps_str, parse_str = encoder
+    return (
+        f"{QUEUE} ! videoconvert ! videoscale ! "
+        f"video/x-raw,format=NV12,width={width},height={height} ! "
+        f"{QUEUE} ! {encoder_str} ! {caps_str} ! {QUEUE} ! {parse_str}"
+    )
+
+
+def build_output_sink(mediamtx_path: str) -> str:
+    return f"{QUEUE} ! rtspclientsink location=rtsp://127.0.0.1:8554/{mediamtx_path} protocols=udp latency=0"
+
+
+@dataclass
+class _EncodeBranch:
+    """Scaler/encoder of one output size and the tee feeding its outputs."""
+    resolution: str
+    bin: Any
+    tee: Any
+    render_pad: Any  # render_tee request pad
+    sinks: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)  # output_id -> (sink bin, tee pad)
+
+
+class SharedRenderer:
+    """One wpesrc rendering a URL for every output showing it."""
+
+    def __init__(
+        self,
+        url: str,
+        resolution: str,
+        framerate: int,
+        bitrate: int,
+        variable_framerate: bool = True,
+        on_message: Optional[Callable[["SharedRenderer", Any], None]] = None,
+    ):
+        self.url = url
+        self.resolution = resolution
+        self.framerate = framerate
+        self.variable_framerate = variable_framerate
+        self.encoder = build_encoder(bitrate, framerate, variable_framerate)
+        self.on_message = on_message
+        self.pipeline = None
+        self.gate: Optional[DamageGate] = None
+        self._tee = None
+        self._branches: Dict[str, _EncodeBranch] = {}  # resolution -> branch
+        self._outputs: Dict[str, str] = {}  # output_id -> resolution
+
+    @property
+    def output_ids(self) -> List[str]:
+        return list(self._outputs)
+
+    def start(self, output_id: str, mediamtx_path: str, resolution: str) -> bool:
+        """Build the renderer with its first output and start it."""
+        Gst = get_gst()
+        pipeline_str = build_render_source(self.url, self.resolution, self.framerate, self.variable_framerate)
+        logger.info(f"Building shared WPE renderer for {self.url}: {pipeline_str}")
+        self.pipeline = Gst.parse_launch(pipeline_str)
+        self._tee = self.pipeline.get_by_name("render_tee")
+        if self.variable_framerate:
+            self.gate = DamageGate()
+            self.gate.attach(self.pipeline.get_by_name("damage"))
+
+        bus = self.pipeline.get_bus()
+        bus.add_signal_watch()
+        bus.connect("message", lambda bus, msg: self.on_message and self.on_message(self, msg))
+
+        if not self.add_output(output_id, mediamtx_path, resolution):
+            self.stop()
+            return False
+
+        if self.pipeline.set_state(Gst.State.PLAYING) == Gst.StateChangeReturn.FAILURE:
+            logger.error(f"Failed to start shared WPE renderer for {self.url}")
+            self.stop()
+            return False
+        # Wait for pipeline to reach PLAYING state
+        time.sleep(0.5)
+        state_ret, _, _ = self.pipeline.get_state(Gst.SECOND)
+        if state_ret == Gst.StateChangeReturn.FAILURE:
+            logger.error(f"Shared WPE renderer for {self.url} failed to reach PLAYING state")
+            self.stop()
+            return False
+        return True
+
+    def add_output(self, output_id: str, mediamtx_path: str, resolution: str) -> bool:
+        """Stream the rendered page to an output (reusing the encoder of an output of the same size)."""
+        Gst = get_gst()
+        try:
+            branch = self._branches.get(resolution)
+            if branch is None:
+                branch = self._add_encode_branch(resolution)
+            sink_bin = Gst.parse_bin_from_description(build_output_sink(mediamtx_path), True)
+            sink_bin.set_name(f"output_{output_id}")
+            tee_pad = self._link_branch(branch.tee, sink_bin)
+        except Exception as e:
+            logger.error(f"Failed to add output '{output_id}' to shared WPE renderer: {e}")
+            return False
+        branch.sinks[output_id] = (sink_bin, tee_pad)
+        self._outputs[output_id] = resolution
+        if self.gate:
+            self.gate.request_keyframe()  # A new subscriber starts with a keyframe
+        logger.info(
+            f"Output '{output_id}' on shared WPE renderer for {self.url} "
+            f"({len(self._outputs)} outputs, {len(self._branches)} encoders)"
+        )
+        return True
+
+    def _add_encode_branch(self, resolution: str) -> _EncodeBranch:
+        Gst = get_gst()
+        encode_bin = Gst.parse_bin_from_description(build_encode_branch(resolution, self.encoder), True)
+        encode_bin.set_name(f"encode_{resolution}")
+        tee = Gst.ElementFactory.make("tee", f"encode_tee_{resolution}")
+        tee.set_property("allow-not-linked", True)
+        self.pipeline.add(tee)
+        if not encode_bin.get_static_pad("src") or encode_bin.get_static_pad("src").link(
+                tee.get_static_pad("sink")) != Gst.PadLinkReturn.OK:
+            self.pipeline.remove(tee)
+            raise RuntimeError(f"Cannot link encoder for {resolution}")
+        tee.sync_state_with_parent()
+        render_pad = self._link_branch(self._tee, encode_bin)
+        branch = _EncodeBranch(resolution, encode_bin, tee, render_pad)
+        self._branches[resolution] = branch
+        return branch
+
+    def _link_branch(self, tee, branch_bin) -> Any:
+        """Add a bin to the pipeline fed by a new tee pad (returns the tee pad)."""
+        Gst = get_gst()
+        self.pipeline.add(branch_bin)
+        tee_pad = tee.request_pad(tee.get_pad_template("src_%u"), None, None)
+        if tee_pad.link(branch_bin.get_static_pad("sink")) != Gst.PadLinkReturn.OK:
+            tee.release_request_pad(tee_pad)
+            self.pipeline.remove(branch_bin)
+            raise RuntimeError(f"Cannot link {branch_bin.get_name()}")
+        branch_bin.sync_state_with_parent()
+        return tee_pad
+
+    def remove_output(self, output_id: str) -> bool:
+        """Stop streaming to an output.
+
+        Returns:
+            True if the renderer has no outputs left (stop it)
+        """
+        resolution = self._outputs.pop(output_id, None)
+        branch = self._branches.get(resolution) if resolution else None
+        if branch and output_id in branch.sinks:
+            sink_bin, tee_pad = branch.sinks.pop(output_id)
+            if branch.sinks:
+                self._unlink_branch(branch.tee, tee_pad, [sink_bin])
+            elif self._outputs:
+                # Last output of this size: drop its encoder too
+                del self._branches[resolution]
+                self._unlink_branch(self._tee, branch.render_pad, [branch.bin, branch.tee, sink_bin])
+        return not self._outputs
+
+    def _unlink_branch(self, tee, tee_pad, elements: List[Any]) -> None:
+        """Unlink a tee pad once idle, then shut down and remove the elements behind it."""
+        Gst = get_gst()
+        pipeline = self.pipeline
+
+        def finish():
+            for element in elements:
+                element.set_state(Gst.State.NULL)
+                pipeline.remove(element)
+            tee.release_request_pad(tee_pad)
+
+        def on_idle(pad, info):
+            peer = pad.get_peer()
+            if peer:
+                pad.unlink(peer)
+            threading.Thread(target=finish, daemon=True).start()
+            return Gst.PadProbeReturn.REMOVE
+
+        tee_pad.add_probe(Gst.PadProbeType.IDLE, on_idle)
+
+    def stop(self) -> None:
+        """Stop the renderer in a background thread."""
+        pipeline, self.pipeline = self.pipeline, None
+        self._branches = {}
+        self._outputs = {}
+        self.gate = None
+        if not pipeline:
+            return
+
+        def stop_pipeline():
+            try:
+                pipeline.set_state(get_gst().State.NULL)
+            except Exception as e:
+                logger.warning(f"Shared WPE renderer stop error: {e}")
+
+        threading.Thread(target=stop_pipeline, daemon=True).start()
+        logger.info(f"Stopped shared WPE renderer for {self.url}")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "outputs": dict(self._outputs),
+            "encoders": sorted(self._branches),
+            "frames": self.gate.get_status() if self.gate else None,
+        }
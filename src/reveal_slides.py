@@ -0,0 +1,422 @@
+"""Pre-rendered slide stills for Reveal.js outputs.
+
+A live Reveal.js output runs a browser (wpesrc) and an H.265 encoder at the
+full framerate although slides only change on navigation. With slide
+pre-rendering, each step of a presentation is rendered once, right after
+the output starts, and the output is served from a still image instead:
+
+- The presentation HTML is fetched and split into steps: horizontal and
+  vertical slides, and one step per fragment (Reveal.js URL hashes
+  #/h/v/f address every step directly).
+- Decks whose slides only exist at runtime (data-markdown/data-external
+  sections, or slides built by page scripts, like static/graphics.html)
+  cannot be split from the HTML and always run live.
+- Steps with video, iframes, canvases, GIFs, CSS or auto-animations are
+  marked dynamic and always run live.
+- Static steps are rendered in a background thread, one at a time, by a
+  low-priority gst-launch-1.0 wpesrc subprocess that lets the page settle
+  and keeps its last frame as a raw NV12 file at the output size. Files
+  are cached under a key hashing the URL, the HTML and the size, so a
+  restarted presentation is not rendered again.
+- StillFeeder pushes the current still into an appsrc when it changes and
+  as a keep-alive (see damage.py), so the encoder sees about one frame per
+  second and the browser does not run at all.
+
+Usage:
+    cache = SlideCache("/tmp/reveal_slides", "1920x1080")
+    deck = cache.prepare("http://localhost:8000/graphics?presentation=demo")
+    cache.render(deck)
+    frame = deck.frame(0)  # NV12 bytes once rendered, else None
+"""
+import hashlib
+import json
+import logging
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+try:
+    from .damage import DamageGate, force_key_unit_event
+except ImportError:
+    # Fallback for direct execution
+    from damage import DamageGate, force_key_unit_event
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "slides.json"
+STILL_FRAMERATE = 2  # Nominal still framerate (frames are pushed on change and as keep-alive)
+RENDER_FRAMERATE = 5  # Render subprocess framerate (only the last frame is kept)
+SETTLE_SECONDS = 3.0  # Page load and layout time before the kept frame
+RENDER_TIMEOUT = 30.0  # seconds per step
+FETCH_TIMEOUT = 5.0  # seconds
+
+NAVIGATION_DIRECTIONS = ("next", "prev", "first", "last")
+
+_DYNAMIC = re.compile(
+    r"<(video|iframe|canvas)\b"
+    r"|data-(autoplay|auto-animate|background-video|background-iframe)\b"
+    r"|\.gif\b"
+    r"|\banimation\s*:",
+    re.IGNORECASE,
+)
+# Slides that Reveal.js plugins or page scripts create after load
+_RUNTIME_SLIDES = re.compile(
+    r"<section\b[^>]*\bdata-(markdown|external)\b"
+    r"|createElement\(\s*['\"]section['\"]"
+    r"|Reveal\.sync\s*\("
+    r"|querySelector\(\s*['\"][^'\"]*\.slides['\"]\s*\)\s*\.(innerHTML|append)",
+    re.IGNORECASE,
+)
+_FRAGMENT = re.compile(r"""class\s*=\s*["'][^"']*\bfragment\b""", re.IGNORECASE)
+_FRAGMENT_INDEX = re.compile(r"""data-fragment-index\s*=\s*["']?(\d+)""", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class SlideStep:
+    """One navigation step: a slide, or a slide with its fragments shown up to `fragment`."""
+    h: int
+    v: int
+    fragment: int  # -1 before the first fragment
+    dynamic: bool
+
+    @property
+    def hash(self) -> str:
+        """Reveal.js URL hash of the step."""
+        if self.fragment >= 0:
+            return f"#/{self.h}/{self.v}/{self.fragment}"
+        return f"#/{self.h}/{self.v}"
+
+
+class _Section:
+    __slots__ = ("children", "content")
+
+    def __init__(self):
+        self.children: List["_Section"] = []
+        self.content: List[str] = []
+
+
+class _SlideParser(HTMLParser):
+    """Collects the <section> tree of a Reveal.js page with each section's raw content."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.roots: List[_Section] = []
+        self._open: List[_Section] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "section":
+            section = _Section()
+            (self._open[-1].children if self._open else self.roots).append(section)
+            self._open.append(section)
+        elif self._open:
+            self._open[-1].content.append(self.get_starttag_text() or "")
+
+    def handle_startendtag(self, tag, attrs):
+        if self._open:
+            self._open[-1].content.append(self.get_starttag_text() or "")
+
+    def handle_endtag(self, tag):
+        if tag == "section" and self._open:
+            self._open.pop()
+
+    def handle_data(self, data):
+        if self._open:
+            self._open[-1].content.append(data)
+
+
+def _count_fragments(content: str) -> int:
+    fragments = len(_FRAGMENT.findall(content))
+    indices = _FRAGMENT_INDEX.findall(content)
+    # Fragments sharing a data-fragment-index appear together
+    return len(set(indices)) + max(0, fragments - len(indices))
+
+
+def builds_slides_at_runtime(html: str) -> bool:
+    """Whether a page's slides are created after load (not visible in its HTML)."""
+    return bool(_RUNTIME_SLIDES.search(html))
+
+
+def parse_slides(html: str) -> List[SlideStep]:
+    """Navigation steps of a Reveal.js page, in Reveal.js "next" order.
+
+    Only <section> elements in the HTML are seen: check
+    builds_slides_at_runtime first.
+    """
+    parser = _SlideParser()
+    parser.feed(html)
+    parser.close()
+    steps = []
+    for h, section in enumerate(parser.roots):
+        for v, slide in enumerate(section.children or [section]):
+            content = "".join(slide.content)
+            dynamic = bool(_DYNAMIC.search(content))
+            for fragment in range(-1, _count_fragments(content)):
+                steps.append(SlideStep(h, v, fragment, dynamic))
+    return steps
+
+
+def slide_url(url: str, step: SlideStep) -> str:
+    """URL of a presentation opened at a step (replacing any hash)."""
+    return url.split("#", 1)[0] + step.hash
+
+
+def step_index(direction: str, index: int, count: int) -> int:
+    """Step index after navigating in a direction (ValueError for unknown directions)."""
+    if direction not in NAVIGATION_DIRECTIONS:
+        raise ValueError(f"Invalid direction '{direction}', expected one of {NAVIGATION_DIRECTIONS}")
+    last = max(0, count - 1)
+    if direction == "next":
+        return min(last, index + 1)
+    if direction == "prev":
+        return max(0, index - 1)
+    return 0 if direction == "first" else last
+
+
+def deck_key(url: str, html: str, resolution: str) -> str:
+    """Cache key of a presentation at an output size."""
+    payload = "\0".join((url.split("#", 1)[0], resolution, html))
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+
+def build_render_command(url: str, output_file: Path, width: int, height: int) -> List[str]:
+    """gst-launch-1.0 command rendering a page and keeping its last frame as raw NV12."""
+    frames = max(1, round(SETTLE_SECONDS * RENDER_FRAMERATE))
+    # multifilesink without a %d pattern overwrites the same file with every frame
+    pipeline = (
+        f'wpesrc location="{url}" draw-background=false ! '
+        f"video/x-raw,width={width},height={height},framerate={RENDER_FRAMERATE}/1 ! "
+        f"identity eos-after={frames} ! "
+        f"videoconvert ! videoscale ! video/x-raw,format=NV12,width={width},height={height} ! "
+        f'multifilesink location="{output_file}"'
+    )
+    command = ["gst-launch-1.0", "-q", pipeline]
+    if shutil.which("nice"):
+        command = ["nice", "-n", "10", *command]
+    return command
+
+
+class SlideDeck:
+    """Steps of one presentation and their rendered stills on disk."""
+
+    def __init__(self, key: str, url: str, steps: List[SlideStep], path: Path, width: int, height: int):
+        self.key = key
+        self.url = url
+        self.steps = steps
+        self.path = path
+        self.width = width
+        self.height = height
+
+    @property
+    def frame_size(self) -> int:
+        return self.width * self.height * 3 // 2  # NV12
+
+    def still_path(self, index: int) -> Path:
+        return self.path / f"{index:04d}.nv12"
+
+    def is_rendered(self, index: int) -> bool:
+        try:
+            return self.still_path(index).stat().st_size == self.frame_size
+        except OSError:
+            return False
+
+    def frame(self, index: int) -> Optional[bytes]:
+        """Rendered NV12 still of a step (None for dynamic or not yet rendered steps)."""
+        if not 0 <= index < len(self.steps) or self.steps[index].dynamic:
+            return None
+        try:
+            data = self.still_path(index).read_bytes()
+        except OSError:
+            return None
+        return data if len(data) == self.frame_size else None
+
+    def url_for(self, index: int) -> str:
+        """URL opening the presentation at a step (for live rendering)."""
+        if 0 <= index < len(self.steps):
+            return slide_url(self.url, self.steps[index])
+        return self.url
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "steps": len(self.steps),
+            "dynamic": sum(1 for step in self.steps if step.dynamic),
+            "rendered": sum(1 for index in range(len(self.steps)) if self.is_rendered(index)),
+        }
+
+
+class SlideCache:
+    """Splits presentations into steps and renders their stills in the background."""
+
+    def __init__(self, cache_dir: str = "/tmp/reveal_slides", resolution: str = "1920x1080"):
+        self.cache_dir = Path(cache_dir)
+        self.resolution = resolution
+        self.width, self.height = (int(v) for v in resolution.split("x"))
+        self._decks: Dict[str, SlideDeck] = {}
+        self._rendering: Set[str] = set()
+        self._listeners: List[Callable[[str, int], None]] = []
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.failures = 0
+
+    def prepare(self, url: str) -> Optional[SlideDeck]:
+        """Fetch and split a presentation (None if it cannot be fetched or has no slides)."""
+        try:
+            import httpx
+            response = httpx.get(url, timeout=FETCH_TIMEOUT, follow_redirects=True)
+            response.raise_for_status()
+            html = response.text
+        except Exception as e:
+            logger.warning(f"Cannot fetch presentation {url} for slide pre-rendering, running live: {e}")
+            return None
+        return self.deck_for(url, html)
+
+    def deck_for(self, url: str, html: str) -> Optional[SlideDeck]:
+        """Deck of a presentation's HTML (shared by outputs showing the same presentation)."""
+        key = deck_key(url, html, self.resolution)
+        with self._lock:
+            deck = self._decks.get(key)
+        if deck:
+            return deck
+        if builds_slides_at_runtime(html):
+            logger.info(f"Slides of {url} are built at runtime, running live")
+            return None
+        steps = parse_slides(html)
+        if not steps:
+            logger.warning(f"No Reveal.js slides found in {url}, running live")
+            return None
+        deck = SlideDeck(key, url, steps, self.cache_dir / key, self.width, self.height)
+        try:
+            deck.path.mkdir(parents=True, exist_ok=True)
+            (deck.path / MANIFEST).write_text(json.dumps({
+                "url": url,
+                "width": self.width,
+                "height": self.height,
+                "steps": [step.hash for step in steps],
+                "dynamic": [index for index, step in enumerate(steps) if step.dynamic],
+            }))
+        except OSError as e:
+            logger.warning(f"Cannot create slide cache {deck.path}, running live: {e}")
+            return None
+        with self._lock:
+            deck = self._decks.setdefault(key, deck)
+        return deck
+
+    def add_ready_listener(self, callback: Callable[[str, int], None]) -> None:
+        """Call callback(deck_key, step_index) (from the render thread) when a still is rendered."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def render(self, deck: SlideDeck, first: int = 0) -> None:
+        """Render the deck's missing static stills in a background thread, starting at `first`."""
+        with self._lock:
+            if deck.key in self._rendering:
+                return
+            self._rendering.add(deck.key)
+        count = len(deck.steps)
+        order = [(first + offset) % count for offset in range(count)]
+        threading.Thread(target=self._render_deck, args=(deck, order), name=f"slides-{deck.key[:8]}", daemon=True).start()
+
+    def _render_deck(self, deck: SlideDeck, order: List[int]) -> None:
+        started = time.monotonic()
+        rendered = 0
+        try:
+            for index in order:
+                if deck.steps[index].dynamic or deck.is_rendered(index):
+                    continue
+                if self._render_step(deck, index):
+                    rendered += 1
+        finally:
+            with self._lock:
+                self._rendering.discard(deck.key)
+        if rendered:
+            logger.info(f"Pre-rendered {rendered} slide stills of {deck.url} in {time.monotonic() - started:.1f}s")
+
+    def _render_step(self, deck: SlideDeck, index: int) -> bool:
+        target = deck.still_path(index)
+        work_file = target.with_suffix(".tmp")
+        started = time.monotonic()
+        try:
+            result = subprocess.run(
+                build_render_command(deck.url_for(index), work_file, deck.width, deck.height),
+                capture_output=True, text=True, timeout=RENDER_TIMEOUT,
+            )
+            if result.returncode != 0 or work_file.stat().st_size != deck.frame_size:
+                raise RuntimeError(result.stderr.strip() or f"gst-launch-1.0 exited with {result.returncode}")
+            work_file.rename(target)
+        except Exception as e:
+            work_file.unlink(missing_ok=True)
+            logger.error(f"Slide pre-render of {deck.url_for(index)} failed: {e}")
+            with self._lock:
+                self.failures += 1
+            return False
+
+        with self._lock:
+            self.renders += 1
+            self.render_seconds += time.monotonic() - started
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(deck.key, index)
+            except Exception as e:
+                logger.warning(f"Slide render listener failed: {e}")
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "decks": len(self._decks),
+                "rendering": sorted(self._rendering),
+                "renders": self.renders,
+                "render_seconds": round(self.render_seconds, 1),
+                "failures": self.failures,
+            }
+
+
+class StillFeeder:
+    """Pushes the current still into an appsrc on change and as a keep-alive."""
+
+    def __init__(self, appsrc, Gst, frame: bytes, gate: Optional[DamageGate] = None):
+        self._appsrc = appsrc
+        self._Gst = Gst
+        self._frame = frame
+        self._version = 0
+        self.gate = gate or DamageGate()
+        self._changed = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="slide-still", daemon=True)
+        self._thread.start()
+
+    def show(self, frame: bytes) -> None:
+        """Replace the still (pushed immediately)."""
+        self._frame = frame
+        self._version += 1
+        self._changed.set()
+
+    def stop(self) -> None:
+        self._running = False
+        self._changed.set()
+
+    def _run(self) -> None:
+        Gst = self._Gst
+        while self._running:
+            push, keyframe = self.gate.check(self._version, time.monotonic())
+            if push:
+                if keyframe:
+                    self._appsrc.send_event(force_key_unit_event())
+                buffer = Gst.Buffer.new_wrapped(self._frame)
+                if self._appsrc.emit("push-buffer", buffer) != Gst.FlowReturn.OK and self._running:
+                    logger.debug("Slide still appsrc refused buffer")
+            self._changed.wait(self.gate.keepalive)
+            self._changed.clear()
@@ -1,7 +1,13 @@
 """Reveal.js video source manager using WPE WebKit or Chromium for HTML rendering.
 
 Supports multiple independent video outputs that can run simultaneously.
-Each output has its own pipeline streaming to a unique MediaMTX path.
+Each output streams to a unique MediaMTX path. Outputs showing the same page
+share one WPE renderer (see reveal_renderer.py) until navigation makes
+them diverge.
+
+With slide pre-rendering enabled, outputs are served from pre-rendered
+stills of each slide (see reveal_slides.py) and only run the browser live
+for slides with video or animation.
 """
 import logging
 import subprocess
@@ -13,11 +19,13 @@ from dataclasses import dataclass, field
 
 try:
     from .gst_utils import ensure_gst_initialized, get_gst
-    from .pipelines import get_h265_encoder
+    from .reveal_renderer import SharedRenderer, build_encoder
+    from .reveal_slides import STILL_FRAMERATE, SlideCache, StillFeeder, step_index
 except ImportError:
     # Fallback for direct execution
     from gst_utils import ensure_gst_initialized, get_gst
-    from pipelines import get_h265_encoder
+    from reveal_renderer import SharedRenderer, build_encoder
+    from reveal_slides import STILL_FRAMERATE, SlideCache, StillFeeder, step_index
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +35,16 @@ class RevealOutput:
     """Represents a single Reveal.js video output instance."""
     output_id: str
     mediamtx_path: str
-    pipeline: Any = None
+    resolution: str = "1920x1080"
+    pipeline: Any = None  # Own pipeline (still mode, chromium)
     state: str = "idle"  # idle, starting, running, stopping, error
     current_url: Optional[str] = None
     current_presentation_id: Optional[str] = None
+    deck: Any = None  # SlideDeck when slide pre-rendering is enabled
+    slide: int = 0  # Current step index in the deck
+    mode: str = "live"  # live (wpesrc) or still (pre-rendered slide)
+    feeder: Any = None  # StillFeeder in still mode
+    renderer: Any = None  # SharedRenderer in live WPE mode
 
 
 class RevealSourceManager:
@@ -40,7 +54,8 @@ class RevealSourceManager:
     - Detection of available HTML rendering backend (wpesrc or Chromium)
     - GStreamer pipeline creation for HTML-to-video conversion
     - Streaming to MediaMTX via RTSP
-    - Multiple independent outputs (e.g., "slides" and "slides_overlay")
+    - Multiple independent outputs (e.g., "slides" and "slides_overlay"),
+      sharing one renderer while they show the same page
     - Slide navigation control via JavaScript injection
     
     Usage:
@@ -57,7 +72,11 @@ class RevealSourceManager:
         bitrate: int = 4000,
         mediamtx_path: str = "slides",  # Kept for backward compatibility
         renderer: str = "auto",
-        outputs: Optional[List[str]] = None
+        outputs: Optional[List[str]] = None,
+        prerender_slides: bool = False,
+        slide_cache_dir: str = "/tmp/reveal_slides",
+        variable_framerate: bool = True,
+        output_resolutions: Optional[Dict[str, str]] = None
     ):
         """Initialize Reveal.js source manager.
         
@@ -68,11 +87,18 @@ class RevealSourceManager:
             mediamtx_path: Default MediaMTX path (used if outputs not specified)
             renderer: Renderer to use ("auto", "wpe", "chromium")
             outputs: List of output IDs (e.g., ["slides", "slides_overlay"])
-                     Each output gets its own pipeline streaming to mediamtx_path=output_id
+                     Each output streams to mediamtx_path=output_id
+            prerender_slides: Serve static slides from pre-rendered stills (WPE only)
+            slide_cache_dir: Directory for pre-rendered slide stills
+            variable_framerate: Encode rendered frames only when the page changed
+                                (plus keep-alive frames), see damage.py
+            output_resolutions: Per-output resolution overrides (output_id -> "WxH");
+                                pages are rendered at `resolution` and scaled
         """
         self.resolution = resolution
         self.framerate = framerate
         self.bitrate = bitrate
+        self.variable_framerate = variable_framerate
         self.renderer_preference = renderer
         
         # Multiple outputs support
@@ -85,9 +111,13 @@ class RevealSourceManager:
         for output_id in outputs:
             self._outputs[output_id] = RevealOutput(
                 output_id=output_id,
-                mediamtx_path=output_id  # Use output_id as MediaMTX path
+                mediamtx_path=output_id,  # Use output_id as MediaMTX path
+                resolution=(output_resolutions or {}).get(output_id, resolution)
             )
         
+        # Shared WPE renderers by URL (including the slide hash)
+        self._renderers: Dict[str, SharedRenderer] = {}
+        
         # Backward compatibility: keep track of default output
         self.mediamtx_path = outputs[0] if outputs else mediamtx_path
         
@@ -98,6 +128,12 @@ class RevealSourceManager:
         # Detect available renderer
         self._detect_renderer()
         
+        # Slide stills need wpesrc for rendering
+        self.slide_cache: Optional[SlideCache] = None
+        if prerender_slides and self.renderer_type == "wpe":
+            self.slide_cache = SlideCache(slide_cache_dir, resolution)
+            self.slide_cache.add_ready_listener(self._on_slide_rendered)
+        
         logger.info(f"RevealSourceManager initialized with outputs: {list(self._outputs.keys())}")
     
     def _detect_renderer(self) -> None:
@@ -195,6 +231,9 @@ class RevealSourceManager:
             logger.error(f"Unknown output_id: {output_id}. Available: {list(self._outputs.keys())}")
             return False
         
+        # Fetch the slides before taking the lock (network access)
+        deck = self.slide_cache.prepare(url) if self.slide_cache else None
+        
         with self._lock:
             output = self._outputs[output_id]
             
@@ -202,104 +241,161 @@ class RevealSourceManager:
                 logger.warning(f"Reveal.js output '{output_id}' already running")
                 return False
             
-            if output.pipeline:
+            if output.pipeline or output.renderer:
                 self._stop_output(output)
             
             output.state = "starting"
             output.current_url = url
             output.current_presentation_id = presentation_id
+            output.deck = deck
+            output.slide = 0
             
+            if not self._launch(output):
+                return False
+            
+            output.state = "running"
+            logger.info(f"Started Reveal.js output '{output_id}': {presentation_id} at {url} ({output.mode})")
+        
+        if deck:
+            self.slide_cache.render(deck)
+        return True
+    
+    def _output_url(self, output: RevealOutput) -> str:
+        """URL of the output's current slide."""
+        return output.deck.url_for(output.slide) if output.deck else output.current_url
+    
+    def _build_output_pipeline(self, output: RevealOutput, frame: Optional[bytes]) -> Any:
+        """Build an output's own pipeline: the slide's pre-rendered still, or Chromium."""
+        if frame is not None:
+            pipeline = self._build_still_pipeline(output.mediamtx_path, output.resolution)
+            output.mode = "still"
+            output.feeder = StillFeeder(pipeline.get_by_name("slide_src"), get_gst(), frame)
+            return pipeline
+        
+        output.mode = "live"
+        if self.renderer_type == "chromium":
+            return self._build_chromium_pipeline(self._output_url(output), output.mediamtx_path)
+        logger.error(f"Unknown renderer type: {self.renderer_type}")
+        return None
+    
+    def _attach_renderer(self, output: RevealOutput) -> bool:
+        """Show the output's current slide live, sharing a renderer already showing it.
+        
+        Call with the lock held.
+        """
+        output.mode = "live"
+        url = self._output_url(output)
+        renderer = self._renderers.get(url)
+        if renderer:
+            if not renderer.add_output(output.output_id, output.mediamtx_path, output.resolution):
+                output.state = "error"
+                return False
+        else:
+            renderer = SharedRenderer(
+                url, self.resolution, self.framerate, self.bitrate,
+                variable_framerate=self.variable_framerate,
+                on_message=self._on_renderer_message,
+            )
             try:
-                # Build pipeline based on renderer type
-                if self.renderer_type == "wpe":
-                    output.pipeline = self._build_wpe_pipeline(url, output.mediamtx_path)
-                elif self.renderer_type == "chromium":
-                    output.pipeline = self._build_chromium_pipeline(url, output.mediamtx_path)
-                else:
-                    logger.error(f"Unknown renderer type: {self.renderer_type}")
-                    output.state = "error"
-                    return False
-                
-                if not output.pipeline:
-                    logger.error(f"Failed to build Reveal.js pipeline for output '{output_id}'")
-                    output.state = "error"
-                    return False
-                
-                # Set up bus message handler with output reference
-                bus = output.pipeline.get_bus()
-                bus.add_signal_watch()
-                bus.connect("message", lambda bus, msg: self._on_bus_message(bus, msg, output))
-                
-                # Start pipeline
-                Gst = get_gst()
-                ret = output.pipeline.set_state(Gst.State.PLAYING)
-                
-                if ret == Gst.StateChangeReturn.FAILURE:
-                    logger.error(f"Failed to start Reveal.js pipeline for output '{output_id}'")
-                    output.pipeline.set_state(Gst.State.NULL)
-                    output.pipeline = None
-                    output.state = "error"
-                    return False
-                
-                # Wait for pipeline to reach PLAYING state
-                time.sleep(0.5)
-                state_ret, current_state, pending_state = output.pipeline.get_state(Gst.SECOND)
-                
-                if state_ret == Gst.StateChangeReturn.FAILURE:
-                    logger.error(f"Reveal.js pipeline for '{output_id}' failed to reach PLAYING state")
-                    output.pipeline.set_state(Gst.State.NULL)
-                    output.pipeline = None
-                    output.state = "error"
-                    return False
-                
-                output.state = "running"
-                logger.info(f"Started Reveal.js output '{output_id}': {presentation_id} at {url}")
-                return True
-                
+                started = renderer.start(output.output_id, output.mediamtx_path, output.resolution)
             except Exception as e:
-                logger.error(f"Failed to start Reveal.js output '{output_id}': {e}")
+                logger.error(f"Failed to start WPE renderer for output '{output.output_id}': {e}")
+                renderer.stop()
+                started = False
+            if not started:
                 output.state = "error"
-                if output.pipeline:
-                    try:
-                        output.pipeline.set_state(get_gst().State.NULL)
-                    except:
-                        pass
-                    output.pipeline = None
                 return False
+            self._renderers[url] = renderer
+        output.renderer = renderer
+        return True
     
-    def _build_wpe_pipeline(self, url: str, mediamtx_path: str) -> Any:
-        """Build GStreamer pipeline using wpesrc.
+    def _launch(self, output: RevealOutput) -> bool:
+        """Build and start the output's pipeline (call with the lock held).
+        
+        Returns:
+            True if the pipeline reached PLAYING
+        """
+        output_id = output.output_id
+        frame = output.deck.frame(output.slide) if output.deck else None
+        if frame is None and self.renderer_type == "wpe":
+            return self._attach_renderer(output)
+        try:
+            output.pipeline = self._build_output_pipeline(output, frame)
+            
+            if not output.pipeline:
+                logger.error(f"Failed to build Reveal.js pipeline for output '{output_id}'")
+                output.state = "error"
+                return False
+            
+            # Set up bus message handler with output reference
+            bus = output.pipeline.get_bus()
+            bus.add_signal_watch()
+            bus.connect("message", lambda bus, msg: self._on_bus_message(bus, msg, output))
+            
+            # Start pipeline
+            Gst = get_gst()
+            ret = output.pipeline.set_state(Gst.State.PLAYING)
+            
+            if ret == Gst.StateChangeReturn.FAILURE:
+                logger.error(f"Failed to start Reveal.js pipeline for output '{output_id}'")
+                self._release_pipeline(output)
+                output.state = "error"
+                return False
+            
+            if output.feeder:
+                output.feeder.start()
+            
+            # Wait for pipeline to reach PLAYING state
+            time.sleep(0.5)
+            state_ret, current_state, pending_state = output.pipeline.get_state(Gst.SECOND)
+            
+            if state_ret == Gst.StateChangeReturn.FAILURE:
+                logger.error(f"Reveal.js pipeline for '{output_id}' failed to reach PLAYING state")
+                self._release_pipeline(output)
+                output.state = "error"
+                return False
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to start Reveal.js output '{output_id}': {e}")
+            output.state = "error"
+            self._release_pipeline(output)
+            return False
+    
+    def _build_still_pipeline(self, mediamtx_path: str, resolution: str) -> Any:
+        """Build GStreamer pipeline streaming pre-rendered NV12 stills from an appsrc.
+        
+        The still is pushed when it changes and as a keep-alive (see
+        StillFeeder), with keyframes forced for new subscribers, so the
+        encoder only sees about one frame per second.
+        
+        Stills are rendered at the manager's resolution and scaled to the
+        output's.
         
         Args:
-            url: URL to render
             mediamtx_path: MediaMTX path for this output
+            resolution: Output resolution
         
         Returns:
-            GStreamer pipeline object
+            GStreamer pipeline object with the appsrc named "slide_src"
         """
         width, height = self.resolution.split("x")
+        out_width, out_height = resolution.split("x")
+        encoder_str, caps_str, parse_str = build_encoder(self.bitrate, STILL_FRAMERATE, True)
         
-        # Get H.265 encoder for hardware acceleration
-        encoder_str, caps_str, parse_str = get_h265_encoder(self.bitrate)
-        
-        # Build wpesrc pipeline
-        # wpesrc renders HTML to video frames
-        # draw-background=false makes background transparent (useful for overlays)
         pipeline_str = (
-            f"wpesrc location=\"{url}\" draw-background=false ! "
-            f"video/x-raw,width={width},height={height},framerate={self.framerate}/1 ! "
-            f"videoconvert ! "
-            f"videoscale ! "
-            f"video/x-raw,format=NV12 ! "
-            f"queue max-size-buffers=5 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
+            f"appsrc name=slide_src is-live=true format=time do-timestamp=true block=false "
+            f"caps=video/x-raw,format=NV12,width={width},height={height},framerate={STILL_FRAMERATE}/1 ! "
+            f"queue max-size-buffers=2 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
+            f"videoscale ! video/x-raw,width={out_width},height={out_height} ! "
             f"{encoder_str} ! "
             f"{caps_str} ! "
-            f"queue max-size-buffers=5 max-size-time=0 max-size-bytes=0 leaky=downstream ! "
             f"{parse_str} ! "
             f"rtspclientsink location=rtsp://127.0.0.1:8554/{mediamtx_path} protocols=udp latency=0"
         )
         
-        logger.info(f"Building WPE pipeline for output '{mediamtx_path}': {pipeline_str}")
+        logger.info(f"Building still pipeline for output '{mediamtx_path}': {pipeline_str}")
         Gst = get_gst()
         return Gst.parse_launch(pipeline_str)
     
@@ -334,6 +430,25 @@ class RevealSourceManager:
         except Exception as e:
             logger.warning(f"Background stop error for '{output_id}': {e}")
     
+    def _release_pipeline(self, output: RevealOutput) -> None:
+        """Detach the output's pipeline and stop it in the background."""
+        if output.feeder:
+            output.feeder.stop()
+            output.feeder = None
+        renderer, output.renderer = output.renderer, None
+        if renderer and renderer.remove_output(output.output_id):
+            renderer.stop()  # Last output of the renderer
+            if self._renderers.get(renderer.url) is renderer:
+                del self._renderers[renderer.url]
+        pipeline = output.pipeline
+        output.pipeline = None
+        if pipeline:
+            threading.Thread(
+                target=self._stop_pipeline_async,
+                args=(pipeline, output.output_id),
+                daemon=True
+            ).start()
+    
     def _stop_output(self, output: RevealOutput) -> bool:
         """Stop a specific output pipeline (internal helper).
         
@@ -346,29 +461,24 @@ class RevealSourceManager:
         Returns:
             True if stop was initiated successfully
         """
-        if not output.pipeline:
+        if not output.pipeline and not output.renderer:
             output.state = "idle"
             return True
         
         output.state = "stopping"
-        pipeline = output.pipeline
-        output.pipeline = None  # Clear reference immediately
-        output_id = output.output_id
+        
+        # Clear reference immediately, stop pipeline in background thread to avoid blocking
+        self._release_pipeline(output)
         
         # Update state immediately - don't wait for pipeline
         output.state = "idle"
         output.current_url = None
         output.current_presentation_id = None
+        output.deck = None
+        output.slide = 0
+        output.mode = "live"
         
-        # Stop pipeline in background thread to avoid blocking
-        stop_thread = threading.Thread(
-            target=self._stop_pipeline_async,
-            args=(pipeline, output_id),
-            daemon=True
-        )
-        stop_thread.start()
-        
-        logger.info(f"Initiated stop for Reveal.js output '{output_id}'")
+        logger.info(f"Initiated stop for Reveal.js output '{output.output_id}'")
         return True
     
     def stop(self, output_id: Optional[str] = None) -> bool:
@@ -407,6 +517,9 @@ class RevealSourceManager:
     def navigate(self, output_id: str, direction: str) -> bool:
         """Navigate slides in a specific presentation output.
         
+        Requires slide pre-rendering (the slides of the presentation are
+        known, and each one can be shown as a still or opened live).
+        
         Args:
             output_id: Output identifier
             direction: Navigation direction ("next", "prev", "first", "last")
@@ -414,43 +527,83 @@ class RevealSourceManager:
         Returns:
             True if navigation command sent successfully
         """
-        if output_id not in self._outputs:
-            logger.error(f"Unknown output_id: {output_id}")
+        output = self._navigable_output(output_id)
+        if not output:
             return False
         
-        output = self._outputs[output_id]
-        if output.state != "running":
-            logger.warning(f"Cannot navigate - output '{output_id}' not running")
-            return False
-        
-        # TODO: Implement slide navigation via JavaScript injection
-        # This requires communication with the wpesrc element or the browser
-        # For now, this is a placeholder
-        logger.warning(f"Slide navigation not yet implemented: {direction} on output '{output_id}'")
-        return False
+        with self._lock:
+            try:
+                index = step_index(direction, output.slide, len(output.deck.steps))
+            except ValueError as e:
+                logger.error(f"Cannot navigate output '{output_id}': {e}")
+                return False
+            return self._show_slide(output, index)
     
     def goto_slide(self, output_id: str, slide_index: int) -> bool:
         """Go to a specific slide on a specific output.
         
         Args:
             output_id: Output identifier
-            slide_index: Slide index to navigate to
+            slide_index: Slide index to navigate to (navigation step, counting
+                         vertical slides and fragments)
         
         Returns:
             True if navigation command sent successfully
         """
+        output = self._navigable_output(output_id)
+        if not output:
+            return False
+        
+        if not 0 <= slide_index < len(output.deck.steps):
+            logger.error(f"Slide {slide_index} out of range for output '{output_id}' ({len(output.deck.steps)} slides)")
+            return False
+        
+        with self._lock:
+            return self._show_slide(output, slide_index)
+    
+    def _navigable_output(self, output_id: str) -> Optional[RevealOutput]:
         if output_id not in self._outputs:
             logger.error(f"Unknown output_id: {output_id}")
-            return False
+            return None
         
         output = self._outputs[output_id]
         if output.state != "running":
             logger.warning(f"Cannot navigate - output '{output_id}' not running")
-            return False
+            return None
         
-        # TODO: Implement goto slide via JavaScript injection
-        logger.warning(f"Goto slide not yet implemented: {slide_index} on output '{output_id}'")
-        return False
+        if not output.deck:
+            # TODO: Implement live slide navigation via JavaScript injection
+            logger.warning(f"Slide navigation requires slide pre-rendering (output '{output_id}')")
+            return None
+        return output
+    
+    def _show_slide(self, output: RevealOutput, index: int) -> bool:
+        """Show a slide on a running output (call with the lock held).
+        
+        Still to still only swaps the image. Any other change rebuilds the
+        pipeline (live slides are opened at their URL hash), which briefly
+        re-publishes the MediaMTX path.
+        """
+        output.slide = index
+        frame = output.deck.frame(index)
+        if frame is not None and output.feeder:
+            output.feeder.show(frame)
+            logger.debug(f"Reveal.js output '{output.output_id}' showing still of slide {index}")
+            return True
+        
+        self._release_pipeline(output)
+        if not self._launch(output):
+            return False
+        logger.info(f"Reveal.js output '{output.output_id}' showing slide {index} ({output.mode})")
+        return True
+    
+    def _on_slide_rendered(self, deck_key: str, index: int) -> None:
+        """Switch outputs showing a slide live to its still once rendered."""
+        with self._lock:
+            for output in self._outputs.values():
+                if (output.state == "running" and output.mode == "live" and output.deck
+                        and output.deck.key == deck_key and output.slide == index):
+                    self._show_slide(output, index)
     
     def get_output_status(self, output_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific output.
@@ -472,9 +625,28 @@ class RevealSourceManager:
                 "presentation_id": output.current_presentation_id,
                 "url": output.current_url,
                 "mediamtx_path": output.mediamtx_path,
-                "stream_url": f"rtsp://127.0.0.1:8554/{output.mediamtx_path}" if output.state == "running" else None
+                "stream_url": f"rtsp://127.0.0.1:8554/{output.mediamtx_path}" if output.state == "running" else None,
+                "mode": output.mode,
+                "slide": output.slide,
+                "slides": output.deck.get_status() if output.deck else None,
+                "frames": self._frame_status(output),
+                "resolution": output.resolution,
+                "shared_with": self._shared_with(output)
             }
     
+    @staticmethod
+    def _frame_status(output: RevealOutput) -> Optional[Dict[str, Any]]:
+        """Frames passed/dropped by the live renderer's damage gate or the still feeder."""
+        gate = output.renderer.gate if output.renderer else (output.feeder.gate if output.feeder else None)
+        return gate.get_status() if gate else None
+    
+    @staticmethod
+    def _shared_with(output: RevealOutput) -> List[str]:
+        """Other outputs on the output's renderer."""
+        if not output.renderer:
+            return []
+        return [output_id for output_id in output.renderer.output_ids if output_id != output.output_id]
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current status of all Reveal.js outputs.
         
@@ -494,7 +666,11 @@ class RevealSourceManager:
                     "presentation_id": output.current_presentation_id,
                     "url": output.current_url,
                     "mediamtx_path": output.mediamtx_path,
-                    "stream_url": f"rtsp://127.0.0.1:8554/{output.mediamtx_path}" if is_running else None
+                    "stream_url": f"rtsp://127.0.0.1:8554/{output.mediamtx_path}" if is_running else None,
+                    "mode": output.mode,
+                    "slide": output.slide,
+                    "resolution": output.resolution,
+                    "shared_with": self._shared_with(output)
                 }
             
             return {
@@ -502,11 +678,20 @@ class RevealSourceManager:
                 "resolution": self.resolution,
                 "framerate": self.framerate,
                 "bitrate": self.bitrate,
+                "variable_framerate": self.variable_framerate,
                 "available_outputs": list(self._outputs.keys()),
                 "any_running": any_running,
+                "slide_cache": self.slide_cache.get_status() if self.slide_cache else None,
+                "renderers": [renderer.get_status() for renderer in self._renderers.values()],
                 "outputs": outputs_status
             }
     
+    def _on_renderer_message(self, renderer: SharedRenderer, message) -> None:
+        """Handle bus messages of a shared renderer for each of its outputs."""
+        for output in list(self._outputs.values()):
+            if output.renderer is renderer:
+                self._on_bus_message(None, message, output)
+    
     def _on_bus_message(self, bus, message, output: RevealOutput) -> None:
         """Handle GStreamer bus messages for a specific output.
         
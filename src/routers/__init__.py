@@ -0,0 +1,9 @@
+"""API routers split out of `main.py`.
+
+Each router module only imports FastAPI and light helpers at import time;
+heavy subsystems are resolved through `services` inside the handlers.
+
+Routers:
+- cairo: /api/cairo/*, /ws/cairo
+- wordpress: /api/v1/wordpress/*, /api/v1/test/*
+"""
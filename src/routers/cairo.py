@@ -0,0 +1,768 @@
+"""Cairo graphics API - real-time broadcast graphics (lower thirds, scoreboards, tickers, timers, logos).
+
+The Cairo graphics manager is resolved through the service registry, so
+pycairo is only imported the first time one of these endpoints is used.
+"""
+import logging
+from operator import methodcaller
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+
+from .. import services
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["cairo"])
+
+
+@router.get("/api/cairo/status")
+async def get_cairo_status() -> Dict[str, Any]:
+    """Get Cairo graphics manager status."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    return cairo_manager.get_status()
+
+
+@router.get("/api/cairo/elements")
+async def list_cairo_elements() -> Dict[str, Any]:
+    """List all Cairo graphics elements."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    return {"elements": cairo_manager.list_elements()}
+
+
+@router.post("/api/cairo/lower_third")
+async def create_cairo_lower_third(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update a Cairo lower third.
+    
+    Request body:
+        - element_id: Unique identifier (required)
+        - name: Name text (required)
+        - title: Title text (optional)
+        - x: X position (default: 50)
+        - y: Y position (default: 900)
+        - width: Width (default: 600)
+        - height: Height (default: 120)
+        - bg_color: Background color hex (default: "#000000")
+        - bg_alpha: Background alpha (default: 0.8)
+        - text_color: Text color hex (default: "#FFFFFF")
+        - name_font_size: Name font size (default: 48)
+        - title_font_size: Title font size (default: 28)
+        - logo_path: Optional logo image path
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element_id = request.get("element_id")
+    name = request.get("name")
+    
+    if not element_id:
+        raise HTTPException(status_code=400, detail="element_id required")
+    if not name:
+        raise HTTPException(status_code=400, detail="name required")
+    
+    try:
+        from ..cairo_graphics import LowerThird
+        
+        lower_third = LowerThird(
+            element_id=element_id,
+            name=name,
+            title=request.get("title", ""),
+            x=request.get("x", 50),
+            y=request.get("y", 900),
+            width=request.get("width", 600),
+            height=request.get("height", 120),
+            bg_color=request.get("bg_color", "#000000"),
+            bg_alpha=request.get("bg_alpha", 0.8),
+            text_color=request.get("text_color", "#FFFFFF"),
+            name_font_size=request.get("name_font_size", 48),
+            title_font_size=request.get("title_font_size", 28),
+            logo_path=request.get("logo_path")
+        )
+        
+        cairo_manager.add_element(element_id, lower_third)
+        
+        return {
+            "status": "created",
+            "element_id": element_id,
+            "type": "lower_third",
+            "name": name,
+            "title": request.get("title", "")
+        }
+    except Exception as e:
+        logger.error(f"Failed to create lower third: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create lower third: {e}")
+
+
+@router.post("/api/cairo/lower_third/{element_id}/show")
+async def show_cairo_lower_third(element_id: str) -> Dict[str, str]:
+    """Show a Cairo lower third with animation."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    success = cairo_manager.show_element(element_id)
+    if not success:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    return {"status": "shown", "element_id": element_id}
+
+
+@router.post("/api/cairo/lower_third/{element_id}/hide")
+async def hide_cairo_lower_third(element_id: str) -> Dict[str, str]:
+    """Hide a Cairo lower third with animation."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    success = cairo_manager.hide_element(element_id)
+    if not success:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    return {"status": "hidden", "element_id": element_id}
+
+
+@router.post("/api/cairo/lower_third/{element_id}/update")
+async def update_cairo_lower_third(element_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Update Cairo lower third text."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import LowerThird
+    if not isinstance(element, LowerThird):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a lower third")
+    
+    name = request.get("name")
+    title = request.get("title")
+    cairo_manager.apply(element_id, methodcaller("update", name=name, title=title))
+    
+    # Applied at the next frame boundary; report the values being set
+    return {
+        "status": "updated",
+        "element_id": element_id,
+        "name": element.name if name is None else name,
+        "title": element.title if title is None else title
+    }
+
+
+@router.post("/api/cairo/scoreboard")
+async def create_cairo_scoreboard(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update a Cairo scoreboard.
+    
+    Request body:
+        - element_id: Unique identifier (required)
+        - team1_name: Team 1 name (default: "Team 1")
+        - team2_name: Team 2 name (default: "Team 2")
+        - team1_score: Team 1 score (default: 0)
+        - team2_score: Team 2 score (default: 0)
+        - x: X position (default: 1600)
+        - y: Y position (default: 50)
+        - width: Width (default: 250)
+        - height: Height (default: 150)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element_id = request.get("element_id")
+    if not element_id:
+        raise HTTPException(status_code=400, detail="element_id required")
+    
+    try:
+        from ..cairo_graphics import Scoreboard
+        
+        scoreboard = Scoreboard(
+            element_id=element_id,
+            team1_name=request.get("team1_name", "Team 1"),
+            team2_name=request.get("team2_name", "Team 2"),
+            team1_score=request.get("team1_score", 0),
+            team2_score=request.get("team2_score", 0),
+            x=request.get("x", 1600),
+            y=request.get("y", 50),
+            width=request.get("width", 250),
+            height=request.get("height", 150)
+        )
+        
+        cairo_manager.add_element(element_id, scoreboard)
+        
+        return {
+            "status": "created",
+            "element_id": element_id,
+            "type": "scoreboard"
+        }
+    except Exception as e:
+        logger.error(f"Failed to create scoreboard: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create scoreboard: {e}")
+
+
+@router.post("/api/cairo/scoreboard/{element_id}/score")
+async def update_cairo_scoreboard(element_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Update scoreboard scores.
+    
+    Request body:
+        - team1_score: Team 1 score (optional)
+        - team2_score: Team 2 score (optional)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Scoreboard
+    if not isinstance(element, Scoreboard):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a scoreboard")
+    
+    team1_score = request.get("team1_score")
+    team2_score = request.get("team2_score")
+    cairo_manager.apply(element_id, methodcaller("update_score", team1_score=team1_score, team2_score=team2_score))
+    
+    # Applied at the next frame boundary; report the values being set
+    return {
+        "status": "updated",
+        "element_id": element_id,
+        "team1_score": element.team1_score if team1_score is None else team1_score,
+        "team2_score": element.team2_score if team2_score is None else team2_score
+    }
+
+
+@router.post("/api/cairo/ticker")
+async def create_cairo_ticker(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update a Cairo ticker.
+    
+    Request body:
+        - element_id: Unique identifier (required)
+        - text: Ticker text (required)
+        - x: X position (default: 0)
+        - y: Y position (default: 0)
+        - width: Width (default: 1920)
+        - height: Height (default: 60)
+        - scroll_speed: Scroll speed in pixels/second (default: 100)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element_id = request.get("element_id")
+    text = request.get("text")
+    
+    if not element_id:
+        raise HTTPException(status_code=400, detail="element_id required")
+    if not text:
+        raise HTTPException(status_code=400, detail="text required")
+    
+    try:
+        from ..cairo_graphics import Ticker
+        
+        ticker = Ticker(
+            element_id=element_id,
+            text=text,
+            x=request.get("x", 0),
+            y=request.get("y", 0),
+            width=request.get("width", 1920),
+            height=request.get("height", 60),
+            scroll_speed=request.get("scroll_speed", 100.0)
+        )
+        
+        cairo_manager.add_element(element_id, ticker)
+        
+        return {
+            "status": "created",
+            "element_id": element_id,
+            "type": "ticker",
+            "text": text
+        }
+    except Exception as e:
+        logger.error(f"Failed to create ticker: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create ticker: {e}")
+
+
+@router.post("/api/cairo/ticker/{element_id}/text")
+async def update_cairo_ticker(element_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Update ticker text.
+    
+    Request body:
+        - text: New ticker text (required)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    text = request.get("text")
+    if not text:
+        raise HTTPException(status_code=400, detail="text required")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Ticker
+    if not isinstance(element, Ticker):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a ticker")
+    
+    cairo_manager.apply(element_id, methodcaller("update_text", text))
+    
+    return {
+        "status": "updated",
+        "element_id": element_id,
+        "text": text
+    }
+
+
+@router.post("/api/cairo/timer")
+async def create_cairo_timer(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update a Cairo timer.
+    
+    Request body:
+        - element_id: Unique identifier (required)
+        - duration: Duration in seconds (required)
+        - mode: "countdown" or "countup" (default: "countdown")
+        - x: X position (default: 1700)
+        - y: Y position (default: 50)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element_id = request.get("element_id")
+    duration = request.get("duration")
+    
+    if not element_id:
+        raise HTTPException(status_code=400, detail="element_id required")
+    if duration is None:
+        raise HTTPException(status_code=400, detail="duration required")
+    
+    try:
+        from ..cairo_graphics import Timer
+        
+        timer = Timer(
+            element_id=element_id,
+            duration=float(duration),
+            mode=request.get("mode", "countdown"),
+            x=request.get("x", 1700),
+            y=request.get("y", 50)
+        )
+        
+        cairo_manager.add_element(element_id, timer)
+        
+        return {
+            "status": "created",
+            "element_id": element_id,
+            "type": "timer",
+            "duration": duration,
+            "mode": request.get("mode", "countdown")
+        }
+    except Exception as e:
+        logger.error(f"Failed to create timer: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create timer: {e}")
+
+
+@router.post("/api/cairo/timer/{element_id}/start")
+async def start_cairo_timer(element_id: str) -> Dict[str, str]:
+    """Start a Cairo timer."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Timer
+    if not isinstance(element, Timer):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a timer")
+    
+    cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.start(timestamp))
+    
+    return {"status": "started", "element_id": element_id}
+
+
+@router.post("/api/cairo/timer/{element_id}/pause")
+async def pause_cairo_timer(element_id: str) -> Dict[str, str]:
+    """Pause a Cairo timer."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Timer
+    if not isinstance(element, Timer):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a timer")
+    
+    cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.pause(timestamp))
+    
+    return {"status": "paused", "element_id": element_id}
+
+
+@router.post("/api/cairo/timer/{element_id}/resume")
+async def resume_cairo_timer(element_id: str) -> Dict[str, str]:
+    """Resume a Cairo timer."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Timer
+    if not isinstance(element, Timer):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a timer")
+    
+    cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.resume(timestamp))
+    
+    return {"status": "resumed", "element_id": element_id}
+
+
+@router.post("/api/cairo/timer/{element_id}/reset")
+async def reset_cairo_timer(element_id: str) -> Dict[str, str]:
+    """Reset a Cairo timer."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics import Timer
+    if not isinstance(element, Timer):
+        raise HTTPException(status_code=400, detail=f"Element {element_id} is not a timer")
+    
+    cairo_manager.apply(element_id, methodcaller("reset"))
+    
+    return {"status": "reset", "element_id": element_id}
+
+
+@router.post("/api/cairo/logo")
+async def create_cairo_logo(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create or update a Cairo logo overlay.
+    
+    Request body:
+        - element_id: Unique identifier (required)
+        - logo_path: Path to logo image (required)
+        - x: X position (default: 1700)
+        - y: Y position (default: 50)
+        - scale: Scale factor (default: 1.0)
+        - pulse: Enable pulse animation (default: false)
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element_id = request.get("element_id")
+    logo_path = request.get("logo_path")
+    
+    if not element_id:
+        raise HTTPException(status_code=400, detail="element_id required")
+    if not logo_path:
+        raise HTTPException(status_code=400, detail="logo_path required")
+    
+    try:
+        from ..cairo_graphics import LogoOverlay
+        
+        logo = LogoOverlay(
+            element_id=element_id,
+            logo_path=logo_path,
+            x=request.get("x", 1700),
+            y=request.get("y", 50),
+            scale=request.get("scale", 1.0),
+            pulse=request.get("pulse", False)
+        )
+        
+        cairo_manager.add_element(element_id, logo)
+        
+        return {
+            "status": "created",
+            "element_id": element_id,
+            "type": "logo",
+            "logo_path": logo_path
+        }
+    except Exception as e:
+        logger.error(f"Failed to create logo: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create logo: {e}")
+
+
+@router.post("/api/cairo/element/{element_id}/timeline")
+async def set_cairo_element_timeline(element_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Set keyframe timelines of a Cairo graphics element.
+    
+    Request body (each key optional, null removes that timeline):
+        - enter: Timeline run on show
+        - exit: Timeline run on hide
+        - loop: Timeline run while visible (set "loop": true inside it to repeat)
+    
+    Timeline format:
+        {"duration": 0.6, "tracks": {"x": [[0, -400, "ease_out_cubic"], [0.6, 0]], "alpha": [[0, 0], [0.3, 1]]}}
+    
+    Tracks: x/y (pixel offset), scale, alpha, or an element property such as bg_color ([r, g, b]).
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    element = cairo_manager.get_element(element_id)
+    if not element:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    from ..cairo_graphics.timeline import timelines_from_request
+    try:
+        timelines = timelines_from_request(request)
+        element.check_timelines(**timelines)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not timelines:
+        raise HTTPException(status_code=400, detail="enter, exit or loop required")
+    
+    cairo_manager.apply(element_id, methodcaller("set_timelines", **timelines))
+    
+    return {
+        "status": "updated",
+        "element_id": element_id,
+        "timelines": {phase: (timeline.duration if timeline else None) for phase, timeline in timelines.items()}
+    }
+
+
+@router.delete("/api/cairo/element/{element_id}")
+async def delete_cairo_element(element_id: str) -> Dict[str, str]:
+    """Delete a Cairo graphics element."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    success = cairo_manager.remove_element(element_id)
+    if not success:
+        raise HTTPException(status_code=404, detail=f"Element {element_id} not found")
+    
+    return {"status": "deleted", "element_id": element_id}
+
+
+@router.post("/api/cairo/clear")
+async def clear_all_cairo_elements() -> Dict[str, str]:
+    """Clear all Cairo graphics elements."""
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        raise HTTPException(status_code=503, detail="Cairo graphics not available")
+    
+    cairo_manager.clear_all()
+    
+    return {"status": "cleared"}
+
+
+@router.websocket("/ws/cairo")
+async def cairo_websocket(websocket: WebSocket):
+    """WebSocket endpoint for real-time Cairo graphics control.
+    
+    Message format:
+        {
+            "type": "lower_third_show" | "lower_third_hide" | "lower_third_update" |
+                    "scoreboard_update" | "ticker_update" | "timer_start" | "get_status",
+            "element_id": "element_id",
+            ... (element-specific fields)
+        }
+    
+    Response format:
+        {
+            "status": "success" | "error",
+            "message": "...",
+            "data": {...}
+        }
+    """
+    cairo_manager = services.get("cairo")
+    if not cairo_manager:
+        await websocket.close(code=1008, reason="Cairo graphics not available")
+        return
+    
+    await websocket.accept()
+    logger.info("Cairo WebSocket client connected")
+    
+    try:
+        while True:
+            # Receive command
+            data = await websocket.receive_json()
+            msg_type = data.get("type")
+            element_id = data.get("element_id")
+            
+            try:
+                # Lower third commands
+                if msg_type == "lower_third_show":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    success = cairo_manager.show_element(element_id)
+                    if success:
+                        await websocket.send_json({"status": "success", "element_id": element_id})
+                    else:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                
+                elif msg_type == "lower_third_hide":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    success = cairo_manager.hide_element(element_id)
+                    if success:
+                        await websocket.send_json({"status": "success", "element_id": element_id})
+                    else:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                
+                elif msg_type == "lower_third_update":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import LowerThird
+                    if isinstance(element, LowerThird):
+                        name = data.get("name")
+                        title = data.get("title")
+                        cairo_manager.apply(element_id, methodcaller("update", name=name, title=title))
+                        await websocket.send_json({
+                            "status": "success",
+                            "element_id": element_id,
+                            "name": element.name if name is None else name,
+                            "title": element.title if title is None else title
+                        })
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a lower third"})
+                
+                # Scoreboard commands
+                elif msg_type == "scoreboard_update":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import Scoreboard
+                    if isinstance(element, Scoreboard):
+                        team1_score = data.get("team1_score")
+                        team2_score = data.get("team2_score")
+                        cairo_manager.apply(
+                            element_id,
+                            methodcaller("update_score", team1_score=team1_score, team2_score=team2_score)
+                        )
+                        await websocket.send_json({
+                            "status": "success",
+                            "element_id": element_id,
+                            "team1_score": element.team1_score if team1_score is None else team1_score,
+                            "team2_score": element.team2_score if team2_score is None else team2_score
+                        })
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a scoreboard"})
+                
+                # Ticker commands
+                elif msg_type == "ticker_update":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    text = data.get("text")
+                    if not text:
+                        await websocket.send_json({"status": "error", "message": "text required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import Ticker
+                    if isinstance(element, Ticker):
+                        cairo_manager.apply(element_id, methodcaller("update_text", text))
+                        await websocket.send_json({"status": "success", "element_id": element_id, "text": text})
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a ticker"})
+                
+                # Timer commands
+                elif msg_type == "timer_start":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import Timer
+                    if isinstance(element, Timer):
+                        cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.start(timestamp))
+                        await websocket.send_json({"status": "success", "element_id": element_id})
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a timer"})
+                
+                elif msg_type == "timer_pause":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import Timer
+                    if isinstance(element, Timer):
+                        cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.pause(timestamp))
+                        await websocket.send_json({"status": "success", "element_id": element_id})
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a timer"})
+                
+                elif msg_type == "timer_resume":
+                    if not element_id:
+                        await websocket.send_json({"status": "error", "message": "element_id required"})
+                        continue
+                    
+                    element = cairo_manager.get_element(element_id)
+                    if not element:
+                        await websocket.send_json({"status": "error", "message": f"Element {element_id} not found"})
+                        continue
+                    
+                    from ..cairo_graphics import Timer
+                    if isinstance(element, Timer):
+                        cairo_manager.apply_timed(element_id, lambda timer, timestamp: timer.resume(timestamp))
+                        await websocket.send_json({"status": "success", "element_id": element_id})
+                    else:
+                        await websocket.send_json({"status": "error", "message": "Element is not a timer"})
+                
+                # Status query
+                elif msg_type == "get_status":
+                    status = cairo_manager.get_status()
+                    await websocket.send_json({"status": "success", "data": status})
+                
+                else:
+                    await websocket.send_json({"status": "error", "message": f"Unknown message type: {msg_type}"})
+            
+            except Exception as e:
+                logger.error(f"Error processing WebSocket message: {e}")
+                await websocket.send_json({"status": "error", "message": str(e)})
+    
+    except WebSocketDisconnect:
+        logger.info("Cairo WebSocket client disconnected")
+    except Exception as e:
+        logger.error(f"Cairo WebSocket error: {e}")
@@ -0,0 +1,1039 @@
+"""WordPress/JetAppointments integration API.
+
+Booking management, client/project handling, calendar, customer portal and
+test booking endpoints. The WordPress client is created on first use by
+`get_wordpress_client`, so nothing here talks to WordPress at startup.
+"""
+import logging
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Body, HTTPException
+
+from .. import services
+from ..wordpress import (
+    get_wordpress_client,
+    get_active_booking,
+    set_active_booking,
+    Booking,
+    BookingStatus,
+    ActiveBookingContext,
+    VideoProject,
+    CustomerInfo,
+    ClientInfo,
+    DisplayMode,
+    ContentType,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["wordpress"])
+
+
+def _config():
+    return services.get("config")
+
+
+@router.get("/api/v1/wordpress/status")
+async def get_wordpress_status() -> Dict[str, Any]:
+    """Get WordPress integration status"""
+    config = _config()
+    wp_client = get_wordpress_client(config)
+
+    if not hasattr(config, 'wordpress') or not config.wordpress.enabled:
+        return {
+            "enabled": False,
+            "connected": False,
+            "wordpress_url": config.wordpress.url if hasattr(config, 'wordpress') else '',
+            "error": "WordPress integration is disabled"
+        }
+
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "enabled": True,
+            "connected": False,
+            "wordpress_url": config.wordpress.url if hasattr(config, 'wordpress') else '',
+            "error": "WordPress credentials not configured"
+        }
+    
+    connected = await wp_client.test_connection()
+    
+    return {
+        "enabled": True,
+        "connected": connected,
+        "wordpress_url": wp_client.base_url,
+        "last_sync": datetime.now().isoformat() if connected else None,
+        "error": wp_client._last_error if not connected else None
+    }
+
+
+@router.get("/api/v1/wordpress/health")
+async def get_wordpress_health() -> Dict[str, Any]:
+    """Lightweight health check for WordPress integration routes"""
+    config = _config()
+    wp_enabled = hasattr(config, 'wordpress') and config.wordpress.enabled
+    wp_client = get_wordpress_client(config)
+
+    if not wp_enabled:
+        return {
+            "ok": False,
+            "enabled": False,
+            "configured": False,
+            "checks": [],
+            "error": "WordPress integration is disabled",
+        }
+
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "ok": False,
+            "enabled": True,
+            "configured": False,
+            "checks": [],
+            "error": "WordPress credentials not configured",
+        }
+
+    checks: List[Dict[str, Any]] = []
+    overall_ok = True
+
+    async def run_check(name: str, coro):
+        nonlocal overall_ok
+        start = time.monotonic()
+        try:
+            result = await coro
+            success = True
+            error = None
+        except Exception as e:
+            result = None
+            success = False
+            error = str(e)
+        duration_ms = int((time.monotonic() - start) * 1000)
+        checks.append({
+            "name": name,
+            "success": success,
+            "duration_ms": duration_ms,
+            "error": error,
+        })
+        if not success:
+            overall_ok = False
+        return result
+
+    # Connection/auth check
+    connection_ok = await run_check("status", wp_client.test_connection())
+    if connection_ok is False:
+        overall_ok = False
+        checks[-1]["success"] = False
+        checks[-1]["error"] = wp_client._last_error or "Authentication failed"
+
+    # Appointments list (today, minimal)
+    today = datetime.now().date()
+    await run_check(
+        "appointments_today",
+        wp_client.get_appointments(date_from=today, date_to=today, limit=1, page=1),
+    )
+
+    # Clients list (minimal)
+    clients: List[ClientInfo] = await run_check("clients", wp_client.get_clients(limit=1)) or []
+
+    # Projects for first client (if available)
+    if clients:
+        await run_check("client_projects", wp_client.get_client_projects(clients[0].id))
+
+    return {
+        "ok": overall_ok,
+        "enabled": True,
+        "configured": True,
+        "wordpress_url": wp_client.base_url,
+        "checked_at": datetime.now().isoformat(),
+        "checks": checks,
+    }
+
+
+@router.get("/api/v1/wordpress/appointments")
+async def list_appointments(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    status: Optional[str] = None,
+    page: int = 1,
+    per_page: int = 20
+) -> Dict[str, Any]:
+    """List appointments from JetAppointments"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "bookings": [],
+            "total": 0,
+            "page": page,
+            "per_page": per_page,
+            "warning": "WordPress not configured - set WORDPRESS_USERNAME and WORDPRESS_APP_PASSWORD"
+        }
+    
+    from datetime import date as date_type
+    df = date_type.fromisoformat(date_from) if date_from else None
+    dt = date_type.fromisoformat(date_to) if date_to else None
+
+    booking_status = None
+    if status:
+        try:
+            booking_status = BookingStatus(status)
+        except Exception:
+            booking_status = None
+
+    bookings = await wp_client.get_appointments(
+        date_from=df,
+        date_to=dt,
+        status=booking_status,
+        limit=per_page,
+        page=page,
+    )
+    
+    return {
+        "bookings": [b.dict() for b in bookings],
+        "total": len(bookings),
+        "page": page,
+        "per_page": per_page
+    }
+
+
+@router.get("/api/v1/wordpress/appointments/today")
+async def get_todays_appointments() -> Dict[str, Any]:
+    """Get today's appointments"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "bookings": [],
+            "total": 0,
+            "warning": "WordPress not configured"
+        }
+
+    bookings = await wp_client.get_todays_appointments()
+    return {
+        "bookings": [b.dict() for b in bookings],
+        "total": len(bookings)
+    }
+
+
+@router.get("/api/v1/wordpress/appointments/{appointment_id}")
+async def get_appointment(appointment_id: int) -> Dict[str, Any]:
+    """Get a specific appointment"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        raise HTTPException(status_code=503, detail="WordPress not configured")
+    
+    booking = await wp_client.get_appointment(appointment_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Appointment not found")
+
+    graphics = []
+    if booking.content_id:
+        graphics = await wp_client.get_content_graphics(int(booking.content_id))
+    elif booking.client and booking.client.default_project_id:
+        project = await wp_client.get_video_project(booking.client.default_project_id)
+        if project:
+            graphics = project.graphics
+
+    return {
+        "booking": booking.dict(),
+        "graphics": [g.dict() for g in graphics]
+    }
+
+
+@router.post("/api/v1/wordpress/appointments/{appointment_id}/activate")
+async def activate_appointment(appointment_id: int, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Activate a booking session"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        raise HTTPException(status_code=503, detail="WordPress not configured")
+
+    current = get_active_booking()
+    if current and current.booking.id != appointment_id:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Another booking is already active: {current.booking.id}"
+        )
+
+    booking = await wp_client.get_appointment(appointment_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Appointment not found")
+
+    if not booking.client:
+        raise HTTPException(status_code=400, detail="Booking has no associated client")
+
+    download_graphics = bool(request.get("download_graphics", True))
+
+    project = await wp_client.get_client_default_project(booking.client.id)
+    if not project:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Client {booking.client.name} has no default project configured"
+        )
+
+    recording_title = f"{booking.client.name} - {booking.date} {booking.slot_start}"
+    recording = await wp_client.create_recording(
+        project_id=project.id,
+        booking_id=booking.id,
+        title=recording_title,
+    )
+
+    if not recording:
+        raise HTTPException(status_code=500, detail="Failed to create recording in WordPress")
+
+    base_path = Path("/data/recordings")
+    client_slug = booking.client.slug or "unknown_client"
+    project_slug = project.slug or "unknown_project"
+    recording_path = base_path / "clients" / client_slug / project_slug / str(recording.id)
+    recording_path.mkdir(parents=True, exist_ok=True)
+
+    graphics_paths: List[str] = []
+    if download_graphics and project.graphics:
+        graphics_dir = recording_path / "graphics"
+        graphics_paths = await wp_client.download_graphics(project.graphics, graphics_dir)
+
+    import secrets
+    access_token = secrets.token_urlsafe(32)
+
+    context = ActiveBookingContext(
+        booking=booking,
+        recording_id=recording.id,
+        project=project,
+        recording_path=str(recording_path),
+        graphics_downloaded=len(graphics_paths) > 0,
+        graphics_paths=graphics_paths,
+        access_token=access_token,
+        display_mode=booking.display_mode,
+        teleprompter_script=booking.teleprompter_script,
+    )
+
+    set_active_booking(context)
+    await wp_client.update_appointment_status(appointment_id, BookingStatus.PROCESSING)
+
+    return {
+        "success": True,
+        "booking": booking.dict(),
+        "recording_path": str(recording_path),
+        "graphics_downloaded": len(graphics_paths),
+        "access_token": access_token,
+        "message": f"Booking activated. Recording #{recording.id} created."
+    }
+
+
+@router.get("/api/v1/wordpress/booking/current")
+async def get_current_booking() -> Dict[str, Any]:
+    """Get currently active booking"""
+    context = get_active_booking()
+    if not context:
+        return {"active": False, "booking": None}
+
+    return {
+        "active": True,
+        "booking": context.booking.dict(),
+        "recording_path": context.recording_path,
+        "graphics_downloaded": context.graphics_downloaded,
+        "graphics_paths": context.graphics_paths,
+        "activated_at": context.activated_at.isoformat(),
+    }
+
+
+@router.post("/api/v1/wordpress/appointments/{appointment_id}/complete")
+async def complete_booking(appointment_id: int, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Complete a booking session and optionally upload recordings"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        raise HTTPException(status_code=503, detail="WordPress not configured")
+
+    current = get_active_booking()
+    if not current or current.booking.id != appointment_id:
+        raise HTTPException(status_code=404, detail="Booking is not currently active")
+
+    upload_recordings = bool(request.get("upload_recordings", True))
+    update_status = bool(request.get("update_status", True))
+
+    recordings_uploaded = 0
+    wordpress_updated = False
+
+    if upload_recordings:
+        recording_dir = Path(current.recording_path)
+        if recording_dir.exists():
+            for extension in (".mkv", ".mp4", ".mov"):
+                for recording_file in recording_dir.glob(f"*{extension}"):
+                    media_id = await wp_client.upload_recording(
+                        recording_file,
+                        title=f"Recording - {current.booking.client.name} - {recording_file.stem}" if current.booking.client else recording_file.stem,
+                        parent_post_id=current.recording_id,
+                    )
+                    if media_id:
+                        await wp_client.attach_media_to_recording(current.recording_id, media_id)
+                        recordings_uploaded += 1
+
+    if update_status:
+        wordpress_updated = await wp_client.update_appointment_status(
+            appointment_id,
+            BookingStatus.COMPLETED,
+        )
+
+    set_active_booking(None)
+
+    return {
+        "success": True,
+        "booking_id": appointment_id,
+        "recordings_uploaded": recordings_uploaded,
+        "wordpress_status_updated": wordpress_updated,
+        "message": f"Booking completed. {recordings_uploaded} recordings uploaded."
+    }
+
+
+@router.get("/api/v1/wordpress/clients")
+async def list_clients() -> Dict[str, Any]:
+    """List all WordPress clients"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "clients": [],
+            "total": 0,
+            "warning": "WordPress not configured - set WORDPRESS_USERNAME and WORDPRESS_APP_PASSWORD environment variables"
+        }
+    
+    clients = await wp_client.get_clients()
+    
+    return {
+        "clients": [c.dict() for c in clients],
+        "total": len(clients)
+    }
+
+
+@router.get("/api/v1/wordpress/clients/{client_id}/projects")
+async def list_client_projects(client_id: int) -> Dict[str, Any]:
+    """List projects for a client"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        return {
+            "projects": [],
+            "total": 0,
+            "warning": "WordPress not configured"
+        }
+
+    projects = await wp_client.get_client_projects(client_id)
+    return {"projects": [p.dict() for p in projects], "total": len(projects)}
+
+
+@router.post("/api/v1/wordpress/projects")
+async def create_project(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a new project"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        raise HTTPException(status_code=503, detail="WordPress not configured")
+
+    client_id = request.get("client_id")
+    name = request.get("name")
+    project_type = request.get("type", "podcast")
+
+    if not client_id or not name:
+        raise HTTPException(status_code=400, detail="client_id and name are required")
+
+    project = await wp_client.create_video_project(int(client_id), name, project_type)
+    if not project:
+        raise HTTPException(status_code=500, detail="Failed to create project")
+
+    return {
+        "id": project.id,
+        "name": project.name,
+        "slug": project.slug,
+        "client_id": project.client_id
+    }
+
+
+@router.get("/api/v1/wordpress/calendar/today")
+async def get_calendar_today() -> Dict[str, Any]:
+    """Get today's calendar with time slots"""
+    from datetime import date as date_type, time, timedelta
+    
+    today = date_type.today()
+    wp_client = get_wordpress_client(_config())
+    
+    # Get today's bookings (empty list if WordPress not configured)
+    bookings = []
+    warning = None
+    if not wp_client or not wp_client.is_configured:
+        warning = "WordPress not configured - showing empty slots"
+    else:
+        bookings = await wp_client.get_todays_appointments()
+    
+    # Generate time slots (9 AM to 5 PM, 30-minute intervals)
+    slots = []
+    current_time = time(9, 0)
+    end_time = time(17, 0)
+    
+    while current_time < end_time:
+        slot_start = current_time.strftime("%H:%M")
+        next_time = (datetime.combine(today, current_time) + timedelta(minutes=30)).time()
+        slot_end = next_time.strftime("%H:%M")
+        
+        # Check if this slot has a booking
+        slot_booking = None
+        for booking in bookings:
+            if booking.slot_start <= slot_start < booking.slot_end:
+                slot_booking = booking.dict()
+                break
+        
+        is_lunch = current_time.hour == 12
+        
+        slots.append({
+            "start_time": slot_start,
+            "end_time": slot_end,
+            "available": slot_booking is None and not is_lunch,
+            "booking": slot_booking,
+            "is_lunch": is_lunch
+        })
+        
+        current_time = next_time
+    
+    result = {
+        "date": today.isoformat(),
+        "slots": slots
+    }
+    if warning:
+        result["warning"] = warning
+    return result
+
+
+@router.post("/api/v1/wordpress/calendar/book")
+async def create_walk_in_booking(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a walk-in booking"""
+    wp_client = get_wordpress_client(_config())
+    if not wp_client or not wp_client.is_configured:
+        raise HTTPException(status_code=503, detail="WordPress not configured")
+
+    from datetime import date as date_type
+
+    slot_start = request.get("slot_start")
+    slot_end = request.get("slot_end")
+    customer_name = request.get("customer_name")
+    customer_email = request.get("customer_email")
+    customer_phone = request.get("customer_phone")
+    recording_type = request.get("recording_type", "podcast")
+
+    if not all([slot_start, slot_end, customer_name, customer_email]):
+        raise HTTPException(status_code=400, detail="Missing required fields")
+
+    today = date_type.today()
+
+    try:
+        result = await wp_client._request(
+            "POST",
+            "/jet-apb/v1/appointments",
+            json_data={
+                "date": today.isoformat(),
+                "slot": f"{slot_start}-{slot_end}",
+                "status": "pending",
+                "user_name": customer_name,
+                "user_email": customer_email,
+                "user_phone": customer_phone or "",
+                "meta": {
+                    "recording_type": recording_type,
+                    "walk_in": True,
+                },
+            },
+        )
+        booking_id = result.get("ID") or result.get("id")
+        return {
+            "success": True,
+            "booking_id": booking_id,
+            "message": f"Booking created for {slot_start}-{slot_end}",
+        }
+    except Exception as e:
+        logger.error(f"Failed to create walk-in booking: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/api/v1/wordpress/customer/validate")
+async def validate_customer_token(request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Validate a customer access token"""
+    token = request.get("token")
+    if not token:
+        raise HTTPException(status_code=400, detail="Token is required")
+
+    context = get_active_booking()
+    if not context:
+        return {"valid": False, "error": "No active booking session"}
+
+    if context.access_token != token:
+        return {"valid": False, "error": "Invalid or expired token"}
+
+    return {
+        "valid": True,
+        "booking": context.booking.dict(),
+        "project": context.project.dict(),
+    }
+
+
+@router.get("/api/v1/wordpress/customer/{token}/status")
+async def get_customer_status(token: str) -> Dict[str, Any]:
+    """Get customer portal status"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid token or no active booking")
+
+    disk_space_gb = 0.0
+    try:
+        disk_usage = shutil.disk_usage("/data")
+        disk_space_gb = disk_usage.free / (1024 ** 3)
+    except Exception:
+        try:
+            disk_usage = shutil.disk_usage("/")
+            disk_space_gb = disk_usage.free / (1024 ** 3)
+        except Exception as e:
+            logger.warning(f"Failed to read disk usage: {e}")
+
+    return {
+        "booking": context.booking.dict(),
+        "project": context.project.dict(),
+        "recording_active": False,
+        "recording_duration_ms": 0,
+        "current_slide_index": 0,
+        "total_slides": len(context.project.graphics),
+        "disk_space_gb": disk_space_gb,
+        "display_mode": context.display_mode.value,
+        "teleprompter_script": context.teleprompter_script,
+        "teleprompter_scroll_speed": context.teleprompter_scroll_speed,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/recording/start")
+async def customer_start_recording(token: str) -> Dict[str, Any]:
+    """Start recording from customer portal"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    
+    # Trigger recording start
+    logger.info(f"Customer initiated recording start for booking #{context.booking.id}")
+    return {
+        "success": True,
+        "message": "Recording started",
+        "recording_path": context.recording_path,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/recording/stop")
+async def customer_stop_recording(token: str) -> Dict[str, Any]:
+    """Stop recording from customer portal"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    
+    logger.info(f"Customer initiated recording stop for booking #{context.booking.id}")
+    return {"success": True, "message": "Recording stopped"}
+
+
+@router.post("/api/v1/wordpress/customer/{token}/presentation/goto/{index}")
+async def customer_goto_slide(token: str, index: int) -> Dict[str, Any]:
+    """Jump to a specific slide in the presentation"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if index < 0 or index >= len(context.project.graphics):
+        raise HTTPException(status_code=400, detail="Invalid slide index")
+
+    logger.info(f"Customer navigated to slide {index} for booking #{context.booking.id}")
+    return {
+        "success": True,
+        "current_index": index,
+        "total_slides": len(context.project.graphics),
+    }
+
+
+@router.get("/api/v1/wordpress/customer/{token}/display-mode")
+async def get_display_mode(token: str) -> Dict[str, Any]:
+    """Get display mode for studio display"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+    
+    return {
+        "display_mode": context.display_mode.value,
+        "content_type": context.booking.content_type.value if context.booking.content_type else None
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/teleprompter/script")
+async def update_teleprompter_script(token: str, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Update teleprompter script for the active booking"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if context.display_mode != DisplayMode.TELEPROMPTER:
+        raise HTTPException(status_code=400, detail="Not in teleprompter mode")
+
+    script = request.get("script", "")
+    context.teleprompter_script = script
+    logger.info(f"Updated teleprompter script for booking #{context.booking.id}")
+
+    return {
+        "success": True,
+        "script_length": len(script),
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/teleprompter/speed")
+async def set_teleprompter_speed(token: str, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Set teleprompter scroll speed (1-100)"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if context.display_mode != DisplayMode.TELEPROMPTER:
+        raise HTTPException(status_code=400, detail="Not in teleprompter mode")
+
+    speed = int(request.get("speed", 50))
+    if speed < 1 or speed > 100:
+        raise HTTPException(status_code=400, detail="Speed must be between 1 and 100")
+
+    context.teleprompter_scroll_speed = speed
+    logger.info(f"Set teleprompter speed to {speed} for booking #{context.booking.id}")
+
+    return {
+        "success": True,
+        "speed": speed,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/teleprompter/scroll")
+async def scroll_teleprompter(token: str, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Scroll teleprompter manually (up/down)"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if context.display_mode != DisplayMode.TELEPROMPTER:
+        raise HTTPException(status_code=400, detail="Not in teleprompter mode")
+
+    direction = request.get("direction", "down")
+    if direction not in ["up", "down"]:
+        raise HTTPException(status_code=400, detail="Invalid direction")
+
+    # In a real implementation, this would send a websocket message to the display
+    # For now, we'll log it and let the display poll for updates if we store state
+    # But scroll position is transient, so polling isn't great.
+    # We might need a command queue or similar.
+    # Assuming for now we just log it as the frontend implementation is a control surface.
+    
+    logger.info(f"Scroll teleprompter {direction} for booking #{context.booking.id}")
+
+    return {
+        "success": True,
+        "direction": direction,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/teleprompter/jump-to")
+async def jump_teleprompter(token: str, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Jump teleprompter to position (top/bottom)"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if context.display_mode != DisplayMode.TELEPROMPTER:
+        raise HTTPException(status_code=400, detail="Not in teleprompter mode")
+
+    position = request.get("position", "top")
+    if position not in ["top", "bottom"]:
+        raise HTTPException(status_code=400, detail="Invalid position")
+
+    logger.info(f"Jump teleprompter to {position} for booking #{context.booking.id}")
+
+    return {
+        "success": True,
+        "position": position,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/teleprompter/text-size")
+async def set_teleprompter_text_size(token: str, request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Set teleprompter text size (1-5)"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    if context.display_mode != DisplayMode.TELEPROMPTER:
+        raise HTTPException(status_code=400, detail="Not in teleprompter mode")
+
+    size = int(request.get("size", 3))
+    if size < 1 or size > 5:
+        raise HTTPException(status_code=400, detail="Size must be between 1 and 5")
+
+    # Store text size in context (need to add field to ActiveBookingContext if persistent)
+    # For now, we'll just log it
+    logger.info(f"Set teleprompter text size to {size} for booking #{context.booking.id}")
+
+    return {
+        "success": True,
+        "size": size,
+    }
+
+
+@router.post("/api/v1/wordpress/customer/{token}/activate")
+async def activate_session(token: str) -> Dict[str, Any]:
+    """Activate session and switch TV display"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    # Determine TV route based on display mode
+    path = "/podcast"
+    if context.display_mode == DisplayMode.TELEPROMPTER:
+        path = "/talking-head"
+    elif context.display_mode == DisplayMode.COURSE:
+        path = "/course"
+    elif context.display_mode == DisplayMode.WEBINAR:
+        path = "/webinar"
+    
+    # Switch TV display
+    script_path = "/opt/preke-r58-recorder/scripts/switch-tv-display.sh"
+    try:
+        import subprocess
+        result = subprocess.run(
+            [script_path, path],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode == 0:
+            logger.info(f"Session activated, TV switched to {path}")
+            return {
+                "success": True,
+                "message": "Session activated",
+                "display_path": path
+            }
+        else:
+            logger.error(f"Failed to switch TV: {result.stderr}")
+            # Still return success for session activation, but warn about TV
+            return {
+                "success": True,
+                "message": "Session activated (TV switch failed)",
+                "error": result.stderr
+            }
+    except Exception as e:
+        logger.error(f"Error activating session: {e}")
+        return {
+            "success": True,
+            "message": "Session activated (TV switch error)",
+            "error": str(e)
+        }
+
+
+@router.get("/api/v1/wordpress/customer/{token}/vdoninja/status")
+async def check_vdoninja_status(token: str) -> Dict[str, Any]:
+    """Check if VDO.ninja VPS is available"""
+    context = get_active_booking()
+    if not context or context.access_token != token:
+        raise HTTPException(status_code=404, detail="Invalid or expired token")
+
+    vdoninja_settings = getattr(_config(), "vdoninja", None)
+    vdoninja_enabled = bool(vdoninja_settings and getattr(vdoninja_settings, "enabled", False))
+    if not vdoninja_enabled:
+        return {
+            "available": False,
+            "error": "VDO.ninja VPS is disabled",
+        }
+
+    host = None
+    if vdoninja_settings:
+        host = getattr(vdoninja_settings, "url", None) or getattr(vdoninja_settings, "host", None)
+        if host and not host.startswith("http"):
+            host = f"https://{host}"
+
+    return {
+        "available": True,
+        "url": host,
+        "error": None,
+    }
+
+
+@router.post("/api/v1/wordpress/qr-session")
+async def create_qr_session(request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Create a QR code session for quick access without a booking"""
+    import secrets
+    
+    # Check for existing active booking to get display_mode
+    existing_context = get_active_booking()
+    if existing_context and existing_context.display_mode:
+        # Use display mode from active booking
+        display_mode = existing_context.display_mode
+    else:
+        # Default to podcast if no active booking
+        display_mode = DisplayMode.PODCAST
+    
+    # Generate access token
+    access_token = secrets.token_urlsafe(32)
+    
+    # Create a minimal booking for QR sessions
+    booking = Booking(
+        id=0,  # No real booking ID
+        status=BookingStatus.PENDING,
+        date=datetime.now().strftime("%Y-%m-%d"),
+        slot_start=datetime.now().strftime("%H:%M"),
+        slot_end=(datetime.now() + timedelta(hours=1)).strftime("%H:%M"),
+        customer=CustomerInfo(id=0, name="QR Session User", email="qr@preke.no"),
+        client=None,
+        content_type=None
+    )
+    
+    # Create a default project
+    project = VideoProject(
+        id=0,
+        slug="qr-session",
+        name="QR Session",
+        client_id=None
+    )
+    
+    # Create recording path
+    recording_path = f"/data/recordings/qr-sessions/{access_token[:8]}"
+    
+    # Create active booking context
+    context = ActiveBookingContext(
+        booking=booking,
+        recording_id=0,
+        project=project,
+        recording_path=recording_path,
+        access_token=access_token,
+        display_mode=display_mode
+    )
+    
+    # Set as active booking
+    set_active_booking(context)
+    
+    return {
+        "success": True,
+        "token": access_token,
+        "display_mode": display_mode.value,
+        "message": "QR session created"
+    }
+
+
+@router.post("/api/v1/test/create-booking")
+async def create_test_booking(request: Dict[str, Any] = Body({})) -> Dict[str, Any]:
+    """Create a test/dummy booking for development and testing.
+    
+    Request body:
+        mode: Display mode - "podcast", "teleprompter", "webinar", or "course"
+        customer_name: Optional customer name (default: "Test Customer")
+        client_name: Optional client name (default: "Test Client")
+        duration_hours: Optional duration in hours (default: 1)
+        teleprompter_script: Optional script for teleprompter mode
+    
+    Returns:
+        token: Access token to use with /customer/{token} route
+        display_mode: The display mode set
+        qr_url: Full URL to the customer portal (for QR code testing)
+    """
+    import secrets
+    
+    mode_str = request.get("mode", "podcast").lower()
+    customer_name = request.get("customer_name", "Test Customer")
+    client_name = request.get("client_name", "Test Client")
+    duration_hours = request.get("duration_hours", 1)
+    teleprompter_script = request.get("teleprompter_script", "This is a sample teleprompter script.\n\nYou can edit this in the customer portal.\n\nThe text will scroll automatically.")
+    
+    # Map mode string to DisplayMode enum
+    mode_map = {
+        "podcast": DisplayMode.PODCAST,
+        "teleprompter": DisplayMode.TELEPROMPTER,
+        "talking-head": DisplayMode.TELEPROMPTER,
+        "talking_head": DisplayMode.TELEPROMPTER,
+        "course": DisplayMode.TELEPROMPTER,  # Course uses teleprompter display
+        "webinar": DisplayMode.WEBINAR,
+    }
+    
+    display_mode = mode_map.get(mode_str, DisplayMode.PODCAST)
+    
+    # Generate access token
+    access_token = secrets.token_urlsafe(32)
+    
+    # Create test booking
+    booking = Booking(
+        id=99999,  # Test booking ID
+        status=BookingStatus.PROCESSING,  # PROCESSING = active booking
+        date=datetime.now().strftime("%Y-%m-%d"),
+        slot_start=datetime.now().strftime("%H:%M"),
+        slot_end=(datetime.now() + timedelta(hours=duration_hours)).strftime("%H:%M"),
+        customer=CustomerInfo(id=99999, name=customer_name, email="test@preke.no"),
+        client=ClientInfo(id=99999, slug=client_name.lower().replace(" ", "-"), name=client_name) if client_name else None,
+        content_type=ContentType.COURSE if mode_str == "course" else ContentType.VIDEO_PROJECT
+    )
+    
+    # Create test project
+    project = VideoProject(
+        id=99999,
+        slug=f"test-{mode_str}-{access_token[:8]}",
+        name=f"Test {mode_str.title()} Session",
+        client_id=99999 if client_name else None
+    )
+    
+    # Create recording path
+    recording_path = f"/data/recordings/test-sessions/{access_token[:8]}"
+    
+    # Create active booking context
+    context = ActiveBookingContext(
+        booking=booking,
+        recording_id=99999,
+        project=project,
+        recording_path=recording_path,
+        access_token=access_token,
+        display_mode=display_mode,
+        teleprompter_script=teleprompter_script if display_mode == DisplayMode.TELEPROMPTER else None,
+        teleprompter_scroll_speed=50
+    )
+    
+    # Set as active booking
+    set_active_booking(context)
+    
+    logger.info(f"Created test booking: mode={display_mode.value}, token={access_token[:16]}...")
+    
+    return {
+        "success": True,
+        "token": access_token,
+        "display_mode": display_mode.value,
+        "customer_name": customer_name,
+        "client_name": client_name,
+        "qr_url": f"https://app.itagenten.no/#/customer/{access_token}",
+        "message": f"Test {mode_str} booking created. Scan QR code or visit qr_url to test customer portal."
+    }
+
+
+@router.get("/api/v1/test/booking-modes")
+async def list_test_booking_modes() -> Dict[str, Any]:
+    """List available display modes for test bookings.
+    
+    Returns info about each mode and how to create test bookings.
+    """
+    return {
+        "modes": {
+            "podcast": {
+                "description": "Podcast recording mode - presentation controls, recording",
+                "display_mode": "podcast",
+                "example": {"mode": "podcast", "customer_name": "Podcast Guest"}
+            },
+            "teleprompter": {
+                "description": "Talking head mode - teleprompter controls, script editing",
+                "display_mode": "teleprompter",
+                "example": {"mode": "teleprompter", "customer_name": "Speaker"}
+            },
+            "course": {
+                "description": "Course recording mode - same as teleprompter but for courses",
+                "display_mode": "teleprompter",
+                "example": {"mode": "course", "customer_name": "Instructor"}
+            },
+            "webinar": {
+                "description": "Webinar mode - VDO.ninja integration, invite links",
+                "display_mode": "webinar",
+                "example": {"mode": "webinar", "customer_name": "Host"}
+            }
+        },
+        "create_endpoint": "POST /api/v1/test/create-booking",
+        "current_booking": get_active_booking().dict() if get_active_booking() else None
+    }
@@ -0,0 +1,142 @@
+"""Lazily initialized application services.
+
+Heavy subsystems (GStreamer mixer, Cairo graphics, Reveal.js/WPE renderer,
+graphics plugin) are registered as factories at startup and only constructed
+the first time an endpoint asks for them. This keeps service restarts fast:
+the API answers as soon as the cheap core (config, ingest, recorder, database)
+is ready.
+
+Usage:
+    from . import services
+
+    services.provide("config", config)
+    services.register("cairo", _create_cairo_manager)
+
+    cairo_manager = services.get("cairo")   # constructed on first call
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyService:
+    """Holds a single service instance created on first access.
+
+    A factory that raises or returns None marks the service as unavailable;
+    the failure is cached so a broken subsystem is not retried on every
+    request (call reset() to retry).
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self._factory = factory
+        self._instance: Any = None
+        self._initialized = False
+        self._error: Optional[str] = None
+        self._init_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Return the service instance, creating it if needed."""
+        if self._initialized:
+            return self._instance
+
+        with self._lock:
+            if self._initialized:
+                return self._instance
+
+            start = time.perf_counter()
+            try:
+                self._instance = self._factory()
+            except Exception as e:
+                logger.error(f"Failed to initialize service '{self.name}': {e}")
+                self._instance = None
+                self._error = str(e)
+            self._init_seconds = time.perf_counter() - start
+            self._initialized = True
+
+            if self._instance is not None:
+                logger.info(f"Service '{self.name}' initialized in {self._init_seconds * 1000:.1f}ms")
+            return self._instance
+
+    def peek(self) -> Any:
+        """Return the instance only if it has already been created."""
+        return self._instance if self._initialized else None
+
+    def reset(self) -> None:
+        """Forget the cached instance (next get() re-runs the factory)."""
+        with self._lock:
+            self._instance = None
+            self._initialized = False
+            self._error = None
+            self._init_seconds = None
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "initialized": self._initialized,
+            "available": self._instance is not None if self._initialized else None,
+            "init_ms": round(self._init_seconds * 1000, 2) if self._init_seconds is not None else None,
+            "error": self._error,
+        }
+
+
+class _ProvidedService(LazyService):
+    """A service whose instance was created eagerly by the caller."""
+
+    def __init__(self, name: str, instance: Any):
+        super().__init__(name, lambda: instance)
+        self._instance = instance
+        self._initialized = True
+        self._init_seconds = 0.0
+
+
+_services: Dict[str, LazyService] = {}
+_registry_lock = threading.Lock()
+
+
+def register(name: str, factory: Callable[[], Any]) -> LazyService:
+    """Register a lazily constructed service."""
+    service = LazyService(name, factory)
+    with _registry_lock:
+        _services[name] = service
+    return service
+
+
+def provide(name: str, instance: Any) -> LazyService:
+    """Register an already constructed service instance."""
+    service = _ProvidedService(name, instance)
+    with _registry_lock:
+        _services[name] = service
+    return service
+
+
+def get(name: str) -> Any:
+    """Get a service instance, initializing it on first use.
+
+    Returns None for unknown or unavailable services.
+    """
+    service = _services.get(name)
+    if service is None:
+        return None
+    return service.get()
+
+
+def peek(name: str) -> Any:
+    """Get a service instance only if it is already initialized."""
+    service = _services.get(name)
+    if service is None:
+        return None
+    return service.peek()
+
+
+def get_status() -> Dict[str, Dict[str, Any]]:
+    """Get initialization status of all registered services."""
+    with _registry_lock:
+        return {name: service.get_status() for name, service in _services.items()}
@@ -0,0 +1,208 @@
+"""Import-time profiling for API cold start.
+
+Records how long each module takes to import while `src.main` is loading,
+in the same shape as `python -X importtime` (self and cumulative
+microseconds per module), plus named startup phases. The report is kept in
+memory and served by `/api/system/startup` so slow restarts can be traced
+to the import that caused them.
+
+Usage:
+    from .startup_profile import get_startup_profiler
+
+    profiler = get_startup_profiler()
+    profiler.start()
+    ...                      # imports happen here
+    profiler.mark("config_loaded")
+    profiler.stop()
+    profiler.get_report()
+"""
+import importlib.abc
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportRecord:
+    """Timing for a single module import."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module and then steps out of the way."""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        profiler = self._profiler
+        profiler._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            profiler._exit(module.__name__, time.perf_counter() - start)
+            # Restore the real loader so importlib.resources and friends
+            # see the original object after import.
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loader found by the other finders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._local.busy = False
+
+
+class StartupProfiler:
+    """Collects import timings and startup phases for one process."""
+
+    def __init__(self):
+        self._finder: Optional[_TimingFinder] = None
+        self._records: List[ImportRecord] = []
+        self._child_time: List[float] = []  # Stack of nested import time
+        self._phases: List[Dict[str, Any]] = []
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start recording imports (idempotent)."""
+        if self._finder is not None:
+            return
+        self._start_time = time.perf_counter()
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        """Stop recording imports and log a short summary."""
+        if self._finder is None:
+            return
+        try:
+            sys.meta_path.remove(self._finder)
+        except ValueError:
+            pass
+        self._finder = None
+        self._end_time = time.perf_counter()
+
+        slowest = self.get_slowest_imports(5)
+        summary = ", ".join(f"{r.module}={r.cumulative_us / 1000:.0f}ms" for r in slowest)
+        logger.info(f"API startup took {self.total_seconds * 1000:.0f}ms (slowest imports: {summary})")
+
+    def mark(self, phase: str) -> None:
+        """Record a named startup phase at the current time."""
+        if self._start_time is None:
+            return
+        self._phases.append({
+            "phase": phase,
+            "at_ms": round((time.perf_counter() - self._start_time) * 1000, 2),
+        })
+
+    def _enter(self) -> None:
+        with self._lock:
+            self._child_time.append(0.0)
+
+    def _exit(self, module: str, elapsed: float) -> None:
+        with self._lock:
+            children = self._child_time.pop() if self._child_time else 0.0
+            depth = len(self._child_time)
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            self._records.append(ImportRecord(
+                module=module,
+                self_us=int((elapsed - children) * 1_000_000),
+                cumulative_us=int(elapsed * 1_000_000),
+                depth=depth,
+            ))
+
+    @property
+    def total_seconds(self) -> float:
+        if self._start_time is None:
+            return 0.0
+        end = self._end_time if self._end_time is not None else time.perf_counter()
+        return end - self._start_time
+
+    def get_slowest_imports(self, limit: int = 20) -> List[ImportRecord]:
+        """Get the imports with the highest cumulative time."""
+        with self._lock:
+            records = list(self._records)
+        return sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+    def format_importtime(self) -> str:
+        """Format records like `python -X importtime` output."""
+        with self._lock:
+            records = list(self._records)
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for r in records:
+            lines.append(f"import time: {r.self_us:>9} | {r.cumulative_us:>10} | {'  ' * r.depth}{r.module}")
+        return "\n".join(lines)
+
+    def get_report(self, limit: int = 20) -> Dict[str, Any]:
+        """Get startup report for the API."""
+        with self._lock:
+            module_count = len(self._records)
+            total_import_us = sum(r.cumulative_us for r in self._records if r.depth == 0)
+        return {
+            "recording": self._finder is not None,
+            "total_ms": round(self.total_seconds * 1000, 2),
+            "import_ms": round(total_import_us / 1000, 2),
+            "modules_imported": module_count,
+            "phases": list(self._phases),
+            "slowest_imports": [
+                {
+                    "module": r.module,
+                    "self_ms": round(r.self_us / 1000, 2),
+                    "cumulative_ms": round(r.cumulative_us / 1000, 2),
+                }
+                for r in self.get_slowest_imports(limit)
+            ],
+        }
+
+
+# Global instance for easy access
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the global startup profiler instance."""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
@@ -0,0 +1,55 @@
+"""Tests for the mixer source availability service."""
+import unittest
+from types import SimpleNamespace
+
+from src.mixer.availability import SourceAvailability, parse_ready_paths
+
+
+class TestSourceAvailability(unittest.TestCase):
+    """Test path parsing and in-memory lookups (no MediaMTX needed)."""
+
+    def test_parse_ready_paths(self):
+        """Test both MediaMTX ready field names and unpublished paths."""
+        payload = {"items": [
+            {"name": "cam1", "ready": True},
+            {"name": "guest1", "ready": False},
+            {"name": "guest2", "sourceReady": True},
+        ]}
+        self.assertEqual(parse_ready_paths(payload), {"cam1", "guest2"})
+        self.assertEqual(parse_ready_paths({"items": None}), set())
+
+    def test_lookups_do_no_io(self):
+        """Test that checks read the polled view and ingest state only."""
+        ingest = SimpleNamespace(states={"cam1": "streaming", "cam2": "no_signal"})
+        availability = SourceAvailability(ingest, api_url="http://127.0.0.1:1")
+        self.assertFalse(availability.is_path_ready("guest1"))  # never polled
+        self.assertTrue(availability.is_ingest_streaming("cam1"))
+        self.assertFalse(availability.is_ingest_streaming("cam2"))
+
+    def test_unreachable_api_keeps_last_view(self):
+        """Test that a failed poll neither clears paths nor fires listeners."""
+        availability = SourceAvailability(api_url="http://127.0.0.1:1")
+        availability._ready_paths = {"guest1"}
+        fired = []
+        availability.add_ready_listener(fired.append)
+        availability.refresh()
+        self.assertTrue(availability.is_path_ready("guest1"))
+        self.assertEqual(fired, [])
+        self.assertIsNotNone(availability.get_status()["error"])
+
+    def test_restart_leaves_one_poll_thread(self):
+        """Test that a quick stop/start does not leave the old poll loop running."""
+        availability = SourceAvailability(interval=60.0)
+        availability.refresh = lambda: None
+        availability.start()
+        first = availability._thread
+        availability.stop()
+        availability.start()
+        first.join(timeout=1.0)
+        self.assertFalse(first.is_alive())
+        self.assertTrue(availability._thread.is_alive())
+        availability.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for compositor backend selection."""
+import importlib.util
+import shutil
+import tempfile
+import unittest
+
+from src.mixer.backends import (
+    BACKENDS,
+    DEFAULT_BACKEND,
+    build_baseline_pipeline_str,
+    build_benchmark_pipeline_str,
+    get_backend,
+    load_benchmark,
+    save_benchmark,
+    select_backend,
+)
+from src.mixer.scenes import SceneManager
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test backend choice and pipeline strings without GStreamer."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.quad = SceneManager(scenes_dir=self.temp_dir).get_scene("quad")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_fastest_successful_backend_wins(self):
+        """Test that failed runs are ignored and the lowest ms/frame is chosen."""
+        self.assertEqual(select_backend({"software": 12.5, "gl": 4.0}), "gl")
+        self.assertEqual(select_backend({"software": 12.5, "gl": None}), "software")
+        self.assertEqual(select_backend({}), DEFAULT_BACKEND)
+
+    def test_unknown_backend_rejected(self):
+        """Test that a misspelled backend name raises."""
+        with self.assertRaises(ValueError):
+            get_backend("metal")
+
+    def test_gl_output_downloads_before_overlays(self):
+        """Test that GL output is back in system memory at the output size."""
+        self.assertEqual(BACKENDS["gl"].output_str(1920, 1080), "gldownload ! video/x-raw,width=1920,height=1080")
+        self.assertEqual(BACKENDS["software"].output_str(1920, 1080), "video/x-raw,width=1920,height=1080")
+
+    def test_benchmark_pipeline_feeds_every_slot(self):
+        """Test that the benchmark drives one videotestsrc per scene slot."""
+        pipeline = build_benchmark_pipeline_str(BACKENDS["software"], self.quad, (1920, 1080), 10)
+        self.assertEqual(pipeline.count("videotestsrc num-buffers=10"), 4)
+        self.assertIn("mix.sink_3", pipeline)
+        self.assertTrue(pipeline.startswith("compositor name=mix"))
+
+    def test_benchmark_sources_are_prescaled(self):
+        """Test that sources come at slot size, so only the compositor is timed."""
+        pipeline = build_benchmark_pipeline_str(BACKENDS["software"], self.quad, (1920, 1080), 10)
+        self.assertEqual(pipeline.count("width=960,height=540"), 4)
+        self.assertNotIn("videoscale", pipeline)
+        baseline = build_baseline_pipeline_str(self.quad, 10)
+        self.assertEqual(baseline.count("fakesink"), 4)
+        self.assertNotIn("compositor", baseline)
+
+    def test_saved_benchmark_reused_only_for_same_key(self):
+        """Test that a saved result is returned for its key and ignored otherwise."""
+        path = f"{self.temp_dir}/benchmark.json"
+        key = {"resolution": "1920x1080", "backends": ["gl", "software"], "gstreamer": "1.22"}
+        self.assertIsNone(load_benchmark(path, key))
+        save_benchmark(path, key, {"software": 9.0, "gl": None})
+        self.assertEqual(load_benchmark(path, key), {"software": 9.0, "gl": None})
+        self.assertIsNone(load_benchmark(path, {**key, "resolution": "1280x720"}))
+
+
+@unittest.skipUnless(importlib.util.find_spec("gi"), "GStreamer Python bindings not installed")
+class TestBackendBenchmark(unittest.TestCase):
+    """Run the videotestsrc benchmark on the software compositor."""
+
+    def test_software_benchmark_runs(self):
+        """Test that the benchmark reaches EOS and reports a timing."""
+        from src.gst_utils import ensure_gst_initialized, get_gst
+        from src.mixer.backends import benchmark_backend
+
+        if not ensure_gst_initialized():
+            self.skipTest("GStreamer not available")
+        temp_dir = tempfile.mkdtemp()
+        try:
+            scene = SceneManager(scenes_dir=temp_dir).get_scene("quad")
+            ms = benchmark_backend(get_gst(), BACKENDS["software"], [scene], (640, 360), frames=10)
+        finally:
+            shutil.rmtree(temp_dir)
+        self.assertIsNotNone(ms)
+        self.assertGreater(ms, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,333 @@
+"""Tests for Cairo graphics element caching, timelines, the registry and the draw budget."""
+import statistics
+import threading
+import time
+import unittest
+from operator import methodcaller
+
+from src.cairo_graphics import CairoGraphicsManager, GraphicsElement, LowerThird, Scoreboard, Ticker, Timer
+from src.cairo_graphics.animations import ease_out_bounce
+from src.cairo_graphics.layer import GraphicsLayer, snap_rect
+from src.cairo_graphics.profiling import OVER_BUDGET_FRAMES, DrawProfiler, DrawStats
+from src.cairo_graphics.timeline import EASINGS, Timeline
+
+SECOND = 1_000_000_000
+
+
+class RecordingElement(GraphicsElement):
+    """Records the score it saw at each draw (stands in for real drawing)."""
+
+    def __init__(self, element_id):
+        super().__init__(element_id=element_id)
+        self.home = 0
+        self.away = 0
+        self.torn_frames = 0
+
+    def set_score(self, score):
+        self.home = score
+        time.sleep(0)  # Yield mid-update: a frame drawn now would see a torn score
+        self.away = score
+
+    def draw(self, context, timestamp):
+        if self.home != self.away:
+            self.torn_frames += 1
+
+
+class BoxElement(GraphicsElement):
+    """A static box that reports a redraw only when told to."""
+
+    def __init__(self, element_id, x, y, width=100, height=50):
+        super().__init__(element_id=element_id, x=x, y=y, visible=True, animation_state="visible")
+        self.width = width
+        self.height = height
+        self.changed = False
+
+    def needs_redraw(self, timestamp):
+        return self.changed
+
+
+class SlowElement(GraphicsElement):
+    """Takes a fixed time to draw."""
+
+    def __init__(self, element_id, seconds):
+        super().__init__(element_id=element_id, visible=True, animation_state="visible")
+        self.seconds = seconds
+
+    def draw(self, context, timestamp):
+        if self.seconds:
+            time.sleep(self.seconds)
+
+
+def make_manager(**kwargs):
+    manager = CairoGraphicsManager(**kwargs)
+    manager._enabled = True  # Elements draw without Cairo
+    return manager
+
+
+class TestSurfaceCache(unittest.TestCase):
+    """Test when cached surfaces go stale (no Cairo needed)."""
+
+    def test_updates_mark_surface_dirty(self):
+        """Test that every content update invalidates the cached surface."""
+        cases = [
+            (LowerThird("lt"), lambda e: e.update(name="Jane Smith")),
+            (Scoreboard("sb"), lambda e: e.update_score(team1_score=1)),
+            (Ticker("tk", text="Breaking"), lambda e: e.update_text("News")),
+        ]
+        for element, update in cases:
+            element._dirty = False
+            update(element)
+            self.assertTrue(element._dirty, type(element).__name__)
+
+    def test_timer_key_changes_once_per_displayed_second(self):
+        """Test that a running timer re-renders only when MM:SS changes."""
+        timer = Timer("t", duration=12.0, warning_threshold=10.0)
+        timer.start(SECOND)
+        keys = {timer._cache_key(SECOND + frame * SECOND // 30) for frame in range(30)}
+        self.assertEqual(keys, {("00:12", False), ("00:11", False)})
+        self.assertEqual(timer._cache_key(3 * SECOND), ("00:10", True))
+
+
+    def test_ticker_loops_without_gap(self):
+        """Test that ticker copies follow each other exactly one loop width apart."""
+        ticker = Ticker("tk", text="Breaking", x=0, width=1000)
+        ticker.loop_width = 300.0
+        self.assertEqual(ticker.strip_positions(), [])  # Not scrolled in yet
+        ticker.scroll_offset = 100.0
+        self.assertEqual(ticker.strip_positions(), [900.0])
+        for offset in (1000.0, 1234.5, 10 * 300.0 + 1000.0):
+            ticker.scroll_offset = offset
+            positions = ticker.strip_positions()
+            self.assertLessEqual(positions[0], 0.0)
+            self.assertGreater(positions[0], -300.0)
+            self.assertGreaterEqual(positions[-1] + 300.0, 1000.0)
+            self.assertTrue(all(b - a == 300.0 for a, b in zip(positions, positions[1:])))
+
+
+class TestTimeline(unittest.TestCase):
+    """Test keyframe evaluation and the idle-element skip (no Cairo needed)."""
+
+    def test_easing_table_matches_curve(self):
+        """Test that the precomputed easing table tracks the easing function."""
+        for i in range(101):
+            self.assertAlmostEqual(EASINGS["ease_out_bounce"](i / 100), ease_out_bounce(i / 100), places=4)
+
+    def test_tracks_interpolate_numbers_and_colors(self):
+        """Test eased numeric values and per-component tuple values."""
+        timeline = Timeline.from_dict({"tracks": {
+            "alpha": [[0, 0.0, "linear"], [1, 1.0]],
+            "bg_color": [[0, [0, 0, 0]], [2, [1, 0.5, 0]]],
+        }})
+        timeline.start(SECOND)
+        values = timeline.evaluate(2 * SECOND)
+        self.assertAlmostEqual(values["alpha"], 1.0)
+        self.assertEqual(values["bg_color"], (0.5, 0.25, 0.0))
+        self.assertFalse(timeline.finished(2 * SECOND))
+        self.assertTrue(timeline.finished(3 * SECOND))
+
+    def test_lower_third_enters_then_goes_idle(self):
+        """Test that the enter timeline completes the show and stops evaluating."""
+        lower_third = LowerThird("lt", x=50, animation_duration=0.5)
+        lower_third.show(SECOND)
+        self.assertEqual(lower_third.get_transform(SECOND)[0], -600)
+        self.assertTrue(lower_third.needs_redraw(SECOND))
+        self.assertEqual(lower_third.get_transform(2 * SECOND), (50, 900, 1.0, 1.0))
+        self.assertEqual(lower_third.animation_state, "visible")
+        self.assertFalse(lower_third.animating)
+        lower_third._dirty = False
+        lower_third._surface_key = lower_third._cache_key(3 * SECOND)
+        self.assertFalse(lower_third.needs_redraw(3 * SECOND))
+
+    def test_exit_timeline_hides_element(self):
+        """Test that hiding runs the exit timeline before the element disappears."""
+        lower_third = LowerThird("lt", animation_duration=0.5)
+        lower_third.show(SECOND)
+        lower_third.hide(2 * SECOND)
+        self.assertEqual(lower_third.animation_state, "exiting")
+        lower_third.get_transform(2 * SECOND + SECOND // 4)
+        self.assertTrue(lower_third.visible)
+        lower_third.get_transform(3 * SECOND)
+        self.assertFalse(lower_third.visible)
+        self.assertEqual(lower_third.animation_state, "hidden")
+
+    def test_invalid_tracks_are_rejected(self):
+        """Test that tracks must name an animatable property with matching values."""
+        lower_third = LowerThird("lt")
+        with self.assertRaises(ValueError):
+            lower_third.check_timelines(enter=Timeline.from_dict({"tracks": {"nope": [[0, 1]]}}))
+        with self.assertRaises(ValueError):
+            lower_third.check_timelines(enter=Timeline.from_dict({"tracks": {"x": [[0, [1, 2]]]}}))
+        with self.assertRaises(ValueError):
+            Timeline.from_dict({"tracks": {"x": [[0, 1, "wobble"]]}})
+
+
+class TestRegistry(unittest.TestCase):
+    """Test that the draw callback is isolated from API calls."""
+
+    def test_draw_does_not_wait_for_writers(self):
+        """Test that a frame is drawn while a writer holds the registry lock."""
+        manager = make_manager()
+        manager.add_element("a", RecordingElement("a"))
+        with manager._lock:
+            drawer = threading.Thread(target=manager.draw_callback, args=(None, None, 0, 0))
+            drawer.start()
+            drawer.join(timeout=1.0)
+            self.assertFalse(drawer.is_alive())
+
+    def test_mutations_apply_at_frame_boundary(self):
+        """Test that queued updates wait for the next frame while frames are drawn."""
+        manager = make_manager()
+        element = RecordingElement("a")
+        manager.add_element("a", element)
+        manager.draw_callback(None, None, 0, 0)
+        self.assertTrue(manager.apply("a", methodcaller("set_score", 3)))
+        self.assertEqual(element.home, 0)
+        manager.draw_callback(None, None, 0, 0)
+        self.assertEqual(element.home, 3)
+        self.assertFalse(manager.apply("missing", methodcaller("set_score", 1)))
+
+    def test_show_starts_at_frame_timestamp(self):
+        """Test that a queued show runs its timeline from the frame it is applied at."""
+        manager = make_manager()
+        lower_third = LowerThird("lt", animation_duration=0.5)
+        manager.add_element("lt", lower_third)
+        manager.begin_frame(10 * SECOND)
+        self.assertTrue(manager.show_element("lt"))
+        manager.begin_frame(11 * SECOND)
+        self.assertEqual(lower_third.get_transform(11 * SECOND)[3], 0.0)
+        lower_third.get_transform(11 * SECOND + SECOND // 2)
+        self.assertEqual(lower_third.animation_state, "visible")
+        self.assertFalse(lower_third.animating)
+        manager.hide_element("lt")
+        manager.begin_frame(SECOND)  # Pipeline restarted: timestamps start over
+        lower_third.get_transform(SECOND)
+        lower_third.get_transform(SECOND + SECOND // 2)
+        self.assertEqual(lower_third.animation_state, "hidden")
+
+    def test_frame_jitter_under_api_load(self):
+        """Measure draw time while API threads add, list and update elements."""
+        manager = make_manager()
+        elements = [RecordingElement(f"e{i}") for i in range(20)]
+        for element in elements:
+            manager.add_element(element.element_id, element)
+        stop = threading.Event()
+
+        def api_load(worker):
+            count = 0
+            while not stop.is_set():
+                count += 1
+                manager.apply(f"e{count % 20}", methodcaller("set_score", count))
+                manager.add_element(f"extra{worker}", RecordingElement(f"extra{worker}"))
+                manager.list_elements()
+                manager.remove_element(f"extra{worker}")
+                time.sleep(0.0005)  # A burst of requests, not a busy loop
+
+        workers = [threading.Thread(target=api_load, args=(i,)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        frame_times = []
+        try:
+            for _ in range(300):
+                start = time.perf_counter()
+                manager.draw_callback(None, None, 0, 0)
+                frame_times.append(time.perf_counter() - start)
+                time.sleep(0.001)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+        frame_times.sort()
+        p50 = statistics.median(frame_times)
+        p99 = frame_times[int(0.99 * (len(frame_times) - 1))]
+        # Generous bound: the GIL still interleaves threads, but no frame may
+        # wait out a writer's critical section
+        self.assertLess(p99 - p50, 0.010, f"p50={p50 * 1e6:.0f}us p99={p99 * 1e6:.0f}us")
+        self.assertEqual(sum(e.torn_frames for e in elements), 0)
+
+
+
+class TestDrawBudget(unittest.TestCase):
+    """Test per-element draw timing and the over-budget reaction."""
+
+    def test_percentiles(self):
+        """Test rolling percentiles over the most recent samples."""
+        stats = DrawStats(size=100)
+        for i in range(300):
+            stats.record((i % 100 + 1) * 1000)  # 1..100 us
+        self.assertAlmostEqual(stats.percentile(0.5), 0.051)
+        self.assertAlmostEqual(stats.percentile(0.99), 0.1)
+
+    def test_slow_element_is_reported_and_degraded(self):
+        """Test that sustained overruns name and degrade the slowest element."""
+        manager = make_manager(draw_budget_ms=1.0, degrade_over_budget=True)
+        manager.add_element("fast", SlowElement("fast", 0))
+        manager.add_element("slow", SlowElement("slow", 0.002))
+        events = []
+        manager.add_budget_listener(events.append)
+        for frame in range(OVER_BUDGET_FRAMES):
+            manager.draw_callback(None, None, frame, 0)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["elements"][0]["element_id"], "slow")
+        self.assertEqual(events[0]["degraded"], "slow")
+        status = manager.get_status()
+        self.assertTrue(status["elements"]["slow"]["degraded"])
+        self.assertGreaterEqual(status["elements"]["slow"]["draw"]["p50_ms"], 2.0)
+        self.assertEqual(status["draw_budget"]["over_budget_frames"], OVER_BUDGET_FRAMES)
+
+    def test_measurement_overhead(self):
+        """Test that timing a draw costs only a few microseconds per element."""
+        elements = [SlowElement(f"e{i}", 0) for i in range(20)]
+        profiler = DrawProfiler()
+        frames = 500
+        start = time.perf_counter()
+        for frame in range(frames):
+            for element in elements:
+                element.draw(None, frame)
+        plain = time.perf_counter() - start
+        start = time.perf_counter()
+        for frame in range(frames):
+            profiler.draw(elements, None, frame)
+        profiled = time.perf_counter() - start
+        self.assertLess((profiled - plain) / (frames * len(elements)), 5e-6)
+
+
+class TestGraphicsLayer(unittest.TestCase):
+    """Test layer region and dirty-rectangle planning (no Cairo or GStreamer)."""
+
+    def test_empty_layer_is_skipped(self):
+        """Test that nothing is rendered without visible elements, and hiding the last one hides the layer."""
+        manager = make_manager()
+        layer = GraphicsLayer(manager, 1920, 1080)
+        self.assertIsNone(layer.plan(0))
+        box = BoxElement("a", 10, 20)
+        manager.add_element("a", box)
+        self.assertEqual(layer.plan(0).region, (10, 20, 100, 50))
+        self.assertIsNone(layer.plan(1))  # Static: keep the last buffer
+        box.visible = False
+        self.assertIsNone(layer.plan(2).region)
+        self.assertIsNone(layer.plan(3))
+
+    def test_only_changed_elements_are_dirty(self):
+        """Test that an update redraws its own rectangle within an unchanged region."""
+        manager = make_manager()
+        layer = GraphicsLayer(manager, 1920, 1080)
+        left, right = BoxElement("l", 0, 900), BoxElement("r", 1700, 50)
+        manager.add_element("l", left)
+        manager.add_element("r", right)
+        first = layer.plan(0)
+        self.assertEqual(first.region, (0, 50, 1800, 900))
+        self.assertTrue(first.moved)
+        right.changed = True
+        update = layer.plan(1)
+        self.assertEqual(update.dirty, [(1700, 50, 100, 50)])
+        self.assertFalse(update.moved)
+
+    def test_bounds_are_clipped_to_the_frame(self):
+        """Test that a lower third sliding in from off-screen stays inside the frame."""
+        self.assertEqual(snap_rect(LowerThird("lt", x=50, y=900).bounds(), 1920, 1080), (0, 900, 650, 120))
+        self.assertIsNone(snap_rect((-200, 0, 100, 10), 1920, 1080))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the mixer clip cache."""
+import unittest
+
+from src.mixer.clip_cache import CachedClip, ClipCache, ClipPlayer, estimate_clip_bytes
+
+MB = 1024 * 1024
+
+
+class FakeBuffer:
+    """Stands in for Gst.Buffer: copy() shares the payload, timestamps are fields."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.pts = self.dts = self.duration = None
+
+    def copy(self):
+        return FakeBuffer(self.payload)
+
+    def get_size(self):
+        return 1
+
+
+class FakeAppSrc:
+    def __init__(self):
+        self.pushed = []
+        self.eos = False
+        self.need_data = None
+
+    def connect(self, signal, callback):
+        self.need_data = callback
+
+    def emit(self, signal, *args):
+        if signal == "push-buffer":
+            self.pushed.append(args[0])
+        elif signal == "end-of-stream":
+            self.eos = True
+
+    def pull(self, count):
+        for _ in range(count):
+            self.need_data(self, 0)
+
+
+def make_clip(name, frames, size_bytes=MB):
+    return CachedClip(
+        key=(name, 0.0, 1920, 1080), caps="video/x-raw",
+        frames=[FakeBuffer(i) for i in range(frames)], frame_ns=100, size_bytes=size_bytes,
+    )
+
+
+class TestClipCache(unittest.TestCase):
+    """Test cache policy without GStreamer."""
+
+    def test_lru_eviction_respects_budget(self):
+        """Test that the least recently used clip is evicted first."""
+        cache = ClipCache(budget_bytes=3 * MB)
+        for name in ("a", "b", "c"):
+            cache._insert(make_clip(name, 1))
+        cache._clips.move_to_end(("a", 0.0, 1920, 1080))  # "a" used again
+        cache._insert(make_clip("d", 1))
+        self.assertEqual([key[0] for key in cache._clips], ["c", "a", "d"])
+        self.assertEqual(cache.get_status()["used_mb"], 3.0)
+
+    def test_long_or_unknown_videos_stream(self):
+        """Test that only short videos of known duration are cached."""
+        cache = ClipCache(budget_bytes=512 * MB, max_seconds=15)
+        self.assertTrue(cache.is_cacheable("/media/stinger.mp4", (1920, 1080), 2.0))
+        self.assertFalse(cache.is_cacheable("/media/show.mp4", (1920, 1080), 600.0))
+        self.assertFalse(cache.is_cacheable("/media/unknown.mp4", (1920, 1080), None))
+        self.assertTrue(cache.is_cacheable("/media/logo.png", (1920, 1080), None))
+        self.assertGreater(estimate_clip_bytes(14.0, 1920, 1080), 512 * MB)
+        self.assertFalse(cache.is_cacheable("/media/loop.mp4", (1920, 1080), 14.0))
+
+
+class TestClipPlayer(unittest.TestCase):
+    """Test appsrc feeding and loop points."""
+
+    def test_loop_wraps_on_exact_frame_with_continuous_timestamps(self):
+        """Test that a loop restarts on the next frame without a timestamp jump."""
+        appsrc = FakeAppSrc()
+        ClipPlayer(appsrc, make_clip("loop", 3), loop=True)
+        appsrc.pull(7)
+        self.assertEqual([b.payload for b in appsrc.pushed], [0, 1, 2, 0, 1, 2, 0])
+        self.assertEqual([b.pts for b in appsrc.pushed], [i * 100 for i in range(7)])
+        self.assertFalse(appsrc.eos)
+
+    def test_stinger_plays_once(self):
+        """Test that a non-looping clip ends after its last frame."""
+        appsrc = FakeAppSrc()
+        ClipPlayer(appsrc, make_clip("stinger", 3), loop=False)
+        appsrc.pull(4)
+        self.assertEqual(len(appsrc.pushed), 3)
+        self.assertTrue(appsrc.eos)
+
+    def test_image_repeats_for_its_duration(self):
+        """Test that a still repeats its frame until its duration runs out."""
+        appsrc = FakeAppSrc()
+        ClipPlayer(appsrc, make_clip("still", 1), loop=False, max_frames=5)
+        appsrc.pull(6)
+        self.assertEqual(len(appsrc.pushed), 5)
+        self.assertTrue(appsrc.eos)
+
+
+if __name__ == "__main__":
+    unittest.main()
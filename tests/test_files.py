@@ -0,0 +1,194 @@
+"""Tests for streaming file uploads."""
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database import Database
+from src.files import FileManager, MultipartFileReader, UploadTooLargeError
+
+
+class TestFileManagerUploads(unittest.TestCase):
+    """Test streaming, deduplicating uploads."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.database = Database(db_path=os.path.join(self.temp_dir, "app.db"))
+        self.file_manager = FileManager(
+            uploads_dir=os.path.join(self.temp_dir, "uploads"),
+            database=self.database,
+            max_upload_bytes=4 * 1024 * 1024
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_stream_saved_with_hash(self):
+        """Test that a streamed upload lands on disk with its content hash."""
+        content = os.urandom(3 * 1024 * 1024 + 17)  # Spans several chunks
+        metadata = self.file_manager.save_stream(io.BytesIO(content), "loop.mp4", loop=True)
+
+        self.assertFalse(metadata["deduplicated"])
+        self.assertEqual(Path(metadata["file_path"]).read_bytes(), content)
+        self.assertEqual(metadata["size_bytes"], len(content))
+        stored = self.file_manager.get_file_metadata(metadata["id"])
+        self.assertEqual(stored["content_hash"], metadata["content_hash"])
+        self.assertTrue(stored["loop"])
+
+    def test_duplicate_upload_reuses_file(self):
+        """Test that identical content is deduplicated."""
+        content = b"same bytes" * 1000
+        first = self.file_manager.save_stream(io.BytesIO(content), "a.png")
+        second = self.file_manager.save_stream(io.BytesIO(content), "b.png", upload_id="dup")
+
+        self.assertTrue(second["deduplicated"])
+        self.assertEqual(second["id"], first["id"])
+        self.assertEqual(len(self.file_manager.list_files()), 1)
+        self.assertEqual(self.file_manager.get_upload_progress("dup")["status"], "deduplicated")
+
+    def test_concurrent_duplicate_uploads_stored_once(self):
+        """Test that identical uploads finishing together are stored once."""
+        content = os.urandom(256 * 1024)
+
+        async def upload_all():
+            return await asyncio.gather(*(
+                asyncio.to_thread(self.file_manager.save_stream, io.BytesIO(content), f"{i}.png")
+                for i in range(4)
+            ))
+
+        results = asyncio.run(upload_all())
+        self.assertEqual(len({r["id"] for r in results}), 1)
+        self.assertEqual(sum(not r["deduplicated"] for r in results), 1)
+        self.assertEqual(len(self.file_manager.list_files()), 1)
+
+    def test_too_large_upload_rejected(self):
+        """Test that the size guard aborts and leaves no partial file."""
+        content = b"\0" * (5 * 1024 * 1024)
+        with self.assertRaises(UploadTooLargeError):
+            self.file_manager.save_stream(io.BytesIO(content), "big.mp4", upload_id="big")
+
+        self.assertEqual(list(self.file_manager.videos_dir.iterdir()), [])
+        self.assertEqual(self.file_manager.get_upload_progress("big")["status"], "failed")
+
+    def test_multipart_body_streamed_to_disk(self):
+        """Test that the file part of a multipart body is parsed as it arrives."""
+        content = os.urandom(2 * 1024 * 1024 + 5)
+        body = (
+            b"--XyZ\r\nContent-Disposition: form-data; name=\"note\"\r\n\r\nhello\r\n"
+            b"--XyZ\r\nContent-Disposition: form-data; name=\"file\"; filename=\"dir/clip.mp4\"\r\n"
+            b"Content-Type: video/mp4\r\n\r\n" + content + b"\r\n--XyZ--\r\n"
+        )
+
+        async def chunks(data):
+            for i in range(0, len(data), 65536):
+                yield data[i:i + 65536]
+
+        async def upload(data):
+            reader = MultipartFileReader("multipart/form-data; boundary=XyZ")
+            stream = chunks(data)
+            await reader.read_headers(stream)
+            feeding = asyncio.create_task(reader.feed_all(stream))
+            try:
+                return await asyncio.to_thread(self.file_manager.save_stream, reader, reader.filename)
+            finally:
+                feeding.cancel()
+
+        metadata = asyncio.run(upload(body))
+        self.assertTrue(metadata["file_path"].endswith(".mp4"))
+        self.assertEqual(Path(metadata["file_path"]).read_bytes(), content)
+        with self.assertRaises(ValueError):
+            asyncio.run(upload(body[:len(body) // 2]))  # Client went away mid-file
+        self.assertEqual(len(list(self.file_manager.videos_dir.iterdir())), 1)
+
+    def test_cancelled_upload_unblocks_writer(self):
+        """Test that cancelling the upload ends the blocked writer and removes its temp file."""
+        head = (
+            b"--XyZ\r\nContent-Disposition: form-data; name=\"file\"; filename=\"clip.mp4\"\r\n"
+            b"\r\n" + b"x" * 1024
+        )
+
+        async def stalled_body():
+            yield head
+            await asyncio.Event().wait()  # Client stops sending
+
+        async def upload():
+            reader = MultipartFileReader("multipart/form-data; boundary=XyZ")
+            stream = stalled_body()
+            await reader.read_headers(stream)
+            feeding = asyncio.create_task(reader.feed_all(stream))
+            writer = asyncio.create_task(
+                asyncio.to_thread(self.file_manager.save_stream, reader, reader.filename)
+            )
+            await asyncio.sleep(0.1)
+            feeding.cancel()  # As when the request handler is cancelled
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(writer, timeout=5)
+
+        asyncio.run(upload())
+        self.assertEqual(list(self.file_manager.videos_dir.iterdir()), [])
+
+    def test_store_asset_content_addressed(self):
+        """Test that graphics assets are stored under their content hash."""
+        dest = Path(self.temp_dir) / "graphics"
+        name1, dup1 = self.file_manager.store_asset(io.BytesIO(b"logo"), dest, ".PNG")
+        name2, dup2 = self.file_manager.store_asset(io.BytesIO(b"logo"), dest, ".png")
+
+        self.assertEqual(name1, name2)
+        self.assertTrue(name1.endswith(".png"))
+        self.assertFalse(dup1)
+        self.assertTrue(dup2)
+        self.assertEqual((dest / name1).read_bytes(), b"logo")
+
+
+class TestProbedMetadata(unittest.TestCase):
+    """Test storage and use of media probe results."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.database = Database(db_path=os.path.join(self.temp_dir, "app.db"))
+        self.file_manager = FileManager(
+            uploads_dir=os.path.join(self.temp_dir, "uploads"),
+            database=self.database
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_probe_results_stored(self):
+        """Test that probe results are written to file_metadata."""
+        metadata = self.file_manager.save_stream(io.BytesIO(b"video"), "clip.mp4")
+        self.database.update_file_probe(metadata["id"], {
+            "duration": 12.5, "width": 1920, "height": 1080, "framerate": 30.0,
+            "container": "mp4", "video_codec": "h264", "keyframe_interval": 2.0,
+            "probe_status": "ok", "ignored_key": "x",
+        })
+
+        stored = self.database.find_file_by_path(metadata["file_path"])
+        self.assertEqual(stored["id"], metadata["id"])
+        self.assertEqual((stored["width"], stored["height"]), (1920, 1080))
+        self.assertEqual(stored["video_codec"], "h264")
+        self.assertEqual(stored["keyframe_interval"], 2.0)
+
+    def test_direct_decoder_from_cached_metadata(self):
+        """Test that probed files skip decodebin autoplugging."""
+        from src.mixer.core import _build_file_decoder_string
+
+        probed = {"probe_status": "ok", "container": "mp4", "video_codec": "h264"}
+        self.assertEqual(_build_file_decoder_string(probed, "mppvideodec"),
+                         "qtdemux ! h264parse ! mppvideodec")
+        self.assertEqual(_build_file_decoder_string(probed),
+                         "qtdemux ! h264parse ! avdec_h264")
+        self.assertEqual(_build_file_decoder_string({"probe_status": "pending"}), "decodebin")
+        self.assertEqual(_build_file_decoder_string(
+            {"probe_status": "ok", "container": "mp4", "video_codec": "av1"}), "decodebin")
+
+
+if __name__ == "__main__":
+    unittest.main()
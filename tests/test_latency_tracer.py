@@ -0,0 +1,56 @@
+"""Tests for latency tracing and event-loop stall sampling."""
+import asyncio
+import time
+import unittest
+
+from src.latency_tracer import LatencyTracer
+
+
+def _blocking_handler():
+    time.sleep(0.4)
+
+
+class TestLatencyTracer(unittest.TestCase):
+    """Test LatencyTracer functionality."""
+
+    def test_stall_sampled_with_stack(self):
+        """Test that a blocked loop is sampled with the blocking stack."""
+        tracer = LatencyTracer(slow_threshold_ms=100)
+
+        async def scenario():
+            await tracer.start()
+            await asyncio.sleep(0.15)
+            token = tracer.request_started("GET", "/api/slow")
+            _blocking_handler()
+            tracer.request_finished(token, "GET", "/api/slow", 0.4)
+            await asyncio.sleep(0.15)
+            await tracer.stop()
+
+        asyncio.run(scenario())
+        report = tracer.get_report()
+
+        self.assertEqual(len(report["slow_samples"]), 1)
+        sample = report["slow_samples"][0]
+        self.assertGreaterEqual(sample["blocked_ms"], 250)
+        self.assertTrue(any("_blocking_handler" in line for line in sample["stack"]))
+        self.assertEqual(sample["in_flight"][0]["path"], "/api/slow")
+        self.assertGreaterEqual(report["event_loop_lag"]["max_ms"], 250)
+        self.assertEqual(report["routes"][0]["route"], "GET /api/slow")
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled tracer does not track requests."""
+        tracer = LatencyTracer(enabled=False)
+
+        async def scenario():
+            await tracer.start()
+            token = tracer.request_started("GET", "/api/x")
+            tracer.request_finished(token, "GET", "/api/x", 0.01)
+
+        asyncio.run(scenario())
+        report = tracer.get_report()
+        self.assertFalse(report["running"])
+        self.assertEqual(report["routes"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for media probe codec naming."""
+import unittest
+
+from src.media_probe import codec_name
+
+
+class FakeStructure:
+    """Stands in for a Gst.Structure (name and int fields)."""
+
+    def __init__(self, name, **fields):
+        self.name = name
+        self.fields = fields
+
+    def get_name(self):
+        return self.name
+
+    def get_int(self, field):
+        return (field in self.fields, self.fields.get(field, 0))
+
+
+class FakeCaps:
+    def __init__(self, name, **fields):
+        self.structure = FakeStructure(name, **fields)
+
+    def get_size(self):
+        return 1
+
+    def get_structure(self, index):
+        return self.structure
+
+
+class TestCodecNames(unittest.TestCase):
+    """Test caps to codec name mapping without GStreamer."""
+
+    def test_mpeg_caps_use_version_and_layer(self):
+        """Test that video/mpeg and audio/mpeg are told apart by their fields."""
+        self.assertEqual(codec_name(FakeCaps("video/mpeg", mpegversion=2)), "mpeg2")
+        self.assertEqual(codec_name(FakeCaps("video/mpeg", mpegversion=4)), "mpeg4")
+        self.assertEqual(codec_name(FakeCaps("audio/mpeg", mpegversion=1, layer=3)), "mp3")
+        self.assertEqual(codec_name(FakeCaps("audio/mpeg", mpegversion=1, layer=2)), "mp2")
+        self.assertEqual(codec_name(FakeCaps("audio/mpeg", mpegversion=4)), "aac")
+        self.assertEqual(codec_name(FakeCaps("audio/mpeg")), "audio/mpeg")
+
+    def test_other_caps_use_the_name_table(self):
+        """Test table lookups and unknown caps names."""
+        self.assertEqual(codec_name(FakeCaps("video/x-h264")), "h264")
+        self.assertEqual(codec_name(FakeCaps("video/x-theora")), "video/x-theora")
+        self.assertIsNone(codec_name(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
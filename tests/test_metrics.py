@@ -0,0 +1,71 @@
+"""Tests for the metrics registry."""
+import threading
+import unittest
+
+from src.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test metric updates and text exposition."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = MetricsRegistry()
+
+    def test_counter_openmetrics_format(self):
+        """Test counter rendering with the _total suffix and EOF marker."""
+        frames = self.registry.counter("r58_camera_frames", "Frames", ["camera"])
+        frames.labels("cam0").inc(3)
+
+        text = self.registry.render(openmetrics=True)
+        self.assertIn("# TYPE r58_camera_frames counter", text)
+        self.assertIn('r58_camera_frames_total{camera="cam0"} 3', text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+        text = self.registry.render(openmetrics=False)
+        self.assertIn("# TYPE r58_camera_frames_total counter", text)
+        self.assertNotIn("# EOF", text)
+
+    def test_histogram_buckets_cumulative(self):
+        """Test that histogram buckets are cumulative and include +Inf."""
+        latency = self.registry.histogram("r58_latency_seconds", "Latency", ["route"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.labels("/x").observe(value)
+
+        text = self.registry.render()
+        self.assertIn('r58_latency_seconds_bucket{route="/x",le="0.1"} 1', text)
+        self.assertIn('r58_latency_seconds_bucket{route="/x",le="1"} 2', text)
+        self.assertIn('r58_latency_seconds_bucket{route="/x",le="+Inf"} 3', text)
+        self.assertIn('r58_latency_seconds_count{route="/x"} 3', text)
+
+    def test_get_or_create_and_conflicts(self):
+        """Test that metrics are shared by name and type conflicts raise."""
+        first = self.registry.gauge("r58_fps", "FPS", ["camera"])
+        self.assertIs(self.registry.gauge("r58_fps", "FPS", ["camera"]), first)
+        with self.assertRaises(ValueError):
+            self.registry.counter("r58_fps", "FPS", ["camera"])
+
+    def test_concurrent_increments(self):
+        """Test that updates from many threads are not lost."""
+        child = self.registry.counter("r58_buffers", "Buffers").labels()
+
+        def worker():
+            for _ in range(10000):
+                child.inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(child.get(), 40000)
+
+    def test_collectors_run_on_render(self):
+        """Test that collectors refresh values at scrape time."""
+        gauge = self.registry.gauge("r58_queue_fill_ratio", "Fill", ["queue"])
+        self.registry.add_collector(lambda: gauge.labels("q0").set(0.5))
+        self.assertIn('r58_queue_fill_ratio{queue="q0"} 0.5', self.registry.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
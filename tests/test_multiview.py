@@ -0,0 +1,50 @@
+"""Tests for the multiview layout and pipeline string."""
+import unittest
+
+from src.mixer.multiview import (
+    BORDER,
+    build_multiview_pipeline_str,
+    multiview_layout,
+    program_frames_resolution,
+)
+
+SIZE = (960, 540)
+CAMERAS = ["cam0", "cam1", "cam2", "cam3"]
+
+
+class TestMultiviewLayout(unittest.TestCase):
+    """Test tile placement without GStreamer."""
+
+    def test_tiles_fit_and_do_not_overlap(self):
+        """Test that every tile is inside the frame and tiles are disjoint."""
+        tiles = multiview_layout(CAMERAS, SIZE)
+        self.assertEqual([t.name for t in tiles], ["program", "preview"] + CAMERAS)
+        for tile in tiles:
+            self.assertLessEqual(tile.x + tile.w, SIZE[0])
+            self.assertLessEqual(tile.y + tile.h, SIZE[1])
+        for i, a in enumerate(tiles):
+            for b in tiles[i + 1:]:
+                overlap = a.x < b.x + b.w and b.x < a.x + a.w and a.y < b.y + b.h and b.y < a.y + a.h
+                self.assertFalse(overlap, (a.name, b.name))
+
+    def test_program_frames_match_program_tile(self):
+        """Test that the mixer publishes program frames at the tile's inner size."""
+        program = multiview_layout(CAMERAS, SIZE)[0]
+        self.assertEqual(program_frames_resolution(CAMERAS, SIZE),
+                         f"{program.w - 2 * BORDER}x{program.h - 2 * BORDER}")
+
+    def test_pipeline_skips_tiles_without_source(self):
+        """Test that compositor pads are numbered over the tiles that have sources."""
+        tiles = multiview_layout(CAMERAS, SIZE)
+        pipeline = build_multiview_pipeline_str(
+            tiles, {"program": "videotestsrc", "cam2": "videotestsrc"}, SIZE, 15,
+            "x264enc", "rtsp://127.0.0.1:8554/multiview",
+        )
+        self.assertIn("mv.sink_1", pipeline)
+        self.assertNotIn("mv.sink_2", pipeline)
+        self.assertIn("videobox name=tally_cam2", pipeline)
+        self.assertIn("framerate=15/1", pipeline)
+
+
+if __name__ == "__main__":
+    unittest.main()
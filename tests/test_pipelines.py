@@ -0,0 +1,38 @@
+"""Tests for pipeline string builders."""
+import unittest
+
+from src.pipelines import (
+    build_local_frame_source,
+    get_local_frame_branch,
+    get_local_frame_channel,
+)
+
+
+class TestLocalFramePath(unittest.TestCase):
+    """Test the ingest -> mixer raw frame handoff strings."""
+
+    def test_branch_and_source_share_channel_and_caps(self):
+        """Test that ingest publishes exactly what the mixer expects to read."""
+        branch = get_local_frame_branch("cam1", "1280x720")
+        source = build_local_frame_source("cam1", "1280x720")
+        channel = get_local_frame_channel("cam1")
+
+        self.assertIn(f"intervideosink channel={channel}", branch)
+        self.assertIn(f"intervideosrc channel={channel}", source)
+        caps = "video/x-raw,format=NV12,width=1280,height=720,framerate=30/1"
+        self.assertIn(caps, branch)
+        self.assertTrue(source.endswith(caps))
+
+    def test_branch_never_blocks_encoder(self):
+        """Test that the raw branch drops frames instead of backpressuring the tee."""
+        branch = get_local_frame_branch("cam1", "1920x1080")
+        self.assertTrue(branch.startswith("queue max-size-buffers=1"))
+        self.assertIn("leaky=downstream", branch)
+
+    def test_channels_are_per_camera(self):
+        """Test that cameras do not share an intervideo channel."""
+        self.assertNotEqual(get_local_frame_channel("cam1"), get_local_frame_channel("cam2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for offline pre-rendering of HTML graphics templates."""
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.graphics.prerender import (
+    MANIFEST,
+    PrerenderFarm,
+    bind_template,
+    build_render_command,
+    with_base_href,
+)
+from src.mixer.clip_cache import ClipCache
+
+MB = 1024 * 1024
+
+
+class TestPrerenderFarm(unittest.TestCase):
+    """Test cache keys and clip lookup without rendering."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / "templates").mkdir()
+        (self.root / "templates" / "lower_third.html").write_text("<h1>{{name}}</h1><p>{{title}}</p>")
+        self.farm = PrerenderFarm(str(self.root / "templates"), str(self.root / "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_bind_template(self):
+        """Test {{variable}} replacement."""
+        html = bind_template("<h1>{{name}}</h1><p>{{title}}</p>", {"name": "Jane Doe", "title": "CEO"})
+        self.assertEqual(html, "<h1>Jane Doe</h1><p>CEO</p>")
+
+    def test_key_covers_template_data_and_size(self):
+        """Test that equal requests share a key and any input change makes a new one."""
+        key = self.farm.key_for("lower_third", {"name": "Jane", "title": "CEO"}, 5.0, (1920, 1080))
+        self.assertEqual(key, self.farm.key_for("lower_third", {"title": "CEO", "name": "Jane"}, 5.0, (1920, 1080)))
+        self.assertNotEqual(key, self.farm.key_for("lower_third", {"name": "John", "title": "CEO"}, 5.0, (1920, 1080)))
+        self.assertNotEqual(key, self.farm.key_for("lower_third", {"name": "Jane", "title": "CEO"}, 5.0, (1280, 720)))
+        (self.root / "templates" / "lower_third.html").write_text("<h2>{{name}}</h2>")
+        self.farm._templates.clear()
+        self.assertNotEqual(key, self.farm.key_for("lower_third", {"name": "Jane", "title": "CEO"}, 5.0, (1920, 1080)))
+
+    def test_key_covers_local_assets(self):
+        """Test that editing a template's image or stylesheet makes a new key."""
+        templates = self.root / "templates"
+        (templates / "logo.html").write_text('<img src="logo.png"><img src="https://cdn/x.png">')
+        (templates / "logo.png").write_bytes(b"v1")
+        (templates / "stinger").mkdir()
+        (templates / "stinger" / "index.html").write_text('<link href="style.css">')
+        (templates / "stinger" / "style.css").write_text("h1 {}")
+        logo = self.farm.key_for("logo", {}, 5.0, (1920, 1080))
+        stinger = self.farm.key_for("stinger", {}, 5.0, (1920, 1080))
+        (templates / "logo.png").write_bytes(b"v2 longer")
+        (templates / "stinger" / "style.css").write_text("h1 { color: red }")
+        self.assertNotEqual(logo, self.farm.key_for("logo", {}, 5.0, (1920, 1080)))
+        self.assertNotEqual(stinger, self.farm.key_for("stinger", {}, 5.0, (1920, 1080)))
+
+    def test_relative_assets_resolve_from_template_dir(self):
+        """Test that the rendered page gets a <base> at the template's directory."""
+        html = with_base_href("<html><head><title>t</title></head></html>", Path("/srv/templates/stinger"))
+        self.assertIn('<head><base href="file:///srv/templates/stinger/">', html)
+        self.assertEqual(with_base_href('<base href="x/"><p>', Path("/srv")), '<base href="x/"><p>')
+
+    def test_invalid_templates_are_rejected(self):
+        """Test template ID validation (no path traversal) and unknown templates."""
+        for template_id in ("../etc/passwd", "missing", ""):
+            with self.assertRaises(ValueError):
+                self.farm.key_for(template_id, {}, 5.0, (1920, 1080))
+
+    def test_cached_clip_is_found_after_restart(self):
+        """Test that a finished clip directory from an earlier run is reused."""
+        key = self.farm.key_for("lower_third", {"name": "Jane"}, 1.0, (1920, 1080))
+        clip_dir = self.root / "cache" / key
+        clip_dir.mkdir(parents=True)
+        self.assertEqual(self.farm.state(key), "missing")  # No manifest: incomplete
+        (clip_dir / MANIFEST).write_text(json.dumps({"width": 1920, "height": 1080, "fps": 30, "frames": 30}))
+        self.assertEqual(self.farm.request("lower_third", {"name": "Jane"}, 1.0, (1920, 1080))[1].duration, 1.0)
+        self.assertEqual(self.farm.get_status()["rendering"], [])
+
+    def test_render_command_keeps_alpha(self):
+        """Test that renders use a transparent page background and a PNG sequence."""
+        command = " ".join(build_render_command(Path("/tmp/a/index.html"), Path("/tmp/a"), (1920, 1080), 150, 30))
+        self.assertIn("draw-background=false", command)
+        self.assertIn("eos-after=150", command)
+        self.assertIn('multifilesink location="/tmp/a/%05d.png"', command)
+
+    def test_short_sequences_fit_the_clip_cache(self):
+        """Test that sequences are budgeted as BGRA frames."""
+        cache = ClipCache(budget_bytes=512 * MB, max_seconds=15)
+        sequence = self.root / "cache"
+        sequence.mkdir()
+        self.assertTrue(cache.is_cacheable(str(sequence), (1920, 1080), 2.0))
+        self.assertFalse(cache.is_cacheable(str(sequence), (1920, 1080), 5.0))  # 150 BGRA frames > 512 MB
+
+
+if __name__ == "__main__":
+    unittest.main()
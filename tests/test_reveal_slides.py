@@ -0,0 +1,130 @@
+"""Tests for Reveal.js output rendering: slide stills, frame gating and shared renderers."""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.damage import DamageGate
+from src.reveal_renderer import build_encode_branch, build_encoder, build_render_source
+from src.reveal_slides import (
+    SlideCache,
+    build_render_command,
+    builds_slides_at_runtime,
+    parse_slides,
+    slide_url,
+    step_index,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PRESENTATION = """<div class="reveal"><div class="slides">
+    <section><h1>Title</h1></section>
+    <section>
+        <section><h2>Vertical 1</h2></section>
+        <section><h2>Vertical 2</h2><video src="clip.mp4" data-autoplay></video></section>
+    </section>
+    <section>
+        <ul><li class="fragment">One</li><li class="fragment">Two</li></ul>
+    </section>
+</div></div>"""
+
+
+class TestRevealSlides(unittest.TestCase):
+    """Test slide parsing, navigation and the still cache without rendering."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.cache = SlideCache(str(self.root), "64x36")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_steps_cover_vertical_slides_and_fragments(self):
+        """Test that steps follow Reveal.js order and dynamic slides are marked."""
+        steps = parse_slides(PRESENTATION)
+        self.assertEqual(
+            [step.hash for step in steps],
+            ["#/0/0", "#/1/0", "#/1/1", "#/2/0", "#/2/0/0", "#/2/0/1"],
+        )
+        self.assertEqual([step.dynamic for step in steps], [False, False, True, False, False, False])
+        self.assertEqual(slide_url("http://host/p?x=1#/5", steps[2]), "http://host/p?x=1#/1/1")
+
+    def test_runtime_built_decks_run_live(self):
+        """Test that markdown and script-built decks are not split from their HTML."""
+        self.assertFalse(builds_slides_at_runtime(PRESENTATION))
+        self.assertTrue(builds_slides_at_runtime('<section data-markdown="slides.md"></section>'))
+        self.assertTrue(builds_slides_at_runtime((REPO_ROOT / "src" / "static" / "graphics.html").read_text()))
+        self.assertIsNone(self.cache.deck_for("http://host/g", "<section data-markdown><script>x</script></section>"))
+
+    def test_navigation_clamps_to_the_deck(self):
+        """Test next/prev/first/last step indices."""
+        self.assertEqual(step_index("next", 5, 6), 5)
+        self.assertEqual(step_index("prev", 0, 6), 0)
+        self.assertEqual(step_index("next", 2, 6), 3)
+        self.assertEqual((step_index("first", 3, 6), step_index("last", 3, 6)), (0, 5))
+        with self.assertRaises(ValueError):
+            step_index("up", 0, 6)
+
+    def test_stills_are_served_once_rendered(self):
+        """Test that only complete stills of static slides are served, across restarts."""
+        deck = self.cache.deck_for("http://host/p", PRESENTATION)
+        self.assertIs(deck, self.cache.deck_for("http://host/p#/1", PRESENTATION))
+        self.assertIsNone(deck.frame(0))
+        deck.still_path(0).write_bytes(b"\0" * 10)  # Truncated render
+        self.assertIsNone(deck.frame(0))
+        deck.still_path(0).write_bytes(b"\0" * deck.frame_size)
+        deck.still_path(2).write_bytes(b"\0" * deck.frame_size)
+        self.assertEqual(len(deck.frame(0)), 64 * 36 * 3 // 2)
+        self.assertIsNone(deck.frame(2))  # Dynamic slides always run live
+        restarted = SlideCache(str(self.root), "64x36").deck_for("http://host/p", PRESENTATION)
+        self.assertEqual(restarted.get_status()["rendered"], 2)
+        self.assertNotEqual(deck.key, SlideCache(str(self.root), "128x72").deck_for("http://host/p", PRESENTATION).key)
+
+    def test_render_command_keeps_last_nv12_frame(self):
+        """Test that renders open the slide's hash and write raw NV12 to one file."""
+        command = " ".join(build_render_command("http://host/p#/1/0", Path("/tmp/s/0001.tmp"), 1920, 1080))
+        self.assertIn('wpesrc location="http://host/p#/1/0"', command)
+        self.assertIn("format=NV12,width=1920,height=1080", command)
+        self.assertIn('multifilesink location="/tmp/s/0001.tmp"', command)
+
+
+class TestDamageGate(unittest.TestCase):
+    """Test damage-driven frame gating."""
+
+    def test_static_frames_drop_to_keepalive(self):
+        """Test that unchanged frames pass only as keep-alives, changes pass at once."""
+        gate = DamageGate(keepalive=1.0, keyframe_interval=2.0)
+        decisions = [gate.check(checksum, now) for checksum, now in [
+            (1, 0.0), (1, 0.033), (1, 0.5), (2, 0.6), (2, 0.7), (2, 1.6), (2, 2.0), (2, 2.7),
+        ]]
+        self.assertEqual([push for push, _ in decisions], [True, False, False, True, False, True, False, True])
+        # Keyframes: first frame, then at the next frame passed 2 s later
+        self.assertEqual([keyframe for _, keyframe in decisions], [True, False, False, False, False, False, False, True])
+        self.assertEqual(gate.get_status()["dropped"], 4)
+
+    def test_unknown_content_always_passes(self):
+        """Test that frames without a checksum (unmappable) are never dropped."""
+        gate = DamageGate()
+        self.assertEqual([gate.check(None, 0.0)[0], gate.check(None, 0.01)[0]], [True, True])
+
+
+class TestSharedRenderer(unittest.TestCase):
+    """Test the shared renderer's pipeline fragments."""
+
+    def test_one_renderer_feeds_scaled_encoders(self):
+        """Test that the page is rendered once into a tee and scaled per output size."""
+        source = build_render_source("http://host/p#/2/0", "1920x1080", 30, True)
+        self.assertEqual(source.count("wpesrc"), 1)
+        self.assertIn("identity name=damage ! tee name=render_tee", source)
+        branch = build_encode_branch("1280x720", build_encoder(4000, 30, True))
+        self.assertIn("videoscale ! video/x-raw,format=NV12,width=1280,height=720", branch)
+        self.assertIn("mpph265enc", branch)
+
+    def test_encoder_leaves_keyframes_to_the_gate(self):
+        """Test VBR everywhere and a long GOP only with variable framerate."""
+        self.assertIn("rc-mode=vbr gop=300", build_encoder(4000, 30, True)[0])
+        self.assertNotIn("gop=", build_encoder(4000, 30, False)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,8 @@ import tempfile
 import shutil
 import json
 
-from src.mixer.scenes import SceneManager, Scene, SceneSlot
+from src.mixer.scenes import SceneManager, Scene, SceneSlot, compile_scene, diff_plan
+from src.mixer.core import _build_preview_tail, _build_slot_tail, _needs_running_time_offset
 
 
 class TestSceneManager(unittest.TestCase):
@@ -91,6 +92,115 @@ class TestSceneManager(unittest.TestCase):
         self.assertEqual(len(loaded.slots), len(scene.slots))
 
 
+class TestSlotScaling(unittest.TestCase):
+    """Test that source branches negotiate straight to their slot size."""
+
+    def setUp(self):
+        self.scene = Scene(
+            id="pip",
+            label="PiP",
+            resolution={"width": 1920, "height": 1080},
+            slots=[
+                SceneSlot(source="cam0", x_rel=0.0, y_rel=0.0, w_rel=1.0, h_rel=1.0),
+                SceneSlot(source="cam1", x_rel=0.7, y_rel=0.7, w_rel=0.3, h_rel=0.3,
+                          crop_x=0.25, crop_w=0.5),
+            ],
+        )
+
+    def test_branch_scales_to_slot_size(self):
+        """Test that the capsfilter uses the slot size, not the output size."""
+        slot = self.scene.slots[1]
+        tail = _build_slot_tail(1, slot, self.scene.get_absolute_coords(slot), (1920, 1080), (1920, 1080))
+        self.assertIn('capsfilter name=slot_caps_1 caps="video/x-raw,width=576,height=324', tail)
+        self.assertNotIn("width=1920", tail)
+
+    def test_non_live_slots_are_offset_to_running_time(self):
+        """Test that file, image and template slots get the running-time offset, live ones not."""
+        for source_type, offset in (("file", True), ("image", True), ("template", True), ("camera", False)):
+            slot = SceneSlot(source="s", source_type=source_type, x_rel=0, y_rel=0, w_rel=1, h_rel=1)
+            self.assertEqual(_needs_running_time_offset(slot), offset, source_type)
+
+    def test_crop_applied_before_scale(self):
+        """Test that cropping happens on source pixels before the single scale."""
+        slot = self.scene.slots[1]
+        tail = _build_slot_tail(1, slot, self.scene.get_absolute_coords(slot), (1280, 720), (1920, 1080))
+        self.assertIn("videocrop name=slot_crop_1 left=320 top=0 right=320 bottom=0", tail)
+        self.assertLess(tail.index("videocrop"), tail.index("videoscale"))
+
+    def test_slot_scale_stretches_like_compositor(self):
+        """Test that sources are stretched to the slot, not letterboxed."""
+        slot = self.scene.slots[0]
+        coords = self.scene.get_absolute_coords(slot)
+        self.assertIn("videoscale add-borders=false ! videoconvert", _build_slot_tail(0, slot, coords, (720, 576), (1920, 1080)))
+        self.assertIn("videoscale add-borders=false ! videoconvert", _build_preview_tail(0, slot, coords, None))
+
+    def test_crop_with_unknown_source_size(self):
+        """Test that an unknown source is normalized to output size before cropping."""
+        slot = self.scene.slots[1]
+        tail = _build_slot_tail(1, slot, self.scene.get_absolute_coords(slot), None, (1920, 1080))
+        self.assertTrue(tail.startswith("videoscale ! video/x-raw,width=1920,height=1080 ! videocrop"))
+        self.assertIn("left=480", tail)
+
+    def test_preview_branch_never_blocks_program(self):
+        """Test that the preview bus branch is leaky and ends in its ghosted queue."""
+        slot = self.scene.slots[1]
+        coords = {"x": 448, "y": 252, "w": 192, "h": 108}
+        tail = _build_preview_tail(1, slot, coords, (1920, 1080))
+        self.assertIn("leaky=downstream", tail.split(" ! ")[0])
+        self.assertIn('capsfilter name=preview_caps_1 caps="video/x-raw,width=192,height=108', tail)
+        self.assertIn("videocrop name=preview_crop_1", tail)
+        self.assertTrue(tail.split(" ! ")[-1].startswith("queue name=preview_out_1"))
+        self.assertNotIn("videocrop", _build_preview_tail(1, slot, coords, None))
+
+
+class TestScenePlans(unittest.TestCase):
+    """Test precompiled scene plans and pad diffs (no GStreamer)."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.scene_manager = SceneManager(scenes_dir=self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_plan_per_output_resolution(self):
+        """Test that plans place slots relative to the output size."""
+        self.scene_manager.add_plan_resolution((1280, 720))
+        plan = self.scene_manager.get_plan("quad", (1280, 720))
+        self.assertEqual(plan.pads["cam1"].props(),
+                         {"xpos": 640, "ypos": 0, "width": 640, "height": 360, "zorder": 0, "alpha": 1.0})
+        self.assertIs(plan, self.scene_manager.get_plan("quad", (1280, 720)))
+
+    def test_saving_scene_recompiles_plan(self):
+        """Test that create_scene replaces the cached plan."""
+        size = (1920, 1080)
+        before = self.scene_manager.get_plan("quad", size)
+        scene = Scene(id="quad", label="Quad", resolution={"width": 1920, "height": 1080},
+                      slots=[SceneSlot(source="cam0", x_rel=0.0, y_rel=0.0, w_rel=1.0, h_rel=1.0)])
+        self.scene_manager.create_scene(scene)
+        after = self.scene_manager.get_plan("quad", size)
+        self.assertIsNot(before, after)
+        self.assertEqual(list(after.pads), ["cam0"])
+
+    def test_diff_only_touches_changed_properties(self):
+        """Test that switching between similar layouts sets only what changed."""
+        size = (1920, 1080)
+        quad = self.scene_manager.get_plan("quad", size)
+        live = {source: pad.props() for source, pad in quad.pads.items()}
+        self.assertEqual(diff_plan(quad, live), {})
+
+        cam1 = self.scene_manager.get_scene("cam1_full")
+        changes = diff_plan(compile_scene(cam1, size), live)
+        self.assertEqual(changes["cam1"], {"xpos": 0, "width": 1920, "height": 1080})
+        for hidden in ("cam0", "cam2", "cam3"):
+            self.assertEqual(changes[hidden], {"alpha": 0.0})
+
+    def test_unknown_live_state_is_set_in_full(self):
+        """Test that pads without known state get every property."""
+        plan = self.scene_manager.get_plan("cam0_full", (1920, 1080))
+        self.assertEqual(diff_plan(plan, {"cam0": {}})["cam0"], plan.pads["cam0"].props())
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,119 @@
+"""Tests for API cold start (lazy service loading)."""
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import shutil
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.mode_manager import ModeManager
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous budget: the point is to catch a heavy import sneaking back into
+# module scope (GStreamer, Cairo, WPE), not to benchmark the machine.
+COLD_START_BUDGET_SECONDS = 5.0
+
+HEAVY_MODULES = [
+    "gi",
+    "cairo",
+    "src.mixer.core",
+    "src.cairo_graphics",
+    "src.reveal_source",
+    "src.graphics",
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import src.main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": [m for m in %r if m in sys.modules],
+    "report": src.main.get_startup_profiler().get_report(5),
+}))
+"""
+
+
+@unittest.skipUnless(importlib.util.find_spec("fastapi"), "fastapi not installed")
+class TestColdStart(unittest.TestCase):
+    """Importing src.main must stay cheap."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Run from a scratch directory so the database and recordings dirs
+        # created at import time do not land in the repository.
+        cls.temp_dir = tempfile.mkdtemp()
+        env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+        proc = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT % HEAVY_MODULES],
+            cwd=cls.temp_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        if proc.returncode != 0:
+            raise AssertionError(f"Importing src.main failed:\n{proc.stderr}")
+        cls.result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_heavy_subsystems_not_imported(self):
+        """Test that mixer, Cairo and WPE modules load on first use only."""
+        self.assertEqual(self.result["loaded"], [])
+
+    def test_cold_start_budget(self):
+        """Test that importing the API stays within the cold-start budget."""
+        self.assertLess(self.result["elapsed"], COLD_START_BUDGET_SECONDS)
+
+    def test_startup_report_recorded(self):
+        """Test that the import-time profile was recorded and stopped."""
+        report = self.result["report"]
+        self.assertFalse(report["recording"])
+        self.assertGreater(report["modules_imported"], 0)
+        phases = [p["phase"] for p in report["phases"]]
+        self.assertIn("app_ready", phases)
+
+
+class TestLazyMixerInModeManager(unittest.TestCase):
+    """The mode manager creates the mixer only when switching to mixer mode."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        state_file = mock.patch.object(ModeManager, "STATE_FILE", Path(self.temp_dir) / "mode.json")
+        state_file.start()
+        self.addCleanup(state_file.stop)
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+        self.created = []
+        self.manager = ModeManager(
+            mixer_core_factory=lambda: self.created.append(mock.Mock()) or self.created[-1],
+            mixer_core_peek=lambda: None,
+        )
+
+    def test_status_does_not_create_mixer(self):
+        """Test that status checks only peek at the mixer."""
+        status = asyncio.run(self.manager.get_status())
+        self.assertFalse(status.mixer_active)
+        self.assertEqual(self.created, [])
+
+    def test_switch_to_mixer_creates_mixer(self):
+        """Test that the mixer is created on the switch to mixer mode."""
+        with mock.patch("src.mode_manager.subprocess.run") as run:
+            run.return_value.returncode = 0
+            result = asyncio.run(self.manager.switch_to_mixer())
+        self.assertTrue(result["success"])
+        self.assertEqual(len(self.created), 1)
+        self.assertIs(self.manager.mixer_core, self.created[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Tests for clock-driven mixer transitions."""
+import importlib.util
+import unittest
+
+from src.mixer.transitions import (
+    PadState,
+    duration_frames,
+    frame_aligned_start,
+    normalize_transition,
+    plan_transition,
+    value_at,
+)
+
+FRAME_NS = 33_333_333
+OUTPUT = (1920, 1080)
+FULL = PadState(x=0, y=0, w=1920, h=1080, alpha=1.0)
+HIDDEN = PadState(x=0, y=0, w=1920, h=1080, alpha=0.0)
+
+
+class TestTransitionPlanning(unittest.TestCase):
+    """Test keyframe planning without GStreamer."""
+
+    def test_aliases_and_unknown_types(self):
+        """Test that "auto" maps to mix and unknown types are rejected."""
+        self.assertEqual(normalize_transition("auto"), "mix")
+        with self.assertRaises(ValueError):
+            normalize_transition("spin")
+
+    def test_start_is_frame_aligned(self):
+        """Test that transitions start on a frame boundary after a lead time."""
+        start = frame_aligned_start(10 * FRAME_NS + 5, FRAME_NS, lead_frames=2)
+        self.assertEqual(start, 13 * FRAME_NS)
+        self.assertEqual(duration_frames(500, 30), 15)
+
+    def test_every_plan_starts_on_outgoing_and_ends_on_target(self):
+        """Test that no transition type jumps at its first or last frame."""
+        outgoing = {"cam0": FULL, "cam1": HIDDEN}
+        incoming = {"cam0": HIDDEN, "cam1": FULL}
+        for kind in ("mix", "dip", "wipe", "slide", "zoom"):
+            plan = plan_transition(kind, outgoing, incoming, OUTPUT)
+            cam0_alpha = plan["cam0"]["alpha"]
+            cam1 = plan["cam1"]
+            self.assertEqual(value_at(cam0_alpha, 0.0), 1.0, kind)
+            self.assertEqual(value_at(cam1["xpos"], 1.0), 0, kind)
+            self.assertEqual(value_at(cam1["width"], 1.0), 1920, kind)
+            self.assertEqual(value_at(cam1["alpha"], 1.0), 1.0, kind)
+            # The incoming source is not visible on the first frame
+            invisible = (
+                value_at(cam1["alpha"], 0.0) == 0.0
+                or abs(value_at(cam1["xpos"], 0.0)) >= 1920
+            )
+            self.assertTrue(invisible, kind)
+
+    def test_dip_reaches_background_at_midpoint(self):
+        """Test that a dip shows only the background halfway through."""
+        plan = plan_transition("dip", {"cam0": FULL, "cam1": HIDDEN}, {"cam0": HIDDEN, "cam1": FULL}, OUTPUT)
+        self.assertEqual(value_at(plan["cam0"]["alpha"], 0.5), 0.0)
+        self.assertEqual(value_at(plan["cam1"]["alpha"], 0.5), 0.0)
+
+    def test_shared_source_moves_to_new_slot(self):
+        """Test that a source in both scenes glides to its new position."""
+        pip = PadState(x=1344, y=756, w=576, h=324, alpha=1.0)
+        plan = plan_transition("mix", {"cam1": pip}, {"cam1": FULL}, OUTPUT)
+        self.assertEqual(value_at(plan["cam1"]["alpha"], 0.5), 1.0)
+        self.assertEqual(value_at(plan["cam1"]["xpos"], 0.0), 1344)
+        self.assertEqual(value_at(plan["cam1"]["xpos"], 1.0), 0)
+
+
+@unittest.skipUnless(importlib.util.find_spec("gi"), "GStreamer Python bindings not installed")
+class TestTransitionFrameAccuracy(unittest.TestCase):
+    """Run a mix on a real compositor and check the frames it lands on."""
+
+    START_FRAME = 10
+    FRAMES = 10
+
+    def test_mix_lands_on_exact_frames(self):
+        """Test that a 10-frame mix starts and ends on the planned frames."""
+        from src.gst_utils import get_gst, get_gst_controller
+        from src.mixer.transitions import bind_keyframes
+
+        Gst = get_gst()
+        GstController = get_gst_controller()
+        if not Gst or not GstController:
+            self.skipTest("GStreamer not available")
+
+        caps = "video/x-raw,format=I420,width=64,height=36,framerate=30/1"
+        pipeline = Gst.parse_launch(
+            f"videotestsrc pattern=black num-buffers=40 ! {caps} ! compositor.sink_0 "
+            f"videotestsrc pattern=white num-buffers=40 ! {caps} ! compositor.sink_1 "
+            f"compositor name=compositor background=black sink_1::alpha=0.0 ! "
+            f"video/x-raw,format=I420 ! appsink name=out sync=false"
+        )
+        frame_ns = Gst.SECOND // 30
+        pad = pipeline.get_by_name("compositor").get_static_pad("sink_1")
+        bind_keyframes(
+            GstController, pad, "alpha", [(0.0, 0.0), (1.0, 1.0)],
+            self.START_FRAME * frame_ns, self.FRAMES * frame_ns,
+        )
+
+        sink = pipeline.get_by_name("out")
+        pipeline.set_state(Gst.State.PLAYING)
+        luma = []
+        try:
+            while True:
+                sample = sink.emit("try-pull-sample", 5 * Gst.SECOND)
+                if sample is None:
+                    break
+                ok, info = sample.get_buffer().map(Gst.MapFlags.READ)
+                luma.append(info.data[0])
+                sample.get_buffer().unmap(info)
+        finally:
+            pipeline.set_state(Gst.State.NULL)
+
+        end = self.START_FRAME + self.FRAMES
+        black, white = luma[0], luma[-1]
+        self.assertLess(black, white)
+        # Untouched before (and on) the start frame, fully switched from the end frame
+        self.assertTrue(all(v == black for v in luma[:self.START_FRAME + 1]))
+        self.assertTrue(all(v == white for v in luma[end:]))
+        # Strictly rising in between: one step per frame
+        ramp = luma[self.START_FRAME:end + 1]
+        self.assertEqual(ramp, sorted(set(ramp)))
+
+
+if __name__ == "__main__":
+    unittest.main()